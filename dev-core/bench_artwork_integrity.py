@@ -0,0 +1,128 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Benchmark the ROM artwork integrity check: the old sequential check against
+# db.read_image_headers() with an empty and with a warm image header index, reading the
+# headers sequentially (the default) and in a pool of num_threads threads.
+#
+# A synthetic artwork tree of mixed PNG/JPEG/GIF files is created in a temporary directory.
+# Some files have the wrong extension, some are corrupt (truncated) and some are missing.
+# The results of all the runs must be the same.
+#
+# The local disk has almost no latency. The runs are repeated adding latency_ms milliseconds
+# to every file read, like the network round trip of a NAS share (SMB/NFS).
+#
+# $ ./bench_artwork_integrity.py [num_files] [num_threads] [latency_ms]
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.db as db
+
+# --- Python standard library ---
+import random
+import shutil
+import tempfile
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+# (extension, image header) of the synthetic files.
+image_table = [
+    ('png', const.IMAGE_MAGIC_DIC[const.IMAGE_PNG_ID][0]),
+    ('jpg', const.IMAGE_MAGIC_DIC[const.IMAGE_JPEG_ID][1]),
+    ('gif', const.IMAGE_MAGIC_DIC[const.IMAGE_GIF_ID][1]),
+]
+
+# Returns the list of image paths. 1 in 20 paths does not exist.
+def make_artwork_tree(root_dir, num_files):
+    rnd = random.Random(1234)
+    path_list = []
+    for i in range(num_files):
+        asset_dir = os.path.join(root_dir, 'platform_{}'.format(i % 10), ['titles', 'snaps', 'boxfronts'][i % 3])
+        if not os.path.isdir(asset_dir): os.makedirs(asset_dir)
+        ext, header = image_table[rnd.randrange(len(image_table))]
+        kind = rnd.randrange(20)
+        if kind == 0:
+            # Wrong extension
+            ext = image_table[(image_table.index((ext, header)) + 1) % len(image_table)][0]
+        file_path = os.path.join(asset_dir, 'Game {:06d}.{}'.format(i, ext))
+        path_list.append(file_path)
+        if kind == 1: continue # Missing file
+        if kind == 2:
+            data = header[:4] # Corrupt file
+        else:
+            data = header + b'\x00' * rnd.randrange(2048, 16384)
+        with open(file_path, 'wb') as file:
+            file.write(data)
+    return path_list
+
+# Copied from the old main.exec_utils_check_ROM_artwork_integrity().
+def check_sequential(path_list):
+    results = {}
+    for asset_fname in path_list:
+        if not os.path.exists(asset_fname):
+            results[asset_fname] = None
+            continue
+        results[asset_fname] = misc.identify_image_id_by_contents(asset_fname)
+    return results
+
+# --- main ---------------------------------------------------------------------------------------
+num_files = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+num_threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+log.set_log_level(log.LOG_INFO)
+root_dir = tempfile.mkdtemp(prefix = 'AEL_bench_')
+print('Creating {:,} synthetic images in "{}"'.format(num_files, root_dir))
+path_list = make_artwork_tree(root_dir, num_files)
+index_FN = utils.FileName(root_dir).pjoin('artwork_header_index.json')
+
+start_time = time.time()
+seq_results = check_sequential(path_list)
+seq_time = time.time() - start_time
+
+# Simulates the network latency. time.sleep() releases the GIL like waiting for the network.
+read_image_header = db._read_image_header
+def network_read_image_header(path, old_entry):
+    time.sleep(latency_ms / 1000.0)
+    return read_image_header(path, old_entry)
+
+# Returns (results, number of files not read again, elapsed time).
+def run_index(threads, cold):
+    if cold and index_FN.exists(): index_FN.unlink()
+    start_time = time.time()
+    index = db.load_image_header_index(index_FN)
+    results, num_cached = db.read_image_headers(path_list, index, num_threads = threads)
+    if cold: db.write_image_header_index(index_FN, index)
+    return (results, num_cached, time.time() - start_time)
+
+table_str = [
+    ['left', 'right', 'right', 'right'],
+    ['Method', 'Files', 'Not read again', 'Time (s)'],
+    ['Old sequential check', '{:,}'.format(len(seq_results)), '0', '{:.3f}'.format(seq_time)],
+]
+results_list = [seq_results]
+for disk_name, read_function in [('local', read_image_header),
+    ('{:g} ms latency'.format(latency_ms), network_read_image_header)]:
+    db._read_image_header = read_function
+    for threads, name in [(1, 'Sequential'), (num_threads, '{} threads'.format(num_threads))]:
+        for cold, index_name in [(True, 'empty index'), (False, 'warm index')]:
+            results, num_cached, elapsed = run_index(threads, cold)
+            results_list.append(results)
+            table_str.append(['{}, {}, {}'.format(name, disk_name, index_name),
+                '{:,}'.format(len(results)), '{:,}'.format(num_cached), '{:.3f}'.format(elapsed)])
+db._read_image_header = read_image_header
+shutil.rmtree(root_dir)
+print('\n'.join(misc.render_table(table_str)))
+if all(results == seq_results for results in results_list):
+    print('Results are the same.')
+else:
+    print('ERROR Results are different.')
+    sys.exit(1)
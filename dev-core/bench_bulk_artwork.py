@@ -0,0 +1,241 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Benchmark and test of the bulk artwork scraper, ScrapeStrategy.scrap_bulk_ROM_assets().
+#
+# A synthetic launcher is scraped with a fake asset scraper. The fake scraper sleeps to
+# simulate the API latency and network.download_img() is replaced with a function that sleeps
+# to simulate the download latency and writes the image file. The scrape is timed with one
+# and with several download threads. Then the scrape is canceled halfway and resumed. After
+# the resumed scrape all the artwork must be downloaded, and the ROMs finished before the
+# cancel must not be scraped again.
+#
+# $ ./bench_bulk_artwork.py [num_roms]
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.assets as assets
+import resources.db as db
+import resources.scrap as scrap
+import resources.main as main
+
+# --- Python standard library ---
+import io
+import shutil
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+API_LATENCY = 0.002
+DOWNLOAD_LATENCY = 0.04
+asset_id_list = [const.ASSET_TITLE_ID, const.ASSET_SNAP_ID, const.ASSET_BOXFRONT_ID]
+
+class FakeScraper(object):
+    DOWNLOAD_MAX_THREADS = 1
+    DOWNLOAD_MIN_INTERVAL = 0.0
+
+    def __init__(self):
+        self.candidates_cache = {} # Survives between runs, like the scraper disk cache.
+        self.candidate = None
+        self.resolved_dic = {} # { ROM base name : number of times the assets were resolved }
+        self.num_flushes = 0
+
+    def get_name(self): return 'Fake scraper'
+
+    def supports_asset_ID(self, asset_ID): return asset_ID in asset_id_list
+
+    def check_candidates_cache(self, ROM_FN, platform): return ROM_FN.getBase() in self.candidates_cache
+
+    def retrieve_from_candidates_cache(self, ROM_FN, platform): return self.candidates_cache[ROM_FN.getBase()]
+
+    def set_candidate_from_cache(self, ROM_FN, platform):
+        self.candidate = self.candidates_cache[ROM_FN.getBase()]
+
+    def clear_cache(self, ROM_FN, platform): pass
+
+    # One game in ten is not found.
+    def get_candidates(self, search_term, ROM_FN, ROM_checksums_FN, platform, st_dic):
+        time.sleep(API_LATENCY)
+        if ROM_FN.getBaseNoExt().endswith('7'): return []
+        return [{ 'id' : ROM_FN.getBaseNoExt(), 'display_name' : search_term }]
+
+    def set_candidate(self, ROM_FN, platform, candidate):
+        self.candidate = candidate
+        if candidate is not None: self.candidates_cache[ROM_FN.getBase()] = candidate
+
+    def get_assets(self, asset_ID, st_dic):
+        if asset_ID == asset_id_list[0]:
+            ROM_base = self.candidate['id']
+            self.resolved_dic[ROM_base] = self.resolved_dic.get(ROM_base, 0) + 1
+        time.sleep(API_LATENCY)
+        return [{ 'url' : 'http://images/{}/{}.png'.format(asset_ID, self.candidate['id']) }]
+
+    def resolve_asset_URL(self, selected_asset, st_dic): return (selected_asset['url'], selected_asset['url'])
+
+    def resolve_asset_URL_extension(self, selected_asset, image_url, st_dic): return 'png'
+
+    def flush_disk_cache(self): self.num_flushes += 1
+
+class FakeProgressDialog(object):
+    # The dialog is canceled after cancel_after updates. None never cancels.
+    def __init__(self, cancel_after = None):
+        self.cancel_after = cancel_after
+        self.num_updates = 0
+
+    def startProgress(self, message, num_steps = 100): pass
+
+    def updateProgressInc(self, message = None): self.num_updates += 1
+
+    def updateProgressIncThrottled(self, message): self.num_updates += 1
+
+    def updateMessage(self, message): pass
+
+    def isCanceled(self):
+        return self.cancel_after is not None and self.num_updates >= self.cancel_after
+
+    def endProgress(self): pass
+
+    def close(self): pass
+
+    def reopen(self): pass
+
+def fake_download_img(img_url, file_path):
+    time.sleep(DOWNLOAD_LATENCY)
+    with io.open(file_path, 'wb') as file:
+        file.write(img_url.encode('utf-8'))
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    return cfg
+
+# A quarter of the ROMs already have all the artwork.
+def make_launcher(root_dir, num_roms):
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['rompath'] = os.path.join(root_dir, 'roms')
+    launcher['romext'] = 'zip'
+    os.makedirs(launcher['rompath'])
+    for asset_id in asset_id_list:
+        AInfo = assets.ASSET_INFO_DICT[asset_id]
+        launcher[AInfo.path_key] = os.path.join(root_dir, 'assets', AInfo.name_plural.lower())
+        os.makedirs(launcher[AInfo.path_key])
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:05d}'.format(i)
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:05d}.zip'.format(i))
+        io.open(rom['filename'], 'wb').close()
+        if i % 4 == 0:
+            for asset_id in asset_id_list:
+                AInfo = assets.ASSET_INFO_DICT[asset_id]
+                io.open(os.path.join(launcher[AInfo.path_key], 'Game {:05d}.png'.format(i)), 'wb').close()
+        roms[rom['id']] = rom
+    return (launcher, roms)
+
+# Returns (report, elapsed time).
+def scrape(cfg, launcher, roms, scraper_obj, progress_FN, pdialog):
+    strategy = scrap.ScrapeStrategy(cfg, cfg.settings)
+    strategy.launcher = launcher
+    strategy.platform = launcher['platform']
+    strategy.asset_scraper_obj = scraper_obj
+    strategy.asset_scraper_name = scraper_obj.get_name()
+    strategy.scanner_set_progress_dialog(pdialog, False)
+    strategy.scanner_check_launcher_unset_asset_dirs()
+    utils.file_cache_clear(verbose = False)
+    for asset_id in asset_id_list:
+        utils.file_cache_add_dir(launcher[assets.ASSET_INFO_DICT[asset_id].path_key], verbose = False)
+    start_time = time.time()
+    report = strategy.scrap_bulk_ROM_assets(roms, progress_FN, pdialog)
+    return (report, time.time() - start_time)
+
+# Number of ROMs with all the artwork files and fields set.
+def count_complete_ROMs(launcher, roms):
+    num_complete = 0
+    for rom in roms.values():
+        for asset_id in asset_id_list:
+            AInfo = assets.ASSET_INFO_DICT[asset_id]
+            if not rom[AInfo.key] or not os.path.isfile(rom[AInfo.key]): break
+        else:
+            num_complete += 1
+    return num_complete
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+num_roms = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+log.set_log_level(log.LOG_WARNING)
+scrap.network.download_img = fake_download_img
+cfg = make_cfg()
+progress_FN = cfg.ADDON_DATA_DIR.pjoin('scrape_artwork_progress.json')
+num_found = len([i for i in range(num_roms) if i % 4 and i % 10 != 7])
+
+# --- Uninterrupted scrapes ---
+table_str = [
+    ['left', 'right', 'right', 'right', 'right', 'right'],
+    ['Threads', 'Local', 'Downloaded', 'Not found', 'Time (s)', 'Speedup'],
+]
+for num_threads in [1, 4, 8]:
+    FakeScraper.DOWNLOAD_MAX_THREADS = num_threads
+    root_dir = os.path.join(kodi_dir, 'bench_{}'.format(num_threads))
+    launcher, roms = make_launcher(root_dir, num_roms)
+    report, elapsed = scrape(cfg, launcher, roms, FakeScraper(), progress_FN, FakeProgressDialog())
+    if num_threads == 1: reference_time = elapsed
+    table_str.append([const.text_type(num_threads), const.text_type(report[scrap.BULK_LOCAL]),
+        const.text_type(report[scrap.BULK_DOWNLOADED]), const.text_type(report[scrap.BULK_NOT_FOUND]),
+        '{:.2f}'.format(elapsed), '{:.1f}x'.format(reference_time / elapsed)])
+    check('{} threads: all artwork downloaded'.format(num_threads),
+        report[scrap.BULK_DOWNLOADED] == num_found * len(asset_id_list))
+    check('{} threads: ROM fields set'.format(num_threads),
+        count_complete_ROMs(launcher, roms) == num_found + (num_roms + 3) // 4)
+    check('{} threads: progress file deleted'.format(num_threads), not progress_FN.exists())
+    shutil.rmtree(root_dir)
+print('\n'.join(misc.render_table(table_str)))
+
+# --- Canceled and resumed scrape ---
+# The missing artwork search does num_roms progress updates, cancel halfway the scraping.
+FakeScraper.DOWNLOAD_MAX_THREADS = 4
+root_dir = os.path.join(kodi_dir, 'resume')
+launcher, roms = make_launcher(root_dir, num_roms)
+scraper_obj = FakeScraper()
+report, elapsed = scrape(cfg, launcher, roms, scraper_obj, progress_FN, FakeProgressDialog(num_roms + num_roms // 2))
+check('Canceled scrape: progress file written', progress_FN.exists())
+done_list = utils.load_JSON_file(progress_FN.getPath(), {}, verbose = False)['done']
+done_base_set = set(utils.FileName(roms[romID]['filename']).getBaseNoExt() for romID in done_list)
+check('Canceled scrape: some ROMs done', 0 < len(done_list) < num_roms)
+check('Canceled scrape: scraper disk cache flushed', scraper_obj.num_flushes > 0)
+resolved_before = dict(scraper_obj.resolved_dic)
+report, elapsed = scrape(cfg, launcher, roms, scraper_obj, progress_FN, FakeProgressDialog())
+check('Resumed scrape: all artwork downloaded', count_complete_ROMs(launcher, roms) == num_found + (num_roms + 3) // 4)
+check('Resumed scrape: progress file deleted', not progress_FN.exists())
+rescraped_list = [ROM_base for ROM_base in done_base_set if scraper_obj.resolved_dic.get(ROM_base, 0) > resolved_before.get(ROM_base, 0)]
+check('Resumed scrape: ROMs done before the cancel not scraped again', not rescraped_list)
+check('Resumed scrape: every ROM scraped at most twice', max(scraper_obj.resolved_dic.values()) <= 2)
+shutil.rmtree(root_dir)
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
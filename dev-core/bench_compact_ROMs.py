@@ -0,0 +1,111 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Memory used by a loaded launcher with dictionary ROMs and with db.CompactROM records.
+#
+# A synthetic MAME-like ROM JSON database is created in a temporary directory and loaded with
+# utils.load_JSON_file() without and with db.compact_ROM_object_hook(). Memory is measured
+# with tracemalloc. The time to read all the ROM fields, like render_ROMs_process() does, is
+# also measured. Finally, CompactROMs are written to disk and loaded again, and the result
+# must be the same as the original database.
+#
+# $ ./bench_compact_ROMs.py [num_roms]
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.db as db
+
+# --- Python standard library ---
+import gc
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# --- configuration ------------------------------------------------------------------------------
+genre_list = ['Shooter / Flying Vertical', 'Platform / Run Jump', 'Fighter / Versus',
+    'Driving / Race', 'Sports / Soccer', 'Puzzle / Drop', 'Maze / Collect', 'Casino / Cards']
+developer_list = ['Capcom', 'Konami', 'Namco', 'Taito', 'SNK', 'Sega', 'Irem', 'Data East']
+
+def make_ROMs_JSON(json_FN, num_roms):
+    rnd = random.Random(1234)
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Arcade game {:05d} (World, rev {})'.format(i, i % 4)
+        rom['m_year'] = const.text_type(rnd.randrange(1978, 2005))
+        rom['m_genre'] = rnd.choice(genre_list)
+        rom['m_developer'] = rnd.choice(developer_list)
+        rom['m_nplayers'] = rnd.choice(['1P', '2P alt', '2P sim', '4P sim'])
+        rom['filename'] = '/home/kodi/ROMs/MAME/game{:05d}.zip'.format(i)
+        rom['pclone_status'] = const.PCLONE_STATUS_CLONE if i % 3 else const.PCLONE_STATUS_PARENT
+        if i % 3: rom['cloneof'] = 'game{:05d}'.format(i - i % 3)
+        rom['s_title'] = '/home/kodi/ROMs/MAME-art/titles/game{:05d}.png'.format(i)
+        rom['s_snap'] = '/home/kodi/ROMs/MAME-art/snaps/game{:05d}.png'.format(i)
+        roms[rom['id']] = rom
+    utils.write_JSON_file(json_FN.getPath(), [{}, {}, roms], verbose = False)
+
+# Returns (roms, current memory, peak memory, load time).
+def load_ROMs(json_FN, object_hook):
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.time()
+    roms = utils.load_JSON_file(json_FN.getPath(), verbose = False, object_hook = object_hook)[2]
+    load_time = time.time() - start_time
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (roms, current_memory, peak_memory, load_time)
+
+def read_all_fields(roms):
+    start_time = time.time()
+    for rom_id in roms:
+        rom = roms[rom_id]
+        for key in rom: rom[key]
+        rom.get('platform', '')
+    return time.time() - start_time
+
+# --- main ---------------------------------------------------------------------------------------
+num_roms = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+log.set_log_level(log.LOG_INFO)
+root_dir = tempfile.mkdtemp(prefix = 'AEL_bench_')
+json_FN = utils.FileName(root_dir).pjoin('roms.json')
+print('Creating ROM database with {:,} ROMs'.format(num_roms))
+make_ROMs_JSON(json_FN, num_roms)
+
+roms, dict_memory, dict_peak, dict_load_time = load_ROMs(json_FN, None)
+dict_read_time = read_all_fields(roms)
+original_roms = roms
+roms, compact_memory, compact_peak, compact_load_time = load_ROMs(json_FN, db.compact_ROM_object_hook)
+compact_read_time = read_all_fields(roms)
+
+# --- Write CompactROMs and load them again ---
+utils.write_JSON_file(json_FN.getPath(), [{}, {}, roms], verbose = False)
+roundtrip_roms = utils.load_JSON_file(json_FN.getPath(), verbose = False)[2]
+shutil.rmtree(root_dir)
+
+table_str = [
+    ['left', 'right', 'right', 'right', 'right'],
+    ['ROM type', 'Memory (MB)', 'Peak (MB)', 'Load (s)', 'Read fields (s)'],
+    ['dict', '{:.1f}'.format(dict_memory / 1e6), '{:.1f}'.format(dict_peak / 1e6),
+        '{:.3f}'.format(dict_load_time), '{:.3f}'.format(dict_read_time)],
+    ['CompactROM', '{:.1f}'.format(compact_memory / 1e6), '{:.1f}'.format(compact_peak / 1e6),
+        '{:.3f}'.format(compact_load_time), '{:.3f}'.format(compact_read_time)],
+]
+print('\n'.join(misc.render_table(table_str)))
+print('Memory saved {:.1f}%'.format(100 * (dict_memory - compact_memory) / dict_memory))
+if roundtrip_roms == original_roms and roms == original_roms:
+    print('CompactROMs are the same as dictionary ROMs.')
+else:
+    print('ERROR CompactROMs are different from dictionary ROMs.')
+    sys.exit(1)
@@ -0,0 +1,231 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Headless benchmark of the AEL hot paths with plain Python, using the Kodi module stubs
+# in kodi_stubs.py. For every size a synthetic ROM launcher is created and these paths
+# are timed:
+#
+#   load_ROMs            db.load_db_index() + db.get_ROM_db_filenames() + db.load_ROMs()
+#   render_ROMs_process  main.render_ROMs_process() + main.render_ROMs_commit()
+#   rom_scanner_files    File stage of main.command_rom_scanner(): ROM path listing, asset
+#                        directory caching and asset search for every ROM.
+#   load_NoIntro_XML     audit.load_NoIntro_XML_file() of a synthetic DAT.
+#   browse_by_rebuild    main.command_update_browse_by_db_all()
+#
+# Results are written to bench_hot_paths_<AEL version>_<date>.json in output_dir, by default
+# the system temporary directory so no files are left in the repository. If a previous
+# results file is given the times are compared, use - for no previous results. Every path
+# is run num_repeat times and the best time is reported.
+#
+# $ ./bench_hot_paths.py [sizes] [previous_results.json | -] [output_dir]
+# $ ./bench_hot_paths.py 1000,10000,100000 /tmp/bench_hot_paths_0.10.0_20220101_120000.json
+# $ ./bench_hot_paths.py 1000,10000 - ~/AEL-bench
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.kodi as kodi
+import resources.db as db
+import resources.assets as assets
+import resources.audit as audit
+import resources.main as main
+
+# --- Python standard library ---
+import io
+import json
+import platform
+import random
+import shutil
+import tempfile
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+num_repeat = 3
+genre_list = ['Action', 'Platform', 'Shooter', 'Sports', 'Puzzle', 'Racing', 'RPG', 'Fighting']
+developer_list = ['Nintendo', 'Sega', 'Capcom', 'Konami', 'Namco', 'Taito', 'SNK', 'Hudson']
+asset_id_list = [const.ASSET_TITLE_ID, const.ASSET_SNAP_ID, const.ASSET_BOXFRONT_ID]
+
+# Returns the best time of num_repeat runs of function(*args).
+def bench(function, *args):
+    time_list = []
+    for i in range(num_repeat):
+        start_time = time.time()
+        function(*args)
+        time_list.append(time.time() - start_time)
+    return min(time_list)
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR, cfg.VIRTUAL_ROMS_DIR, cfg.COLLECTIONS_DIR, cfg.REPORTS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    main.g_base_url = cfg.base_url = 'plugin://plugin.program.AEL.dev/'
+    return cfg
+
+# Creates the synthetic launcher, its ROM files, artwork files and ROM database.
+# Half of the ROMs have artwork. Returns the launcher ID.
+def make_launcher(cfg, root_dir, num_roms):
+    rnd = random.Random(num_roms)
+    category = db.new_category()
+    category['id'] = misc.generate_random_SID()
+    category['m_name'] = 'Benchmark'
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['m_name'] = 'Benchmark {:,} ROMs'.format(num_roms)
+    launcher['categoryID'] = category['id']
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['application'] = '/usr/bin/retroarch'
+    launcher['rompath'] = os.path.join(root_dir, 'roms')
+    launcher['romext'] = 'zip|sfc'
+    launcher['roms_base_noext'] = 'benchmark_{}'.format(num_roms)
+    for asset_id in asset_id_list:
+        AInfo = assets.ASSET_INFO_DICT[asset_id]
+        launcher[AInfo.path_key] = os.path.join(root_dir, 'assets', AInfo.name_plural.lower())
+        os.makedirs(launcher[AInfo.path_key])
+    os.makedirs(launcher['rompath'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:06d}'.format(i)
+        rom['m_year'] = const.text_type(rnd.randrange(1985, 2000))
+        rom['m_genre'] = rnd.choice(genre_list)
+        rom['m_developer'] = rnd.choice(developer_list)
+        rom['m_nplayers'] = rnd.choice(['1', '2', '1-4'])
+        rom['m_plot'] = 'Plot of game {}. '.format(i) * 10
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:06d}.zip'.format(i))
+        io.open(rom['filename'], 'wb').close()
+        if i % 2 == 0:
+            for asset_id in asset_id_list:
+                AInfo = assets.ASSET_INFO_DICT[asset_id]
+                rom[AInfo.key] = os.path.join(launcher[AInfo.path_key], 'Game {:06d}.png'.format(i))
+                io.open(rom[AInfo.key], 'wb').close()
+        roms[rom['id']] = rom
+
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, category['id'], launcher['id'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+    db.get_ROM_db_filenames(cfg, st, category['id'], launcher['id'])
+    cfg.roms = roms
+    db.save_ROMs(cfg, st)
+    return (category['id'], launcher['id'])
+
+def make_NoIntro_DAT(DAT_FN, num_roms):
+    sl = [
+        '<?xml version="1.0"?>',
+        '<datafile>',
+        '<header><name>Nintendo - Super Nintendo Entertainment System</name></header>',
+    ]
+    for i in range(num_roms):
+        sl.append('<game name="Game {0:06d}"><description>Game {0:06d}</description>'.format(i))
+        sl.append('<rom name="Game {:06d}.sfc" size="1048576" crc="{:08x}" sha1="{:040x}"/></game>'.format(
+            i, i * 2654435761 % 2**32, i))
+    sl.append('</datafile>')
+    utils.write_slist_to_file(DAT_FN.getPath(), sl)
+
+def run_load_ROMs(cfg, categoryID, launcherID):
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, categoryID, launcherID)
+    db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+    db.load_ROMs(cfg, st)
+
+def run_render_ROMs_process(cfg, categoryID, launcherID):
+    run_load_ROMs(cfg, categoryID, launcherID)
+    main.render_ROMs_commit(cfg, main.render_ROMs_process(cfg, categoryID, launcherID))
+
+def run_rom_scanner_files(cfg, launcherID):
+    launcher = cfg.launchers[launcherID]
+    utils.file_cache_clear(verbose = False)
+    for asset_id in asset_id_list:
+        utils.file_cache_add_dir(launcher[assets.ASSET_INFO_DICT[asset_id].path_key], verbose = False)
+    rom_ext_list = ['.' + ext for ext in launcher['romext'].split('|')]
+    for f_path in sorted(utils.FileName(launcher['rompath']).recursiveScanFilesInPath('*.*')):
+        ROM = utils.FileName(f_path)
+        if ROM.getExt() not in rom_ext_list: continue
+        for asset_id in asset_id_list:
+            AInfo = assets.ASSET_INFO_DICT[asset_id]
+            utils.file_cache_search(launcher[AInfo.path_key], ROM.getBaseNoExt(), AInfo.exts)
+
+# --- main ---------------------------------------------------------------------------------------
+size_list = [int(size) for size in sys.argv[1].split(',')] if len(sys.argv) > 1 else [1000, 10000]
+previous_FN = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != '-' else None
+output_dir = os.path.expanduser(sys.argv[3]) if len(sys.argv) > 3 else tempfile.gettempdir()
+log.set_log_level(log.LOG_WARNING)
+cfg = make_cfg()
+print('Kodi special:// directory "{}"'.format(kodi_dir))
+
+results = {
+    'AEL_version' : cfg.addon.info_version,
+    'python' : platform.python_version(),
+    'platform' : platform.platform(),
+    'date' : time.strftime('%Y-%m-%d %H:%M:%S'),
+    'num_repeat' : num_repeat,
+    'times' : {}, # { 'path@size' : seconds }
+}
+for num_roms in size_list:
+    print('Benchmarking launcher with {:,} ROMs...'.format(num_roms))
+    root_dir = os.path.join(kodi_dir, 'bench_{}'.format(num_roms))
+    categoryID, launcherID = make_launcher(cfg, root_dir, num_roms)
+    DAT_FN = utils.FileName(root_dir).pjoin('benchmark.dat')
+    make_NoIntro_DAT(DAT_FN, num_roms)
+    times = results['times']
+    times['load_ROMs@{}'.format(num_roms)] = bench(run_load_ROMs, cfg, categoryID, launcherID)
+    times['render_ROMs_process@{}'.format(num_roms)] = bench(run_render_ROMs_process, cfg, categoryID, launcherID)
+    times['rom_scanner_files@{}'.format(num_roms)] = bench(run_rom_scanner_files, cfg, launcherID)
+    times['load_NoIntro_XML@{}'.format(num_roms)] = bench(audit.load_NoIntro_XML_file, DAT_FN)
+    times['browse_by_rebuild@{}'.format(num_roms)] = bench(main.command_update_browse_by_db_all, cfg)
+    shutil.rmtree(root_dir)
+shutil.rmtree(kodi_dir)
+
+output_fname = os.path.join(output_dir, 'bench_hot_paths_{}_{}.json'.format(
+    results['AEL_version'], time.strftime('%Y%m%d_%H%M%S')))
+with io.open(output_fname, 'wt', encoding = 'utf-8') as file:
+    file.write(const.text_type(json.dumps(results, indent = 1, sort_keys = True)))
+print('Results written to "{}"'.format(output_fname))
+
+# --- Print results and compare with previous results, if any ---
+previous = {}
+if previous_FN:
+    with io.open(previous_FN, 'rt', encoding = 'utf-8') as file:
+        previous = json.load(file)
+    table_str = [
+        ['left', 'right', 'right', 'right', 'right'],
+        ['Path', 'ROMs', previous['AEL_version'] + ' (s)', results['AEL_version'] + ' (s)', 'Change'],
+    ]
+else:
+    table_str = [
+        ['left', 'right', 'right'],
+        ['Path', 'ROMs', 'Time (s)'],
+    ]
+for key in sorted(results['times'], key = lambda x : (x.split('@')[0], int(x.split('@')[1]))):
+    path_name, num_roms = key.split('@')
+    row = [path_name, '{:,}'.format(int(num_roms))]
+    if previous_FN:
+        if key in previous['times'] and previous['times'][key] > 0:
+            old_time = previous['times'][key]
+            row.append('{:.3f}'.format(old_time))
+            row.append('{:.3f}'.format(results['times'][key]))
+            row.append('{:+.1f}%'.format(100 * (results['times'][key] - old_time) / old_time))
+        else:
+            row.extend(['', '{:.3f}'.format(results['times'][key]), ''])
+    else:
+        row.append('{:.3f}'.format(results['times'][key]))
+    table_str.append(row)
+print('\n'.join(misc.render_table(table_str)))
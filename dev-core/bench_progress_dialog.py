@@ -0,0 +1,108 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Micro-benchmark of kodi.ProgressDialog with a fake xbmcgui module.
+#
+# Runs a loop that calls updateProgressInc() and isCanceled() once per item, like the ROM
+# scanner, audit and check loops do, with the old unthrottled dialog and with the current
+# dialog. Then the loop is run with a different message for every item, like the bulk
+# artwork scraper does, with updateProgressInc() and with updateProgressIncThrottled(). Every call to the fake Kodi dialog costs CALL_COST seconds, to simulate the
+# crossing into the Kodi GUI layer.
+#
+# $ ./bench_progress_dialog.py [num_items]
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.kodi as kodi
+
+# --- Python standard library ---
+import math
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+CALL_COST = 0.00005
+
+class FakeDialogProgress(object):
+    num_calls = 0
+
+    def _call(self):
+        FakeDialogProgress.num_calls += 1
+        time.sleep(CALL_COST)
+
+    def create(self, *args): self._call()
+
+    def update(self, *args): self._call()
+
+    def iscanceled(self):
+        self._call()
+        return False
+
+    def close(self): self._call()
+
+class FakeXbmcgui(object):
+    DialogProgress = FakeDialogProgress
+
+# Old kodi.ProgressDialog methods, before update throttling.
+class OldProgressDialog(object):
+    def __init__(self):
+        self.progressDialog = FakeDialogProgress()
+
+    def startProgress(self, message, step_total = 100, step_counter = 0):
+        self.step_total = step_total
+        self.step_counter = step_counter
+        self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self.progressDialog.create(const.ADDON_LONG_NAME, message)
+        self.progressDialog.update(self.progress)
+
+    def updateProgressInc(self, message = None):
+        self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self.step_counter += 1
+        self.progressDialog.update(self.progress)
+
+    def isCanceled(self):
+        return self.progressDialog.iscanceled()
+
+    def endProgress(self):
+        self.progressDialog.iscanceled()
+        self.progressDialog.update(100)
+        self.progressDialog.close()
+
+# update_function is called with (pdialog, item number) for every item.
+def bench(pdialog, num_items, update_function = lambda pdialog, i : pdialog.updateProgressInc()):
+    FakeDialogProgress.num_calls = 0
+    start_time = time.time()
+    pdialog.startProgress('Scanning ROMs...', num_items)
+    for i in range(num_items):
+        update_function(pdialog, i)
+        if pdialog.isCanceled(): break
+    pdialog.endProgress()
+    return (FakeDialogProgress.num_calls, time.time() - start_time)
+
+# --- main ---------------------------------------------------------------------------------------
+num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+log.set_log_level(log.LOG_INFO)
+kodi.xbmcgui = FakeXbmcgui
+
+old_calls, old_time = bench(OldProgressDialog(), num_items)
+new_calls, new_time = bench(kodi.ProgressDialog(), num_items)
+msg_calls, msg_time = bench(kodi.ProgressDialog(), num_items,
+    lambda pdialog, i : pdialog.updateProgressInc('ROM {}'.format(i)))
+msg_thr_calls, msg_thr_time = bench(kodi.ProgressDialog(), num_items,
+    lambda pdialog, i : pdialog.updateProgressIncThrottled('ROM {}'.format(i)))
+table_str = [
+    ['left', 'right', 'right', 'right'],
+    ['Dialog', 'Items', 'Kodi calls', 'Time (s)'],
+    ['Unthrottled', '{:,}'.format(num_items), '{:,}'.format(old_calls), '{:.3f}'.format(old_time)],
+    ['Throttled', '{:,}'.format(num_items), '{:,}'.format(new_calls), '{:.3f}'.format(new_time)],
+    ['Message per item', '{:,}'.format(num_items), '{:,}'.format(msg_calls), '{:.3f}'.format(msg_time)],
+    ['Message per item, throttled', '{:,}'.format(num_items), '{:,}'.format(msg_thr_calls), '{:.3f}'.format(msg_thr_time)],
+]
+print('\n'.join(misc.render_table(table_str)))
@@ -0,0 +1,150 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Benchmark and test of the addon settings snapshot, main.get_settings().
+#
+# The startup of the addon, the settings part of main.run_plugin(), is timed:
+#
+#   eager     All the settings read from Kodi, like get_settings() did before the snapshot.
+#   lazy      No valid snapshot. Only the settings used are read from Kodi.
+#   snapshot  Valid snapshot. The settings are read from the snapshot file.
+#
+# Outside Kodi the setting reads are dictionary lookups in kodi_stubs.py, so every Kodi setting
+# read sleeps setting_latency milliseconds to simulate the cost of a call into Kodi.
+# The snapshot must have the same values as Kodi and must be invalidated when settings.xml
+# changes or when the addon version changes.
+#
+# $ ./bench_settings_snapshot.py [setting_latency_ms]
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.main as main
+
+# --- Python standard library ---
+import io
+import shutil
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+num_repeat = 20
+setting_latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.0002
+
+num_setting_reads = 0
+def slow_getter(getter):
+    def slow_getter_function(self, key):
+        global num_setting_reads
+        num_setting_reads += 1
+        time.sleep(setting_latency)
+        return getter(self, key)
+    return slow_getter_function
+
+for name in ['getSetting', 'getSettingBool', 'getSettingInt', 'getSettingNumber', 'getSettingString']:
+    setattr(kodi_stubs._Addon, name, slow_getter(getattr(kodi_stubs._Addon, name)))
+
+# Settings part of main.run_plugin(). Returns cfg.
+def startup(eager = False):
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    if eager: cfg.settings.read_all()
+    log.set_log_level(cfg.settings['log_level'])
+    main.get_settings_log_enabled(cfg)
+    cfg.settings['debug_command_timing']
+    return cfg
+
+# Returns (best time, number of Kodi setting reads).
+def bench(function):
+    global num_setting_reads
+    time_list = []
+    for i in range(num_repeat):
+        num_setting_reads = 0
+        start_time = time.time()
+        function()
+        time_list.append(time.time() - start_time)
+    return (min(time_list), num_setting_reads)
+
+def run_eager():
+    if cfg.SETTINGS_SNAPSHOT_FILE_PATH.exists(): cfg.SETTINGS_SNAPSHOT_FILE_PATH.unlink()
+    startup(eager = True)
+
+def run_lazy():
+    if cfg.SETTINGS_SNAPSHOT_FILE_PATH.exists(): cfg.SETTINGS_SNAPSHOT_FILE_PATH.unlink()
+    startup()
+
+def run_snapshot():
+    startup()
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+cfg = main.Configuration()
+if not cfg.ADDON_DATA_DIR.exists(): cfg.ADDON_DATA_DIR.makedirs()
+print('{} settings, {:.2f} ms per Kodi setting read'.format(len(main.SETTINGS_GETTER_DIC), setting_latency * 1000))
+
+# --- Benchmark ---
+eager_time, eager_reads = bench(run_eager)
+lazy_time, lazy_reads = bench(run_lazy)
+main.save_settings_snapshot(startup())
+snapshot_time, snapshot_reads = bench(run_snapshot)
+table_str = [
+    ['left', 'right', 'right', 'right'],
+    ['Startup', 'Kodi reads', 'Time (ms)', 'Speedup'],
+    ['eager', const.text_type(eager_reads), '{:.2f}'.format(eager_time * 1000), '1.0x'],
+    ['lazy', const.text_type(lazy_reads), '{:.2f}'.format(lazy_time * 1000), '{:.1f}x'.format(eager_time / lazy_time)],
+    ['snapshot', const.text_type(snapshot_reads), '{:.2f}'.format(snapshot_time * 1000), '{:.1f}x'.format(eager_time / snapshot_time)],
+]
+print('\n'.join(misc.render_table(table_str)))
+
+# --- Snapshot values ---
+eager_cfg = startup(eager = True)
+snapshot_cfg = startup()
+check('Snapshot used', not snapshot_cfg.settings_snapshot_dirty and snapshot_reads == 0)
+check('Snapshot has all the settings', set(snapshot_cfg.settings.values) == set(main.SETTINGS_GETTER_DIC))
+check('Snapshot values are the same as Kodi values', snapshot_cfg.settings == eager_cfg.settings)
+check('Snapshot has Kodi values and not the values changed by the addon',
+    snapshot_cfg.settings.values['categories_asset_dir'] == kodi_stubs._Addon.settings['categories_asset_dir'])
+
+# --- Snapshot invalidation ---
+kodi_stubs._Addon.settings['display_hide_favs'] = 'true'
+utils.write_slist_to_file(cfg.SETTINGS_FILE_PATH.getPath(), ['<settings version="2" />'])
+changed_cfg = startup()
+check('settings.xml created: snapshot not used', changed_cfg.settings_snapshot_dirty)
+check('settings.xml created: new value read', changed_cfg.settings['display_hide_favs'] is True)
+main.save_settings_snapshot(changed_cfg)
+check('Snapshot written again', not startup().settings_snapshot_dirty)
+kodi_stubs._Addon.settings['display_hide_favs'] = 'false'
+settings_mtime = os.path.getmtime(cfg.SETTINGS_FILE_PATH.getPath())
+os.utime(cfg.SETTINGS_FILE_PATH.getPath(), (settings_mtime + 1, settings_mtime + 1))
+changed_cfg = startup()
+check('settings.xml changed: snapshot not used', changed_cfg.settings_snapshot_dirty)
+check('settings.xml changed: new value read', changed_cfg.settings['display_hide_favs'] is False)
+main.save_settings_snapshot(changed_cfg)
+snapshot = utils.load_JSON_file(cfg.SETTINGS_SNAPSHOT_FILE_PATH.getPath(), {}, verbose = False)
+snapshot['stamp'][0] = '0.0.1'
+utils.write_JSON_file(cfg.SETTINGS_SNAPSHOT_FILE_PATH.getPath(), snapshot, verbose = False)
+check('Addon version changed: snapshot not used', startup().settings_snapshot_dirty)
+io.open(cfg.SETTINGS_SNAPSHOT_FILE_PATH.getPath(), 'wt').write('{"stamp" : ')
+check('Corrupted snapshot: not used', startup().settings_snapshot_dirty)
+check('No temporary files left', not [f for f in os.listdir(cfg.ADDON_DATA_DIR.getPath()) if f.endswith('.tmp')])
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Minimal stand-ins for the Kodi Python modules xbmc, xbmcaddon, xbmcgui, xbmcplugin and xbmcvfs,
+# so AEL modules can be imported and benchmarked with plain Python outside Kodi.
+#
+# Call install() before importing any AEL module. Kodi functions not defined here are
+# accepted and do nothing. Addon settings have the default values in resources/settings.xml
+# and special:// paths are translated into a temporary directory.
+#
+# This module is only for the development scripts. Never import it from the addon.
+
+# --- Python standard library ---
+import os
+import sys
+import json
+import tempfile
+import types
+import xml.etree.ElementTree
+
+ADDON_CODE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Directory where special:// paths point to. Set by install().
+special_dir = None
+
+# Number of list items added to a Kodi directory with xbmcplugin.
+num_directory_items = 0
+
+def _nop(*args, **kwargs): return None
+
+# Object that accepts any method call. Used for ListItem, Window, Monitor, Dialog, etc.
+class _Stub(object):
+    def __init__(self, *args, **kwargs): pass
+
+    def __getattr__(self, name): return _nop
+
+class _DialogProgress(_Stub):
+    def iscanceled(self): return False
+
+class _Monitor(_Stub):
+    def abortRequested(self): return False
+
+class _Addon(object):
+    settings = None
+
+    def __init__(self, *args, **kwargs):
+        if _Addon.settings is None: _Addon.settings = _load_default_settings()
+        # addon.xml XML declaration has no version, which Kodi accepts but ElementTree does not.
+        with open(os.path.join(ADDON_CODE_DIR, 'addon.xml'), 'rb') as file:
+            addon_xml_str = file.read().decode('utf-8')
+        addon_xml_str = addon_xml_str[addon_xml_str.index('?>') + 2:] if addon_xml_str.startswith('<?xml') else addon_xml_str
+        addon_xml = xml.etree.ElementTree.fromstring(addon_xml_str)
+        self.info = {
+            'id' : addon_xml.attrib['id'],
+            'name' : addon_xml.attrib['name'],
+            'version' : addon_xml.attrib['version'],
+            'author' : addon_xml.attrib['provider-name'],
+            'profile' : 'special://profile/addon_data/{}/'.format(addon_xml.attrib['id']),
+            'type' : 'xbmc.python.pluginsource',
+        }
+
+    def getAddonInfo(self, key): return self.info.get(key, '')
+
+    def getSetting(self, key): return _Addon.settings.get(key, '')
+
+    def setSetting(self, key, value): _Addon.settings[key] = value
+
+    def getSettingBool(self, key): return _Addon.settings.get(key, 'false') == 'true'
+
+    def getSettingInt(self, key): return int(float(_Addon.settings.get(key) or 0))
+
+    def getSettingNumber(self, key): return float(_Addon.settings.get(key) or 0)
+
+    def getSettingString(self, key): return _Addon.settings.get(key, '')
+
+    def getLocalizedString(self, id): return ''
+
+# Returns a dictionary { setting id : default value string }
+def _load_default_settings():
+    settings = {}
+    xml_root = xml.etree.ElementTree.parse(os.path.join(ADDON_CODE_DIR, 'resources', 'settings.xml')).getroot()
+    for setting in xml_root.iter('setting'):
+        if 'id' not in setting.attrib: continue
+        settings[setting.attrib['id']] = setting.attrib.get('default', '')
+    return settings
+
+# Kodi Matrix, Estuary skin.
+def _executeJSONRPC(request_str):
+    request = json.loads(request_str)
+    if request['method'] == 'Application.GetProperties':
+        result = {
+            'name' : 'Kodi',
+            'version' : { 'major' : 19, 'minor' : 4, 'revision' : '', 'tag' : 'stable' },
+        }
+    elif request['method'] == 'Settings.GetSettingValue':
+        result = { 'value' : 'skin.estuary' }
+    else:
+        result = {}
+    return json.dumps({ 'id' : request.get('id', 1), 'jsonrpc' : '2.0', 'result' : result })
+
+def _translatePath(path):
+    if not path.lower().startswith('special://'): return path
+    return os.path.join(special_dir, *path[len('special://'):].split('/'))
+
+def _addDirectoryItem(handle, url, listitem, isFolder = False, totalItems = 0):
+    global num_directory_items
+    num_directory_items += 1
+    return True
+
+def _addDirectoryItems(handle, items, totalItems = 0):
+    global num_directory_items
+    num_directory_items += len(items)
+    return True
+
+def _make_module(name, attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    # Any other Kodi function or constant is a function that does nothing (PEP 562).
+    module.__getattr__ = lambda attr_name: _nop
+    return module
+
+# Installs the Kodi modules in sys.modules. If root_dir is None a temporary directory is
+# created. Returns the directory where special:// paths point to.
+def install(root_dir = None):
+    global special_dir
+    special_dir = root_dir if root_dir else tempfile.mkdtemp(prefix = 'AEL_kodi_')
+    sys.modules['xbmc'] = _make_module('xbmc', {
+        'LOGDEBUG' : 0, 'LOGINFO' : 1, 'LOGWARNING' : 2, 'LOGERROR' : 3, 'LOGFATAL' : 4,
+        'Monitor' : _Monitor, 'Player' : _Stub, 'Keyboard' : _Stub,
+        'getCondVisibility' : lambda condition: False,
+        'getInfoLabel' : lambda label: '',
+        'executeJSONRPC' : _executeJSONRPC,
+        'translatePath' : _translatePath,
+    })
+    sys.modules['xbmcaddon'] = _make_module('xbmcaddon', { 'Addon' : _Addon })
+    sys.modules['xbmcgui'] = _make_module('xbmcgui', {
+        'NOTIFICATION_INFO' : 'info', 'NOTIFICATION_WARNING' : 'warning', 'NOTIFICATION_ERROR' : 'error',
+        'Dialog' : _Stub, 'DialogProgress' : _DialogProgress, 'DialogProgressBG' : _DialogProgress,
+        'ListItem' : _Stub, 'Window' : _Stub,
+    })
+    sys.modules['xbmcplugin'] = _make_module('xbmcplugin', {
+        'addDirectoryItem' : _addDirectoryItem, 'addDirectoryItems' : _addDirectoryItems,
+    })
+    sys.modules['xbmcvfs'] = _make_module('xbmcvfs', {
+        'translatePath' : _translatePath, 'exists' : os.path.exists,
+    })
+    return special_dir
@@ -0,0 +1,180 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Test of the Favourites and ROM Collections ROM references.
+#
+# A synthetic launcher is written and some of its ROMs are added to Favourites and to a ROM
+# Collection, one of them edited. Rendering Favourites and the Collection must not load the
+# launcher database and must show the edited fields. The full ROMs must be resolved from the
+# launcher database. When a launcher ROM is edited and saved the snapshots must be refreshed.
+#
+# $ ./test_ROM_references.py
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.kodi as kodi
+import resources.db as db
+import resources.main as main
+
+# --- Python standard library ---
+import shutil
+
+# --- configuration ------------------------------------------------------------------------------
+num_roms = 20
+num_favs = 5
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR, cfg.VIRTUAL_ROMS_DIR, cfg.COLLECTIONS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    return cfg
+
+# Writes launchers.xml and the ROM database. Returns (category ID, launcher ID).
+def make_launcher(cfg):
+    category = db.new_category()
+    category['id'] = misc.generate_random_SID()
+    category['m_name'] = 'Test'
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['m_name'] = 'Test launcher'
+    launcher['categoryID'] = category['id']
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['rompath'] = os.path.join(kodi_dir, 'roms')
+    launcher['romext'] = 'zip'
+    launcher['roms_base_noext'] = 'test_launcher'
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:02d}'.format(i)
+        rom['m_plot'] = 'Plot of game {}.'.format(i)
+        rom['m_esrb'] = 'ESRB E'
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:02d}.zip'.format(i))
+        roms[rom['id']] = rom
+
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, category['id'], launcher['id'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+    db.get_ROM_db_filenames(cfg, st, category['id'], launcher['id'])
+    cfg.roms = roms
+    db.save_ROMs(cfg, st)
+    db.write_launchers_XML(cfg)
+    return (category['id'], launcher['id'])
+
+# Adds the first num_favs ROMs to Favourites and to a Collection. The first ROM is renamed.
+# Returns the Collection ID.
+def make_Favourites_and_Collection(cfg, categoryID, launcherID):
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, categoryID, launcherID)
+    db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+    db.load_ROMs(cfg, st)
+    launcher = cfg.launchers[launcherID]
+    fav_list = [db.get_Favourite_from_ROM(cfg.roms[romID], launcher) \
+        for romID in sorted(cfg.roms, key = lambda x : cfg.roms[x]['m_name'])[:num_favs]]
+    fav_list[0]['m_name'] = 'Edited name'
+    db.write_Favourite_ROMs(cfg, { rom['id'] : rom for rom in fav_list })
+    collection = db.new_collection()
+    collection['id'] = misc.generate_random_SID()
+    collection['m_name'] = 'Test collection'
+    collection['roms_base_noext'] = db.get_collection_ROMs_basename(collection['m_name'], collection['id'])
+    db.write_Collection_index_XML(cfg.COLLECTIONS_FILE_PATH, { collection['id'] : collection })
+    roms_FN = cfg.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
+    db.write_Collection_ROMs(cfg, roms_FN, fav_list)
+    return collection['id']
+
+# Counts the reads of the launcher ROM database.
+num_launcher_DB_reads = 0
+load_JSON_file = utils.load_JSON_file
+def counting_load_JSON_file(json_filename, *args, **kwargs):
+    global num_launcher_DB_reads
+    if os.path.basename(json_filename) == 'test_launcher.json': num_launcher_DB_reads += 1
+    return load_JSON_file(json_filename, *args, **kwargs)
+utils.load_JSON_file = counting_load_JSON_file
+
+# Loads the ROMs of a virtual launcher. Returns (roms, number of launcher database reads).
+def load_ROMs(categoryID, launcherID, resolve):
+    global num_launcher_DB_reads
+    cfg = make_cfg()
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, categoryID, launcherID)
+    db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+    num_launcher_DB_reads = 0
+    db.load_ROMs(cfg, st, resolve = resolve)
+    return (cfg.roms, num_launcher_DB_reads)
+
+# Renders a virtual launcher. Returns (number of rendered items, number of launcher database reads).
+def render_ROMs(categoryID, launcherID):
+    global num_launcher_DB_reads
+    cfg = make_cfg()
+    num_launcher_DB_reads = 0
+    kodi_stubs.num_directory_items = 0
+    main.render_ROMs(cfg, categoryID, launcherID)
+    return (kodi_stubs.num_directory_items, num_launcher_DB_reads)
+
+def sorted_names(roms):
+    return sorted(rom['m_name'] for rom in roms.values())
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_WARNING)
+cfg = make_cfg()
+categoryID, launcherID = make_launcher(cfg)
+collectionID = make_Favourites_and_Collection(cfg, categoryID, launcherID)
+fav_route = (const.VCATEGORY_SPECIAL_ID, const.VLAUNCHER_FAVOURITES_ID)
+col_route = (const.VCATEGORY_ROM_COLLECTION_ID, collectionID)
+
+for route_name, route in [('Favourites', fav_route), ('Collection', col_route)]:
+    num_items, num_reads = render_ROMs(*route)
+    check('{}: all ROMs rendered'.format(route_name), num_items == num_favs)
+    check('{}: render does not load the launcher database'.format(route_name), num_reads == 0)
+    render_roms, num_reads = load_ROMs(route[0], route[1], False)
+    check('{}: render ROMs have the edited name'.format(route_name), 'Edited name' in sorted_names(render_roms))
+    check('{}: render ROMs have the plot'.format(route_name),
+        all(rom['m_plot'].startswith('Plot of game') for rom in render_roms.values()))
+    check('{}: render ROMs status OK'.format(route_name),
+        all(rom['fav_status'] == 'OK' for rom in render_roms.values()))
+    full_roms, num_reads = load_ROMs(route[0], route[1], True)
+    check('{}: resolve loads the launcher database once'.format(route_name), num_reads == 1)
+    check('{}: resolved ROMs have the edited name'.format(route_name), sorted_names(full_roms) == sorted_names(render_roms))
+    check('{}: resolved ROMs are full ROMs'.format(route_name),
+        all(rom['m_esrb'] == 'ESRB E' for rom in full_roms.values()))
+
+# --- Edit the launcher ROMs. The snapshots are refreshed ---
+st = kodi.new_status_dic()
+db.load_db_index(cfg, st, categoryID, launcherID)
+db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+db.load_ROMs(cfg, st)
+for rom in cfg.roms.values(): rom['m_plot'] = 'New plot.'
+db.save_ROMs(cfg, st)
+for route_name, route in [('Favourites', fav_route), ('Collection', col_route)]:
+    render_roms, num_reads = load_ROMs(route[0], route[1], False)
+    check('{}: snapshots refreshed after a launcher save'.format(route_name),
+        all(rom['m_plot'] == 'New plot.' for rom in render_roms.values()))
+    check('{}: edited name kept after a launcher save'.format(route_name), 'Edited name' in sorted_names(render_roms))
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
@@ -0,0 +1,163 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Test of the play statistics render snapshots.
+#
+# Some ROMs of a synthetic launcher are launched, recorded with db.record_ROM_launch().
+# Rendering Recently played and Most played ROMs must not load the launcher database. Then
+# the snapshots are removed, like in the statistics of older AEL versions: the render must
+# resolve those ROMs and the database check must add the snapshots again.
+#
+# $ ./test_play_stats.py
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.const as const
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.kodi as kodi
+import resources.db as db
+import resources.main as main
+
+# --- Python standard library ---
+import shutil
+
+# --- configuration ------------------------------------------------------------------------------
+num_roms = 20
+num_played = 5
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR, cfg.VIRTUAL_ROMS_DIR, cfg.COLLECTIONS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    return cfg
+
+# Writes launchers.xml and the ROM database. Returns (category ID, launcher ID).
+def make_launcher(cfg):
+    category = db.new_category()
+    category['id'] = misc.generate_random_SID()
+    category['m_name'] = 'Test'
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['m_name'] = 'Test launcher'
+    launcher['categoryID'] = category['id']
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['rompath'] = os.path.join(kodi_dir, 'roms')
+    launcher['romext'] = 'zip'
+    launcher['roms_base_noext'] = 'test_launcher'
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:02d}'.format(i)
+        rom['m_plot'] = 'Plot of game {}.'.format(i)
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:02d}.zip'.format(i))
+        roms[rom['id']] = rom
+
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, category['id'], launcher['id'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+    db.get_ROM_db_filenames(cfg, st, category['id'], launcher['id'])
+    cfg.roms = roms
+    db.save_ROMs(cfg, st)
+    db.write_launchers_XML(cfg)
+    return (category['id'], launcher['id'])
+
+# Launches the first num_played ROMs, the first ROM i + 1 times. Returns { romID : name }.
+def launch_ROMs(cfg, categoryID, launcherID):
+    launcher = cfg.launchers[launcherID]
+    played_dic = {}
+    for i, romID in enumerate(sorted(cfg.roms, key = lambda x : cfg.roms[x]['m_name'])[:num_played]):
+        fav_rom = db.get_Favourite_from_ROM(cfg.roms[romID], launcher)
+        for j in range(i + 1): db.record_ROM_launch(cfg, categoryID, launcherID, romID, fav_rom)
+        played_dic[romID] = fav_rom['m_name']
+    return played_dic
+
+# Counts the reads of the launcher ROM database.
+num_launcher_DB_reads = 0
+load_JSON_file = utils.load_JSON_file
+def counting_load_JSON_file(json_filename, *args, **kwargs):
+    global num_launcher_DB_reads
+    if os.path.basename(json_filename) == 'test_launcher.json': num_launcher_DB_reads += 1
+    return load_JSON_file(json_filename, *args, **kwargs)
+utils.load_JSON_file = counting_load_JSON_file
+
+# Loads the ROMs of a play statistics virtual launcher for rendering.
+# Returns (roms, number of launcher database reads).
+def load_render_ROMs(launcherID):
+    global num_launcher_DB_reads
+    cfg = make_cfg()
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, const.VCATEGORY_SPECIAL_ID, launcherID)
+    db.get_ROM_db_filenames(cfg, st, const.VCATEGORY_SPECIAL_ID, launcherID)
+    num_launcher_DB_reads = 0
+    db.load_ROMs(cfg, st, resolve = False)
+    return (cfg.roms, num_launcher_DB_reads)
+
+# Renders a play statistics virtual launcher.
+# Returns (number of rendered items, number of launcher database reads).
+def render_ROMs(launcherID):
+    global num_launcher_DB_reads
+    cfg = make_cfg()
+    num_launcher_DB_reads = 0
+    kodi_stubs.num_directory_items = 0
+    main.render_ROMs(cfg, const.VCATEGORY_SPECIAL_ID, launcherID)
+    return (kodi_stubs.num_directory_items, num_launcher_DB_reads)
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_WARNING)
+cfg = make_cfg()
+categoryID, launcherID = make_launcher(cfg)
+played_dic = launch_ROMs(cfg, categoryID, launcherID)
+played_names = sorted(played_dic.values())
+
+for list_name, vlauncherID in [('Recently played', const.VLAUNCHER_RECENT_ID),
+    ('Most played', const.VLAUNCHER_MOST_PLAYED_ID)]:
+    num_items, num_reads = render_ROMs(vlauncherID)
+    check('{}: all ROMs rendered'.format(list_name), num_items == num_played)
+    check('{}: render does not load the launcher database'.format(list_name), num_reads == 0)
+    roms, num_reads = load_render_ROMs(vlauncherID)
+    check('{}: render ROMs have the name and plot'.format(list_name),
+        sorted(rom['m_name'] for rom in roms.values()) == played_names and \
+        all(rom['m_plot'].startswith('Plot of game') for rom in roms.values()))
+roms, num_reads = load_render_ROMs(const.VLAUNCHER_MOST_PLAYED_ID)
+check('Most played: ordered by launch count', [rom['launch_count'] for rom in roms.values()] == \
+    list(range(num_played, 0, -1)))
+
+# --- Statistics of an older AEL version, without snapshots ---
+stats = db.load_play_stats(cfg)
+for entry in stats['roms'].values(): del entry['snapshot']
+db.save_play_stats(cfg, stats)
+roms, num_reads = load_render_ROMs(const.VLAUNCHER_RECENT_ID)
+check('No snapshots: ROMs resolved from the launcher database',
+    sorted(rom['m_name'] for rom in roms.values()) == played_names and num_reads == 1)
+result = db.repair_play_stats(make_cfg())
+check('No snapshots: database check adds the snapshots', result['num_fixed'] == num_played)
+roms, num_reads = load_render_ROMs(const.VLAUNCHER_RECENT_ID)
+check('Repaired: render does not load the launcher database',
+    sorted(rom['m_name'] for rom in roms.values()) == played_names and num_reads == 0)
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
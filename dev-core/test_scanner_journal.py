@@ -0,0 +1,224 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Test of the ROM scanner journal, db.ScannerJournal.
+#
+# scan() follows the steps of main.command_rom_scanner() and journals the work with the same
+# ScannerJournal scanner step methods. A fake scraper counts the metadata and asset requests.
+# The scan is interrupted at every scanner stage, by a cancel of the progress dialog or by a kill
+# (an exception in the progress dialog or in the scraper), and then resumed. The resumed ROM
+# database must be the same as the one of an uninterrupted scan, and with a cancel no ROM must
+# be scraped twice.
+#
+# $ ./test_scanner_journal.py
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.misc as misc
+import resources.utils as utils
+import resources.db as db
+
+# --- Python standard library ---
+import io
+import shutil
+import tempfile
+
+# --- configuration ------------------------------------------------------------------------------
+NUM_OLD_ROMS = 10
+NUM_DEAD_ROMS = 3
+NUM_NEW_ROMS = 12
+STAGE_PENDING_ASSETS = 'pending_assets'
+
+class Interrupted(Exception): pass
+
+# interrupt is (stage, index of the item being processed, kind) or None. Kinds are 'cancel' (the
+# user cancels the progress dialog), 'kill' (killed when the progress dialog is checked) and
+# 'kill_assets' (killed while scraping the assets).
+class FakeProgressDialog(object):
+    def __init__(self, interrupt):
+        self.interrupt = interrupt
+        self.stage = None
+        self.index = -1
+
+    def startProgress(self, stage):
+        self.stage, self.index = stage, -1
+
+    def is_interrupt(self, kind): return self.interrupt == (self.stage, self.index, kind)
+
+    def updateProgressInc(self):
+        self.index += 1
+        if self.stage == db.SCANNER_STAGE_DEAD_ROMS and self.is_interrupt('kill'): raise Interrupted()
+
+    def isCanceled(self):
+        if self.is_interrupt('kill'): raise Interrupted()
+        return self.is_interrupt('cancel')
+
+# Counts the scraped ROMs. Interrupted scrapes are not counted.
+class FakeScraper(object):
+    def __init__(self):
+        self.pdialog = None
+        self.num_metadata = 0
+        self.num_assets = 0
+
+    def scanner_process_ROM_begin(self, rom, ROM, ROM_checksums): pass
+
+    def scanner_process_ROM_metadata(self, rom, ROM):
+        self.num_metadata += 1
+        rom['m_name'] = ROM.getBaseNoExt().replace('_', ' ')
+        rom['m_plot'] = 'Scraped plot of {}'.format(rom['m_name'])
+
+    def scanner_process_ROM_assets(self, rom, ROM):
+        if self.pdialog.is_interrupt('kill_assets'): raise Interrupted()
+        self.num_assets += 1
+        rom['s_title'] = '/assets/titles/{}.png'.format(ROM.getBaseNoExt())
+
+# Creates the ROM directory and the ROM database. Some ROMs in the database are dead.
+def make_launcher(root_dir):
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['rompath'] = os.path.join(root_dir, 'roms')
+    launcher['romext'] = 'zip'
+    os.makedirs(launcher['rompath'])
+    roms = {}
+    for i in range(NUM_OLD_ROMS + NUM_DEAD_ROMS):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Old game {:02d}'.format(i)
+        rom['filename'] = os.path.join(launcher['rompath'], 'Old_game_{:02d}.zip'.format(i))
+        if i < NUM_OLD_ROMS: io.open(rom['filename'], 'wb').close()
+        roms[rom['id']] = rom
+    for i in range(NUM_NEW_ROMS):
+        io.open(os.path.join(launcher['rompath'], 'New_game_{:02d}.zip'.format(i)), 'wb').close()
+    return (launcher, roms)
+
+# ROM scanner. roms_db is the ROM database on disk, only changed at the end of the scan.
+def scan(launcher, roms_db, journal_dir_FN, scraper, interrupt = None):
+    roms = dict((romID, dict(rom)) for romID, rom in roms_db.items())
+    pdialog = FakeProgressDialog(interrupt)
+    scraper.pdialog = pdialog
+    journal = db.ScannerJournal(journal_dir_FN, launcher)
+    pending_assets_list = []
+    if journal.load(): pending_assets_list = journal.apply(roms)
+
+    # --- Remove dead ROMs ---
+    pdialog.startProgress(db.SCANNER_STAGE_DEAD_ROMS)
+    journal.remove_dead_ROMs(roms, pdialog)
+
+    # --- Pending assets of the interrupted scan ---
+    pdialog.startProgress(STAGE_PENDING_ASSETS)
+    if not journal.scrape_pending_assets(roms, pending_assets_list, scraper, pdialog): return
+
+    # --- Process files ---
+    pdialog.startProgress(db.SCANNER_STAGE_ROMS)
+    rom_filename_set = set(rom['filename'] for rom in roms.values())
+    file_list = sorted(utils.FileName(launcher['rompath']).scanFilesInPath('*.*'))
+    for f_path in file_list:
+        pdialog.updateProgressInc()
+        if f_path in rom_filename_set: continue
+        ROM = utils.FileName(f_path)
+        romdata = db.new_rom()
+        romdata['id'] = misc.generate_random_SID()
+        romdata['filename'] = ROM.getOriginalPath()
+        journal.scrape_new_ROM(roms, romdata, ROM, ROM, scraper)
+        if journal.checkpoint_is_canceled(pdialog): return
+    journal.set_stage(db.SCANNER_STAGE_SAVE)
+    if interrupt == (db.SCANNER_STAGE_SAVE, 0, 'kill'): raise Interrupted()
+
+    # --- Save ROM database ---
+    roms_db.clear()
+    roms_db.update(roms)
+    journal.delete()
+
+# ROM IDs are random and every test has its own ROM path, so ROM databases are compared by
+# ROM file base name.
+def ROMs_by_filename(roms):
+    return dict((os.path.basename(rom['filename']), (rom['m_name'], rom['m_plot'], rom['s_title'])) \
+        for rom in roms.values())
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_WARNING)
+root_dir = tempfile.mkdtemp(prefix = 'AEL_test_')
+journal_dir_FN = utils.FileName(root_dir).pjoin('scanner_journal')
+
+# --- Uninterrupted scan ---
+launcher, roms_db = make_launcher(os.path.join(root_dir, 'reference'))
+scraper = FakeScraper()
+scan(launcher, roms_db, journal_dir_FN, scraper)
+reference = ROMs_by_filename(roms_db)
+check('Uninterrupted scan finds {} ROMs'.format(NUM_OLD_ROMS + NUM_NEW_ROMS),
+    len(reference) == NUM_OLD_ROMS + NUM_NEW_ROMS)
+check('Uninterrupted scan deletes the journal', not os.listdir(journal_dir_FN.getPath()))
+
+# --- Interrupted and resumed scans ---
+interrupt_list = [
+    (db.SCANNER_STAGE_DEAD_ROMS, 5, 'kill'),
+    (db.SCANNER_STAGE_ROMS, 4, 'kill_assets'),
+    (db.SCANNER_STAGE_ROMS, 7, 'cancel'),
+    (db.SCANNER_STAGE_ROMS, 7, 'kill'),
+    (db.SCANNER_STAGE_SAVE, 0, 'kill'),
+]
+for checkpoint_interval in [0, 3600]:
+    db.SCANNER_JOURNAL_CHECKPOINT_INTERVAL = checkpoint_interval
+    for interrupt in interrupt_list:
+        test_name = '{} at {} {}, checkpoint interval {}'.format(
+            interrupt[2].replace('_', ' ').capitalize(), interrupt[0], interrupt[1], checkpoint_interval)
+        launcher, roms_db = make_launcher(os.path.join(root_dir, misc.generate_random_SID()))
+        old_roms_db = dict(roms_db)
+        scraper = FakeScraper()
+        try:
+            scan(launcher, roms_db, journal_dir_FN, scraper, interrupt)
+        except Interrupted:
+            pass
+        check(test_name + ': database not changed', roms_db == old_roms_db)
+        scan(launcher, roms_db, journal_dir_FN, scraper)
+        check(test_name + ': resumed scan equals uninterrupted scan', ROMs_by_filename(roms_db) == reference)
+        check(test_name + ': journal deleted', not os.listdir(journal_dir_FN.getPath()))
+        # A cancel forces a checkpoint, so no ROM is scraped twice. A kill loses the work done
+        # after the last checkpoint, with checkpoints after every step at most one ROM.
+        if interrupt[2] == 'cancel':
+            check(test_name + ': no ROM scraped twice',
+                scraper.num_metadata == NUM_NEW_ROMS and scraper.num_assets == NUM_NEW_ROMS)
+        elif checkpoint_interval == 0:
+            check(test_name + ': at most one ROM scraped twice',
+                scraper.num_metadata <= NUM_NEW_ROMS + 1 and scraper.num_assets <= NUM_NEW_ROMS + 1)
+
+# --- Interrupted twice, the second time while scraping the pending assets ---
+db.SCANNER_JOURNAL_CHECKPOINT_INTERVAL = 0
+launcher, roms_db = make_launcher(os.path.join(root_dir, 'twice'))
+scraper = FakeScraper()
+for interrupt in [(db.SCANNER_STAGE_ROMS, 4, 'kill_assets'), (STAGE_PENDING_ASSETS, 0, 'kill_assets')]:
+    try:
+        scan(launcher, roms_db, journal_dir_FN, scraper, interrupt)
+    except Interrupted:
+        pass
+scan(launcher, roms_db, journal_dir_FN, scraper)
+check('Interrupted twice: resumed scan equals uninterrupted scan', ROMs_by_filename(roms_db) == reference)
+check('Interrupted twice: no ROM scraped twice',
+    scraper.num_metadata == NUM_NEW_ROMS and scraper.num_assets == NUM_NEW_ROMS)
+
+# --- Journal of a launcher whose ROM path changed is discarded ---
+launcher, roms_db = make_launcher(os.path.join(root_dir, 'changed'))
+try:
+    scan(launcher, roms_db, journal_dir_FN, FakeScraper(), ('assets', 7, 'cancel'))
+except Interrupted:
+    pass
+launcher['rompath'] = os.path.join(root_dir, 'changed', 'other')
+check('Journal discarded if ROM path changed', not db.ScannerJournal(journal_dir_FN, launcher).load())
+shutil.rmtree(root_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
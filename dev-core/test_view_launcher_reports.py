@@ -0,0 +1,110 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Test of the launcher Metadata and Asset reports of the View menu, main.command_view_menu().
+#
+# A synthetic launcher is written and the View menu of the launcher is run with the select
+# dialog returning the report entries. The text window must show every ROM of the launcher.
+#
+# $ ./test_view_launcher_reports.py
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.misc as misc
+import resources.kodi as kodi
+import resources.db as db
+import resources.main as main
+
+# --- Python standard library ---
+import shutil
+
+# --- configuration ------------------------------------------------------------------------------
+num_roms = 20
+# Rows of the launcher View menu.
+MENU_METADATA_REPORT = 2
+MENU_ASSET_REPORT = 3
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR, cfg.VIRTUAL_ROMS_DIR, cfg.COLLECTIONS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    return cfg
+
+# Writes launchers.xml and the ROM database. Returns (category ID, launcher ID).
+def make_launcher(cfg):
+    category = db.new_category()
+    category['id'] = misc.generate_random_SID()
+    category['m_name'] = 'Test'
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['m_name'] = 'Test launcher'
+    launcher['categoryID'] = category['id']
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['rompath'] = os.path.join(kodi_dir, 'roms')
+    launcher['romext'] = 'zip'
+    launcher['roms_base_noext'] = 'test_launcher'
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:02d}'.format(i)
+        rom['m_plot'] = 'Plot of game {}.'.format(i)
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:02d}.zip'.format(i))
+        roms[rom['id']] = rom
+
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, category['id'], launcher['id'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+    db.get_ROM_db_filenames(cfg, st, category['id'], launcher['id'])
+    cfg.roms = roms
+    db.save_ROMs(cfg, st)
+    db.write_launchers_XML(cfg)
+    return (category['id'], launcher['id'])
+
+# Runs the launcher View menu selecting menu_row. Returns (window title, text) or None.
+def view_report(categoryID, launcherID, menu_row):
+    window_list = []
+    kodi.SelectDialog.executeDialog = lambda self : menu_row
+    main.kodi.display_text_window_mono = lambda title, text : window_list.append((title, text))
+    cfg = make_cfg()
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st)
+    main.command_view_menu(cfg, categoryID, launcherID, None)
+    return window_list[0] if window_list else None
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_WARNING)
+categoryID, launcherID = make_launcher(make_cfg())
+game_list = ['Game {:02d}'.format(i) for i in range(num_roms)]
+
+for menu_row, report_name in [(MENU_METADATA_REPORT, 'Metadata'), (MENU_ASSET_REPORT, 'Asset')]:
+    window = view_report(categoryID, launcherID, menu_row)
+    check('{} report shown'.format(report_name), window is not None)
+    if window is None: continue
+    check('{} report title'.format(report_name), window[0] == 'Launcher "Test launcher" {} Report'.format(report_name))
+    check('{} report has every ROM'.format(report_name), all(game in window[1] for game in game_list))
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
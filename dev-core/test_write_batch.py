@@ -0,0 +1,117 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Test of the database write batch in dry run mode, db.WriteBatch().
+#
+# A synthetic launcher is written and then loaded and saved again inside a dry run batch.
+# Nothing changed, so no file must be reported as changed, even if the batch flush updates
+# the launcher timestamps. Then a ROM is changed and only the ROM database must be reported.
+#
+# $ ./test_write_batch.py
+
+# --- Kodi stubs. Must be installed before importing AEL modules ---
+import kodi_stubs
+kodi_dir = kodi_stubs.install()
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.misc as misc
+import resources.kodi as kodi
+import resources.db as db
+import resources.main as main
+
+# --- Python standard library ---
+import shutil
+
+# --- configuration ------------------------------------------------------------------------------
+num_roms = 20
+
+def make_cfg():
+    cfg = main.Configuration()
+    main.get_settings(cfg)
+    main.get_settings_log_enabled(cfg)
+    for dir_FN in [cfg.ADDON_DATA_DIR, cfg.ROMS_DIR, cfg.VIRTUAL_ROMS_DIR, cfg.COLLECTIONS_DIR]:
+        if not dir_FN.exists(): dir_FN.makedirs()
+    return cfg
+
+# Writes launchers.xml and the ROM database. Returns (category ID, launcher ID).
+def make_launcher(cfg):
+    category = db.new_category()
+    category['id'] = misc.generate_random_SID()
+    category['m_name'] = 'Test'
+    launcher = db.new_launcher()
+    launcher['id'] = misc.generate_random_SID()
+    launcher['m_name'] = 'Test launcher'
+    launcher['categoryID'] = category['id']
+    launcher['platform'] = 'Nintendo SNES'
+    launcher['rompath'] = os.path.join(kodi_dir, 'roms')
+    launcher['romext'] = 'zip'
+    launcher['roms_base_noext'] = 'test_launcher'
+    roms = {}
+    for i in range(num_roms):
+        rom = db.new_rom()
+        rom['id'] = misc.generate_random_SID()
+        rom['m_name'] = 'Game {:02d}'.format(i)
+        rom['m_plot'] = 'Plot of game {}.\nSecond line.'.format(i)
+        rom['filename'] = os.path.join(launcher['rompath'], 'Game {:02d}.zip'.format(i))
+        roms[rom['id']] = rom
+
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, category['id'], launcher['id'])
+    cfg.categories = { category['id'] : category }
+    cfg.launchers = { launcher['id'] : launcher }
+    db.get_ROM_db_filenames(cfg, st, category['id'], launcher['id'])
+    cfg.roms = roms
+    db.save_ROMs(cfg, st)
+    return (category['id'], launcher['id'])
+
+# Loads and saves the launcher ROMs in a dry run batch. Returns the batch.
+def dry_run_save(cfg, categoryID, launcherID, edit_function = None):
+    with db.WriteBatch(cfg, dry_run = True) as batch:
+        st = kodi.new_status_dic()
+        db.load_db_index(cfg, st, categoryID, launcherID)
+        db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+        db.load_ROMs(cfg, st)
+        if edit_function: edit_function(cfg.roms)
+        db.save_ROMs(cfg, st)
+        db.write_launchers_XML(cfg)
+    return batch
+
+def edit_ROM(roms):
+    rom = roms[sorted(roms)[0]]
+    rom['m_name'] = rom['m_name'] + ' (edited)'
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_WARNING)
+cfg = make_cfg()
+categoryID, launcherID = make_launcher(cfg)
+launchers_XML_mtime = os.path.getmtime(cfg.CATEGORIES_FILE_PATH.getPath())
+
+batch = dry_run_save(cfg, categoryID, launcherID)
+check('No-op dry run: database writes recorded', batch.num_writes > 0)
+check('No-op dry run: zero changed files', batch.changed_files == [])
+for fname in batch.changed_files: print('      Changed "{}"'.format(fname))
+
+batch = dry_run_save(cfg, categoryID, launcherID, edit_ROM)
+ROMs_FN = cfg.ROMS_DIR.pjoin('test_launcher.json')
+check('Edited ROM dry run: only the ROM database changed', batch.changed_files == [ROMs_FN.getPath()])
+check('Dry run: launchers.xml not written',
+    os.path.getmtime(cfg.CATEGORIES_FILE_PATH.getPath()) == launchers_XML_mtime)
+shutil.rmtree(kodi_dir)
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
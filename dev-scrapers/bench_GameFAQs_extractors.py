@@ -0,0 +1,127 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Benchmark and test of the GameFAQs page extractors against the old regular expressions,
+# which were compiled on every call.
+#
+# The extractors must return the same results as the old regular expressions. The test pages are
+# synthetic pages that reproduce the GameFAQs markup the old regular expressions match. To
+# benchmark real pages replace them with the pages saved by the scraper debug file dump, for
+# example by running test_GameFAQs_metadata.py and test_GameFAQs_asset.py.
+#
+# assets/GameFAQs_get_candidates.html
+# assets/GameFAQs_get_metadata.html
+# assets/GameFAQs_load_assets_from_page.html
+#
+# $ ./bench_GameFAQs_extractors.py [num_iterations]
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.misc as misc
+import resources.scrap as scrap
+
+# --- Python standard library ---
+import io
+import re
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+# --- Old regular expression extractors ----------------------------------------------------------
+# Copied from the GameFAQs scraper before the page extractors were introduced. Page data is
+# joined into one line like network.get_URL_oneline() does. The regex_*_result() functions
+# convert the matches into the extractor results like the old scraper code did.
+def regex_candidates(page_data):
+    r = r'<div class="sr_cell sr_platform">(.*?)</div>\s*<div class="sr_cell sr_title"><a class="log_search" data-row="[0-9]+" data-col="1" data-pid="[0-9]+" href="(.*?)">(.*?)</a></div>'
+    return re.findall(r, page_data, re.MULTILINE)
+
+def regex_metadata(page_data):
+    m_date = re.search('<li><b>Release:</b> <a href=".*?">(.*?)</a></li>', page_data)
+    m_genre = re.search('<li><b>Genre:</b> <a href=".*?">(.*?)</a>', page_data)
+    m_dev_a = re.search('<li><b>Developer/Publisher: </b><a href=".*?">(.*?)</a></li>', page_data)
+    m_dev_b = re.search('<li><b>Developer: </b><a href=".*?">(.*?)</a></li>', page_data)
+    m_plot = re.search('"description":"(.*?)",', page_data)
+    return (m_date, m_genre, m_dev_a, m_dev_b, m_plot)
+
+def regex_assets(page_data):
+    r_str = '<div class="head"><h2 class="title">([\w\s]+?)</h2></div><div class="body"><table class="contrib">(.*?)</table></div>'
+    r_img = '<a href="(?P<lnk>.+?)"><img class="(img100\s)?imgboxart" src="(?P<thumb>.+?)" (alt="(?P<alt>.+?)")?\s?/></a>'
+    return [(block[0], list(re.finditer(r_img, block[1]))) for block in re.findall(r_str, page_data)]
+
+def regex_candidates_result(page_data):
+    return [(r[0], r[1], misc.unescape_HTML(r[2])) for r in regex_candidates(page_data)]
+
+def regex_metadata_result(page_data):
+    m_date, m_genre, m_dev_a, m_dev_b, m_plot = regex_metadata(page_data)
+    m_year = re.search(r'\d\d\d\d', m_date.group(1)) if m_date else None
+    if   m_dev_a: developer = m_dev_a.group(1)
+    elif m_dev_b: developer = m_dev_b.group(1)
+    else:         developer = ''
+    return {
+        'year' : m_year.group(0) if m_year else '',
+        'genre' : m_genre.group(1) if m_genre else '',
+        'developer' : developer,
+        'plot' : misc.unescape_HTML(m_plot.group(1)) if m_plot else '',
+    }
+
+def regex_assets_result(page_data):
+    return [(title, [(m.group('lnk'), m.group('thumb'), m.group('alt') or '') for m in m_list])
+        for title, m_list in regex_assets(page_data)]
+
+page_table = [
+    # (page file name, regex result function, page extractor)
+    ('GameFAQs_get_candidates.html', regex_candidates_result, scrap.GameFAQs_parse_search_page),
+    ('GameFAQs_get_metadata.html', regex_metadata_result, scrap.GameFAQs_parse_game_page),
+    ('GameFAQs_load_assets_from_page.html', regex_assets_result, scrap.GameFAQs_parse_images_page),
+]
+
+num_tests = 0
+num_errors = 0
+def check(test_name, condition):
+    global num_tests, num_errors
+    num_tests += 1
+    if not condition: num_errors += 1
+    print('{} {}'.format('OK   ' if condition else 'ERROR', test_name))
+
+# --- main ---------------------------------------------------------------------------------------
+num_iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+log.set_log_level(log.LOG_INFO)
+for fname, regex_result_function, parse_function in page_table:
+    fpath = os.path.join(ASSETS_DIR, fname)
+    with io.open(fpath, 'rt', encoding = 'utf-8') as file:
+        page_data = file.read()
+    print('Page {} ({:,} bytes, {} iterations)'.format(fname, len(page_data), num_iterations))
+
+    start_time = time.time()
+    for i in range(num_iterations):
+        oneline_data = page_data.replace('\r\n', '').replace('\n', '')
+        regex_result = regex_result_function(oneline_data)
+    regex_time = time.time() - start_time
+
+    start_time = time.time()
+    for i in range(num_iterations):
+        oneline_data = page_data.replace('\r\n', '').replace('\n', '')
+        result = parse_function(oneline_data)
+    extractor_time = time.time() - start_time
+
+    print('  Old regular expressions {:.4f} s'.format(regex_time))
+    print('  Page extractor          {:.4f} s'.format(extractor_time))
+    print('  Extractor returned {} items'.format(len(result)))
+
+    check('{} extractor finds data'.format(fname), len(result) > 0)
+    check('{} extractor same as regular expressions'.format(fname), result == regex_result)
+
+# --- Plot HTML entities ---
+result = scrap.GameFAQs_parse_game_page(
+    '<script type="application/ld+json">{"description":"Samus&#039; &quot;mission&quot;",}</script>')
+check('Plot HTML entities unescaped', result['plot'] == 'Samus\' "mission"')
+
+print('{} tests, {} errors'.format(num_tests, num_errors))
+if num_errors: sys.exit(1)
@@ -0,0 +1,86 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Benchmark the ScreenScraper JSON decoding: the old decode/repair/retry loop against
+# misc.decode_tolerant_JSON().
+#
+# Payloads are the ScreenScraper pages recorded with bench_scrapers_replay.py in the
+# fixtures/ScreenScraper directory. For every payload a broken version with a trailing comma
+# is also benchmarked. The old code only repaired some trailing comma patterns. Record the
+# fixtures first with network access:
+#
+# $ ./bench_scrapers_replay.py record ScreenScraper 10
+#
+# $ ./bench_ScreenScraper_JSON.py [num_iterations]
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.misc as misc
+
+# --- Python standard library ---
+import io
+import json
+import time
+
+# --- configuration ------------------------------------------------------------------------------
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'ScreenScraper')
+
+# Copied from ScreenScraper._retrieve_URL_as_JSON() before decode_tolerant_JSON().
+def old_decode(page_data_raw):
+    try:
+        return json.loads(page_data_raw)
+    except Exception:
+        pass
+    new_page_data_raw = page_data_raw.replace('],\n\t\t}', ']\n\t\t}')
+    try:
+        return json.loads(new_page_data_raw)
+    except Exception:
+        pass
+    new_page_data_raw = page_data_raw.replace('\t\t},\n\t\t}', '\t\t}\n\t\t}')
+    return json.loads(new_page_data_raw)
+
+def bench(function, payload, num_iterations):
+    start_time = time.time()
+    for i in range(num_iterations): function(payload)
+    return time.time() - start_time
+
+# --- main ---------------------------------------------------------------------------------------
+num_iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+log.set_log_level(log.LOG_INFO)
+payload_list = []
+if os.path.isdir(FIXTURE_DIR):
+    for fname in sorted(os.listdir(FIXTURE_DIR)):
+        fixture_FN = os.path.join(FIXTURE_DIR, fname)
+        if not os.path.isfile(fixture_FN): continue
+        with io.open(fixture_FN, 'rt', encoding = 'utf-8') as file:
+            fixture = json.load(file)
+        if 'screenscraper' not in fixture['url'] or fixture['http_code'] != 200: continue
+        if not fixture['page_data'].lstrip().startswith('{'): continue
+        payload_list.append((fixture['url'], fixture['page_data']))
+print('Found {} ScreenScraper payloads in "{}"'.format(len(payload_list), FIXTURE_DIR))
+
+table_str = [
+    ['left', 'right', 'left', 'right', 'right'],
+    ['URL', 'Bytes', 'Payload', 'Old (s)', 'Tolerant (s)'],
+]
+for url, payload in payload_list:
+    # Add a trailing comma before the last '}', like the broken JSON SS sometimes returns.
+    broken_payload = payload.rstrip()[:-1].rstrip() + ',\n}'
+    for payload_name, data in [('valid', payload), ('broken', broken_payload)]:
+        try:
+            old_time = '{:.4f}'.format(bench(old_decode, data, num_iterations))
+        except ValueError:
+            old_time = 'error'
+        try:
+            new_time = '{:.4f}'.format(bench(misc.decode_tolerant_JSON, data, num_iterations))
+        except ValueError:
+            new_time = 'error'
+        table_str.append([misc.limit_string(url, 60), '{:,}'.format(len(data)), payload_name,
+            old_time, new_time])
+print('\n'.join(misc.render_table(table_str)))
@@ -0,0 +1,144 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Offline scraper benchmark using recorded HTTP fixtures.
+#
+# The scrapers are driven with the same sequence of calls the ROM scanner does in
+# ScrapeStrategy._scanner_get_candidate(), _scanner_scrap_ROM_metadata() and
+# _scanner_scrap_ROM_asset(), over N synthetic ROMs built from the games in common.py.
+# Synthetic ROMs repeat when N is bigger than the number of test games, so repeated ROMs
+# exercise the scraper disk cache.
+#
+# The ROM files are created in a temporary directory, because ScreenScraper searches
+# by checksum. Every scraper has its own fixtures directory, fixtures/<scraper name>.
+# First record the fixtures with network access, then replay them offline:
+#
+# $ ./bench_scrapers_replay.py record MobyGames 10
+# $ ./bench_scrapers_replay.py replay MobyGames 1000
+#
+# Only the MobyGames scraper is benchmarked, because it is the only scraper with committed
+# fixtures. They are made from the MobyGames API responses in assets/ by
+# make_MobyGames_fixtures.py. To benchmark another scraper record its fixtures and add it
+# to scraper_table.
+#
+# Scraper names: MobyGames, all.
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.utils as utils
+import resources.kodi as kodi
+import resources.misc as misc
+import resources.network as network
+import resources.scrap as scrap
+import common
+
+# --- Python standard library ---
+import io
+import shutil
+import tempfile
+import time
+import zipfile
+
+# --- configuration ------------------------------------------------------------------------------
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+scraper_table = [
+    # (name, class, game keys)
+    ('MobyGames', scrap.MobyGames, ['castlevania']),
+]
+
+# --- functions ----------------------------------------------------------------------------------
+# Scrape num_roms synthetic ROMs. Returns a dictionary with the benchmark results.
+def bench_scraper(scraper_class, game_keys, num_roms):
+    cache_dir = tempfile.mkdtemp(prefix = 'AEL_bench_')
+    settings = dict(common.settings)
+    settings['scraper_cache_dir'] = cache_dir
+    # ROM contents are always the same so the ScreenScraper checksums do not change.
+    # ScreenScraper uses the checksums of the file inside ZIP files.
+    for game_key in game_keys:
+        rombase = common.games[game_key][1]
+        rom_path = os.path.join(cache_dir, rombase)
+        if rombase.lower().endswith('.zip'):
+            with zipfile.ZipFile(rom_path, 'w') as zip:
+                zip.writestr(rombase[:-4] + '.bin', rombase.encode('utf-8'))
+        else:
+            with io.open(rom_path, 'wb') as file:
+                file.write(rombase.encode('utf-8'))
+    scraper = scraper_class(settings)
+    scraper.set_verbose_mode(False)
+    network.reset_transport_stats()
+    cache_hits, errors = 0, 0
+    start_time = time.time()
+    for i in range(num_roms):
+        search_term, rombase, platform = common.games[game_keys[i % len(game_keys)]]
+        st = kodi.new_status_dic()
+        rom_FN = utils.FileName(os.path.join(cache_dir, rombase))
+        if scraper.check_candidates_cache(rom_FN, platform):
+            cache_hits += 1
+            scraper.set_candidate_from_cache(rom_FN, platform)
+        else:
+            scraper.clear_cache(rom_FN, platform)
+            candidates = scraper.get_candidates(search_term, rom_FN, rom_FN, platform, st)
+            if st['abort'] or candidates is None:
+                errors += 1
+                scraper.set_candidate(rom_FN, platform, None)
+                continue
+            scraper.set_candidate(rom_FN, platform, candidates[0] if candidates else dict())
+        if scraper.supports_metadata():
+            scraper.get_metadata(st)
+        if scraper.supports_assets():
+            for asset_ID in scraper_class.supported_asset_list:
+                asset_list = scraper.get_assets(asset_ID, st)
+                if asset_list: scraper.resolve_asset_URL(asset_list[0], st)
+        if st['abort']: errors += 1
+    scraper.flush_disk_cache()
+    wall_time = time.time() - start_time
+    shutil.rmtree(cache_dir)
+
+    return {
+        'roms' : num_roms,
+        'requests' : network.transport_stats['requests'],
+        'bytes' : network.transport_stats['bytes'],
+        'misses' : network.transport_stats['fixture_misses'],
+        'hit_rate' : 100.0 * cache_hits / num_roms if num_roms else 0.0,
+        'errors' : errors,
+        'wall_time' : wall_time,
+    }
+
+# --- main ---------------------------------------------------------------------------------------
+if len(sys.argv) < 4 or sys.argv[1] not in ('record', 'replay'):
+    print('Usage: bench_scrapers_replay.py record|replay <scraper|all> <num_roms>')
+    sys.exit(1)
+mode, scraper_name, num_roms = sys.argv[1], sys.argv[2], int(sys.argv[3])
+if scraper_name != 'all' and scraper_name not in [name for name, c, k in scraper_table]:
+    print('Unknown scraper {}. Only MobyGames has fixtures.'.format(scraper_name))
+    sys.exit(1)
+log.set_log_level(log.LOG_INFO)
+table_str = [
+    ['left', 'right', 'right', 'right', 'right', 'right', 'right', 'right'],
+    ['Scraper', 'ROMs', 'Requests', 'Bytes', 'Fixture misses', 'Cache hit %', 'Errors', 'Time (s)'],
+]
+for name, scraper_class, game_keys in scraper_table:
+    if scraper_name != 'all' and scraper_name != name: continue
+    scraper_fixture_dir = os.path.join(FIXTURE_DIR, name)
+    if mode == 'record':
+        network.set_transport(network.TRANSPORT_RECORD, scraper_fixture_dir)
+    elif os.path.isdir(scraper_fixture_dir):
+        network.set_transport(network.TRANSPORT_REPLAY, scraper_fixture_dir)
+    else:
+        print('No fixtures for scraper {}. Record them first. Skipping.'.format(name))
+        continue
+    print('Benchmarking scraper {} ({} ROMs, {})...'.format(name, num_roms, mode))
+    r = bench_scraper(scraper_class, game_keys, num_roms)
+    table_str.append([
+        name, '{:,}'.format(r['roms']), '{:,}'.format(r['requests']), '{:,}'.format(r['bytes']),
+        '{:,}'.format(r['misses']), '{:.1f}'.format(r['hit_rate']), '{:,}'.format(r['errors']),
+        '{:.3f}'.format(r['wall_time']),
+    ])
+print('')
+print('\n'.join(misc.render_table(table_str)))
@@ -0,0 +1,47 @@
+#!/usr/bin/python3 -B
+# -*- coding: utf-8 -*-
+
+# Makes the bench_scrapers_replay.py fixtures of the MobyGames scraper from the MobyGames API
+# responses in assets/. The responses are for the game Castlevania (game ID 2062) in the
+# Nintendo NES platform (MobyGames platform ID 22), which is common.games['castlevania'].
+# Fixtures are keyed by the URL with the API key removed, so they replay with any API key.
+#
+# $ ./make_MobyGames_fixtures.py
+
+# --- Import AEL modules ---
+import os
+import sys
+if __name__ == "__main__" and __package__ is None:
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    print('Adding to sys.path {}'.format(path))
+    sys.path.append(path)
+import resources.log as log
+import resources.network as network
+import resources.scrap as scrap
+
+# --- Python standard library ---
+import io
+
+# --- configuration ------------------------------------------------------------------------------
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'MobyGames')
+fixture_table = [
+    # (URL without API key, response file in assets/)
+    (scrap.MobyGames.URL_games + '?api_key=***&format=brief&title=Castlevania&platform=22',
+        'mobygames_castlevania_list.json'),
+    (scrap.MobyGames.URL_games + '/2062?api_key=***', 'mobygames_castlevania.json'),
+    (scrap.MobyGames.URL_games + '/2062/platforms/22/screenshots?api_key=***',
+        'mobygames_castlevania_screenshots.json'),
+    (scrap.MobyGames.URL_games + '/2062/platforms/22/covers?api_key=***',
+        'mobygames_castlevania_covers.json'),
+]
+
+# --- main ---------------------------------------------------------------------------------------
+log.set_log_level(log.LOG_INFO)
+network.set_transport(network.TRANSPORT_RECORD, FIXTURE_DIR)
+for url_log, fname in fixture_table:
+    with io.open(os.path.join(ASSETS_DIR, fname), 'rt', encoding = 'utf-8') as file:
+        page_data = file.read()
+    network._record_fixture(url_log, url_log, None, page_data, 200, False)
+    print('Fixture of "{}" made from {}'.format(url_log, fname))
+network.set_transport(network.TRANSPORT_LIVE)
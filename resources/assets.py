@@ -204,8 +204,8 @@ def get_ROM_path_noext(object_dic, data_dic, asset_ID):
 #
 # Returns a Unicode string
 def get_collection_asset_basename(AInfo, basename_noext, platform, ext):
-    pindex = get_AEL_platform_index(platform)
-    platform_compact_name = AEL_platforms[pindex].compact_name
+    pindex = platforms.get_AEL_platform_index(platform)
+    platform_compact_name = platforms.AEL_platforms[pindex].compact_name
     return basename_noext + '_' + platform_compact_name + '_' + AInfo.fname_infix + ext
 
 # Get a list of enabled assets.
@@ -213,11 +213,11 @@ def get_collection_asset_basename(AInfo, basename_noext, platform, ext):
 # Returns tuple:
 # configured_bool_list    List of boolean values. It has all assets defined in ROM_ASSET_ID_LIST
 def get_enabled_asset_list(launcher):
-    configured_bool_list = [False] * len(ROM_ASSET_ID_LIST)
+    configured_bool_list = [False] * len(const.ROM_ASSET_ID_LIST)
 
     # Check if asset paths are configured or not
-    for i, asset in enumerate(ROM_ASSET_ID_LIST):
-        A = assets_get_info_scheme(asset)
+    for i, asset in enumerate(const.ROM_ASSET_ID_LIST):
+        A = ASSET_INFO_DICT[asset]
         configured_bool_list[i] = True if launcher[A.path_key] else False
         if not configured_bool_list[i]:
             log.debug('asset_get_enabled_asset_list() {:<9} path unconfigured'.format(A.name))
@@ -228,21 +228,21 @@ def get_enabled_asset_list(launcher):
 # unconfigured_name_list  List of disabled asset names
 def get_unconfigured_name_list(configured_bool_list):
     unconfigured_name_list = []
-    for i, asset in enumerate(ROM_ASSET_ID_LIST):
-        A = assets_get_info_scheme(asset)
+    for i, asset in enumerate(const.ROM_ASSET_ID_LIST):
+        A = ASSET_INFO_DICT[asset]
         if not configured_bool_list[i]:
             unconfigured_name_list.append(A.name)
     return unconfigured_name_list
 
 # Get a list of assets with duplicated paths. Refuse to do anything if duplicated paths found.
 def get_duplicated_dir_list(launcher):
-    duplicated_bool_list = [False] * len(ROM_ASSET_ID_LIST)
+    duplicated_bool_list = [False] * len(const.ROM_ASSET_ID_LIST)
     duplicated_name_list = []
     # Check for duplicated asset paths
-    for i, asset_i in enumerate(ROM_ASSET_ID_LIST[:-1]):
-        A_i = get_info_scheme(asset_i)
-        for j, asset_j in enumerate(ROM_ASSET_ID_LIST[i+1:]):
-            A_j = get_info_scheme(asset_j)
+    for i, asset_i in enumerate(const.ROM_ASSET_ID_LIST[:-1]):
+        A_i = ASSET_INFO_DICT[asset_i]
+        for j, asset_j in enumerate(const.ROM_ASSET_ID_LIST[i+1:]):
+            A_j = ASSET_INFO_DICT[asset_j]
             # Exclude unconfigured assets (empty strings).
             if not launcher[A_i.path_key] or not launcher[A_j.path_key]: continue
             # log.debug('asset_get_duplicated_asset_list() Checking {0:<9} vs {1:<9}'.format(A_i.name, A_j.name))
@@ -268,7 +268,7 @@ def search_local_cached_assets(launcher, ROMFile, enabled_ROM_ASSET_ID_LIST):
         if not enabled_ROM_ASSET_ID_LIST[i]:
             log.debug('Disabled {:<9}'.format(AInfo.name))
             continue
-        local_asset = utils_file_cache_search(launcher[AInfo.path_key], rom_basename_noext, AInfo.exts)
+        local_asset = utils.file_cache_search(launcher[AInfo.path_key], rom_basename_noext, AInfo.exts)
         if local_asset:
             local_asset_list[i] = local_asset.getOriginalPath()
             log.debug('Found    {:<9} "{}"'.format(AInfo.name, local_asset_list[i]))
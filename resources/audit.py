@@ -17,21 +17,36 @@
 import resources.const as const
 import resources.log as log
 import resources.misc as misc
+import resources.utils as utils
+import resources.platforms as platforms
 
 # --- Python standard library ---
+import hashlib
 import os
+import re
 import xml
+import zipfile
+import zlib
+if const.ADDON_RUNNING_PYTHON_2:
+    import cPickle as pickle
+elif const.ADDON_RUNNING_PYTHON_3:
+    import pickle
+else:
+    raise TypeError('Undefined Python runtime version.')
 
 # -------------------------------------------------------------------------------------------------
 # Data structures
 # -------------------------------------------------------------------------------------------------
 # DTD "http://www.logiqx.com/Dats/datafile.dtd"
+# roms is a list of (size, crc, sha1) tuples, one for each <rom> of the <game>.
+# size is an int (-1 if unknown), crc and sha1 are lower case hex strings.
 def new_rom_logiqx():
     return {
         'name'         : '',
         'cloneof'      : '',
         'year'         : '',
-        'manufacturer' : ''
+        'manufacturer' : '',
+        'roms'         : [],
     }
 
 # HyperList doesn't include Plot
@@ -229,8 +244,8 @@ def load_OfflineScraper_XML(xml_file):
 
 # Loads a No-Intro Parent-Clone XML DAT file. Creates a data structure like
 # roms_nointro = {
-#   'rom_name_A' : { 'name' : 'rom_name_A', 'cloneof' : '' | 'rom_name_parent},
-#   'rom_name_B' : { 'name' : 'rom_name_B', 'cloneof' : '' | 'rom_name_parent},
+#   'rom_name_A' : { 'name' : 'rom_name_A', 'cloneof' : '' | 'rom_name_parent, 'roms' : [...] },
+#   'rom_name_B' : { 'name' : 'rom_name_B', 'cloneof' : '' | 'rom_name_parent, 'roms' : [...] },
 # }
 def load_NoIntro_XML_file(xml_FN):
     nointro_roms = {}
@@ -246,23 +261,89 @@ def load_NoIntro_XML_file(xml_FN):
         xml_tree = xml.etree.ElementTree.parse(xml_FN.getPath())
     except xml.etree.ElementTree.ParseError as ex:
         log.error('(ParseError) Exception parsing XML categories.xml')
-        log.error('(ParseError) {}'.format(text_type(ex)))
+        log.error('(ParseError) {}'.format(const.text_type(ex)))
         return nointro_roms
     except IOError as ex:
-        log.error('(IOError) {}'.format(text_type(ex)))
+        log.error('(IOError) {}'.format(const.text_type(ex)))
         return nointro_roms
     xml_root = xml_tree.getroot()
     for root_element in xml_root:
         if root_element.tag == 'game':
-            nointro_rom = audit_new_rom_logiqx()
+            nointro_rom = new_rom_logiqx()
             rom_name = root_element.attrib['name']
             nointro_rom['name'] = rom_name
             if 'cloneof' in root_element.attrib:
                 nointro_rom['cloneof'] = root_element.attrib['cloneof']
+            for rom_element in root_element:
+                if rom_element.tag != 'rom': continue
+                try:
+                    rom_size = int(rom_element.attrib.get('size', -1))
+                except ValueError:
+                    rom_size = -1
+                nointro_rom['roms'].append((rom_size,
+                    rom_element.attrib.get('crc', '').lower(),
+                    rom_element.attrib.get('sha1', '').lower()))
             nointro_roms[rom_name] = nointro_rom
 
     return nointro_roms
 
+# Same as load_NoIntro_XML_file() but keeps a binary cache of the parsed DAT in cache_dir_FN.
+# The cache file name is derived from the DAT path and the cache is valid while the DAT
+# size and mtime do not change. Only (name, cloneof, roms) tuples are stored, which is much
+# faster to load than parsing the XML again on every scan or audit.
+NOINTRO_CACHE_VERSION = 2
+
+def load_NoIntro_XML_file_cached(xml_FN, cache_dir_FN):
+    if not xml_FN.exists():
+        log.error('Does not exists "{}"'.format(xml_FN.getPath()))
+        return {}
+    xml_stat = xml_FN.stat()
+    path_hash = hashlib.sha1(xml_FN.getPath().encode('utf-8')).hexdigest()
+    cache_FN = cache_dir_FN.pjoin(path_hash + '.pickle')
+
+    # --- Try the cache first ---
+    if cache_FN.exists():
+        try:
+            with open(cache_FN.getPath(), 'rb') as file:
+                cache_dic = pickle.load(file)
+        except Exception as ex:
+            log.warning('load_NoIntro_XML_file_cached() Exception loading cache {}'.format(ex))
+            cache_dic = None
+        if cache_dic and cache_dic['version'] == NOINTRO_CACHE_VERSION and \
+            cache_dic['path'] == xml_FN.getPath() and \
+            cache_dic['size'] == xml_stat.st_size and cache_dic['mtime'] == xml_stat.st_mtime:
+            log.debug('load_NoIntro_XML_file_cached() Cache hit "{}"'.format(cache_FN.getPath()))
+            nointro_roms = {}
+            for rom_name, cloneof, rom_list in cache_dic['roms']:
+                nointro_rom = new_rom_logiqx()
+                nointro_rom['name'] = rom_name
+                nointro_rom['cloneof'] = cloneof
+                nointro_rom['roms'] = rom_list
+                nointro_roms[rom_name] = nointro_rom
+            return nointro_roms
+        log.debug('load_NoIntro_XML_file_cached() Cache stale "{}"'.format(cache_FN.getPath()))
+
+    # --- Parse the DAT and update the cache ---
+    nointro_roms = load_NoIntro_XML_file(xml_FN)
+    if not nointro_roms: return nointro_roms
+    cache_dic = {
+        'version' : NOINTRO_CACHE_VERSION,
+        'path' : xml_FN.getPath(),
+        'size' : xml_stat.st_size,
+        'mtime' : xml_stat.st_mtime,
+        'roms' : [(r['name'], r['cloneof'], r['roms']) for r in nointro_roms.values()],
+    }
+    try:
+        cache_dir_FN.makedirs()
+        with open(cache_FN.getPath(), 'wb') as file:
+            pickle.dump(cache_dic, file, pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError) as ex:
+        log.warning('load_NoIntro_XML_file_cached() Cannot write cache {}'.format(ex))
+    else:
+        log.debug('load_NoIntro_XML_file_cached() Cache written "{}"'.format(cache_FN.getPath()))
+
+    return nointro_roms
+
 def load_GameDB_XML(xml_FN):
     __debug_xml_parser = 0
     games = {}
@@ -465,31 +546,31 @@ def make_NoIntro_Parents_dic(nointro_dic):
 #       UNKNOWN_ROMS_PARENT_ID : ['unknown_id_1', 'unknown_id_2', 'unknown_id_3']
 #   }
 #
-def generate_DAT_PClone_index(roms, roms_nointro, unknown_ROMs_are_parents):
+# rom_names_dic maps ROM IDs to DAT names. When the audit matches ROMs by checksum the
+# ROM filename may not be the DAT name. If None the ROM base_noext names are used.
+def generate_DAT_PClone_index(roms, roms_nointro, unknown_ROMs_are_parents, rom_names_dic = None):
     roms_pclone_index_by_id = {}
 
     # --- Create a dictionary to convert ROMbase_noext names into IDs ---
+    if rom_names_dic is None:
+        rom_names_dic = {}
+        for rom_id in roms:
+            rom_names_dic[rom_id] = utils.FileName(roms[rom_id]['filename']).getBaseNoExt()
     names_to_ids_dic = {}
     for rom_id in roms:
-        rom = roms[rom_id]
-        ROMFileName = FileName(rom['filename'])
-        rom_name = ROMFileName.getBaseNoExt()
-        # log.debug('{} --> {}'.format(rom_name, rom_id))
-        # log.debug('{}'.format(rom))
-        names_to_ids_dic[rom_name] = rom_id
+        # log.debug('{} --> {}'.format(rom_names_dic[rom_id], rom_id))
+        names_to_ids_dic[rom_names_dic[rom_id]] = rom_id
 
     # --- Build PClone dictionary using ROM base_noext names ---
     for rom_id in roms:
         rom = roms[rom_id]
-        ROMFileName = FileName(rom['filename'])
-        rom_nointro_name = ROMFileName.getBaseNoExt()
+        rom_nointro_name = rom_names_dic[rom_id]
         # log.debug('rom_id {}'.format(rom_id))
         # log.debug('  nointro_status   "{}"'.format(rom['nointro_status']))
         # log.debug('  filename         "{}"'.format(rom['filename']))
-        # log.debug('  ROM_base_noext   "{}"'.format(ROMFileName.getBaseNoExt()))
         # log.debug('  rom_nointro_name "{}"'.format(rom_nointro_name))
 
-        if rom['nointro_status'] == AUDIT_STATUS_UNKNOWN:
+        if rom['nointro_status'] == const.AUDIT_STATUS_UNKNOWN:
             if unknown_ROMs_are_parents:
                 # Unknown ROMs are parents
                 if rom_id not in roms_pclone_index_by_id:
@@ -497,13 +578,13 @@ def generate_DAT_PClone_index(roms, roms_nointro, unknown_ROMs_are_parents):
             else:
                 # Unknown ROMs are clones
                 # Also, if the parent ROMs of all clones does not exist yet then create it
-                if UNKNOWN_ROMS_PARENT_ID not in roms_pclone_index_by_id:
-                    roms_pclone_index_by_id[UNKNOWN_ROMS_PARENT_ID] = []
-                    roms_pclone_index_by_id[UNKNOWN_ROMS_PARENT_ID].append(rom_id)
+                if const.UNKNOWN_ROMS_PARENT_ID not in roms_pclone_index_by_id:
+                    roms_pclone_index_by_id[const.UNKNOWN_ROMS_PARENT_ID] = []
+                    roms_pclone_index_by_id[const.UNKNOWN_ROMS_PARENT_ID].append(rom_id)
                 else:
-                    roms_pclone_index_by_id[UNKNOWN_ROMS_PARENT_ID].append(rom_id)
-        elif rom['nointro_status'] == AUDIT_STATUS_EXTRA:
-            # Extra ROMs are parents.
+                    roms_pclone_index_by_id[const.UNKNOWN_ROMS_PARENT_ID].append(rom_id)
+        elif rom['nointro_status'] == const.AUDIT_STATUS_EXTRA or rom_nointro_name not in roms_nointro:
+            # Extra ROMs are parents. Missing ROMs not in the DAT are also parents.
             if rom_id not in roms_pclone_index_by_id:
                 roms_pclone_index_by_id[rom_id] = []
         else:
@@ -590,6 +671,195 @@ def generate_filename_PClone_index(roms, roms_nointro, unknown_ROMs_are_parents)
 
     return roms_pclone_index_by_id
 
+# -------------------------------------------------------------------------------------------------
+# DAT catalog
+# -------------------------------------------------------------------------------------------------
+# The No-Intro and Redump DAT directories are scanned only when the directory mtime changes.
+# Every DAT filename is parsed once into (prefix, type, date) and the latest DAT for every
+# prefix is found with a dictionary lookup.
+#
+# No-Intro DAT: Atari - 2600 (Parent-Clone) (20190607-043542).dat
+# Redump DAT:   Commodore - Amiga CD32 - Datfile (157) (2019-09-24 21-03-02).dat
+#
+# The catalog file looks like
+# DAT_catalog = {
+#   'version' : DAT_CATALOG_VERSION,
+#   'No-Intro' : { 'dir' : '...', 'mtime' : 123.45, 'DATs' : [ [prefix, type, date, path], ... ] },
+#   'Redump' : { ... },
+# }
+DAT_CATALOG_VERSION = 1
+NOINTRO_DAT_FNAME_RE = re.compile(r'^(.*) \(Parent-Clone\) \((\d{8}-\d{6})\)\.dat$')
+REDUMP_DAT_FNAME_RE = re.compile(r'^(.*) \(\d+\) \((\d{4}-\d{2}-\d{2} \d{2}-\d{2}-\d{2})\)\.dat$')
+
+def scan_DAT_dir(dir_path, DAT_type):
+    fname_re = NOINTRO_DAT_FNAME_RE if DAT_type == platforms.DAT_NOINTRO else REDUMP_DAT_FNAME_RE
+    DAT_list = []
+    for fname in os.listdir(dir_path):
+        m = fname_re.match(fname)
+        if not m: continue
+        DAT_list.append([m.group(1), DAT_type, m.group(2), os.path.join(dir_path, fname)])
+    log.debug('scan_DAT_dir() Found {} {} DATs in "{}"'.format(len(DAT_list), DAT_type, dir_path))
+
+    return DAT_list
+
+# Returns a dictionary { DAT_type : { prefix : DAT path } } with the latest DAT of every prefix.
+# Directories that do not exist are skipped.
+def load_DAT_catalog(catalog_FN, nointro_dir, redump_dir):
+    catalog = utils.load_JSON_file(catalog_FN.getPath(), {}, verbose = False)
+    if catalog.get('version') != DAT_CATALOG_VERSION:
+        catalog = { 'version' : DAT_CATALOG_VERSION }
+    catalog_changed = False
+    for DAT_type, dir_path in [(platforms.DAT_NOINTRO, nointro_dir), (platforms.DAT_REDUMP, redump_dir)]:
+        if not dir_path or not os.path.isdir(dir_path):
+            catalog[DAT_type] = { 'dir' : dir_path, 'mtime' : 0, 'DATs' : [] }
+            continue
+        dir_mtime = os.path.getmtime(dir_path)
+        type_dic = catalog.get(DAT_type)
+        if type_dic and type_dic['dir'] == dir_path and type_dic['mtime'] == dir_mtime: continue
+        catalog[DAT_type] = {
+            'dir' : dir_path,
+            'mtime' : dir_mtime,
+            'DATs' : scan_DAT_dir(dir_path, DAT_type),
+        }
+        catalog_changed = True
+    if catalog_changed:
+        utils.write_JSON_file(catalog_FN.getPath(), catalog, verbose = False)
+
+    # --- Index the latest DAT of every prefix ---
+    # Dates in the filenames sort lexicographically.
+    DAT_index = {}
+    for DAT_type in [platforms.DAT_NOINTRO, platforms.DAT_REDUMP]:
+        latest_dic = {}
+        for prefix, unused_type, date, path in catalog[DAT_type]['DATs']:
+            if prefix not in latest_dic or date > latest_dic[prefix][0]:
+                latest_dic[prefix] = (date, path)
+        DAT_index[DAT_type] = { prefix : latest_dic[prefix][1] for prefix in latest_dic }
+
+    return DAT_index
+
+# Returns the path of the latest DAT for the platform object or an empty string.
+def get_DAT_for_platform(DAT_index, platform):
+    if not platform.DAT_prefix: return ''
+    if platform.DAT not in DAT_index: return ''
+
+    return DAT_index[platform.DAT].get(platform.DAT_prefix, '')
+
+# -------------------------------------------------------------------------------------------------
+# Checksum audit
+# -------------------------------------------------------------------------------------------------
+# Verify-by-content audit. ROMs are matched against the DAT <rom> size/CRC/SHA1 data so
+# renamed or mislabeled dumps are detected.
+#
+# checksum_index = {
+#   'size' : set of ROM sizes in the DAT,
+#   'crc'  : { (size, crc) : DAT game name, ... },
+#   'sha1' : { sha1 : DAT game name, ... },
+# }
+def make_NoIntro_checksum_index(nointro_dic):
+    log.info('Making checksum index ...')
+    checksum_index = { 'size' : set(), 'crc' : {}, 'sha1' : {} }
+    for game_name in nointro_dic:
+        for rom_size, rom_crc, rom_sha1 in nointro_dic[game_name]['roms']:
+            checksum_index['size'].add(rom_size)
+            if rom_crc: checksum_index['crc'][(rom_size, rom_crc)] = game_name
+            if rom_sha1: checksum_index['sha1'][rom_sha1] = game_name
+    log.info('Checksum index has {} CRCs and {} SHA1s'.format(
+        len(checksum_index['crc']), len(checksum_index['sha1'])))
+
+    return checksum_index
+
+# The checksum cache avoids hashing unchanged files again. Entries are keyed by file path
+# and are valid while the file size and mtime do not change.
+# checksum_cache = {
+#   'path' : (file_size, file_mtime, [(size, crc, sha1), ...]),
+# }
+# ZIP files have one entry per ZIP member with an empty SHA1.
+def load_checksum_cache(cache_FN):
+    if not cache_FN.exists(): return {}
+    try:
+        with open(cache_FN.getPath(), 'rb') as file:
+            checksum_cache = pickle.load(file)
+    except Exception as ex:
+        log.warning('load_checksum_cache() Exception loading cache {}'.format(ex))
+        return {}
+    log.debug('load_checksum_cache() Loaded {} entries'.format(len(checksum_cache)))
+
+    return checksum_cache
+
+# Entries of deleted files are removed before saving.
+def save_checksum_cache(cache_FN, checksum_cache):
+    for file_path in utils.get_missing_files(list(checksum_cache.keys())):
+        del checksum_cache[file_path]
+    try:
+        with open(cache_FN.getPath(), 'wb') as file:
+            pickle.dump(checksum_cache, file, pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError) as ex:
+        log.warning('save_checksum_cache() Cannot write cache {}'.format(ex))
+        return
+    log.debug('save_checksum_cache() Saved {} entries'.format(len(checksum_cache)))
+
+# ZIP files store the CRC32 and uncompressed size of every member in the central directory,
+# so there is no need to decompress them.
+def get_ZIP_checksums(file_path):
+    checksum_list = []
+    with zipfile.ZipFile(file_path, 'r') as zip_f:
+        for zinfo in zip_f.infolist():
+            if zinfo.filename.endswith('/'): continue
+            checksum_list.append((zinfo.file_size, '{:08x}'.format(zinfo.CRC), ''))
+
+    return checksum_list
+
+def get_file_checksums(file_path, block_size = 1024 * 1024):
+    crc = 0
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            if not block: break
+            crc = zlib.crc32(block, crc)
+            sha1.update(block)
+
+    return '{:08x}'.format(crc & 0xFFFFFFFF), sha1.hexdigest()
+
+# Returns the DAT game name of the ROM file or an empty string if the contents of the
+# file are not in the DAT. Returns None if the file is missing or cannot be read.
+# checksum_cache is updated.
+def match_ROM_by_checksum(file_path, checksum_index, checksum_cache):
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    file_size, file_mtime = file_stat.st_size, file_stat.st_mtime
+    is_ZIP = file_path.lower().endswith('.zip')
+
+    # --- Files whose size is not in the DAT cannot match, skip hashing ---
+    if not is_ZIP and file_size not in checksum_index['size']: return ''
+
+    # --- Get checksums from cache or compute them ---
+    cache_entry = checksum_cache.get(file_path)
+    if cache_entry and cache_entry[0] == file_size and cache_entry[1] == file_mtime:
+        checksum_list = cache_entry[2]
+    else:
+        try:
+            if is_ZIP:
+                checksum_list = get_ZIP_checksums(file_path)
+            else:
+                crc, sha1 = get_file_checksums(file_path)
+                checksum_list = [(file_size, crc, sha1)]
+        except (IOError, OSError, zipfile.BadZipfile) as ex:
+            log.warning('match_ROM_by_checksum() Exception {}'.format(ex))
+            return None
+        checksum_cache[file_path] = (file_size, file_mtime, checksum_list)
+
+    # --- Match SHA1 first, then size and CRC ---
+    for rom_size, rom_crc, rom_sha1 in checksum_list:
+        if rom_sha1 and rom_sha1 in checksum_index['sha1']:
+            return checksum_index['sha1'][rom_sha1]
+        if (rom_size, rom_crc) in checksum_index['crc']:
+            return checksum_index['crc'][(rom_size, rom_crc)]
+
+    return ''
+
 # -------------------------------------------------------------------------------------------------
 # NARS (NARS Advanced ROM Sorting) stuff
 # -------------------------------------------------------------------------------------------------
@@ -27,10 +27,24 @@ import resources.platforms as platforms
 # --- Python standard library ---
 import collections
 import copy
+import hashlib
+import io
+import json
 import os
+import shutil
 import string
 import sys
+import threading
 import time
+import zipfile
+if const.ADDON_RUNNING_PYTHON_2:
+    import Queue as queue
+    collections_abc = collections
+elif const.ADDON_RUNNING_PYTHON_3:
+    import queue
+    import collections.abc as collections_abc
+else:
+    raise TypeError('Undefined Python runtime version.')
 
 # -------------------------------------------------------------------------------------------------
 # Data model used in the plugin
@@ -100,6 +114,7 @@ def new_launcher():
         'num_extra' : 0,
         'timestamp_launcher' : 0.0,
         'timestamp_report' : 0.0,
+        'stats' : {},
         'default_icon' : 's_icon',
         'default_fanart' : 's_fanart',
         'default_banner' : 's_banner',
@@ -231,6 +246,101 @@ def new_render_launcher(): pass
 
 def new_render_ROM(): pass
 
+# -------------------------------------------------------------------------------------------------
+# Compact ROM representation
+# -------------------------------------------------------------------------------------------------
+# A loaded ROM is a dictionary with about 30 keys. Every dictionary has its own hash table, which
+# is the biggest part of the memory used by a launcher with tens of thousands of ROMs.
+#
+# CompactROM is a slotted record that behaves like a ROM dictionary: it supports rom[key],
+# rom.get(), key in rom, iteration, keys(), items(), update(), dict(rom), etc. Values are stored
+# in slots, one per field of new_rom() (the key table is shared by all the records) and fields
+# not in new_rom() are stored in a small dictionary created only if needed. Repeated values
+# like genre, year or audit status are interned so all the ROMs share the same string object.
+#
+# CompactROMs are used when the setting compact_ROMs_in_memory is enabled. ROM JSON files are
+# the same (JSON is written with utils.JSON_encode_default()).
+ROM_FIELD_LIST = list(new_rom().keys()) + ['platform']
+ROM_FIELD_SET = set(ROM_FIELD_LIST)
+ROM_INTERN_FIELD_SET = {
+    'm_year', 'm_genre', 'm_developer', 'm_nplayers', 'm_esrb', 'm_rating',
+    'nointro_status', 'pclone_status', 'cloneof', 'altapp', 'altarg', 'platform',
+}
+
+# Interned values { value : value }. Shared by all the CompactROMs.
+rom_intern_table = {}
+
+class CompactROM(collections_abc.MutableMapping):
+    __slots__ = tuple(ROM_FIELD_LIST) + ('_extra',)
+
+    def __init__(self, rom = None):
+        self._extra = None
+        if rom is None: return
+        for key, value in rom.items(): self[key] = value
+
+    def __getitem__(self, key):
+        if key in ROM_FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None: raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in ROM_FIELD_SET:
+            if key in ROM_INTERN_FIELD_SET and isinstance(value, const.text_type):
+                value = rom_intern_table.setdefault(value, value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None: self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in ROM_FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        else:
+            if self._extra is None: raise KeyError(key)
+            del self._extra[key]
+
+    def __iter__(self):
+        for key in ROM_FIELD_LIST:
+            if hasattr(self, key): yield key
+        if self._extra is not None:
+            for key in self._extra: yield key
+
+    def __len__(self):
+        return sum(1 for key in ROM_FIELD_LIST if hasattr(self, key)) + \
+            (len(self._extra) if self._extra is not None else 0)
+
+    def __contains__(self, key):
+        if key in ROM_FIELD_SET: return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __repr__(self): return repr(dict(self.items()))
+
+    # Faster than the MutableMapping methods, which use __getitem__() and KeyError.
+    def get(self, key, default = None):
+        if key in ROM_FIELD_SET: return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    # Like dict.copy() returns a shallow copy, as a dictionary.
+    def copy(self): return dict(self.items())
+
+# Use as object_hook of the JSON decoder. ROMs are converted into CompactROMs as soon as they
+# are decoded, so all the ROM dictionaries are never in memory at the same time.
+def compact_ROM_object_hook(json_obj):
+    if 'filename' in json_obj and 'm_name' in json_obj: return CompactROM(json_obj)
+    return json_obj
+
+# Converts the ROMs of a roms dictionary into CompactROMs, in place.
+def compact_ROMs(roms):
+    for rom_id in roms:
+        if not isinstance(roms[rom_id], CompactROM): roms[rom_id] = CompactROM(roms[rom_id])
+
 # -------------------------------------------------------------------------------------------------
 # Favourite ROM creation/management
 # -------------------------------------------------------------------------------------------------
@@ -364,6 +474,214 @@ def aux_copy_ROM_artwork(source_launcher, source_rom, dest_rom):
     dest_rom['roms_default_poster']    = source_launcher['roms_default_poster']
     dest_rom['roms_default_clearlogo'] = source_launcher['roms_default_clearlogo']
 
+# -------------------------------------------------------------------------------------------------
+# ROM references (Favourites and ROM Collections)
+# -------------------------------------------------------------------------------------------------
+# Favourites and ROM Collections store references to launcher ROMs instead of full Favourite
+# ROM copies. Metadata and artwork come from the launcher ROM, so Favourites do not need to be
+# repaired when the launcher ROM is edited. The fields of the Favourite/Collection ROM that
+# differ from the launcher ROM (edited metadata, artwork or launch settings, fav_status set by
+# the Favourites check, etc.) are stored in the reference and applied over the launcher ROM.
+#
+# rom_ref = {
+#     'id' : romID, 'launcherID' : launcherID,
+#     'snapshot' : { ... }, # Used to render the ROM, and to launch it if the launcher or the
+#                           # ROM are not found.
+#     'overrides' : { ... }, # Fields that differ from the launcher ROM.
+# }
+#
+# Rendering Favourites and Collections only uses the snapshot and the overrides, so no
+# launcher database is loaded. Full ROMs are resolved from the launcher databases with
+# resolve_ROM_references() only by the commands that need them (launch, edit, export, etc.).
+# The snapshots of the references to a launcher are refreshed every time the ROMs of the
+# launcher are saved, see refresh_ROM_reference_snapshots().
+#
+# Full Favourite ROMs (old databases) are read as they are and converted into references the
+# next time the database is saved. Favourite ROMs whose launcher or ROM cannot be found (for
+# example, imported in a ROM Collection from another computer) are stored as full Favourite
+# ROMs to not lose data.
+ROM_RENDER_SNAPSHOT_FIELDS = [
+    'm_name', 'm_year', 'm_genre', 'm_developer', 'm_rating', 'm_plot', 'm_nplayers', 'm_esrb',
+    'platform', 'disks', 'finished',
+    's_title', 's_snap', 's_boxfront', 's_boxback', 's_3dbox', 's_cartridge', 's_flyer', 's_map',
+    's_fanart', 's_banner', 's_clearlogo',
+    'roms_default_icon', 'roms_default_fanart', 'roms_default_banner',
+    'roms_default_poster', 'roms_default_clearlogo',
+]
+ROM_REFERENCE_SNAPSHOT_FIELDS = ROM_RENDER_SNAPSHOT_FIELDS + [
+    'filename', 'application', 'args', 'args_extra', 'rompath', 'romext',
+    'toggle_window', 'non_blocking',
+]
+
+def is_ROM_reference(rom):
+    return 'snapshot' in rom
+
+# Returns the snapshot of a full Favourite ROM.
+def get_ROM_reference_snapshot(fav_rom):
+    return { f : fav_rom[f] for f in ROM_REFERENCE_SNAPSHOT_FIELDS }
+
+# Returns the fields of a ROM needed to render it. Used by the play statistics.
+def get_ROM_render_snapshot(rom):
+    return { f : rom[f] for f in ROM_RENDER_SNAPSHOT_FIELDS if f in rom }
+
+# Loads the ROMs of the launchers in launcher_ID_set. Returns { launcherID : roms }.
+# Launchers not found in cfg.launchers or without ROM database are not included.
+def _load_launchers_ROMs(cfg, launcher_ID_set):
+    launchers_roms = {}
+    for launcherID in launcher_ID_set:
+        if launcherID not in cfg.launchers: continue
+        launcher = cfg.launchers[launcherID]
+        roms_FN = cfg.ROMS_DIR.pjoin(launcher['roms_base_noext'] + '.json')
+        json_data = utils.load_JSON_file(roms_FN.getPath(), [], verbose = False)
+        if json_data: launchers_roms[launcherID] = json_data[2]
+    log.debug('_load_launchers_ROMs() Loaded {} launcher databases'.format(len(launchers_roms)))
+
+    return launchers_roms
+
+# Bulk resolver. Returns a list of full Favourite ROMs, in the same order as ref_list.
+# Every launcher database is loaded only once.
+def resolve_ROM_references(cfg, ref_list):
+    if not cfg.launchers: load_launchers_XML(cfg)
+    launchers_roms = _load_launchers_ROMs(cfg,
+        set(ref['launcherID'] for ref in ref_list if is_ROM_reference(ref)))
+    rom_list = []
+    for ref in ref_list:
+        if not is_ROM_reference(ref):
+            rom_list.append(ref)
+            continue
+        launcherID = ref['launcherID']
+        if launcherID in launchers_roms and ref['id'] in launchers_roms[launcherID]:
+            rom = get_Favourite_from_ROM(launchers_roms[launcherID][ref['id']], cfg.launchers[launcherID])
+            rom.update(ref['overrides'])
+        else:
+            rom = new_rom()
+            rom.update(ref['snapshot'])
+            rom.update(ref['overrides'])
+            rom['id'] = ref['id']
+            rom['launcherID'] = launcherID
+            if launcherID in cfg.launchers:
+                rom['fav_status'] = 'Unlinked ROM'
+            else:
+                rom['fav_status'] = 'Unlinked Launcher'
+        rom_list.append(rom)
+
+    return rom_list
+
+# Returns a list of Favourite ROMs made from the snapshots, in the same order as ref_list.
+# No launcher database is loaded, use it to render Favourites and Collections.
+def render_ROM_references(cfg, ref_list):
+    if not cfg.launchers: load_launchers_XML(cfg)
+    rom_list = []
+    for ref in ref_list:
+        if not is_ROM_reference(ref):
+            rom_list.append(ref)
+            continue
+        rom = new_rom()
+        rom.update(ref['snapshot'])
+        rom['id'] = ref['id']
+        rom['launcherID'] = ref['launcherID']
+        rom['fav_status'] = 'OK'
+        rom.update(ref['overrides'])
+        if ref['launcherID'] not in cfg.launchers: rom['fav_status'] = 'Unlinked Launcher'
+        rom_list.append(rom)
+
+    return rom_list
+
+# Refreshes the snapshots of the references to ROMs of launcher in ref_list, in place.
+# Returns True if some snapshot changed.
+def _refresh_snapshots(launcher, roms, ref_list):
+    changed = False
+    for ref in ref_list:
+        if not is_ROM_reference(ref): continue
+        if ref['launcherID'] != launcher['id'] or ref['id'] not in roms: continue
+        snapshot = get_ROM_reference_snapshot(get_Favourite_from_ROM(roms[ref['id']], launcher))
+        if snapshot == ref['snapshot']: continue
+        ref['snapshot'] = snapshot
+        changed = True
+
+    return changed
+
+# Called when the ROMs of a launcher are saved. Refreshes the snapshots of the Favourites and
+# Collection references to the launcher ROMs. Only the files with changed snapshots are written.
+def refresh_ROM_reference_snapshots(cfg, launcher, roms):
+    if cfg.FAV_JSON_FILE_PATH.exists():
+        raw_data = utils.load_JSON_file(cfg.FAV_JSON_FILE_PATH.getPath(), [], verbose = False)
+        if raw_data and _refresh_snapshots(launcher, roms, list(raw_data[1].values())):
+            log.debug('refresh_ROM_reference_snapshots() Writing Favourites')
+            _write_JSON_file(cfg.FAV_JSON_FILE_PATH.getPath(), raw_data)
+    if not cfg.COLLECTIONS_FILE_PATH.exists(): return
+    collections_index = load_Collection_index_XML(cfg.COLLECTIONS_FILE_PATH)
+    for collection in collections_index['collections'].values():
+        roms_FN = cfg.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
+        raw_data = utils.load_JSON_file(roms_FN.getPath(), [], verbose = False)
+        if raw_data and _refresh_snapshots(launcher, roms, raw_data[1]):
+            log.debug('refresh_ROM_reference_snapshots() Writing Collection "{}"'.format(collection['m_name']))
+            _write_JSON_file(roms_FN.getPath(), raw_data)
+
+# Returns a list of ROM references (or full Favourite ROMs if the parent ROM cannot be found),
+# in the same order as rom_list. Every launcher database is loaded only once.
+def make_ROM_references(cfg, rom_list):
+    if not cfg.launchers: load_launchers_XML(cfg)
+    launchers_roms = _load_launchers_ROMs(cfg,
+        set(rom['launcherID'] for rom in rom_list if 'launcherID' in rom))
+    ref_list = []
+    for rom in rom_list:
+        launcherID = rom['launcherID'] if 'launcherID' in rom else ''
+        if launcherID not in launchers_roms or rom['id'] not in launchers_roms[launcherID]:
+            ref_list.append(rom)
+            continue
+        parent = get_Favourite_from_ROM(launchers_roms[launcherID][rom['id']], cfg.launchers[launcherID])
+        ref_list.append({
+            'id' : rom['id'],
+            'launcherID' : launcherID,
+            'snapshot' : get_ROM_reference_snapshot(parent),
+            'overrides' : { f : rom[f] for f in rom if f not in parent or rom[f] != parent[f] },
+        })
+
+    return ref_list
+
+# Favourites are a dictionary { romID : rom_ref, ... }
+# Returns a dictionary of full Favourite ROMs. Never fails.
+# If resolve is False the ROMs are made from the snapshots, use it only to render.
+def load_Favourite_ROMs(cfg, resolve = True):
+    raw_data = utils.load_JSON_file(cfg.FAV_JSON_FILE_PATH.getPath(), [], verbose = False)
+    if not raw_data: return {}
+    ref_dic = raw_data[1]
+    romID_list = list(ref_dic.keys())
+    ref_list = [ref_dic[romID] for romID in romID_list]
+    if resolve:
+        rom_list = resolve_ROM_references(cfg, ref_list)
+    else:
+        rom_list = render_ROM_references(cfg, ref_list)
+
+    return dict(zip(romID_list, rom_list))
+
+def write_Favourite_ROMs(cfg, roms):
+    control_dic = {
+        'control' : 'Advanced Emulator Launcher Favourite ROMs',
+        'version' : const.AEL_STORAGE_FORMAT,
+    }
+    romID_list = list(roms.keys())
+    ref_list = make_ROM_references(cfg, [roms[romID] for romID in romID_list])
+    _write_JSON_file(cfg.FAV_JSON_FILE_PATH.getPath(), [control_dic, dict(zip(romID_list, ref_list))])
+
+# ROM Collections are a list [rom_ref, rom_ref, ...]
+# Returns a list of full Favourite ROMs. Never fails.
+# If resolve is False the ROMs are made from the snapshots, use it only to render.
+def load_Collection_ROMs(cfg, roms_FN, resolve = True):
+    raw_data = utils.load_JSON_file(roms_FN.getPath(), [], verbose = False)
+    if not raw_data: return []
+    if not resolve: return render_ROM_references(cfg, raw_data[1])
+
+    return resolve_ROM_references(cfg, raw_data[1])
+
+def write_Collection_ROMs(cfg, roms_FN, rom_list):
+    control_dic = {
+        'control' : 'Advanced Emulator Launcher Collection ROMs',
+        'version' : const.AEL_STORAGE_FORMAT,
+    }
+    _write_JSON_file(roms_FN.getPath(), [control_dic, make_ROM_references(cfg, rom_list)])
+
 # ------------------------------------------------------------------------------------------------
 # ROM storage file names
 # ------------------------------------------------------------------------------------------------
@@ -380,6 +698,290 @@ def get_collection_ROMs_basename(collection_name, collectionID):
     log.debug('get_collection_ROMs_basename() roms_base_noext "{}"'.format(roms_base_noext))
     return roms_base_noext
 
+# ------------------------------------------------------------------------------------------------
+# ROM scanner journal
+# ------------------------------------------------------------------------------------------------
+# The ROM scanner only writes the ROM database at the end. The journal keeps the work done by an
+# unfinished scan so a cancelled or killed scan can be resumed instead of scraping again the ROMs
+# already done. There is one journal per launcher, in the scanner journal directory.
+#
+# The journal is written by checkpoint(), at most every SCANNER_JOURNAL_CHECKPOINT_INTERVAL
+# seconds unless forced, and deleted when the scanner saves the ROM database. The journal is
+# discarded if the launcher ROM path or ROM extensions changed since it was written.
+#
+# journal = {
+#     'launcherID' : str, 'rompath' : str, 'romext' : str, 'timestamp' : time.time(),
+#     'stage' : SCANNER_STAGE_*,
+#     'removed_ROMs' : [ romID, ... ],
+#     'new_ROMs' : { romID : rom, ... },
+#     'pending_assets' : { romID : [ROM path, ROM checksums path], ... },
+# }
+#
+# new_ROMs have their metadata scraped. ROMs in pending_assets still need the asset scraping.
+SCANNER_STAGE_DEAD_ROMS = 'dead_ROMs' # Removing dead ROMs.
+SCANNER_STAGE_ROMS      = 'ROMs'      # Dead ROMs removed. Processing files.
+SCANNER_STAGE_SAVE      = 'save'      # All files processed. Saving the ROM database.
+SCANNER_JOURNAL_CHECKPOINT_INTERVAL = 20
+
+class ScannerJournal(object):
+    def __init__(self, journal_dir_FN, launcher):
+        self.journal_FN = journal_dir_FN.pjoin(launcher['id'] + '.json')
+        self.launcher = launcher
+        self.last_checkpoint = time.time()
+        self.reset()
+
+    # Starts an empty journal. The journal file, if any, is overwritten on the next checkpoint.
+    def reset(self):
+        self.journal = {
+            'launcherID' : self.launcher['id'],
+            'rompath' : self.launcher['rompath'],
+            'romext' : self.launcher['romext'],
+            'timestamp' : time.time(),
+            'stage' : SCANNER_STAGE_DEAD_ROMS,
+            'removed_ROMs' : [],
+            'new_ROMs' : {},
+            'pending_assets' : {},
+        }
+
+    # Returns True if there is a valid journal of an interrupted scan of the launcher.
+    def load(self):
+        if not self.journal_FN.exists(): return False
+        journal = utils.load_JSON_file(self.journal_FN.getPath(), {}, verbose = False)
+        for key in ['launcherID', 'rompath', 'romext', 'stage', 'removed_ROMs', 'new_ROMs', 'pending_assets']:
+            if key not in journal:
+                log.warning('ScannerJournal.load() Journal corrupted. Discarding it.')
+                return False
+        if journal['launcherID'] != self.launcher['id'] or \
+            journal['rompath'] != self.launcher['rompath'] or journal['romext'] != self.launcher['romext']:
+            log.info('ScannerJournal.load() Launcher changed since the journal was written. Discarding it.')
+            return False
+        self.journal = journal
+        log.info('ScannerJournal.load() Stage "{}", {} removed ROMs, {} new ROMs, {} pending assets'.format(
+            journal['stage'], len(journal['removed_ROMs']), len(journal['new_ROMs']),
+            len(journal['pending_assets'])))
+        return True
+
+    def get_stage(self): return self.journal['stage']
+
+    def get_num_new_ROMs(self): return len(self.journal['new_ROMs'])
+
+    # Applies the journal to the ROMs loaded from the database: removes the dead ROMs and adds
+    # the new ROMs. Returns a list of (romID, ROM_FN, ROM_checksums_FN) of the ROMs with pending
+    # assets. The ROM objects in roms and in the journal are the same.
+    def apply(self, roms):
+        for romID in self.journal['removed_ROMs']:
+            if romID in roms: del roms[romID]
+        for romID, rom in self.journal['new_ROMs'].items():
+            roms[romID] = rom
+        pending_list = []
+        for romID in sorted(self.journal['pending_assets']):
+            if romID not in roms: continue
+            ROM_path, ROM_checksums_path = self.journal['pending_assets'][romID]
+            pending_list.append((romID, utils.FileName(ROM_path), utils.FileName(ROM_checksums_path)))
+        return pending_list
+
+    def set_stage(self, stage):
+        self.journal['stage'] = stage
+        self.checkpoint(force = True)
+
+    def add_removed_ROM(self, romID):
+        self.journal['removed_ROMs'].append(romID)
+
+    # The ROM is stored by reference so changes made by the asset scraper are journaled.
+    def add_new_ROM(self, rom, ROM_FN, ROM_checksums_FN):
+        self.journal['new_ROMs'][rom['id']] = rom
+        self.journal['pending_assets'][rom['id']] = [ROM_FN.getPath(), ROM_checksums_FN.getPath()]
+
+    def set_assets_done(self, romID):
+        if romID in self.journal['pending_assets']: del self.journal['pending_assets'][romID]
+
+    # Writes the journal if force is True or if the last checkpoint is old enough. The journal is
+    # written in a temporary file and then renamed so a killed write does not corrupt it.
+    def checkpoint(self, force = False):
+        if not force and time.time() - self.last_checkpoint < SCANNER_JOURNAL_CHECKPOINT_INTERVAL: return
+        self.journal['timestamp'] = time.time()
+        journal_dir = self.journal_FN.getDir()
+        if not os.path.isdir(journal_dir): os.makedirs(journal_dir)
+        temp_path = self.journal_FN.getPath() + '.tmp'
+        utils.write_JSON_file(temp_path, self.journal, verbose = False)
+        if const.ADDON_RUNNING_PYTHON_2:
+            if self.journal_FN.exists(): self.journal_FN.unlink()
+            os.rename(temp_path, self.journal_FN.getPath())
+        elif const.ADDON_RUNNING_PYTHON_3:
+            os.replace(temp_path, self.journal_FN.getPath())
+        else:
+            raise TypeError('Undefined Python runtime version.')
+        self.last_checkpoint = time.time()
+        log.debug('ScannerJournal.checkpoint() Stage "{}", {} new ROMs, {} pending assets'.format(
+            self.journal['stage'], len(self.journal['new_ROMs']), len(self.journal['pending_assets'])))
+
+    # Called when the scan is finished and the ROM database saved.
+    def delete(self):
+        if self.journal_FN.exists(): self.journal_FN.unlink()
+        log.debug('ScannerJournal.delete() Journal deleted')
+
+    # --- ROM scanner steps ---
+    # main.command_rom_scanner() journals its work with these methods, so they are tested by
+    # dev-core/test_scanner_journal.py. scraper_strategy is the ScrapeStrategy of the scanner
+    # and pdialog a kodi.ProgressDialog.
+
+    # Removes from roms the ROMs whose file does not exist, unless the interrupted scan already
+    # removed them. Returns the number of ROMs removed.
+    def remove_dead_ROMs(self, roms, pdialog):
+        if self.journal['stage'] != SCANNER_STAGE_DEAD_ROMS: return 0
+        num_removed_roms = 0
+        for romID in sorted(roms, key = lambda x : roms[x]['m_name']):
+            pdialog.updateProgressInc()
+            if not utils.FileName(roms[romID]['filename']).exists():
+                log.debug('ScannerJournal.remove_dead_ROMs() Deleting from DB {}'.format(roms[romID]['filename']))
+                del roms[romID]
+                self.add_removed_ROM(romID)
+                num_removed_roms += 1
+        self.set_stage(SCANNER_STAGE_ROMS)
+        return num_removed_roms
+
+    # Scrapes the assets of the ROMs added by the interrupted scan. pending_assets_list is the
+    # list returned by apply(). Returns False if the user cancelled the progress dialog.
+    def scrape_pending_assets(self, roms, pending_assets_list, scraper_strategy, pdialog):
+        for romID, ROM, ROM_checksums in pending_assets_list:
+            pdialog.updateProgressInc()
+            scraper_strategy.scanner_process_ROM_begin(roms[romID], ROM, ROM_checksums)
+            scraper_strategy.scanner_process_ROM_assets(roms[romID], ROM)
+            self.set_assets_done(romID)
+            if self.checkpoint_is_canceled(pdialog): return False
+        return True
+
+    # Scrapes the metadata and assets of a new ROM and adds it to roms. Scraping the assets
+    # may take long, so there is also a checkpoint after the metadata is scraped.
+    def scrape_new_ROM(self, roms, romdata, ROM, ROM_checksums, scraper_strategy):
+        scraper_strategy.scanner_process_ROM_begin(romdata, ROM, ROM_checksums)
+        scraper_strategy.scanner_process_ROM_metadata(romdata, ROM)
+        self.add_new_ROM(romdata, ROM, ROM_checksums)
+        self.checkpoint()
+        scraper_strategy.scanner_process_ROM_assets(romdata, ROM)
+        self.set_assets_done(romdata['id'])
+        roms[romdata['id']] = romdata
+
+    # Checkpoint after a ROM is done. Returns True if the user cancelled the progress dialog.
+    # The journal is then written so the next scan resumes after this ROM.
+    def checkpoint_is_canceled(self, pdialog):
+        self.checkpoint()
+        if not pdialog.isCanceled(): return False
+        self.checkpoint(force = True)
+        return True
+
+# ------------------------------------------------------------------------------------------------
+# Write batching
+# ------------------------------------------------------------------------------------------------
+# Bulk operations, for example exec_utils_check_database(), call save_ROMs() for many launchers
+# and every call rewrites launchers.xml. Inside a write batch launchers.xml writes and launcher
+# timestamp updates are deferred until the batch ends, so launchers.xml is written only once.
+# launchers.xml is also loaded only once per batch so deferred changes are not lost when
+# load_db_index() is called again.
+#
+# In dry run mode no database file is written. Files whose contents would change are
+# stored in batch.changed_files. The timestamp lines of XML index files are ignored because
+# every write, and the batch flush, updates them.
+#
+# >>> How to use this code <<<
+# with db.WriteBatch(cfg, dry_run = False) as batch:
+#     for launcherID in cfg.launchers:
+#         ...
+#         db.save_ROMs(cfg, st)
+# for fname in batch.changed_files: log.info(fname)
+current_batch = None
+
+class WriteBatch(object):
+    def __init__(self, cfg, dry_run = False):
+        self.cfg = cfg
+        self.dry_run = dry_run
+        self.flushing = False
+        self.launchers_loaded = False
+        self.launchers_XML_dirty = False
+        self.update_timestamp = 0.0
+        self.touched_launcher_IDs = set()
+        self.changed_files = []
+        self.num_writes = 0
+        # record_write() is called from the database repair worker threads.
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        global current_batch
+        if current_batch is not None: raise RuntimeError('Nested write batches not supported')
+        log.debug('WriteBatch() Starting write batch (dry_run {})'.format(self.dry_run))
+        current_batch = self
+        return self
+
+    # The batch is flushed even if there was an exception, because ROM databases already
+    # written must be consistent with launchers.xml. Exceptions are not suppressed.
+    def __exit__(self, exc_type, exc_value, traceback):
+        global current_batch
+        try:
+            self.flush()
+        finally:
+            current_batch = None
+        log.debug('WriteBatch() Finished. {} writes, {} files changed'.format(
+            self.num_writes, len(self.changed_files)))
+        return False
+
+    def flush(self):
+        self.flushing = True
+        if self.touched_launcher_IDs:
+            _t = time.time()
+            for launcherID in self.touched_launcher_IDs:
+                if launcherID in self.cfg.launchers:
+                    self.cfg.launchers[launcherID]['timestamp_launcher'] = _t
+            self.touched_launcher_IDs = set()
+        if self.launchers_XML_dirty:
+            write_launchers_XML(self.cfg, self.update_timestamp)
+            self.launchers_XML_dirty = False
+        self.flushing = False
+
+    def record_write(self, filename, changed):
+        with self.lock:
+            self.num_writes += 1
+            if changed and filename not in self.changed_files: self.changed_files.append(filename)
+
+# Returns True if launchers.xml writes must be deferred.
+def _defer_launchers_XML_write(update_timestamp):
+    if current_batch is None or current_batch.flushing: return False
+    current_batch.launchers_XML_dirty = True
+    if update_timestamp: current_batch.update_timestamp = update_timestamp
+    return True
+
+# DB writers call these functions instead of the utils ones so dry run works.
+def _write_JSON_file(json_filename, json_data):
+    if current_batch is None or not current_batch.dry_run:
+        utils.write_JSON_file(json_filename, json_data)
+        if current_batch is not None: current_batch.record_write(json_filename, True)
+        return
+    old_data = utils.load_JSON_file(json_filename, None, verbose = False)
+    new_data = json.loads(json.dumps(json_data, default = utils.JSON_encode_default))
+    current_batch.record_write(json_filename, old_data != new_data)
+    log.debug('_write_JSON_file() Dry run, not writing "{}"'.format(json_filename))
+
+# XML tags ignored when comparing XML index files in dry run mode.
+DRY_RUN_IGNORED_XML_TAGS = ('<update_timestamp>', '<timestamp_launcher>')
+
+# Lines are stripped because misc.XML() indents them. slist elements may have several lines.
+def _get_dry_run_compare_lines(text):
+    line_list = [line.strip() for line in text.split('\n')]
+    return [line for line in line_list if not line.startswith(DRY_RUN_IGNORED_XML_TAGS)]
+
+def _write_slist_to_file(filename, slist):
+    if current_batch is None or not current_batch.dry_run:
+        utils.write_slist_to_file(filename, slist)
+        if current_batch is not None: current_batch.record_write(filename, True)
+        return
+    if os.path.isfile(filename):
+        with io.open(filename, 'rt', encoding = 'utf-8') as file:
+            old_lines = _get_dry_run_compare_lines(file.read())
+    else:
+        old_lines = None
+    new_lines = _get_dry_run_compare_lines('\n'.join(slist))
+    current_batch.record_write(filename, old_lines != new_lines)
+    log.debug('_write_slist_to_file() Dry run, not writing "{}"'.format(filename))
+
 # ------------------------------------------------------------------------------------------------
 # ROM database high-level IO functions
 # Put here the URL examples?
@@ -495,8 +1097,11 @@ def load_db_index(cfg, st, categoryID = None, launcherID = None, romID = None):
     # Refresh view_type
     # Copy this from main.command_view_menu()
 
-    # This must be loaded always because of cfg.update_timestamp
-    load_launchers_XML(cfg)
+    # This must be loaded always because of cfg.update_timestamp.
+    # Inside a write batch load it only once to keep the deferred changes.
+    if current_batch is None or not current_batch.launchers_loaded:
+        load_launchers_XML(cfg)
+        if current_batch is not None: current_batch.launchers_loaded = True
 
     # --- Load database indices ---
     if cfg.launcher_is_standard:
@@ -625,10 +1230,10 @@ def get_ROM_db_filenames(cfg, st, categoryID, launcherID):
         cfg.roms_FN = cfg.FAV_JSON_FILE_PATH
 
     elif cfg.launcher_is_vlauncher and launcherID == const.VLAUNCHER_RECENT_ID:
-        cfg.roms_FN = cfg.RECENT_PLAYED_FILE_PATH
+        cfg.roms_FN = cfg.PLAY_STATS_FILE_PATH
 
     elif cfg.launcher_is_vlauncher and launcherID == const.VLAUNCHER_MOST_PLAYED_ID:
-        cfg.roms_FN = cfg.MOST_PLAYED_FILE_PATH
+        cfg.roms_FN = cfg.PLAY_STATS_FILE_PATH
 
     elif cfg.launcher_is_vcategory and categoryID == const.VCATEGORY_ROM_COLLECTION_ID:
         collection = cfg.collections[launcherID]
@@ -709,7 +1314,10 @@ def get_launcher_from_ROM(cfg, st, rom): pass
 # * In most cases cfg.roms is a dictionary of dictionaries.
 #   In some cases () cfg.roms is an OrderedDictionary.
 # * If load_pclone_ROMs_flag is True then PClone ROMs are also loaded.
-def load_ROMs(cfg, st_dic, load_pclone_ROMs_flag = False):
+# If resolve is False Favourites, Collections and play statistics ROMs are made from the
+# render snapshots and no launcher database is loaded. Use it only to render, never to edit
+# and save the ROMs.
+def load_ROMs(cfg, st_dic, load_pclone_ROMs_flag = False, resolve = True):
     # log.debug('load_ROMs() categoryID "{}" | launcherID "{}"'.format(cfg.categoryID, cfg.launcherID))
 
     # Actual ROM Launcher ------------------------------------------------------------------------
@@ -717,7 +1325,8 @@ def load_ROMs(cfg, st_dic, load_pclone_ROMs_flag = False):
         if not cfg.roms_FN.exists():
             kodi.set_st_notify(st_dic, 'Launcher JSON database not found. Add ROMs to launcher.')
             return
-        json_data = utils.load_JSON_file(cfg.roms_FN.getPath())
+        object_hook = compact_ROM_object_hook if cfg.settings['compact_ROMs_in_memory'] else None
+        json_data = utils.load_JSON_file(cfg.roms_FN.getPath(), object_hook = object_hook)
         control_dic  = json_data[0]
         launcher_dic = json_data[1]
         cfg.roms     = json_data[2]
@@ -730,7 +1339,7 @@ def load_ROMs(cfg, st_dic, load_pclone_ROMs_flag = False):
         if not cfg.parents_FN.exists():
             kodi.set_st_notify(st_dic, 'Parent ROMs JSON not found.')
             return
-        cfg.roms_parent = utils.load_JSON_file(cfg.parents_FN.getPath())
+        cfg.roms_parent = utils.load_JSON_file(cfg.parents_FN.getPath(), object_hook = object_hook)
         if not cfg.roms_parent:
             kodi.set_st_notify(st_dic, 'Parent ROMs JSON is empty.')
             return
@@ -745,51 +1354,43 @@ def load_ROMs(cfg, st_dic, load_pclone_ROMs_flag = False):
             return
 
     # Virtual launchers --------------------------------------------------------------------------
+    # Favourites and Collections store ROM references. Resolve them into full ROMs.
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_FAVOURITES_ID:
-        # Transform list of dictionaries into an OrderedDict
-        raw_data = utils.load_JSON_file(cfg.roms_FN.getPath())
-        cfg.roms = raw_data[1] if raw_data else {}
+        cfg.roms = load_Favourite_ROMs(cfg, resolve)
         if not cfg.roms:
-            kodi_set_st_notify(st_dic, 'Favourites is empty. Add ROMs to Favourites first.')
+            kodi.set_st_notify(st_dic, 'Favourites is empty. Add ROMs to Favourites first.')
             return
-        # Extract roms from JSON data structure and ensure version is correct.
-        cfg.control_str = raw_data[0]['control']
-        cfg.version_int = raw_data[0]['version']
 
+    # Play statistics only have ROM references. Full ROMs are looked up in their databases.
+    # Render snapshots are used when rendering.
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_RECENT_ID:
-        # Collection ROMs are a list od dictionaries, not a dictionary as usual in other DBs.
-        # Transform list of dictionaries into an OrderedDict to keep the order.
-        raw_data = utils.load_JSON_file(cfg.roms_FN.getPath())
-        cfg.roms = collections.OrderedDict()
-        for r in raw_data[1]: cfg.roms[r['id']] = r
+        stats = load_play_stats(cfg)
+        if resolve:
+            cfg.roms = resolve_play_stats_ROMs(cfg, stats, stats['recent'])
+        else:
+            cfg.roms = render_play_stats_ROMs(cfg, stats, stats['recent'])
         if not cfg.roms:
-            kodi_set_st_notify(st_dic, 'Recently played list is empty. Play some ROMs first!')
+            kodi.set_st_notify(st_dic, 'Recently played list is empty. Play some ROMs first!')
             return
-        cfg.control_str = raw_data[0]['control']
-        cfg.version_int = raw_data[0]['version']
 
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_MOST_PLAYED_ID:
-        raw_data = utils.load_JSON_file(cfg.roms_FN.getPath())
-        cfg.roms = raw_data[1] if raw_data else {}
+        stats = load_play_stats(cfg)
+        if resolve:
+            cfg.roms = resolve_play_stats_ROMs(cfg, stats, get_most_played_ROM_IDs(stats))
+        else:
+            cfg.roms = render_play_stats_ROMs(cfg, stats, get_most_played_ROM_IDs(stats))
         if not cfg.roms:
-            kodi_set_st_notify(st_dic, 'Most played ROMs list is empty. Play some ROMs first!.')
+            kodi.set_st_notify(st_dic, 'Most played ROMs list is empty. Play some ROMs first!.')
             return
-        # Extract roms from JSON data structe and ensure version is correct.
-        cfg.control_str = raw_data[0]['control']
-        cfg.version_int = raw_data[0]['version']
 
     elif cfg.launcher_is_vcategory and cfg.db_filenames_categoryID == const.VCATEGORY_ROM_COLLECTION_ID:
         # Collection ROMs are a list, not a dictionary as usual in other DBs.
         # Convert the list to an OrderedDict() to keep the order.
-        raw_data = utils.load_JSON_file(cfg.roms_FN.getPath())
         cfg.roms = collections.OrderedDict()
-        for r in raw_data[1]: cfg.roms[r['id']] = r
+        for r in load_Collection_ROMs(cfg, cfg.roms_FN, resolve): cfg.roms[r['id']] = r
         if not cfg.roms:
             kodi.set_st_notify(st_dic, 'Collection is empty. Add ROMs to this collection first.')
             return
-        else:
-            cfg.control_str = raw_data[0]['control']
-            cfg.version_int = raw_data[0]['version']
 
     elif cfg.launcher_is_browse_by:
         if not cfg.vlauncher_FN.exists():
@@ -829,8 +1430,10 @@ def save_ROMs(cfg, st):
         # Save categories/launchers to update main timestamp.
         # Also update changed launcher timestamp.
         launcher = cfg.launchers[cfg.db_filenames_launcherID]
-        launcher['num_roms'] = len(cfg.roms)
-        launcher['timestamp_launcher'] = _t = time.time()
+        if current_batch is None:
+            launcher['timestamp_launcher'] = time.time()
+        else:
+            current_batch.touched_launcher_IDs.add(cfg.db_filenames_launcherID)
         pdiag = kodi.ProgressDialog()
         pdiag.startProgress('Saving ROM JSON database...')
         control_dic = {
@@ -845,72 +1448,229 @@ def save_ROMs(cfg, st):
             'rompath'    : launcher['rompath'],
             'romext'     : launcher['romext'],
         }
-        utils.write_JSON_file(cfg.roms_FN.getPath(), [control_dic, launcher_dic, cfg.roms])
+        _write_JSON_file(cfg.roms_FN.getPath(), [control_dic, launcher_dic, cfg.roms])
+        write_ROM_ID_manifest(cfg.ROMS_DIR, launcher, cfg.roms)
+        set_launcher_stats(cfg.ROMS_DIR, launcher, cfg.roms)
+        refresh_ROM_reference_snapshots(cfg, launcher, cfg.roms)
         pdiag.updateProgress(95)
         write_launchers_XML(cfg)
         pdiag.endProgress()
 
-        # If launcher is audited then synchronise the edit ROM in the list of parents.
-        if cfg.launcher['audit_state'] == const.AUDIT_STATE_ON:
-            log.debug('Updating ROM in Parents JSON')
+        # If launcher is audited then synchronise the edited ROMs in the list of parents.
+        if launcher['audit_state'] == const.AUDIT_STATE_ON and cfg.parents_FN.exists():
+            log.debug('Updating ROMs in Parents JSON')
             pdiag.startProgress('Loading Parents JSON...')
-            json_FN = g_PATHS.ROMS_DIR.pjoin(launcher['roms_base_noext'] + '_parents.json')
-            parent_roms = utils.load_JSON_file(json_FN.getPath())
+            parent_roms = utils.load_JSON_file(cfg.parents_FN.getPath())
             # Only edit if ROM is in parent list
-            if romID in parent_roms:
-                log.debug('romID in Parent JSON. Updating...')
-                parent_roms[romID] = roms[romID]
+            for romID in parent_roms:
+                if romID in cfg.roms: parent_roms[romID] = cfg.roms[romID]
             pdiag.updateProgress(10, 'Saving Parents JSON...')
-            utils.write_JSON_file(cfg.ROMS_DIR, parents_roms_base_noext, parent_roms)
+            _write_JSON_file(cfg.parents_FN.getPath(), parent_roms)
             pdiag.endProgress()
 
     # Virtual launchers --------------------------------------------------------------------------
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_FAVOURITES_ID:
-        # Saves ROMs as a dictionary of dictionaries. First dictionary key is rom_ID.
-        control_dic = {
-            'control' : 'Advanced Emulator Launcher Favourite ROMs',
-            'version' : const.AEL_STORAGE_FORMAT,
-        }
-        utils.write_JSON_file(cfg.FAV_JSON_FILE_PATH.getPath(), [control_dic, cfg.roms])
+        # Saves ROMs as a dictionary of ROM references. Dictionary key is rom_ID.
+        write_Favourite_ROMs(cfg, cfg.roms)
 
+    # Only ROM references are stored. ROMs removed from cfg.roms are removed from the list,
+    # edits to the ROM data are not saved.
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_RECENT_ID:
-        # Convert back the OrderedDict into a list and save Collection.
-        # Save ROMs as a list of dictionaries.
-        control_dic = {
-            'control' : 'Advanced Emulator Launcher Collection ROMs',
-            'version' : const.AEL_STORAGE_FORMAT,
-        }
-        rom_list = [cfg.roms[key] for key in cfg.roms]
-        utils.write_JSON_file(cfg.RECENT_PLAYED_FILE_PATH.getPath(), [control_dic, rom_list])
+        stats = load_play_stats(cfg)
+        stats['recent'] = [romID for romID in stats['recent'] if romID in cfg.roms]
+        save_play_stats(cfg, stats)
 
     elif cfg.launcher_is_vlauncher and cfg.db_filenames_launcherID == const.VLAUNCHER_MOST_PLAYED_ID:
-        control_dic = {
-            'control' : 'Advanced Emulator Launcher Favourite ROMs',
-            'version' : const.AEL_STORAGE_FORMAT,
-        }
-        utils.write_JSON_file(cfg.MOST_PLAYED_FILE_PATH.getPath(), [control_dic, cfg.roms])
+        stats = load_play_stats(cfg)
+        for romID in stats['roms']:
+            if romID not in cfg.roms: stats['roms'][romID]['launch_count'] = 0
+        save_play_stats(cfg, stats)
 
     elif cfg.launcher_is_vcategory and cfg.db_filenames_categoryID == const.VCATEGORY_ROM_COLLECTION_ID:
         # Convert back the OrderedDict into a list and save Collection
-        # Save ROMs as a list of dictionaries.
-        control_dic = {
-            'control' : 'Advanced Emulator Launcher Collection ROMs',
-            'version' : const.AEL_STORAGE_FORMAT,
-        }
-        rom_list = [cfg.roms[key] for key in cfg.roms]
-        utils.write_JSON_file(cfg.roms_FN.getPath(), [control_dic, rom_list])
+        # Save ROMs as a list of ROM references.
+        write_Collection_ROMs(cfg, cfg.roms_FN, [cfg.roms[key] for key in cfg.roms])
 
     elif cfg.launcher_is_browse_by:
-        utils.write_JSON_file(cfg.vlauncher_FN.getPath(), cfg.roms)
+        _write_JSON_file(cfg.vlauncher_FN.getPath(), cfg.roms)
 
     else:
         raise RuntimeError
 
+# ------------------------------------------------------------------------------------------------
+# Database check and repair
+# ------------------------------------------------------------------------------------------------
+# ROM databases are checked in a pool of worker threads. The workers load the ROMs with
+# load_ROMs() and apply the fix function. A database is only saved if the fix function changed
+# at least one ROM, detected by comparing a hash of every ROM before and after the fix.
+# Databases are saved with save_ROMs() in the calling thread, so the launcher ROM ID manifest,
+# the launcher statistics and the launcher timestamps are updated and a dry run write batch
+# works. Call repair_ROM_databases() inside a write batch so launchers.xml is loaded and
+# written only once.
+#
+# Every job has its own shallow copy of cfg, made with load_db_index() and
+# get_ROM_db_filenames() in the calling thread before the workers start.
+#
+# Progress is recorded in progress_FN as { job_key : [size, mtime] } for every finished job.
+# If the check is cancelled, the next run skips the jobs whose file did not change since they
+# were checked. The progress file is deleted when all the jobs are finished.
+#
+# job_list = [ (job_key, job_name, categoryID, launcherID, fix_function), ... ]
+#
+# Returns (result_list, cancelled) where result_list is a list of
+# { 'key' : str, 'name' : str, 'status' : str, 'num_roms' : int, 'num_fixed' : int }
+REPAIR_FIXED     = 'Fixed'
+REPAIR_UNCHANGED = 'Unchanged'
+REPAIR_RESUMED   = 'Resumed'
+REPAIR_MISSING   = 'Missing'
+REPAIR_ERROR     = 'Error'
+
+def _new_repair_result(job_key, job_name, status = REPAIR_UNCHANGED):
+    return {
+        'key' : job_key,
+        'name' : job_name,
+        'status' : status,
+        'num_roms' : 0,
+        'num_fixed' : 0,
+    }
+
+def _get_file_signature(file_path):
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return [file_stat.st_size, file_stat.st_mtime]
+
+def _get_ROM_hash(rom):
+    return hashlib.sha1(json.dumps(rom, sort_keys = True, default = utils.JSON_encode_default).encode('utf-8')).digest()
+
+# Returns the database file of a cfg prepared with get_ROM_db_filenames().
+def _get_ROM_db_FN(cfg):
+    return cfg.vlauncher_FN if cfg.launcher_is_browse_by else cfg.roms_FN
+
+# Loads and fixes the ROMs of job_cfg. Does not write anything, it is called in the worker
+# threads. If some ROM was fixed the fixed ROMs are kept in job_cfg.roms for save_ROMs().
+def repair_ROM_database(job_key, job_name, job_cfg, fix_function):
+    result = _new_repair_result(job_key, job_name)
+    if not _get_ROM_db_FN(job_cfg).exists():
+        result['status'] = REPAIR_MISSING
+        return result
+    job_cfg.roms = {}
+    load_ROMs(job_cfg, kodi.new_status_dic())
+    for rom in job_cfg.roms.values():
+        old_hash = _get_ROM_hash(rom)
+        fix_function(rom)
+        if _get_ROM_hash(rom) != old_hash: result['num_fixed'] += 1
+    result['num_roms'] = len(job_cfg.roms)
+    if result['num_fixed']:
+        result['status'] = REPAIR_FIXED
+    else:
+        job_cfg.roms = {}
+
+    return result
+
+class Threaded_DB_Repair(threading.Thread):
+    def __init__(self, job_queue, result_queue, cancel_event):
+        threading.Thread.__init__(self)
+        self.job_queue = job_queue
+        self.result_queue = result_queue
+        self.cancel_event = cancel_event
+
+    def run(self):
+        while not self.cancel_event.is_set():
+            try:
+                job_key, job_name, job_cfg, fix_function = self.job_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = repair_ROM_database(job_key, job_name, job_cfg, fix_function)
+            except Exception as ex:
+                log.error('Threaded_DB_Repair() Exception repairing "{}"'.format(job_name))
+                log.error('Threaded_DB_Repair() {}'.format(ex))
+                result = _new_repair_result(job_key, job_name, REPAIR_ERROR)
+            result['cfg'] = job_cfg
+            self.result_queue.put(result)
+
+# Saves the database of a finished job and records the progress. Called in the calling thread.
+def _finish_repair_job(result, progress_dic, dry_run):
+    job_cfg = result.pop('cfg')
+    if result['status'] == REPAIR_FIXED:
+        save_ROMs(job_cfg, kodi.new_status_dic())
+        job_cfg.roms = {}
+    if not dry_run and result['status'] in (REPAIR_FIXED, REPAIR_UNCHANGED):
+        progress_dic[result['key']] = _get_file_signature(_get_ROM_db_FN(job_cfg).getPath())
+
+def repair_ROM_databases(cfg, job_list, progress_FN, pdiag = None, num_threads = 4):
+    dry_run = current_batch is not None and current_batch.dry_run
+    progress_dic = utils.load_JSON_file(progress_FN.getPath(), {}, verbose = False) \
+        if progress_FN.exists() else {}
+    result_list = []
+
+    # --- Skip jobs finished in a previous cancelled run ---
+    job_queue = queue.Queue()
+    num_pending = 0
+    for job_key, job_name, categoryID, launcherID, fix_function in job_list:
+        job_cfg = copy.copy(cfg)
+        st = kodi.new_status_dic()
+        load_db_index(job_cfg, st, categoryID, launcherID)
+        get_ROM_db_filenames(job_cfg, st, categoryID, launcherID)
+        signature = _get_file_signature(_get_ROM_db_FN(job_cfg).getPath())
+        if job_key in progress_dic and progress_dic[job_key] == signature:
+            result_list.append(_new_repair_result(job_key, job_name, REPAIR_RESUMED))
+            continue
+        job_queue.put((job_key, job_name, job_cfg, fix_function))
+        num_pending += 1
+    log.info('repair_ROM_databases() {} jobs, {} resumed, {} pending'.format(
+        len(job_list), len(result_list), num_pending))
+
+    # --- Run the jobs in the worker pool ---
+    result_queue = queue.Queue()
+    cancel_event = threading.Event()
+    thread_list = [Threaded_DB_Repair(job_queue, result_queue, cancel_event)
+        for i in range(min(num_threads, num_pending))]
+    for thread in thread_list: thread.start()
+    if pdiag: pdiag.startProgress('Checking ROM databases...', len(job_list), len(result_list))
+    num_done = 0
+    while num_done < num_pending:
+        try:
+            result = result_queue.get(timeout = 0.1)
+        except queue.Empty:
+            if pdiag and pdiag.isCanceled(): cancel_event.set()
+            if cancel_event.is_set() and not any(t.is_alive() for t in thread_list): break
+            continue
+        num_done += 1
+        _finish_repair_job(result, progress_dic, dry_run)
+        result_list.append(result)
+        if not dry_run and num_done % 20 == 0:
+            utils.write_JSON_file(progress_FN.getPath(), progress_dic, verbose = False)
+        if pdiag: pdiag.updateProgress(len(result_list))
+    for thread in thread_list: thread.join()
+    while not result_queue.empty():
+        result = result_queue.get()
+        _finish_repair_job(result, progress_dic, dry_run)
+        result_list.append(result)
+    if pdiag: pdiag.endProgress()
+
+    # --- Record or clear progress ---
+    cancelled = cancel_event.is_set() and len(result_list) < len(job_list)
+    if dry_run:
+        pass
+    elif cancelled:
+        log.info('repair_ROM_databases() Cancelled. Saving progress.')
+        utils.write_JSON_file(progress_FN.getPath(), progress_dic, verbose = False)
+    elif progress_FN.exists():
+        progress_FN.unlink()
+
+    return result_list, cancelled
+
 # ------------------------------------------------------------------------------------------------
 # Categories/Launchers
 # ------------------------------------------------------------------------------------------------
 # Write to disk categories.xml/launchers.xml
 def write_launchers_XML(cfg, update_timestamp = 0.0):
+    if _defer_launchers_XML_write(update_timestamp):
+        log.debug('write_launchers_XML() Write deferred until the end of the write batch')
+        return
     db_file = cfg.CATEGORIES_FILE_PATH
     categories = cfg.categories
     launchers = cfg.launchers
@@ -1006,6 +1766,8 @@ def write_launchers_XML(cfg, update_timestamp = 0.0):
         sl.append(misc.XML('num_extra', const.text_type(launcher['num_extra'])))
         sl.append(misc.XML('timestamp_launcher', const.text_type(launcher['timestamp_launcher'])))
         sl.append(misc.XML('timestamp_report', const.text_type(launcher['timestamp_report'])))
+        if launcher['stats']:
+            sl.append(misc.XML('stats', json.dumps(launcher['stats'], sort_keys = True, separators = (',', ':'))))
         # Launcher artwork
         sl.append(misc.XML('default_icon', launcher['default_icon']))
         sl.append(misc.XML('default_fanart', launcher['default_fanart']))
@@ -1043,7 +1805,7 @@ def write_launchers_XML(cfg, update_timestamp = 0.0):
         sl.append(misc.XML('path_trailer', launcher['path_trailer']))
         sl.append('</launcher>')
     sl.append('</advanced_emulator_launcher>')
-    utils.write_slist_to_file(db_file.getPath(), sl)
+    _write_slist_to_file(db_file.getPath(), sl)
 
 # Loads categories.xml/launchers.xml from disk and fills dictionaries in cfg object.
 # Returns None.
@@ -1114,6 +1876,12 @@ def load_launchers_XML(cfg):
                 elif xml_tag == 'timestamp_launcher' or xml_tag == 'timestamp_report':
                     # Transform Float datatype
                     launcher[xml_tag] = float(text_XML)
+                elif xml_tag == 'stats':
+                    # Transform JSON datatype. Broken statistics are rebuilt when used.
+                    try:
+                        launcher[xml_tag] = json.loads(text_XML) if text_XML else {}
+                    except ValueError:
+                        launcher[xml_tag] = {}
                 else:
                     launcher[xml_tag] = text_XML
             launchers[launcher['id']] = launcher
@@ -1165,6 +1933,11 @@ def unlink_ROMs_database(roms_dir_FN, launcher):
         log.info('Deleting DAT JSON     "{}"'.format(roms_DAT_FN.getOriginalPath()))
         roms_DAT_FN.unlink()
 
+    roms_IDs_FN = get_ROM_ID_manifest_FN(roms_dir_FN, roms_base_noext)
+    if roms_IDs_FN.exists():
+        log.info('Deleting IDs JSON     "{}"'.format(roms_IDs_FN.getOriginalPath()))
+        roms_IDs_FN.unlink()
+
 def rename_ROMs_database(roms_dir_FN, old_roms_base_noext, new_roms_base_noext):
     # Only rename if base names are different
     log.debug('rename_ROMs_database() old_roms_base_noext "{}"'.format(old_roms_base_noext))
@@ -1179,6 +1952,7 @@ def rename_ROMs_database(roms_dir_FN, old_roms_base_noext, new_roms_base_noext):
     old_roms_index_PClone_FN  = roms_dir_FN.pjoin(old_roms_base_noext + '_index_PClone.json')
     old_roms_parents_FN       = roms_dir_FN.pjoin(old_roms_base_noext + '_parents.json')
     old_roms_DAT_FN           = roms_dir_FN.pjoin(old_roms_base_noext + '_DAT.json')
+    old_roms_IDs_FN           = get_ROM_ID_manifest_FN(roms_dir_FN, old_roms_base_noext)
 
     new_roms_json_FN          = roms_dir_FN.pjoin(new_roms_base_noext + '.json')
     new_roms_xml_FN           = roms_dir_FN.pjoin(new_roms_base_noext + '.xml')
@@ -1186,6 +1960,7 @@ def rename_ROMs_database(roms_dir_FN, old_roms_base_noext, new_roms_base_noext):
     new_roms_index_PClone_FN  = roms_dir_FN.pjoin(new_roms_base_noext + '_index_PClone.json')
     new_roms_parents_FN       = roms_dir_FN.pjoin(new_roms_base_noext + '_parents.json')
     new_roms_DAT_FN           = roms_dir_FN.pjoin(new_roms_base_noext + '_DAT.json')
+    new_roms_IDs_FN           = get_ROM_ID_manifest_FN(roms_dir_FN, new_roms_base_noext)
 
     # Only rename files if originals found.
     if old_roms_json_FN.exists():
@@ -1218,6 +1993,449 @@ def rename_ROMs_database(roms_dir_FN, old_roms_base_noext, new_roms_base_noext):
         log.debug('RENAMED OP {}'.format(old_roms_DAT_FN.getOriginalPath()))
         log.debug('   into OP {}'.format(new_roms_DAT_FN.getOriginalPath()))
 
+    if old_roms_IDs_FN.exists():
+        old_roms_IDs_FN.rename(new_roms_IDs_FN)
+        log.debug('RENAMED OP {}'.format(old_roms_IDs_FN.getOriginalPath()))
+        log.debug('   into OP {}'.format(new_roms_IDs_FN.getOriginalPath()))
+
+# -------------------------------------------------------------------------------------------------
+# ROM ID manifest
+# -------------------------------------------------------------------------------------------------
+# Every launcher ROM database has a sidecar file roms_base_noext_IDs.json with the list of
+# ROM IDs. This answers ROM membership queries (for example, checking Favourites) without
+# loading the full ROM dictionaries.
+#
+# The manifest stores the size and mtime of the ROM JSON file it was made from. If the ROM
+# JSON was written by code that does not update the manifest, the manifest is stale and it
+# is rebuilt from the ROM JSON file the next time it is loaded.
+#
+# manifest = { 'size' : int, 'mtime' : float, 'ids' : [romID, romID, ...] }
+def get_ROM_ID_manifest_FN(roms_dir_FN, roms_base_noext):
+    return roms_dir_FN.pjoin(roms_base_noext + '_IDs.json')
+
+def write_ROM_ID_manifest(roms_dir_FN, launcher, roms):
+    if current_batch is not None and current_batch.dry_run: return
+    roms_json_FN = roms_dir_FN.pjoin(launcher['roms_base_noext'] + '.json')
+    signature = _get_file_signature(roms_json_FN.getPath())
+    if signature is None: return
+    manifest = { 'size' : signature[0], 'mtime' : signature[1], 'ids' : list(roms.keys()) }
+    manifest_FN = get_ROM_ID_manifest_FN(roms_dir_FN, launcher['roms_base_noext'])
+    utils.write_JSON_file(manifest_FN.getPath(), manifest, verbose = False)
+
+# Returns a set with the ROM IDs of the launcher. The set is empty if the launcher has no
+# ROM database.
+def load_ROM_ID_set(roms_dir_FN, launcher):
+    roms_json_FN = roms_dir_FN.pjoin(launcher['roms_base_noext'] + '.json')
+    signature = _get_file_signature(roms_json_FN.getPath())
+    if signature is None: return set()
+    manifest_FN = get_ROM_ID_manifest_FN(roms_dir_FN, launcher['roms_base_noext'])
+    manifest = utils.load_JSON_file(manifest_FN.getPath(), {}, verbose = False) \
+        if manifest_FN.exists() else {}
+    if manifest and [manifest['size'], manifest['mtime']] == signature:
+        return set(manifest['ids'])
+
+    # --- Manifest missing or stale. Rebuild it ---
+    log.debug('load_ROM_ID_set() Rebuilding manifest "{}"'.format(manifest_FN.getPath()))
+    json_data = utils.load_JSON_file(roms_json_FN.getPath(), None, verbose = False)
+    if not json_data: return set()
+    roms = json_data[2]
+    write_ROM_ID_manifest(roms_dir_FN, launcher, roms)
+
+    return set(roms.keys())
+
+# -------------------------------------------------------------------------------------------------
+# Launcher statistics
+# -------------------------------------------------------------------------------------------------
+# The counters of the launcher reports and the global reports are stored in the launcher
+# index (categories.xml), in the launcher field 'stats'. They are computed in one pass over
+# the ROMs when the ROMs of the launcher are saved, so reports never load the ROM databases.
+#
+# Like the ROM ID manifest, the statistics store the size and mtime of the ROM JSON file they
+# were computed from. If the ROM JSON was written by code that does not update the statistics
+# they are stale and they are recomputed from the ROM JSON file the next time they are used.
+#
+# stats = {
+#     'size' : int, 'mtime' : float, 'num_roms' : int,
+#     'missing' : { field : int, ... },    Number of ROMs with empty metadata field or asset.
+#     'audit' : { AUDIT_STATUS_* : int, ... },
+#     'pclone' : { PCLONE_STATUS_* : int, ... },
+# }
+LAUNCHER_STATS_META_LIST = [
+    ('m_year', 'Year'),
+    ('m_genre', 'Genre'),
+    ('m_developer', 'Developer'),
+    ('m_nplayers', 'NPlayers'),
+    ('m_esrb', 'ESRB'),
+    ('m_rating', 'Rating'),
+    ('m_plot', 'Plot'),
+]
+LAUNCHER_STATS_ASSET_LIST = [
+    ('s_title', 'Title'),
+    ('s_snap', 'Snap'),
+    ('s_boxfront', 'Boxfront'),
+    ('s_boxback', 'Boxback'),
+    ('s_cartridge', 'Cartridge'),
+    ('s_fanart', 'Fanart'),
+    ('s_banner', 'Banner'),
+    ('s_clearlogo', 'Clearlogo'),
+    ('s_flyer', 'Flyer'),
+    ('s_map', 'Map'),
+    ('s_manual', 'Manual'),
+    ('s_trailer', 'Trailer'),
+]
+
+def new_launcher_stats():
+    field_list = LAUNCHER_STATS_META_LIST + LAUNCHER_STATS_ASSET_LIST
+    return {
+        'size' : 0,
+        'mtime' : 0.0,
+        'num_roms' : 0,
+        'missing' : { field : 0 for field, name in field_list },
+        'audit' : { status : 0 for status in const.AUDIT_STATUS_LIST },
+        'pclone' : { status : 0 for status in const.PCLONE_STATUS_LIST },
+    }
+
+# Adds the ROM to the statistics counters. Use delta = -1 to remove the ROM.
+def update_launcher_stats(stats, rom, delta = 1):
+    stats['num_roms'] += delta
+    missing = stats['missing']
+    for field, name in LAUNCHER_STATS_META_LIST:
+        if field == 'm_esrb':
+            if rom.get('m_esrb', const.ESRB_PENDING) == const.ESRB_PENDING: missing[field] += delta
+        elif not rom.get(field): missing[field] += delta
+    for field, name in LAUNCHER_STATS_ASSET_LIST:
+        if not rom.get(field): missing[field] += delta
+    # Unknown statuses are counted as not audited.
+    audit_status = rom.get('nointro_status', const.AUDIT_STATUS_NONE)
+    if audit_status not in stats['audit']: audit_status = const.AUDIT_STATUS_NONE
+    stats['audit'][audit_status] += delta
+    pclone_status = rom.get('pclone_status', const.PCLONE_STATUS_NONE)
+    if pclone_status not in stats['pclone']: pclone_status = const.PCLONE_STATUS_NONE
+    stats['pclone'][pclone_status] += delta
+
+def compute_launcher_stats(roms):
+    stats = new_launcher_stats()
+    for rom in roms.values(): update_launcher_stats(stats, rom)
+    return stats
+
+# Call after the ROM JSON file of the launcher has been written. Sets the launcher statistics
+# and the ROM counters. The launcher index is not saved.
+def set_launcher_stats(roms_dir_FN, launcher, roms):
+    stats = compute_launcher_stats(roms)
+    roms_json_FN = roms_dir_FN.pjoin(launcher['roms_base_noext'] + '.json')
+    signature = _get_file_signature(roms_json_FN.getPath())
+    if signature is not None: stats['size'], stats['mtime'] = signature
+    launcher['stats'] = stats
+    launcher['num_roms'] = stats['num_roms']
+
+# Returns a tuple (stats, rebuilt). Missing or stale statistics are recomputed from the
+# ROM JSON file. If rebuilt is True the caller must save the launcher index.
+def get_launcher_stats(roms_dir_FN, launcher):
+    roms_json_FN = roms_dir_FN.pjoin(launcher['roms_base_noext'] + '.json')
+    signature = _get_file_signature(roms_json_FN.getPath())
+    if signature is None: return (new_launcher_stats(), False)
+    stats = launcher['stats']
+    if stats and [stats['size'], stats['mtime']] == signature: return (stats, False)
+
+    # --- Statistics missing or stale. Rebuild them ---
+    log.debug('get_launcher_stats() Rebuilding statistics of "{}"'.format(launcher['m_name']))
+    json_data = utils.load_JSON_file(roms_json_FN.getPath(), None, verbose = False)
+    if not json_data: return (new_launcher_stats(), False)
+    set_launcher_stats(roms_dir_FN, launcher, json_data[2])
+
+    return (launcher['stats'], True)
+
+# -------------------------------------------------------------------------------------------------
+# Play statistics (Recently played and Most played ROMs)
+# -------------------------------------------------------------------------------------------------
+# Play statistics only store ROM references, counters and a small render snapshot of the ROM,
+# taken every time the ROM is launched. The Recently played and Most played ROMs are rendered
+# from the snapshots with render_play_stats_ROMs(). The full ROM data is looked up in the
+# database the ROM was launched from with resolve_play_stats_ROMs() only when needed (view,
+# delete missing ROMs, etc.).
+#
+# Launching a ROM appends one line to the launch log play_stats.log, so launching never
+# rewrites a database. The log is replayed over the snapshot play_stats.json when statistics
+# are loaded. Loading never writes files, so render commands running concurrently can load
+# the statistics. compact_play_stats() merges the log into the snapshot when it has more than
+# PLAY_STATS_MAX_LOG_LINES events and writes the statistics imported from the old
+# history.json/most_played.json. It is called only by commands that run with no concurrency.
+#
+# The launch route (categoryID, launcherID) is where the ROM was launched from:
+#   (categoryID, launcherID)                        Standard ROM launcher
+#   (VCATEGORY_SPECIAL_ID, VLAUNCHER_FAVOURITES_ID) Favourites
+#   (VCATEGORY_ROM_COLLECTION_ID, collectionID)     ROM Collection
+# ROMs in Browse By virtual launchers are recorded with the route of their parent launcher.
+#
+# stats = {
+#     'roms' : {
+#         romID : {
+#             'categoryID' : str, 'launcherID' : str,
+#             'launch_count' : int, 'last_played' : float, 'playtime' : float,
+#             'snapshot' : { ROM_RENDER_SNAPSHOT_FIELDS }, # Missing in old statistics.
+#         }, ...
+#     },
+#     'recent' : [romID, romID, ...], # Most recent first, at most PLAY_STATS_MAX_RECENT.
+# }
+#
+# Log events, one JSON object per line:
+#   { 'event' : 'launch', 'romID' : str, 'categoryID' : str, 'launcherID' : str, 'time' : float,
+#     'snapshot' : { ... } }
+#   { 'event' : 'playtime', 'romID' : str, 'playtime' : float }
+PLAY_STATS_MAX_RECENT = 100
+PLAY_STATS_MAX_LOG_LINES = 500
+
+def _new_play_stats():
+    return { 'roms' : {}, 'recent' : [] }
+
+def _apply_play_event(stats, event):
+    romID = event['romID']
+    if event['event'] == 'launch':
+        if romID in stats['roms']:
+            entry = stats['roms'][romID]
+        else:
+            entry = { 'launch_count' : 0, 'last_played' : 0.0, 'playtime' : 0.0 }
+            stats['roms'][romID] = entry
+        entry['categoryID'] = event['categoryID']
+        entry['launcherID'] = event['launcherID']
+        entry['launch_count'] += 1
+        entry['last_played'] = event['time']
+        if 'snapshot' in event: entry['snapshot'] = event['snapshot']
+        if romID in stats['recent']: stats['recent'].remove(romID)
+        stats['recent'].insert(0, romID)
+        del stats['recent'][PLAY_STATS_MAX_RECENT:]
+    elif event['event'] == 'playtime':
+        if romID in stats['roms']: stats['roms'][romID]['playtime'] += event['playtime']
+    else:
+        log.warning('_apply_play_event() Unknown event "{}"'.format(event['event']))
+
+def _append_play_event(cfg, event):
+    with io.open(cfg.PLAY_STATS_LOG_FILE_PATH.getPath(), 'ab') as file:
+        file.write((json.dumps(event) + '\n').encode('utf-8'))
+
+# Imports the old history.json and most_played.json, which stored full Favourite ROM copies.
+# The parent launcher is used as the launch route.
+def _import_legacy_play_stats(cfg):
+    stats = _new_play_stats()
+    if cfg.MOST_PLAYED_FILE_PATH.exists():
+        raw_data = utils.load_JSON_file(cfg.MOST_PLAYED_FILE_PATH.getPath(), [])
+        roms = raw_data[1] if raw_data else {}
+        for romID in roms:
+            stats['roms'][romID] = {
+                'categoryID' : '', 'launcherID' : roms[romID]['launcherID'],
+                'launch_count' : roms[romID]['launch_count'], 'last_played' : 0.0,
+                'playtime' : 0.0, 'snapshot' : get_ROM_render_snapshot(roms[romID]),
+            }
+    if cfg.RECENT_PLAYED_FILE_PATH.exists():
+        raw_data = utils.load_JSON_file(cfg.RECENT_PLAYED_FILE_PATH.getPath(), [])
+        rom_list = raw_data[1] if raw_data else []
+        for rom in rom_list[:PLAY_STATS_MAX_RECENT]:
+            if rom['id'] not in stats['roms']:
+                stats['roms'][rom['id']] = {
+                    'categoryID' : '', 'launcherID' : rom['launcherID'],
+                    'launch_count' : 0, 'last_played' : 0.0, 'playtime' : 0.0,
+                    'snapshot' : get_ROM_render_snapshot(rom),
+                }
+            stats['recent'].append(rom['id'])
+    log.info('_import_legacy_play_stats() Imported {} ROMs, {} recently played'.format(
+        len(stats['roms']), len(stats['recent'])))
+
+    return stats
+
+# Returns the play statistics dictionary with the launch log replayed. Never writes files.
+# If there is no snapshot the old history.json/most_played.json are imported.
+def load_play_stats(cfg):
+    stats, num_events = _load_play_stats(cfg)
+    return stats
+
+# Returns (stats, number of launch log events).
+def _load_play_stats(cfg):
+    if cfg.PLAY_STATS_FILE_PATH.exists():
+        raw_data = utils.load_JSON_file(cfg.PLAY_STATS_FILE_PATH.getPath(), [], verbose = False)
+        stats = raw_data[1] if raw_data else _new_play_stats()
+    elif cfg.RECENT_PLAYED_FILE_PATH.exists() or cfg.MOST_PLAYED_FILE_PATH.exists():
+        stats = _import_legacy_play_stats(cfg)
+    else:
+        stats = _new_play_stats()
+
+    # --- Replay the launch log ---
+    # A partially written last line (Kodi killed while writing) is ignored.
+    num_events = 0
+    if cfg.PLAY_STATS_LOG_FILE_PATH.exists():
+        with io.open(cfg.PLAY_STATS_LOG_FILE_PATH.getPath(), 'rb') as file:
+            for line in file:
+                try:
+                    event = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    log.warning('load_play_stats() Skipping malformed log line')
+                    continue
+                _apply_play_event(stats, event)
+                num_events += 1
+    log.debug('load_play_stats() {} ROMs, {} log events'.format(len(stats['roms']), num_events))
+
+    return (stats, num_events)
+
+# Writes the snapshot if the launch log is long or if the old play statistics files were not
+# imported yet. Call it only from commands that run with no concurrency (run_protected()),
+# because the launch log is deleted.
+def compact_play_stats(cfg):
+    needs_import = not cfg.PLAY_STATS_FILE_PATH.exists() and \
+        (cfg.RECENT_PLAYED_FILE_PATH.exists() or cfg.MOST_PLAYED_FILE_PATH.exists())
+    if not needs_import and not cfg.PLAY_STATS_LOG_FILE_PATH.exists(): return
+    stats, num_events = _load_play_stats(cfg)
+    if not needs_import and num_events <= PLAY_STATS_MAX_LOG_LINES: return
+    log.info('compact_play_stats() Writing snapshot, {} log events merged'.format(num_events))
+    save_play_stats(cfg, stats)
+
+# Writes the snapshot and empties the launch log. stats must be loaded with load_play_stats()
+# so the launch log is already merged. Entries not in the recently played list and never
+# launched (deleted from Most played) are dropped.
+def save_play_stats(cfg, stats):
+    recent_set = set(stats['recent'])
+    stats['roms'] = { romID : entry for romID, entry in stats['roms'].items() \
+        if entry['launch_count'] > 0 or romID in recent_set }
+    control_dic = {
+        'control' : 'Advanced Emulator Launcher play statistics',
+        'version' : const.AEL_STORAGE_FORMAT,
+    }
+    _write_JSON_file(cfg.PLAY_STATS_FILE_PATH.getPath(), [control_dic, stats])
+    if current_batch is not None and current_batch.dry_run: return
+    if cfg.PLAY_STATS_LOG_FILE_PATH.exists(): cfg.PLAY_STATS_LOG_FILE_PATH.unlink()
+
+# Called when a ROM is launched. Only appends one event to the launch log.
+# rom is the Favourite ROM launched, its render snapshot is stored in the statistics.
+def record_ROM_launch(cfg, categoryID, launcherID, romID, rom):
+    _append_play_event(cfg, {
+        'event' : 'launch', 'romID' : romID,
+        'categoryID' : categoryID, 'launcherID' : launcherID, 'time' : time.time(),
+        'snapshot' : get_ROM_render_snapshot(rom),
+    })
+
+# Called after a blocking launch returns. playtime is in seconds.
+def record_ROM_playtime(cfg, romID, playtime):
+    _append_play_event(cfg, { 'event' : 'playtime', 'romID' : romID, 'playtime' : playtime })
+
+# Returns an OrderedDict with the full ROMs in rom_ID_list, in the same order, with the
+# play statistics fields launch_count, last_played and playtime added.
+# Every database referenced is loaded only once. ROMs that cannot be found (launcher,
+# collection or ROM deleted) are not included.
+def resolve_play_stats_ROMs(cfg, stats, rom_ID_list):
+    if not cfg.launchers: load_launchers_XML(cfg)
+    db_cache = {}
+    collections_index = None
+    resolved = collections.OrderedDict()
+    for romID in rom_ID_list:
+        if romID not in stats['roms']: continue
+        entry = stats['roms'][romID]
+        route = (entry['categoryID'], entry['launcherID'])
+        if route not in db_cache:
+            if entry['launcherID'] == const.VLAUNCHER_FAVOURITES_ID:
+                db_cache[route] = (None, load_Favourite_ROMs(cfg))
+            elif entry['categoryID'] == const.VCATEGORY_ROM_COLLECTION_ID:
+                if collections_index is None:
+                    collections_index = load_Collection_index_XML(cfg.COLLECTIONS_FILE_PATH)
+                roms = {}
+                if entry['launcherID'] in collections_index['collections']:
+                    collection = collections_index['collections'][entry['launcherID']]
+                    roms_FN = cfg.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
+                    for r in load_Collection_ROMs(cfg, roms_FN): roms[r['id']] = r
+                db_cache[route] = (None, roms)
+            elif entry['launcherID'] in cfg.launchers:
+                launcher = cfg.launchers[entry['launcherID']]
+                roms_FN = cfg.ROMS_DIR.pjoin(launcher['roms_base_noext'] + '.json')
+                json_data = utils.load_JSON_file(roms_FN.getPath(), [], verbose = False)
+                db_cache[route] = (launcher, json_data[2] if json_data else {})
+            else:
+                db_cache[route] = (None, {})
+        launcher, roms = db_cache[route]
+        if romID not in roms:
+            log.debug('resolve_play_stats_ROMs() ROM {} not found in {}'.format(romID, route))
+            continue
+        if launcher is None:
+            rom = dict(roms[romID])
+        else:
+            rom = get_Favourite_from_ROM(roms[romID], launcher)
+        rom['launch_count'] = entry['launch_count']
+        rom['last_played'] = entry['last_played']
+        rom['playtime'] = entry['playtime']
+        resolved[romID] = rom
+    log.debug('resolve_play_stats_ROMs() Resolved {} of {} ROMs, {} databases loaded'.format(
+        len(resolved), len(rom_ID_list), len(db_cache)))
+
+    return resolved
+
+# Returns an OrderedDict with the ROMs in rom_ID_list made from the snapshots, in the same
+# order, like resolve_play_stats_ROMs(). Use it only to render. Only the ROMs without snapshot
+# (statistics of an older AEL version) are resolved from their databases.
+def render_play_stats_ROMs(cfg, stats, rom_ID_list):
+    no_snapshot_list = [romID for romID in rom_ID_list \
+        if romID in stats['roms'] and 'snapshot' not in stats['roms'][romID]]
+    resolved = resolve_play_stats_ROMs(cfg, stats, no_snapshot_list) if no_snapshot_list else {}
+    rendered = collections.OrderedDict()
+    for romID in rom_ID_list:
+        if romID in resolved:
+            rendered[romID] = resolved[romID]
+            continue
+        if romID not in stats['roms'] or romID in no_snapshot_list: continue
+        entry = stats['roms'][romID]
+        rom = new_rom()
+        rom.update(entry['snapshot'])
+        rom['id'] = romID
+        rom['launcherID'] = entry['launcherID']
+        rom['launch_count'] = entry['launch_count']
+        rom['last_played'] = entry['last_played']
+        rom['playtime'] = entry['playtime']
+        rendered[romID] = rom
+    log.debug('render_play_stats_ROMs() {} ROMs, {} without snapshot'.format(
+        len(rendered), len(no_snapshot_list)))
+
+    return rendered
+
+# Returns the list of ROM IDs in Most played ROMs, most launched first.
+def get_most_played_ROM_IDs(stats):
+    rom_ID_list = [romID for romID in stats['roms'] if stats['roms'][romID]['launch_count'] > 0]
+    return sorted(rom_ID_list, key = lambda x : stats['roms'][x]['launch_count'], reverse = True)
+
+# Checks the play statistics, called by the database check. Entries with missing fields are
+# completed, the launch route of entries imported from history.json/most_played.json is set
+# and the recently played list is cleaned. The statistics are saved only if something changed.
+# Returns a repair result like repair_ROM_databases().
+def repair_play_stats(cfg):
+    result = _new_repair_result('play_stats', 'Play statistics')
+    if not cfg.PLAY_STATS_FILE_PATH.exists() and not cfg.PLAY_STATS_LOG_FILE_PATH.exists():
+        result['status'] = REPAIR_MISSING
+        return result
+    if not cfg.launchers: load_launchers_XML(cfg)
+    stats = load_play_stats(cfg)
+    for romID, entry in stats['roms'].items():
+        old_hash = _get_ROM_hash(entry)
+        for field, default in [('categoryID', ''), ('launcherID', ''),
+            ('launch_count', 0), ('last_played', 0.0), ('playtime', 0.0)]:
+            if field not in entry: entry[field] = default
+        if not entry['categoryID'] and entry['launcherID'] in cfg.launchers:
+            entry['categoryID'] = cfg.launchers[entry['launcherID']]['categoryID']
+        if _get_ROM_hash(entry) != old_hash: result['num_fixed'] += 1
+    # --- Add the render snapshot missing in the statistics of older AEL versions ---
+    no_snapshot_list = [romID for romID in stats['roms'] if 'snapshot' not in stats['roms'][romID]]
+    if no_snapshot_list:
+        roms = resolve_play_stats_ROMs(cfg, stats, no_snapshot_list)
+        for romID in roms:
+            stats['roms'][romID]['snapshot'] = get_ROM_render_snapshot(roms[romID])
+        result['num_fixed'] += len(roms)
+    recent_list = []
+    for romID in stats['recent']:
+        if romID in stats['roms'] and romID not in recent_list: recent_list.append(romID)
+    recent_list = recent_list[:PLAY_STATS_MAX_RECENT]
+    if recent_list != stats['recent']:
+        result['num_fixed'] += len(stats['recent']) - len(recent_list)
+        stats['recent'] = recent_list
+    result['num_roms'] = len(stats['roms'])
+    if result['num_fixed']:
+        save_play_stats(cfg, stats)
+        result['status'] = REPAIR_FIXED
+
+    return result
+
 # -------------------------------------------------------------------------------------------------
 # Virtual Categories
 # -------------------------------------------------------------------------------------------------
@@ -1239,7 +2457,7 @@ def write_VCategory_XML(roms_xml_file, roms):
         sl.append(misc.XML('roms_base_noext', rom['roms_base_noext']))
         sl.append('</VLauncher>')
     sl.append('</advanced_emulator_launcher_Virtual_Category_index>')
-    utils.write_slist_to_file(roms_xml_file.getPath(), sl)
+    _write_slist_to_file(roms_xml_file.getPath(), sl)
 
 # Loads an XML file containing Virtual Launcher indices
 # It is basically the same as ROMs, but with some more fields to store launching application data.
@@ -1303,7 +2521,7 @@ def write_Collection_index_XML(xml_FN, collections):
         sl.append(misc.XML('s_trailer', collection['s_trailer']))
         sl.append('</Collection>')
     sl.append('</advanced_emulator_launcher_Collection_index>')
-    utils.write_slist_to_file(xml_FN.getPath(), sl)
+    _write_slist_to_file(xml_FN.getPath(), sl)
 
 def load_Collection_index_XML(xml_FN):
     log.debug('load_Collection_index_XML() Loading XML file {}'.format(xml_FN.getOriginalPath()))
@@ -1330,40 +2548,218 @@ def load_Collection_index_XML(xml_FN):
             ret['collections'][collection['id']] = collection
     return ret
 
-# Exports a collection in human-readable JSON.
-# Filenames of artwork/assets must be converted to relative paths, see
-# comments in fs_export_ROM_collection_assets()
-def export_ROM_collection(output_filename, collection, rom_list):
-    log.info('export_ROM_collection() File {}'.format(output_filename.getOriginalPath()))
-
+# Changes the asset filenames of the collection and the collection ROMs to the relative paths
+# used when exporting. Returns the JSON data of the exported collection. See the comments in
+# export_ROM_collection_assets().
+def _get_export_collection_data(collection, rom_list):
     ex_collection_dic = copy.deepcopy(collection)
-    for asset_kind in COLLECTION_ASSET_ID_LIST:
-        AInfo = assets_get_info_scheme(asset_kind)
+    for asset_kind in const.COLLECTION_ASSET_ID_LIST:
+        AInfo = assets.ASSET_INFO_DICT[asset_kind]
         if not ex_collection_dic[AInfo.key]: continue
         # Change filename of asset.
-        asset_FN = FileName(ex_collection_dic[AInfo.key])
+        asset_FN = utils.FileName(ex_collection_dic[AInfo.key])
         new_asset_path = collection['m_name'] + '_' + AInfo.fname_infix + asset_FN.getExt()
         ex_collection_dic[AInfo.key] = new_asset_path
 
     ex_rom_list = copy.deepcopy(rom_list)
     for rom in ex_rom_list:
-        for asset_kind in ROM_ASSET_ID_LIST:
-            AInfo = assets_get_info_scheme(asset_kind)
+        for asset_kind in const.ROM_ASSET_ID_LIST:
+            AInfo = assets.ASSET_INFO_DICT[asset_kind]
             if not rom[AInfo.key]: continue
             # Change filename of asset.
-            asset_FN = FileName(rom[AInfo.key])
-            ROM_FileName = FileName(rom['filename'])
-            new_asset_basename = assets_get_collection_asset_basename(
+            asset_FN = utils.FileName(rom[AInfo.key])
+            ROM_FileName = utils.FileName(rom['filename'])
+            new_asset_basename = assets.get_collection_asset_basename(
                 AInfo, ROM_FileName.getBaseNoExt(), rom['platform'], asset_FN.getExt())
             rom[AInfo.key] = collection['m_name'] + ' assets' + '/' + new_asset_basename
 
-    # Produce nicely formatted JSON when exporting
     control_dic = {
         'control' : 'Advanced Emulator Launcher Collection ROMs',
-        'version' : AEL_STORAGE_FORMAT
+        'version' : const.AEL_STORAGE_FORMAT,
     }
-    raw_data = [control_dic, ex_collection_dic, ex_rom_list]
-    utils_write_JSON_file(output_filename.getPath(), raw_data, pprint = True)
+    return [control_dic, ex_collection_dic, ex_rom_list]
+
+# Exports a collection in human-readable JSON.
+# Filenames of artwork/assets must be converted to relative paths, see
+# comments in export_ROM_collection_assets()
+def export_ROM_collection(output_filename, collection, rom_list):
+    log.info('export_ROM_collection() File {}'.format(output_filename.getOriginalPath()))
+    # Produce nicely formatted JSON when exporting
+    raw_data = _get_export_collection_data(collection, rom_list)
+    utils.write_JSON_file(output_filename.getPath(), raw_data, pprint = True)
+
+# Returns a list of (source_path, relative_path) of the assets to export. relative_path uses
+# '/' as separator and it is the same path written in the exported collection JSON.
+# Assets not set are not included. Assets set but missing are included and reported as
+# missing when copying.
+def _get_export_collection_assets(collection, rom_list):
+    asset_list = []
+    for asset_kind in const.COLLECTION_ASSET_ID_LIST:
+        AInfo = assets.ASSET_INFO_DICT[asset_kind]
+        if not collection[AInfo.key]: continue
+        asset_FN = utils.FileName(collection[AInfo.key])
+        rel_path = collection['m_name'] + '_' + AInfo.fname_infix + asset_FN.getExt()
+        asset_list.append((asset_FN.getPath(), rel_path))
+    for rom in rom_list:
+        ROM_FileName = utils.FileName(rom['filename'])
+        for asset_kind in const.ROM_ASSET_ID_LIST:
+            AInfo = assets.ASSET_INFO_DICT[asset_kind]
+            if not rom[AInfo.key]: continue
+            asset_FN = utils.FileName(rom[AInfo.key])
+            new_asset_basename = assets.get_collection_asset_basename(
+                AInfo, ROM_FileName.getBaseNoExt(), rom['platform'], asset_FN.getExt())
+            rel_path = collection['m_name'] + ' assets' + '/' + new_asset_basename
+            asset_list.append((asset_FN.getPath(), rel_path))
+
+    return asset_list
+
+# -------------------------------------------------------------------------------------------------
+# Parallel verified file copy (ROM Collection export and import)
+# -------------------------------------------------------------------------------------------------
+# Files are copied in a pool of threads. A file is not copied if the destination has the same
+# size and mtime (shutil.copystat() is used after copying) or the same SHA1 hash.
+#
+# The export writes a manifest next to the collection JSON with the size and SHA1 of every
+# exported file. When importing, if the manifest is found the imported files are verified
+# against it and files with wrong checksum are not imported.
+#
+# manifest = {
+#     'control' : 'Advanced Emulator Launcher Collection manifest', 'version' : int,
+#     'files' : { relative_path : { 'size' : int, 'mtime' : float, 'sha1' : str }, ... },
+# }
+COPY_COPIED   = 'Copied'
+COPY_SKIPPED  = 'Skipped'
+COPY_MISSING  = 'Missing'
+COPY_BAD_HASH = 'Bad checksum'
+COPY_ERROR    = 'Error'
+
+COPY_BLOCK_SIZE = 1024 * 1024
+
+def get_collection_manifest_FN(json_FN):
+    return utils.FileName(json_FN.getPathNoExt() + '_manifest.json')
+
+def load_collection_manifest(json_FN):
+    manifest_FN = get_collection_manifest_FN(json_FN)
+    if not manifest_FN.exists(): return {}
+    manifest = utils.load_JSON_file(manifest_FN.getPath(), {}, verbose = False)
+
+    return manifest['files'] if manifest else {}
+
+def write_collection_manifest(json_FN, manifest_files):
+    manifest = {
+        'control' : 'Advanced Emulator Launcher Collection manifest',
+        'version' : const.AEL_STORAGE_FORMAT,
+        'files' : manifest_files,
+    }
+    utils.write_JSON_file(get_collection_manifest_FN(json_FN).getPath(), manifest, pprint = True)
+
+def _get_file_SHA1(file_path):
+    sha1 = hashlib.sha1()
+    with io.open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(COPY_BLOCK_SIZE), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+# Copies the file and computes the SHA1 hash in one pass. Returns the SHA1 hex string.
+def _copy_file_with_SHA1(source_path, dest_path):
+    sha1 = hashlib.sha1()
+    with io.open(source_path, 'rb') as f_in, io.open(dest_path, 'wb') as f_out:
+        for block in iter(lambda: f_in.read(COPY_BLOCK_SIZE), b''):
+            sha1.update(block)
+            f_out.write(block)
+    shutil.copystat(source_path, dest_path)
+    return sha1.hexdigest()
+
+# Returns a tuple (status, manifest_entry). manifest_entry is None if the file was not copied.
+# old_entry is the entry of this file in the manifest of the previous copy, or None.
+def copy_file_verified(source_path, dest_path, old_entry = None, expected_sha1 = None):
+    try:
+        src_stat = os.stat(source_path)
+    except OSError:
+        return (COPY_MISSING, None)
+    try:
+        try:
+            dst_stat = os.stat(dest_path)
+        except OSError:
+            dst_stat = None
+        sha1 = None
+        if dst_stat is not None and dst_stat.st_size == src_stat.st_size:
+            if int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+                if old_entry and old_entry['size'] == src_stat.st_size and \
+                    int(old_entry['mtime']) == int(src_stat.st_mtime):
+                    sha1 = old_entry['sha1']
+                else:
+                    sha1 = _get_file_SHA1(dest_path)
+            else:
+                dest_sha1 = _get_file_SHA1(dest_path)
+                if _get_file_SHA1(source_path) == dest_sha1: sha1 = dest_sha1
+        if sha1 is not None:
+            status = COPY_SKIPPED
+        else:
+            dest_dir = os.path.dirname(dest_path)
+            if dest_dir and not os.path.isdir(dest_dir): os.makedirs(dest_dir)
+            sha1 = _copy_file_with_SHA1(source_path, dest_path)
+            status = COPY_COPIED
+        if expected_sha1 is not None and sha1 != expected_sha1:
+            if status == COPY_COPIED: os.remove(dest_path)
+            return (COPY_BAD_HASH, None)
+    except (OSError, IOError) as ex:
+        log.error('copy_file_verified() Exception copying "{}"'.format(source_path))
+        log.error('copy_file_verified() {}'.format(ex))
+        return (COPY_ERROR, None)
+
+    return (status, { 'size' : src_stat.st_size, 'mtime' : src_stat.st_mtime, 'sha1' : sha1 })
+
+class Threaded_File_Copy(threading.Thread):
+    def __init__(self, job_queue, result_queue, cancel_event):
+        threading.Thread.__init__(self)
+        self.job_queue = job_queue
+        self.result_queue = result_queue
+        self.cancel_event = cancel_event
+
+    def run(self):
+        while not self.cancel_event.is_set():
+            try:
+                source_path, dest_path, rel_path, old_entry, expected_sha1 = self.job_queue.get_nowait()
+            except queue.Empty:
+                return
+            status, entry = copy_file_verified(source_path, dest_path, old_entry, expected_sha1)
+            self.result_queue.put((rel_path, status, entry))
+
+# job_list is a list of (source_path, dest_path, relative_path).
+# old_manifest is the manifest of the previous copy, used to not hash unchanged files.
+# If verify is True files are checked against the SHA1 in old_manifest.
+# Returns a tuple (manifest_files, report) where report is a dictionary
+# { status : [relative_path, ...] }
+def copy_files_parallel(job_list, old_manifest = {}, verify = False, pdiag = None, num_threads = 8):
+    job_queue = queue.Queue()
+    result_queue = queue.Queue()
+    cancel_event = threading.Event()
+    for source_path, dest_path, rel_path in job_list:
+        old_entry = old_manifest[rel_path] if rel_path in old_manifest else None
+        expected_sha1 = old_entry['sha1'] if verify and old_entry else None
+        job_queue.put((source_path, dest_path, rel_path, old_entry, expected_sha1))
+    workers = [Threaded_File_Copy(job_queue, result_queue, cancel_event) \
+        for i in range(min(num_threads, len(job_list)))]
+    for worker in workers: worker.start()
+
+    manifest_files = {}
+    report = { COPY_COPIED : [], COPY_SKIPPED : [], COPY_MISSING : [], COPY_BAD_HASH : [], COPY_ERROR : [] }
+    for i in range(len(job_list)):
+        rel_path, status, entry = result_queue.get()
+        report[status].append(rel_path)
+        if entry is not None: manifest_files[rel_path] = entry
+        if pdiag is not None:
+            pdiag.updateProgressInc()
+            if pdiag.isCanceled():
+                cancel_event.set()
+                break
+    for worker in workers: worker.join()
+    log.info('copy_files_parallel() {} copied, {} skipped, {} missing, {} bad checksum, {} errors'.format(
+        len(report[COPY_COPIED]), len(report[COPY_SKIPPED]), len(report[COPY_MISSING]),
+        len(report[COPY_BAD_HASH]), len(report[COPY_ERROR])))
+
+    return (manifest_files, report)
 
 # Export collection assets.
 #
@@ -1389,6 +2785,7 @@ def export_ROM_collection(output_filename, collection, rom_list):
 # The exported layout looks like this:
 #
 # /output/dir/Collection Name.json                              -- Collection metadata
+# /output/dir/Collection Name_manifest.json                     -- Exported files checksums
 # /output/dir/Collection Name_icon.png                          -- Collection assets.
 # /output/dir/Collection Name_fanart.png
 # /output/dir/Collection Name/ROM Name_platform_cname_icon.png  -- Collection ROM assets
@@ -1399,85 +2796,93 @@ def export_ROM_collection(output_filename, collection, rom_list):
 #   collection    dictionary
 #   rom_list      list of dictionaries
 #   asset_dir_FN  FileName object default self.settings['collections_asset_dir']
-def export_ROM_collection_assets(out_dir_FN, collection, rom_list, asset_dir_FN):
+#
+# Returns the copy report, see copy_files_parallel().
+def export_ROM_collection_assets(out_dir_FN, collection, rom_list, asset_dir_FN, pdiag = None):
     log.info('export_ROM_collection_assets() Dir {}'.format(out_dir_FN.getOriginalPath()))
-
-    # --- Export Collection own assets ---
-    assets_dic = {}
-    log.debug('export_ROM_collection_assets() Exporting Collecion assets')
-    for asset_kind in COLLECTION_ASSET_ID_LIST:
-        AInfo = assets_get_info_scheme(asset_kind)
-        asset_FN = FileName(collection[AInfo.key])
-        if not collection[AInfo.key]:
-            log.debug('{:<9s} not set'.format(AInfo.name))
-            continue
-        elif not asset_FN.exists():
-            log.debug('{:<9s} not found "{}"'.format(AInfo.name, asset_FN.getPath()))
-            log.debug('{:<9s} ignoring'.format(AInfo.name))
-            continue
-        # Copy asset file to output dir with new filename.
-        asset_ext = asset_FN.getExt()
-        new_asset_FN = out_dir_FN.pjoin(collection['m_name'] + '_' + AInfo.fname_infix + asset_ext)
-        # log.debug('{:<9s} OP COPY "{}"'.format(AInfo.name, asset_FN.getOriginalPath()))
-        # log.debug('{:<9s} OP   TO "{}"'.format(AInfo.name, new_asset_FN.getOriginalPath()))
-        log.debug('{:<9s} P  COPY "{}"'.format(AInfo.name, asset_FN.getPath()))
-        log.debug('{:<9s} P    TO "{}"'.format(AInfo.name, new_asset_FN.getPath()))
-        try:
-            source_path = asset_FN.getPath().decode(get_fs_encoding(), 'ignore')
-            dest_path = new_asset_FN.getPath().decode(get_fs_encoding(), 'ignore')
-            shutil.copy(source_path, dest_path)
-        except OSError:
-            log.error('export_ROM_collection_assets() OSError exception copying image')
-            kodi.notify_warn('OSError exception copying image')
-            return
-        except IOError:
-            log.error('export_ROM_collection_assets() IOError exception copying image')
-            kodi.notify_warn('IOError exception copying image')
-            return
-
-    # --- Export Collection ROM assets ---
-    # Create output dir if it does not exits.
-    ROM_out_dir_FN = out_dir_FN.pjoin(collection['m_name'] + ' assets')
-    if not ROM_out_dir_FN.exists():
-        log.debug('Creating dir "{}"'.format(ROM_out_dir_FN.getPath()))
-        ROM_out_dir_FN.makedirs()
-
-    # Traverse ROMs and export (copy) assets.
-    log.debug('export_ROM_collection_assets() Exporting ROM assets')
-    # log.debug('Directory {}'.format(ROM_out_dir_FN.getDir()))
-    for rom in rom_list:
-        log.debug('export_ROM_collection_assets() ROM "{}"'.format(rom['m_name']))
-        for asset_kind in ROM_ASSET_ID_LIST:
-            AInfo = assets_get_info_scheme(asset_kind)
-            asset_FN = FileName(rom[AInfo.key])
-            if not rom[AInfo.key]:
-                log.debug('{:<9s} not set'.format(AInfo.name))
-                continue
-            elif not asset_FN.exists():
-                log.debug('{:<9s} not found "{}"'.format(AInfo.name, asset_FN.getPath()))
-                log.debug('{:<9s} ignoring'.format(AInfo.name))
+    json_FN = out_dir_FN.pjoin(collection['m_name'] + '.json')
+    job_list = []
+    for source_path, rel_path in _get_export_collection_assets(collection, rom_list):
+        job_list.append((source_path, out_dir_FN.pjoin(rel_path).getPath(), rel_path))
+    if pdiag is not None: pdiag.startProgress('Exporting ROM Collection assets...', len(job_list))
+    manifest_files, report = copy_files_parallel(job_list, load_collection_manifest(json_FN), pdiag = pdiag)
+    if pdiag is not None: pdiag.endProgress()
+
+    # Add the collection JSON to the manifest.
+    manifest_files[collection['m_name'] + '.json'] = {
+        'size' : os.path.getsize(json_FN.getPath()),
+        'mtime' : os.path.getmtime(json_FN.getPath()),
+        'sha1' : _get_file_SHA1(json_FN.getPath()),
+    }
+    write_collection_manifest(json_FN, manifest_files)
+
+    return report
+
+# Exports the collection JSON, the assets and the manifest in a single ZIP file instead of
+# loose files. Files are stored, not compressed, because artwork is already compressed.
+# Returns the copy report, see copy_files_parallel().
+def export_ROM_collection_archive(zip_FN, collection, rom_list, pdiag = None):
+    log.info('export_ROM_collection_archive() File {}'.format(zip_FN.getOriginalPath()))
+    json_name = collection['m_name'] + '.json'
+    json_data = json.dumps(_get_export_collection_data(collection, rom_list),
+        ensure_ascii = False, sort_keys = True, indent = const.JSON_INDENT, separators = const.JSON_SEP)
+    json_bytes = const.text_type(json_data).encode('utf-8')
+    asset_list = _get_export_collection_assets(collection, rom_list)
+    report = { COPY_COPIED : [], COPY_SKIPPED : [], COPY_MISSING : [], COPY_BAD_HASH : [], COPY_ERROR : [] }
+    manifest_files = {
+        json_name : {
+            'size' : len(json_bytes), 'mtime' : time.time(),
+            'sha1' : hashlib.sha1(json_bytes).hexdigest(),
+        },
+    }
+    if pdiag is not None: pdiag.startProgress('Exporting ROM Collection archive...', len(asset_list))
+    with zipfile.ZipFile(zip_FN.getPath(), 'w', zipfile.ZIP_STORED) as zip_file:
+        zip_file.writestr(json_name, json_bytes)
+        for source_path, rel_path in asset_list:
+            if pdiag is not None: pdiag.updateProgressInc()
+            if not os.path.isfile(source_path):
+                report[COPY_MISSING].append(rel_path)
                 continue
-            # Copy asset file to output dir with new filename.
-            ROM_FileName = FileName(rom['filename'])
-            new_asset_basename = assets_get_collection_asset_basename(
-                AInfo, ROM_FileName.getBaseNoExt(), rom['platform'], asset_FN.getExt())
-            new_asset_FN = ROM_out_dir_FN.pjoin(new_asset_basename)
-            # log.debug('{:<9s} OP COPY "{}"'.format(AInfo.name, asset_FN.getOriginalPath()))
-            # log.debug('{:<9s} OP   TO "{}"'.format(AInfo.name, new_asset_FN.getOriginalPath()))
-            log.debug('{:<9s} COPY "{}"'.format(AInfo.name, asset_FN.getPath()))
-            log.debug('{:<9s}   TO "{}"'.format(AInfo.name, new_asset_FN.getPath()))
             try:
-                utils_copy_file(asset_FN.getPath(), new_asset_FN.getPath())
-            except OSError:
-                log.error('export_ROM_collection_assets() OSError exception copying image')
-                kodi.notify_warn('OSError exception copying image')
-                return
-            except IOError:
-                log.error('export_ROM_collection_assets() IOError exception copying image')
-                kodi.notify_warn('IOError exception copying image')
-                return
-
-# See fs_export_ROM_collection() function.
+                zip_file.write(source_path, rel_path)
+                manifest_files[rel_path] = {
+                    'size' : os.path.getsize(source_path),
+                    'mtime' : os.path.getmtime(source_path),
+                    'sha1' : _get_file_SHA1(source_path),
+                }
+                report[COPY_COPIED].append(rel_path)
+            except (OSError, IOError) as ex:
+                log.error('export_ROM_collection_archive() Exception adding "{}"'.format(source_path))
+                log.error('export_ROM_collection_archive() {}'.format(ex))
+                report[COPY_ERROR].append(rel_path)
+        manifest = {
+            'control' : 'Advanced Emulator Launcher Collection manifest',
+            'version' : const.AEL_STORAGE_FORMAT,
+            'files' : manifest_files,
+        }
+        zip_file.writestr(collection['m_name'] + '_manifest.json',
+            json.dumps(manifest, sort_keys = True, indent = const.JSON_INDENT,
+                separators = const.JSON_SEP).encode('utf-8'))
+    if pdiag is not None: pdiag.endProgress()
+
+    return report
+
+# Extracts a ROM Collection ZIP archive into out_dir_FN (deleted first if it exists).
+# Returns the FileName of the collection JSON inside the archive or None if not found.
+def extract_ROM_collection_archive(zip_FN, out_dir_FN):
+    log.info('extract_ROM_collection_archive() File {}'.format(zip_FN.getOriginalPath()))
+    if out_dir_FN.exists(): shutil.rmtree(out_dir_FN.getPath())
+    out_dir_FN.makedirs()
+    json_FN = None
+    with zipfile.ZipFile(zip_FN.getPath(), 'r') as zip_file:
+        zip_file.extractall(out_dir_FN.getPath())
+        for name in zip_file.namelist():
+            if '/' not in name and name.endswith('.json') and not name.endswith('_manifest.json'):
+                json_FN = out_dir_FN.pjoin(name)
+
+    return json_FN
+
+# See export_ROM_collection() function.
 # Returns a tuple (control_dic, collection_dic, rom_list)
 def import_ROM_collection(input_FileName):
     default_return = ({}, {}, [])
@@ -1498,18 +2903,54 @@ def import_ROM_collection(input_FileName):
 
     return (control_dic, collection_dic, rom_list)
 
-# Returns a tuple (control_dic, assets_dic)
-def import_ROM_collection_assets(input_FileName):
-    default_return = ({}, {})
-
+# Imports the collection and collection ROM assets into asset_dir_FN and updates the asset
+# paths in the collection and ROMs. If the collection manifest exists the imported files are
+# verified against it. Assets not found or with bad checksum are unset.
+# Returns the copy report, see copy_files_parallel().
+def import_ROM_collection_assets(input_FileName, collection, rom_list, asset_dir_FN, pdiag = None):
     log.info('import_ROM_collection_assets() Loading {}'.format(input_FileName.getOriginalPath()))
-    raw_data = utils.load_JSON_file(input_FileName.getPath())
-    if not raw_data: return default_return
-    control_dic = raw_data[0]
-    assets_dic  = raw_data[1]
-    control_str = control_dic['control']
-    version_int = control_dic['version']
-    return (control_dic, assets_dic)
+    in_dir_FN = utils.FileName(input_FileName.getDir())
+    manifest_files = load_collection_manifest(input_FileName)
+    if manifest_files:
+        log.info('import_ROM_collection_assets() Verifying {} files with manifest'.format(len(manifest_files)))
+
+    # --- Make the list of files to import ---
+    # (object, asset key, source path, dest path, relative path)
+    asset_list = []
+    for asset_kind in const.COLLECTION_ASSET_ID_LIST:
+        AInfo = assets.ASSET_INFO_DICT[asset_kind]
+        if not collection[AInfo.key]: continue
+        in_asset_FN = in_dir_FN.pjoin(collection[AInfo.key])
+        new_asset_basename = collection['m_name'] + '_' + AInfo.fname_infix + in_asset_FN.getExt()
+        new_asset_FN = asset_dir_FN.pjoin(new_asset_basename)
+        asset_list.append((collection, AInfo.key, in_asset_FN.getPath(), new_asset_FN, collection[AInfo.key]))
+    for rom in rom_list:
+        ROM_FileName = utils.FileName(rom['filename'])
+        for asset_kind in const.ROM_ASSET_ID_LIST:
+            AInfo = assets.ASSET_INFO_DICT[asset_kind]
+            if not rom[AInfo.key]: continue
+            in_asset_FN = in_dir_FN.pjoin(rom[AInfo.key])
+            new_asset_basename = assets.get_collection_asset_basename(
+                AInfo, ROM_FileName.getBaseNoExt(), rom['platform'], in_asset_FN.getExt())
+            new_asset_FN = asset_dir_FN.pjoin(new_asset_basename)
+            asset_list.append((rom, AInfo.key, in_asset_FN.getPath(), new_asset_FN, rom[AInfo.key]))
+
+    # --- Copy files ---
+    job_list = [(a[2], a[3].getPath(), a[4]) for a in asset_list]
+    if pdiag is not None: pdiag.startProgress('Importing ROM Collection assets...', len(job_list))
+    imported_files, report = copy_files_parallel(job_list, manifest_files,
+        verify = bool(manifest_files), pdiag = pdiag)
+    if pdiag is not None: pdiag.endProgress()
+
+    # --- Update asset paths in the database ---
+    for edict, asset_key, source_path, new_asset_FN, rel_path in asset_list:
+        if rel_path in imported_files:
+            edict[asset_key] = new_asset_FN.getOriginalPath()
+        else:
+            log.debug('import_ROM_collection_assets() Unsetting {} "{}"'.format(asset_key, rel_path))
+            edict[asset_key] = ''
+
+    return report
 
 # Slow implementation that uses a linear search.
 # Returns:
@@ -1523,6 +2964,126 @@ def collection_ROM_index_by_romID(romID, collection_rom_list):
             break
     return current_ROM_position
 
+# -------------------------------------------------------------------------------------------------
+# Artwork integrity check
+# -------------------------------------------------------------------------------------------------
+# The image type found in the header of every file is kept in the image header index, keyed by
+# file path together with the size and mtime of the file. Files not changed since the last
+# check are not opened again.
+#
+# Image headers are read sequentially by default. On a local disk reading headers in a pool
+# of threads is slower than reading them sequentially (thread overhead and the GIL cost more
+# than the time waiting for the disk, see dev-core/bench_artwork_integrity.py). A pool of
+# threads only pays off when every file open has a high latency, like in network shares, and
+# main.exec_utils_check_ROM_artwork_integrity() uses it only for the files in network shares.
+#
+# index = { path : [size, mtime, img_id], ... }
+def load_image_header_index(index_FN):
+    if not index_FN.exists(): return {}
+    return utils.load_JSON_file(index_FN.getPath(), {}, verbose = False)
+
+def write_image_header_index(index_FN, index):
+    if current_batch is not None and current_batch.dry_run: return
+    utils.write_JSON_file(index_FN.getPath(), index, verbose = False)
+
+# Returns a tuple (entry, cached). entry is None if the file does not exist.
+def _read_image_header(path, old_entry):
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return (None, False)
+    if old_entry and old_entry[0] == file_stat.st_size and old_entry[1] == file_stat.st_mtime:
+        return (old_entry, True)
+    file_bytes = b''
+    mtime = file_stat.st_mtime
+    if file_stat.st_size >= misc.IMAGE_HEADER_SIZE:
+        try:
+            with open(path, 'rb') as file:
+                file_bytes = file.read(misc.IMAGE_HEADER_SIZE)
+        except (IOError, OSError) as ex:
+            log.error('_read_image_header() Exception reading "{}"'.format(path))
+            log.error('_read_image_header() {}'.format(ex))
+            # Unreadable files are reported as corrupt and checked again next time.
+            mtime = 0.0
+    img_id = misc.identify_image_id_by_header(file_bytes, file_stat.st_size)
+
+    return ([file_stat.st_size, mtime, img_id], False)
+
+class Threaded_Image_Header_Read(threading.Thread):
+    def __init__(self, job_queue, result_queue, cancel_event):
+        threading.Thread.__init__(self)
+        self.job_queue = job_queue
+        self.result_queue = result_queue
+        self.cancel_event = cancel_event
+
+    def run(self):
+        while not self.cancel_event.is_set():
+            try:
+                path, old_entry = self.job_queue.get_nowait()
+            except queue.Empty:
+                return
+            entry, cached = _read_image_header(path, old_entry)
+            self.result_queue.put((path, entry, cached))
+
+# Identifies the image type of the files in path_list. The index is updated in place: new and
+# changed files are added and files that do not exist are removed. If num_threads is more
+# than 1 the headers are read in a pool of num_threads threads.
+# Returns a tuple (results, num_cached) where results is a dictionary { path : img_id } and
+# img_id is None if the file does not exist. If the user cancels the progress dialog results
+# only has the files checked so far.
+def read_image_headers(path_list, index, pdiag = None, num_threads = 1):
+    results = {}
+    num_cached = 0
+    def add_result(path, entry):
+        if entry is None:
+            results[path] = None
+            if path in index: del index[path]
+        else:
+            results[path] = entry[2]
+            index[path] = entry
+
+    # --- Sequential read ---
+    if num_threads <= 1:
+        for path in path_list:
+            entry, cached = _read_image_header(path, index[path] if path in index else None)
+            add_result(path, entry)
+            if cached: num_cached += 1
+            if pdiag is not None:
+                pdiag.updateProgressInc()
+                if pdiag.isCanceled(): break
+        log.info('read_image_headers() {} files, {} cached, {} read'.format(
+            len(results), num_cached, len(results) - num_cached))
+        return (results, num_cached)
+
+    # --- Read in a pool of threads ---
+    job_queue = queue.Queue()
+    result_queue = queue.Queue()
+    cancel_event = threading.Event()
+    for path in path_list:
+        job_queue.put((path, index[path] if path in index else None))
+    workers = [Threaded_Image_Header_Read(job_queue, result_queue, cancel_event) \
+        for i in range(min(num_threads, len(path_list)))]
+    for worker in workers: worker.start()
+    for i in range(len(path_list)):
+        path, entry, cached = result_queue.get()
+        add_result(path, entry)
+        if cached: num_cached += 1
+        if pdiag is not None:
+            pdiag.updateProgressInc()
+            if pdiag.isCanceled():
+                cancel_event.set()
+                break
+    for worker in workers: worker.join()
+    # Keep the files being read when the dialog was cancelled.
+    while not result_queue.empty():
+        path, entry, cached = result_queue.get()
+        add_result(path, entry)
+        if cached: num_cached += 1
+    log.info('read_image_headers() {} files, {} cached, {} read'.format(
+        len(results), num_cached, len(results) - num_cached))
+
+    return (results, num_cached)
+
 # -------------------------------------------------------------------------------------------------
 # NFO files
 # -------------------------------------------------------------------------------------------------
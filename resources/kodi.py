@@ -298,6 +298,15 @@ def display_exception(ex):
 # Messages and progress in the dialog are always remembered, even if closed and reopened.
 # If the dialog is canceled this class remembers it forever.
 #
+# Every call to xbmcgui.DialogProgress() crosses into the Kodi GUI layer, so updates are merged.
+# The dialog is only updated when the message changes, when the progress advances at least
+# PROGRESS_UPDATE_PCENT percent and PROGRESS_UPDATE_INTERVAL seconds have passed since the last
+# update, or every PROGRESS_REFRESH_INTERVAL seconds to refresh the speed and ETA line.
+# Loops that show a different message for every item must use updateProgressIncThrottled(),
+# a new message in updateProgressInc() always updates the dialog.
+# isCanceled() asks Kodi at most every PROGRESS_CANCEL_INTERVAL seconds, so cancel is
+# honoured within that delay.
+#
 # Kodi Matrix change: Renamed option line1 to message. Removed option line2. Removed option line3.
 # See https://forum.kodi.tv/showthread.php?tid=344263&pid=2933596#pid2933596
 #
@@ -308,6 +317,11 @@ def display_exception(ex):
 #     pDialog.updateProgressInc()
 #     # Do stuff...
 # pDialog.endProgress()
+PROGRESS_UPDATE_PCENT = 1
+PROGRESS_UPDATE_INTERVAL = 0.1
+PROGRESS_REFRESH_INTERVAL = 1.0
+PROGRESS_CANCEL_INTERVAL = 0.25
+
 class ProgressDialog(object):
     def __init__(self):
         self.heading = const.ADDON_LONG_NAME
@@ -316,61 +330,76 @@ class ProgressDialog(object):
         self.dialog_active = False
         self.progressDialog = xbmcgui.DialogProgress()
 
+    # Sets the step counters and resets the speed and ETA.
+    def _set_steps(self, step_total, step_counter):
+        # Fix case when step_total is 0.
+        self.step_total = step_total if step_total else 0.001
+        self.step_counter = step_counter
+        self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self.start_time = time.time()
+        self.start_counter = step_counter
+        self.last_update_time = 0.0
+        self.last_update_progress = -PROGRESS_UPDATE_PCENT
+        self.last_cancel_time = self.start_time
+
+    # Returns a string like '123.4 items/s, ETA 01:23' or None if it cannot be computed yet.
+    def _get_speed_str(self, now):
+        elapsed = now - self.start_time
+        num_steps = self.step_counter - self.start_counter
+        if self.step_total < 2 or elapsed < PROGRESS_REFRESH_INTERVAL or num_steps < 1: return None
+        speed = num_steps / elapsed
+        eta = max(0, self.step_total - self.step_counter) / speed
+        return '{:.1f} items/s, ETA {:02d}:{:02d}'.format(speed, int(eta) // 60, int(eta) % 60)
+
+    # Updates the Kodi dialog if needed. Use force = True when the message changed.
+    def _update_dialog(self, force = False):
+        now = time.time()
+        elapsed = now - self.last_update_time
+        if not force:
+            if elapsed < PROGRESS_UPDATE_INTERVAL: return
+            if self.progress - self.last_update_progress < PROGRESS_UPDATE_PCENT and \
+                elapsed < PROGRESS_REFRESH_INTERVAL: return
+        self.last_update_time = now
+        self.last_update_progress = self.progress
+        speed_str = self._get_speed_str(now)
+        # In Leia and lower xbmcgui.DialogProgress().update() requires an int.
+        if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
+            message = self.message if speed_str is None else '{}\n{}'.format(self.message, speed_str)
+            self.progressDialog.update(int(self.progress), message)
+        else:
+            self.progressDialog.update(int(self.progress), self.message,
+                ' ' if speed_str is None else speed_str, ' ')
+
     # Creates a new progress dialog.
     def startProgress(self, message, step_total = 100, step_counter = 0):
         if self.dialog_active: raise TypeError
-        self.step_total = step_total
-        self.step_counter = step_counter
-        try:
-            self.progress = math.floor((self.step_counter * 100) / self.step_total)
-        except ZeroDivisionError:
-            # Fix case when step_total is 0.
-            self.step_total = 0.001
-            self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self._set_steps(step_total, step_counter)
         self.dialog_active = True
         self.message = message
-        # In Leia and lower xbmcgui.DialogProgress().update() requires an int.
         if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
             self.progressDialog.create(self.heading, self.message)
-            self.progressDialog.update(self.progress)
         else:
             self.progressDialog.create(self.heading, self.message, ' ', ' ')
-            self.progressDialog.update(int(self.progress))
+        self._update_dialog(True)
 
     # Changes message and resets progress.
     def resetProgress(self, message, step_total = 100, step_counter = 0):
         if not self.dialog_active: raise TypeError
-        self.step_total = step_total
-        self.step_counter = step_counter
-        try:
-            self.progress = math.floor((self.step_counter * 100) / self.step_total)
-        except ZeroDivisionError:
-            # Fix case when step_total is 0.
-            self.step_total = 0.001
-            self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self._set_steps(step_total, step_counter)
         self.message = message
-        if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-            self.progressDialog.update(self.progress, self.message)
-        else:
-            self.progressDialog.update(int(self.progress), self.message, ' ', ' ')
+        self._update_dialog(True)
 
     # Update progress and optionally update message as well.
     def updateProgress(self, step_counter, message = None):
         if not self.dialog_active: raise TypeError
         self.step_counter = step_counter
         self.progress = math.floor((self.step_counter * 100) / self.step_total)
-        if message is None:
-            if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-                self.progressDialog.update(self.progress)
-            else:
-                self.progressDialog.update(int(self.progress))
+        if message is None or message == self.message:
+            self._update_dialog()
         else:
-            if type(message) is not text_type: raise TypeError
+            if type(message) is not const.text_type: raise TypeError
             self.message = message
-            if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-                self.progressDialog.update(self.progress, self.message)
-            else:
-                self.progressDialog.update(int(self.progress), self.message, ' ', ' ')
+            self._update_dialog(True)
         # DEBUG code
         # time.sleep(1)
 
@@ -380,34 +409,38 @@ class ProgressDialog(object):
         if not self.dialog_active: raise TypeError
         self.progress = math.floor((self.step_counter * 100) / self.step_total)
         self.step_counter += 1
-        if message is None:
-            if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-                self.progressDialog.update(self.progress)
-            else:
-                self.progressDialog.update(int(self.progress))
+        if message is None or message == self.message:
+            self._update_dialog()
         else:
-            if type(message) is not text_type: raise TypeError
+            if type(message) is not const.text_type: raise TypeError
             self.message = message
-            if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-                self.progressDialog.update(self.progress, self.message)
-            else:
-                self.progressDialog.update(int(self.progress), self.message, ' ', ' ')
+            self._update_dialog(True)
+
+    # Like updateProgressInc() but the message is only shown when the dialog is updated by the
+    # progress, so a message that changes for every step does not update the dialog every step.
+    def updateProgressIncThrottled(self, message):
+        if not self.dialog_active: raise TypeError
+        if type(message) is not const.text_type: raise TypeError
+        self.progress = math.floor((self.step_counter * 100) / self.step_total)
+        self.step_counter += 1
+        self.message = message
+        self._update_dialog()
 
     # Update dialog message but keep same progress.
     def updateMessage(self, message):
         if not self.dialog_active: raise TypeError
-        if type(message) is not text_type: raise TypeError
+        if type(message) is not const.text_type: raise TypeError
         self.message = message
-        if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
-            self.progressDialog.update(self.progress, self.message)
-        else:
-            self.progressDialog.update(int(self.progress), self.message, ' ', ' ')
+        self._update_dialog(True)
 
     def isCanceled(self):
         # If the user pressed the cancel button before then return it now.
         if self.flag_dialog_canceled: return True
         # If not check and set the flag.
         if not self.dialog_active: raise TypeError
+        now = time.time()
+        if now - self.last_cancel_time < PROGRESS_CANCEL_INTERVAL: return False
+        self.last_cancel_time = now
         self.flag_dialog_canceled = self.progressDialog.iscanceled()
         return self.flag_dialog_canceled
 
@@ -431,13 +464,12 @@ class ProgressDialog(object):
     # and the progress it had when it was closed.
     def reopen(self):
         if self.dialog_active: raise TypeError
-        if kodi_running_version >= KODI_VERSION_MATRIX:
+        if utils.kodi_running_version >= utils.KODI_VERSION_MATRIX:
             self.progressDialog.create(self.heading, self.message)
-            self.progressDialog.update(self.progress)
         else:
             self.progressDialog.create(self.heading, self.message, ' ', ' ')
-            self.progressDialog.update(int(self.progress))
         self.dialog_active = True
+        self._update_dialog(True)
 
 # Wrapper class for xbmcgui.Dialog().select(). Takes care of Kodi bugs.
 # v17 (Krypton) Python API changes:
@@ -69,6 +69,8 @@ class Configuration:
 
         # Former global variables
         self.settings = {}
+        self.settings_snapshot_stamp = None
+        self.settings_snapshot_dirty = False
         self.base_url = ''
         self.addon_handle = 0
         self.content_type = ''
@@ -88,6 +90,10 @@ class Configuration:
         self.ICON_FILE_PATH = self.ADDON_CODE_DIR.pjoin('media/icon.png')
         self.FANART_FILE_PATH = self.ADDON_CODE_DIR.pjoin('media/fanart.jpg')
 
+        # --- Addon settings. settings.xml is written by Kodi ---
+        self.SETTINGS_FILE_PATH = self.ADDON_DATA_DIR.pjoin('settings.xml')
+        self.SETTINGS_SNAPSHOT_FILE_PATH = self.ADDON_DATA_DIR.pjoin('settings_snapshot.json')
+
         # --- Databases and reports ---
         self.CATEGORIES_FILE_PATH      = self.ADDON_DATA_DIR.pjoin('launchers.xml')
         self.FAV_JSON_FILE_PATH        = self.ADDON_DATA_DIR.pjoin('favourites.json')
@@ -103,12 +109,15 @@ class Configuration:
         self.LAUNCH_LOG_FILE_PATH      = self.ADDON_DATA_DIR.pjoin('launcher.log')
         self.RECENT_PLAYED_FILE_PATH   = self.ADDON_DATA_DIR.pjoin('history.json')
         self.MOST_PLAYED_FILE_PATH     = self.ADDON_DATA_DIR.pjoin('most_played.json')
+        self.PLAY_STATS_FILE_PATH      = self.ADDON_DATA_DIR.pjoin('play_stats.json')
+        self.PLAY_STATS_LOG_FILE_PATH  = self.ADDON_DATA_DIR.pjoin('play_stats.log')
 
         # Reports
         self.BIOS_REPORT_FILE_PATH = self.ADDON_DATA_DIR.pjoin('report_BIOS.txt')
         self.LAUNCHER_REPORT_FILE_PATH = self.ADDON_DATA_DIR.pjoin('report_Launchers.txt')
         self.ROM_SYNC_REPORT_FILE_PATH = self.ADDON_DATA_DIR.pjoin('report_ROM_sync_status.txt')
         self.ROM_ART_INTEGRITY_REPORT_FILE_PATH = self.ADDON_DATA_DIR.pjoin('report_ROM_artwork_integrity.txt')
+        self.ART_HEADER_INDEX_FILE_PATH = self.ADDON_DATA_DIR.pjoin('artwork_header_index.json')
 
         # --- Offline scraper databases ---
         self.GAMEDB_INFO_DIR           = self.ADDON_CODE_DIR.pjoin('data-AOS')
@@ -119,6 +128,24 @@ class Configuration:
         # --- Online scraper on-disk cache ---
         self.SCRAPER_CACHE_DIR = self.ADDON_DATA_DIR.pjoin('ScraperCache')
 
+        # --- No-Intro/Redump parsed DAT cache ---
+        self.DAT_CACHE_DIR = self.ADDON_DATA_DIR.pjoin('DATCache')
+        self.DAT_CATALOG_FILE_PATH = self.DAT_CACHE_DIR.pjoin('DAT_catalog.json')
+
+        # --- Database check progress. Allows resuming a cancelled check ---
+        self.CHECK_DATABASE_PROGRESS_FILE_PATH = self.ADDON_DATA_DIR.pjoin('check_database_progress.json')
+        self.SCRAPE_ARTWORK_PROGRESS_FILE_PATH = self.ADDON_DATA_DIR.pjoin('scrape_artwork_progress.json')
+
+        # --- ROM scanner journals. Allow resuming an interrupted scan ---
+        self.SCANNER_JOURNAL_DIR = self.ADDON_DATA_DIR.pjoin('scanner_journal')
+
+        # --- On-disk index of the files in the asset directories ---
+        self.ASSET_INDEX_DIR = self.ADDON_DATA_DIR.pjoin('asset_index')
+
+        # --- Command timing telemetry and cProfile stats ---
+        self.COMMAND_TIMING_FILE_PATH = self.ADDON_DATA_DIR.pjoin('command_timing.log')
+        self.CPROFILE_DIR = self.ADDON_DATA_DIR.pjoin('cProfile')
+
         # --- Artwork and NFO for Categories and Launchers ---
         self.DEFAULT_CAT_ASSET_DIR     = self.ADDON_DATA_DIR.pjoin('asset-categories')
         self.DEFAULT_COL_ASSET_DIR     = self.ADDON_DATA_DIR.pjoin('asset-collections')
@@ -262,6 +289,7 @@ def run_plugin(addon_argv):
     # --- Addon data paths creation ---
     if not cfg.ADDON_DATA_DIR.exists(): cfg.ADDON_DATA_DIR.makedirs()
     if not cfg.SCRAPER_CACHE_DIR.exists(): cfg.SCRAPER_CACHE_DIR.makedirs()
+    if not cfg.DAT_CACHE_DIR.exists(): cfg.DAT_CACHE_DIR.makedirs()
     if not cfg.DEFAULT_CAT_ASSET_DIR.exists(): cfg.DEFAULT_CAT_ASSET_DIR.makedirs()
     if not cfg.DEFAULT_COL_ASSET_DIR.exists(): cfg.DEFAULT_COL_ASSET_DIR.makedirs()
     if not cfg.DEFAULT_LAUN_ASSET_DIR.exists(): cfg.DEFAULT_LAUN_ASSET_DIR.makedirs()
@@ -270,6 +298,7 @@ def run_plugin(addon_argv):
     if not cfg.ROMS_DIR.exists(): cfg.ROMS_DIR.makedirs()
     if not cfg.COLLECTIONS_DIR.exists(): cfg.COLLECTIONS_DIR.makedirs()
     if not cfg.REPORTS_DIR.exists(): cfg.REPORTS_DIR.makedirs()
+    utils.file_cache_set_index_dir(cfg.ASSET_INDEX_DIR)
 
     # --- Process URL ---
     cfg.base_url = addon_argv[0]
@@ -324,13 +353,26 @@ def run_plugin(addon_argv):
         'BUILD_GAMES_MENU',
     }
     if command in concurrent_command_set:
-        run_concurrent(cfg, command, args)
+        run_command(cfg, run_concurrent, command, args)
     else:
         # Ensure AEL only runs one instance at a time
         with SingleInstance():
-            run_protected(cfg, command, args)
+            run_command(cfg, run_protected, command, args)
+            db.compact_play_stats(cfg)
+    save_settings_snapshot(cfg)
     log.debug('Advanced Emulator Launcher run_plugin() exit')
 
+# Calls run_concurrent() or run_protected(). If command timing is enabled in settings the
+# timing of the command is recorded and, optionally, the command is profiled with cProfile.
+def run_command(cfg, run_function, command, args):
+    if not cfg.settings['debug_command_timing']:
+        run_function(cfg, command, args)
+        return
+    profile_dir_FN = cfg.CPROFILE_DIR if cfg.settings['debug_cProfile'] else None
+    launID = args['launID'][0] if 'launID' in args else ''
+    utils.command_timing_run(cfg.COMMAND_TIMING_FILE_PATH, profile_dir_FN,
+        run_function is run_protected, command, launID, run_function, cfg, command, args)
+
 # This function may run concurrently with other AEL instances.
 # Do not write files, only read stuff.
 #
@@ -467,10 +509,12 @@ def run_protected(cfg, command, args):
     elif command == 'EXECUTE_UTILS_CREATE_BACKUP': exec_utils_create_backup(cfg)
 
     elif command == 'EXECUTE_UTILS_CHECK_DATABASE': exec_utils_check_database(cfg)
+    elif command == 'EXECUTE_UTILS_CHECK_DATABASE_DRY_RUN': exec_utils_check_database(cfg, dry_run = True)
     elif command == 'EXECUTE_UTILS_CHECK_LAUNCHERS': exec_utils_check_launchers(cfg)
     elif command == 'EXECUTE_UTILS_CHECK_LAUNCHER_SYNC_STATUS': exec_utils_check_launcher_sync_status(cfg)
     elif command == 'EXECUTE_UTILS_CHECK_ARTWORK_INTEGRITY': exec_utils_check_artwork_integrity(cfg)
-    elif command == 'EXECUTE_UTILS_CHECK_ROM_ARTWORK_INTEGRITY': exec_utils_check_ROM_artwork_integritycfg
+    elif command == 'EXECUTE_UTILS_CHECK_ROM_ARTWORK_INTEGRITY': exec_utils_check_ROM_artwork_integrity(cfg)
+    elif command == 'EXECUTE_UTILS_COMMAND_TIMING': exec_utils_command_timing(cfg)
     elif command == 'EXECUTE_UTILS_DELETE_REDUNDANT_ARTWORK': exec_utils_delete_redundant_artwork(cfg)
     elif command == 'EXECUTE_UTILS_DELETE_ROM_REDUNDANT_ARTWORK': exec_utils_delete_ROM_redundant_artwork(cfg)
     elif command == 'EXECUTE_UTILS_SHOW_DETECTED_DATS': exec_utils_show_DATs(cfg)
@@ -484,111 +528,146 @@ def run_protected(cfg, command, args):
 
     # Commands called from Global Reports menu.
     elif command == 'EXECUTE_GLOBAL_ROM_STATS': exec_global_rom_stats(cfg)
-    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_ALL': exec_global_audit_stats(AUDIT_REPORT_ALL)
-    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_NOINTRO': exec_global_audit_stats(AUDIT_REPORT_NOINTRO)
-    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_REDUMP': exec_global_audit_stats(AUDIT_REPORT_REDUMP)
+    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_ALL': exec_global_audit_stats(cfg, const.AUDIT_REPORT_ALL)
+    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_NOINTRO': exec_global_audit_stats(cfg, const.AUDIT_REPORT_NOINTRO)
+    elif command == 'EXECUTE_GLOBAL_AUDIT_STATS_REDUMP': exec_global_audit_stats(cfg, const.AUDIT_REPORT_REDUMP)
 
     # Unknown command
     else:
         kodi.dialog_OK('run_protected(): Unknown command {}'.format(command))
     log.debug('Advanced Emulator Launcher run_protected() END')
 
-# Get Addon Settings
-# In the future use the cfg = Configuration() class and not g_PATHS. See the AML code.
-def get_settings(cfg):
-    settings = cfg.settings
-
+# --- Addon settings ---
+# Setting key and the utils.get_*_setting() function that reads it from Kodi.
+# delay_tempo is a float setting in Kodi Leia and an integer setting in Kodi Matrix.
+if const.ADDON_RUNNING_PYTHON_2:
+    get_delay_tempo_setting = utils.get_float_setting_as_int
+elif const.ADDON_RUNNING_PYTHON_3:
+    get_delay_tempo_setting = utils.get_int_setting
+else:
+    raise TypeError('Undefined Python runtime version.')
+SETTINGS_GETTER_DIC = dict([
     # --- ROM Scanner settings ---
-    settings['scan_recursive'] = utils.get_bool_setting(cfg, 'scan_recursive')
-    settings['scan_ignore_bios'] = utils.get_bool_setting(cfg, 'scan_ignore_bios')
-    settings['scan_ignore_scrap_title'] = utils.get_bool_setting(cfg, 'scan_ignore_scrap_title')
-    settings['scan_ignore_scrap_title_MAME'] = utils.get_bool_setting(cfg, 'scan_ignore_scrap_title_MAME')
-    settings['scan_clean_tags'] = utils.get_bool_setting(cfg, 'scan_clean_tags')
-    settings['scan_update_NFO_files'] = utils.get_bool_setting(cfg, 'scan_update_NFO_files')
+    ('scan_recursive', utils.get_bool_setting),
+    ('scan_ignore_bios', utils.get_bool_setting),
+    ('scan_ignore_scrap_title', utils.get_bool_setting),
+    ('scan_ignore_scrap_title_MAME', utils.get_bool_setting),
+    ('scan_clean_tags', utils.get_bool_setting),
+    ('scan_update_NFO_files', utils.get_bool_setting),
 
     # --- ROM scraping ---
     # Scanner settings
-    settings['scan_metadata_policy'] = utils.get_int_setting(cfg, 'scan_metadata_policy')
-    settings['scan_asset_policy'] = utils.get_int_setting(cfg, 'scan_asset_policy')
-    settings['game_selection_mode'] = utils.get_int_setting(cfg, 'game_selection_mode')
-    settings['asset_selection_mode'] = utils.get_int_setting(cfg, 'asset_selection_mode')
+    ('scan_metadata_policy', utils.get_int_setting),
+    ('scan_asset_policy', utils.get_int_setting),
+    ('game_selection_mode', utils.get_int_setting),
+    ('asset_selection_mode', utils.get_int_setting),
     # Scanner scrapers
-    settings['scraper_metadata'] = utils.get_int_setting(cfg, 'scraper_metadata')
-    settings['scraper_asset'] = utils.get_int_setting(cfg, 'scraper_asset')
-    settings['scraper_metadata_MAME'] = utils.get_int_setting(cfg, 'scraper_metadata_MAME')
-    settings['scraper_asset_MAME'] = utils.get_int_setting(cfg, 'scraper_asset_MAME')
+    ('scraper_metadata', utils.get_int_setting),
+    ('scraper_asset', utils.get_int_setting),
+    ('scraper_metadata_MAME', utils.get_int_setting),
+    ('scraper_asset_MAME', utils.get_int_setting),
 
     # --- Misc settings ---
-    settings['scraper_mobygames_apikey'] = utils.get_str_setting(cfg, 'scraper_mobygames_apikey')
-    settings['scraper_screenscraper_ssid'] = utils.get_str_setting(cfg, 'scraper_screenscraper_ssid')
-    settings['scraper_screenscraper_sspass'] = utils.get_str_setting(cfg, 'scraper_screenscraper_sspass')
+    ('scraper_mobygames_apikey', utils.get_str_setting),
+    ('scraper_screenscraper_ssid', utils.get_str_setting),
+    ('scraper_screenscraper_sspass', utils.get_str_setting),
 
-    settings['scraper_screenscraper_region'] = utils.get_int_setting(cfg, 'scraper_screenscraper_region')
-    settings['scraper_screenscraper_language'] = utils.get_int_setting(cfg, 'scraper_screenscraper_language')
+    ('scraper_screenscraper_region', utils.get_int_setting),
+    ('scraper_screenscraper_language', utils.get_int_setting),
 
-    settings['io_retroarch_sys_dir'] = utils.get_str_setting(cfg, 'io_retroarch_sys_dir')
-    settings['io_retroarch_only_mandatory'] = utils.get_bool_setting(cfg, 'io_retroarch_only_mandatory')
+    ('io_retroarch_sys_dir', utils.get_str_setting),
+    ('io_retroarch_only_mandatory', utils.get_bool_setting),
 
     # --- ROM audit ---
-    settings['audit_unknown_roms'] = utils.get_int_setting(cfg, 'audit_unknown_roms')
-    settings['audit_pclone_assets'] = utils.get_bool_setting(cfg, 'audit_pclone_assets')
-    settings['audit_nointro_dir'] = utils.get_str_setting(cfg, 'audit_nointro_dir')
-    settings['audit_redump_dir'] = utils.get_str_setting(cfg, 'audit_redump_dir')
+    ('audit_unknown_roms', utils.get_int_setting),
+    ('audit_pclone_assets', utils.get_bool_setting),
+    ('audit_verify_checksums', utils.get_bool_setting),
+    ('audit_nointro_dir', utils.get_str_setting),
+    ('audit_redump_dir', utils.get_str_setting),
 
-    # settings['audit_1G1R_first_region'] = utils.get_int_setting(cfg, 'audit_1G1R_first_region')
-    # settings['audit_1G1R_second_region'] = utils.get_int_setting(cfg, 'audit_1G1R_second_region')
-    # settings['audit_1G1R_third_region'] = utils.get_int_setting(cfg, 'audit_1G1R_third_region')
+    # ('audit_1G1R_first_region', utils.get_int_setting),
+    # ('audit_1G1R_second_region', utils.get_int_setting),
+    # ('audit_1G1R_third_region', utils.get_int_setting),
 
     # --- Display ---
-    settings['display_category_mode'] = utils.get_int_setting(cfg, 'display_category_mode')
-    settings['display_launcher_notify'] = utils.get_bool_setting(cfg, 'display_launcher_notify')
-    settings['display_hide_finished'] = utils.get_bool_setting(cfg, 'display_hide_finished')
-    settings['display_launcher_roms'] = utils.get_bool_setting(cfg, 'display_launcher_roms')
-
-    settings['display_rom_in_fav'] = utils.get_bool_setting(cfg, 'display_rom_in_fav')
-    settings['display_nointro_stat'] = utils.get_bool_setting(cfg, 'display_nointro_stat')
-    settings['display_fav_status'] = utils.get_bool_setting(cfg, 'display_fav_status')
-
-    settings['display_hide_favs'] = utils.get_bool_setting(cfg, 'display_hide_favs')
-    settings['display_hide_collections'] = utils.get_bool_setting(cfg, 'display_hide_collections')
-    settings['display_hide_vlaunchers'] = utils.get_bool_setting(cfg, 'display_hide_vlaunchers')
-    settings['display_hide_AEL_scraper'] = utils.get_bool_setting(cfg, 'display_hide_AEL_scraper')
-    settings['display_hide_recent'] = utils.get_bool_setting(cfg, 'display_hide_recent')
-    settings['display_hide_mostplayed'] = utils.get_bool_setting(cfg, 'display_hide_mostplayed')
-    settings['display_hide_utilities'] = utils.get_bool_setting(cfg, 'display_hide_utilities')
-    settings['display_hide_g_reports'] = utils.get_bool_setting(cfg, 'display_hide_g_reports')
+    ('display_category_mode', utils.get_int_setting),
+    ('display_launcher_notify', utils.get_bool_setting),
+    ('display_hide_finished', utils.get_bool_setting),
+    ('display_launcher_roms', utils.get_bool_setting),
+
+    ('display_rom_in_fav', utils.get_bool_setting),
+    ('display_nointro_stat', utils.get_bool_setting),
+    ('display_fav_status', utils.get_bool_setting),
+
+    ('display_hide_favs', utils.get_bool_setting),
+    ('display_hide_collections', utils.get_bool_setting),
+    ('display_hide_vlaunchers', utils.get_bool_setting),
+    ('display_hide_AEL_scraper', utils.get_bool_setting),
+    ('display_hide_recent', utils.get_bool_setting),
+    ('display_hide_mostplayed', utils.get_bool_setting),
+    ('display_hide_utilities', utils.get_bool_setting),
+    ('display_hide_g_reports', utils.get_bool_setting),
 
     # --- Paths ---
-    settings['categories_asset_dir'] = utils.get_str_setting(cfg, 'categories_asset_dir')
-    settings['launchers_asset_dir'] = utils.get_str_setting(cfg, 'launchers_asset_dir')
-    settings['favourites_asset_dir'] = utils.get_str_setting(cfg, 'favourites_asset_dir')
-    settings['collections_asset_dir'] = utils.get_str_setting(cfg, 'collections_asset_dir')
+    ('categories_asset_dir', utils.get_str_setting),
+    ('launchers_asset_dir', utils.get_str_setting),
+    ('favourites_asset_dir', utils.get_str_setting),
+    ('collections_asset_dir', utils.get_str_setting),
 
     # --- Advanced ---
-    settings['media_state_action'] = utils.get_int_setting(cfg, 'media_state_action')
-    if const.ADDON_RUNNING_PYTHON_2:
-        settings['delay_tempo'] = utils.get_float_setting_as_int(cfg, 'delay_tempo')
-    elif const.ADDON_RUNNING_PYTHON_3:
-        settings['delay_tempo'] = utils.get_int_setting(cfg, 'delay_tempo')
+    ('media_state_action', utils.get_int_setting),
+    ('delay_tempo', get_delay_tempo_setting),
+    ('suspend_audio_engine', utils.get_bool_setting),
+    ('suspend_screensaver', utils.get_bool_setting),
+    # ('suspend_joystick_engine', utils.get_bool_setting),
+    ('escape_romfile', utils.get_bool_setting),
+    ('lirc_state', utils.get_bool_setting),
+    ('show_batch_window', utils.get_bool_setting),
+    ('windows_close_fds', utils.get_bool_setting),
+    ('windows_cd_apppath', utils.get_bool_setting),
+    ('compact_ROMs_in_memory', utils.get_bool_setting),
+    ('io_image_header_threads', utils.get_int_setting),
+    ('log_level', utils.get_int_setting),
+    ('debug_command_timing', utils.get_bool_setting),
+    ('debug_cProfile', utils.get_bool_setting),
+])
+
+# Get Addon Settings
+# Settings are read from the settings snapshot if it is valid. Otherwise they are read lazily
+# from Kodi when used (see utils.LazySettings) and the snapshot is written again by
+# save_settings_snapshot() at the end of the execution.
+# Kodi writes the user settings.xml when any setting is changed, so the snapshot is valid while
+# the settings.xml modification time and the addon version do not change.
+def get_settings(cfg):
+    if cfg.SETTINGS_FILE_PATH.exists():
+        settings_mtime = os.path.getmtime(cfg.SETTINGS_FILE_PATH.getPath())
     else:
-        raise TypeError('Undefined Python runtime version.')
-    settings['suspend_audio_engine'] = utils.get_bool_setting(cfg, 'suspend_audio_engine')
-    settings['suspend_screensaver'] = utils.get_bool_setting(cfg, 'suspend_screensaver')
-    # settings['suspend_joystick_engine'] = utils.get_bool_setting(cfg, 'suspend_joystick_engine')
-    settings['escape_romfile'] = utils.get_bool_setting(cfg, 'escape_romfile')
-    settings['lirc_state'] = utils.get_bool_setting(cfg, 'lirc_state')
-    settings['show_batch_window'] = utils.get_bool_setting(cfg, 'show_batch_window')
-    settings['windows_close_fds'] = utils.get_bool_setting(cfg, 'windows_close_fds')
-    settings['windows_cd_apppath'] = utils.get_bool_setting(cfg, 'windows_cd_apppath')
-    settings['log_level'] = utils.get_int_setting(cfg, 'log_level')
+        settings_mtime = 0
+    cfg.settings = utils.LazySettings(cfg, SETTINGS_GETTER_DIC)
+    cfg.settings_snapshot_stamp = [cfg.addon.info_version, settings_mtime]
+    values = utils.load_settings_snapshot(cfg.SETTINGS_SNAPSHOT_FILE_PATH, cfg.settings_snapshot_stamp)
+    if values is None:
+        cfg.settings_snapshot_dirty = True
+    else:
+        cfg.settings.update_values(values)
+        cfg.settings_snapshot_dirty = False
 
     # --- Dump settings for DEBUG ---
     # log.debug('Settings dump BEGIN')
-    # for key in sorted(settings):
+    # for key in sorted(cfg.settings.read_all()):
     #     log.debug('{} --> {:10s} {}'.format(key.rjust(21),
-    #         const.text_type(settings[key]), type(settings[key])))
+    #         const.text_type(cfg.settings[key]), type(cfg.settings[key])))
     # log.debug('Settings dump END')
 
+# Writes the settings snapshot if get_settings() could not use it. All the settings not
+# used during this execution are read from Kodi.
+def save_settings_snapshot(cfg):
+    if not cfg.settings_snapshot_dirty: return
+    log.debug('save_settings_snapshot() Writing settings snapshot')
+    utils.save_settings_snapshot(cfg.SETTINGS_SNAPSHOT_FILE_PATH,
+        cfg.settings_snapshot_stamp, cfg.settings.read_all())
+    cfg.settings_snapshot_dirty = False
+
 # Called after log is enabled. Process secondary settings.
 def get_settings_log_enabled(cfg):
     # Check if user changed default artwork paths for categories/launchers. If not, set defaults.
@@ -682,8 +761,10 @@ def aux_get_all_ROMs(cfg):
         # NOTE roms is updated by assigment, dictionaries are mutable
         # roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, launcher)
         st = kodi.new_status_dic()
-        db.get_launcher_info(cfg, st, categoryID, launcherID)
+        db.load_db_index(cfg, st, categoryID, launcherID)
+        db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
         db.load_ROMs(cfg, st)
+        if kodi.is_error_status(st): continue
         fav_roms = {}
         for romID in cfg.roms:
             fav_rom = db.get_Favourite_from_ROM(cfg.roms[romID], launcher)
@@ -810,7 +891,7 @@ def render_skin_all_ROMs(cfg):
             temp_roms[rom_id] = temp_rom
         all_roms.update(temp_roms)
     # Load favourites
-    roms_fav = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+    roms_fav = db.load_Favourite_ROMs(g_PATHS, resolve = False)
     roms_fav_set = set(roms_fav.keys())
 
     # --- Set content type and sorting methods ---
@@ -832,8 +913,10 @@ def render_main_window(cfg):
     misc_clear_AEL_Launcher_Content(cfg)
 
     # Load launchers.xml and set MODE to Normal Launcher.
+    loading_ticks_start = time.time()
     st = kodi.new_status_dic()
     db.load_db_index(cfg, st)
+    utils.command_timing_add(utils.TIMING_PHASE_LOAD, time.time() - loading_ticks_start)
 
     # --- Render categories/launchers in classic mode or in flat mode ---
     # This code must never fail. If categories.xml cannot be read because an upgrade
@@ -1619,6 +1702,12 @@ def render_vlaunchers_Utilities(cfg):
     url = aux_url('EXECUTE_UTILS_CHECK_DATABASE')
     render_vlaunchers_Utilities_row(cfg, vcat_name, vcat_plot, url)
 
+    vcat_name = 'Check all databases (dry run)'
+    vcat_plot = ('Checks all AEL databases like [COLOR=orange]Check/Update all databases[/COLOR] '
+        'but does not write anything. Shows a report of the database files that would change.')
+    url = aux_url('EXECUTE_UTILS_CHECK_DATABASE_DRY_RUN')
+    render_vlaunchers_Utilities_row(cfg, vcat_name, vcat_plot, url)
+
     # <setting label="Check Launchers ..."
     #  action="RunPlugin(plugin://plugin.program.advanced.emulator.launcher/?com=CHECK_LAUNCHERS)"/>
     vcat_name = 'Check Launchers'
@@ -1649,6 +1738,13 @@ def render_vlaunchers_Utilities(cfg):
     url = aux_url('EXECUTE_UTILS_CHECK_ROM_ARTWORK_INTEGRITY')
     render_vlaunchers_Utilities_row(cfg, vcat_name, vcat_plot, url)
 
+    vcat_name = 'Command timing report'
+    vcat_plot = ('Shows the [COLOR orange]slowest AEL commands[/COLOR] recorded when '
+        '"Record command timing" is enabled in Advanced settings, with the time spent '
+        'loading, processing and rendering.')
+    url = aux_url('EXECUTE_UTILS_COMMAND_TIMING')
+    render_vlaunchers_Utilities_row(cfg, vcat_name, vcat_plot, url)
+
     # vcat_name = 'Delete redundant artwork'
     # vcat_plot = ('Scans all Launchers, Favourites and Collections and finds redundant '
     #     'or unused artwork. You may delete this unneeded images.')
@@ -1794,7 +1890,7 @@ def render_ROMs(cfg, categoryID, launcherID):
     st = kodi.new_status_dic()
     db.load_db_index(cfg, st, categoryID, launcherID)
     db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
-    db.load_ROMs(cfg, st)    
+    db.load_ROMs(cfg, st, resolve = False)
     if kodi.is_error_status(st):
         xbmcplugin.endOfDirectory(cfg.addon_handle, succeeded = True, cacheToDisc = False)
         kodi_display_status_message(st)
@@ -1826,6 +1922,9 @@ def render_ROMs(cfg, categoryID, launcherID):
     xbmcplugin.endOfDirectory(cfg.addon_handle, succeeded = True, cacheToDisc = False)
 
     # DEBUG Data loading/rendering statistics.
+    utils.command_timing_add(utils.TIMING_PHASE_LOAD, loading_time)
+    utils.command_timing_add(utils.TIMING_PHASE_PROCESS, filtering_time + processing_time)
+    utils.command_timing_add(utils.TIMING_PHASE_RENDER, commit_time)
     total_time = loading_time + filtering_time + processing_time + commit_time
     log.debug('Loading time     {:.3f} s'.format(loading_time))
     log.debug('Filtering time   {:.3f} s'.format(filtering_time))
@@ -1891,7 +1990,7 @@ def render_ROMs_clone_ROMs(cfg, categoryID, launcherID, romID):
     # NOTE Never filter ROMs in the PClone set. They are not that many so no need to filter.
 
     # --- Render ROMs ---
-    roms_fav = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+    roms_fav = db.load_Favourite_ROMs(g_PATHS, resolve = False)
     roms_fav_set = set(roms_fav.keys())
     for key in sorted(roms, key = lambda x : roms[x]['m_name']):
         self._gui_render_rom_row(categoryID, launcherID, roms[key], key in roms_fav_set, view_mode, False)
@@ -2677,7 +2776,7 @@ def command_add_ROM_to_favourites(self, categoryID, launcherID, romID):
         COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
         roms_base_noext = COL['collections'][launcherID]['roms_base_noext']
         roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(roms_base_noext + '.json')
-        rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+        rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
         roms = collections.OrderedDict()
         for crom in rom_list: roms[crom['id']] = crom
         launcher = self.launchers[roms[romID]['launcherID']]
@@ -2692,7 +2791,7 @@ def command_add_ROM_to_favourites(self, categoryID, launcherID, romID):
         return
 
     # --- Load favourites ---
-    roms_fav = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+    roms_fav = db.load_Favourite_ROMs(g_PATHS)
 
     # --- DEBUG info ---
     log.debug('_command_add_to_favourites() Adding ROM to Favourites')
@@ -2718,7 +2817,7 @@ def command_add_ROM_to_favourites(self, categoryID, launcherID, romID):
     # If thumb is empty then use launcher thum. / If fanart is empty then use launcher fanart.
     # if roms_fav[romID]['thumb']  == '': roms_fav[romID]['thumb']  = launcher['thumb']
     # if roms_fav[romID]['fanart'] == '': roms_fav[romID]['fanart'] = launcher['fanart']
-    fs_write_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH, roms_fav)
+    db.write_Favourite_ROMs(g_PATHS, roms_fav)
     kodi_notify('ROM {} added to Favourites'.format(roms[romID]['m_name']))
     kodi_refresh_container()
 
@@ -2754,12 +2853,19 @@ def command_add_collection(self):
 # Imports a ROM Collection.
 def command_import_collection(self):
     # --- Choose collection to import ---
-    collection_file_str = kodi_dialog_get_file('Select the ROM Collection file', '.json')
+    # ROM Collections can be exported as loose files or as a single ZIP file.
+    collection_file_str = kodi.dialog_get_file('Select the ROM Collection file', '.json|.zip')
     if not collection_file_str: return
 
     # --- Load ROM Collection file ---
     i_collection_FN = utils.FileName(collection_file_str)
-    i_control_dic, i_collection, i_rom_list = fs_import_ROM_collection(i_collection_FN)
+    if i_collection_FN.getExt().lower() == '.zip':
+        i_collection_FN = db.extract_ROM_collection_archive(i_collection_FN,
+            g_PATHS.ADDON_DATA_DIR.pjoin('collection_import'))
+        if i_collection_FN is None:
+            kodi.dialog_OK('ROM Collection JSON file not found in ZIP file.')
+            return
+    i_control_dic, i_collection, i_rom_list = db.import_ROM_collection(i_collection_FN)
     if not i_collection:
         kodi.dialog_OK('Error reading Collection JSON file. JSON file corrupted or wrong.')
         return
@@ -2787,88 +2893,15 @@ def command_import_collection(self):
     # --- Import assets ---
     collections_asset_dir_FN = utils.FileName(self.settings['collections_asset_dir'])
 
-    # --- Import Collection assets ---
+    # --- Import Collection and ROM assets ---
     # When importing assets copy them to the Collection assets dir set in AEL addon settings.
+    # Files are copied in parallel and verified with the collection manifest if found.
     log.info('_command_import_collection() Importing ROM Collection assets ...')
-    in_dir_FN = utils.FileName(i_collection_FN.getDir())
-    for asset_kind in CATEGORY_ASSET_ID_LIST:
-        # Test if assets exists before copy.
-        AInfo = assets_get_info_scheme(asset_kind)
-        if not i_collection[AInfo.key]:
-            log.debug('{:<9s} undefined (empty string)'.format(AInfo.name))
-            continue
-        in_asset_FN = in_dir_FN.pjoin(i_collection[AInfo.key])
-        log.debug('{:<9s} path "{}"'.format(AInfo.name, in_asset_FN.getPath()))
-        if not in_asset_FN.exists():
-            # Asset not found. Make sure asset is unset in imported Collection.
-            i_collection[AInfo.key] = ''
-            log.debug('{:<9s} NOT found in imported asset dictionary'.format(AInfo.name))
-            continue
-        log.debug('{:<9s} found in imported asset dictionary'.format(AInfo.name))
-
-        # Copy Collection asset from input directory to Collections asset directory.
-        new_asset_basename = i_collection['m_name'] + '_' + AInfo.fname_infix + in_asset_FN.getExt()
-        new_asset_FN = collections_asset_dir_FN.pjoin(new_asset_basename)
-        log.debug('{:<9s} COPY "{}"'.format(AInfo.name, in_asset_FN.getPath()))
-        log.debug('{:<9s}   TO "{}"'.format(AInfo.name, new_asset_FN.getPath()))
-        try:
-            utils_copy_file(in_asset_FN.getPath(), new_asset_FN.getPath())
-        except OSError:
-            log.error('fs_export_ROM_collection_assets() OSError exception copying image')
-            kodi_notify_warn('OSError exception copying image')
-            return
-        except IOError:
-            log.error('fs_export_ROM_collection_assets() IOError exception copying image')
-            kodi_notify_warn('IOError exception copying image')
-            return
-
-        # Update imported asset filename in database.
-        log.debug('{:<9s} collection[{}] is "{}"'.format(
-            AInfo.name, AInfo.key, new_asset_FN.getOriginalPath()))
-        i_collection[AInfo.key] = new_asset_FN.getOriginalPath()
-
-    # --- Import ROM assets ---
-    log.info('_command_import_collection() Importing ROM assets ...')
-    for rom in i_rom_list:
-        log.debug('_command_import_collection() ROM "{}"'.format(rom['m_name']))
-        log.debug('ROM platform "{}"'.format(rom['platform']))
-        for asset_kind in ROM_ASSET_ID_LIST:
-            # Test if assets exists before copy.
-            AInfo = assets_get_info_scheme(asset_kind)
-            if not rom[AInfo.key]:
-                log.debug('{:<9s} undefined (empty string)'.format(AInfo.name))
-                continue
-            in_asset_FN = in_dir_FN.pjoin(rom[AInfo.key])
-            log.debug('{:<9s} path "{}"'.format(AInfo.name, in_asset_FN.getPath()))
-            if not in_asset_FN.exists():
-                # Asset not found. Make sure asset is unset in imported Collection.
-                i_collection[AInfo.key] = ''
-                log.debug('{:<9s} NOT found in imported asset dictionary'.format(AInfo.name))
-                continue
-            log.debug('{:<9s} found in imported asset dictionary'.format(AInfo.name))
-
-            # Copy ROM Collection asset from input directory to Collections asset directory.
-            ROM_FileName = utils.FileName(rom['filename'])
-            new_asset_basename = assets_get_collection_asset_basename(
-                AInfo, ROM_FileName.getBaseNoExt(), rom['platform'], in_asset_FN.getExt())
-            new_asset_FN = collections_asset_dir_FN.pjoin(new_asset_basename)
-            log.debug('{:<9s} COPY "{}"'.format(AInfo.name, in_asset_FN.getPath()))
-            log.debug('{:<9s}   TO "{}"'.format(AInfo.name, new_asset_FN.getPath()))
-            try:
-                utils_copy_file(in_asset_FN.getPath(), new_asset_FN.getPath())
-            except OSError:
-                log.error('fs_export_ROM_collection_assets() OSError exception copying image')
-                kodi_notify_warn('OSError exception copying image')
-                return
-            except IOError:
-                log.error('fs_export_ROM_collection_assets() IOError exception copying image')
-                kodi_notify_warn('IOError exception copying image')
-                return
-
-            # Update asset info in database
-            log.debug('{:<9s} rom[{}] is "{}"'.format(
-                AInfo.name, AInfo.key, new_asset_FN.getOriginalPath()))
-            rom[AInfo.key] = new_asset_FN.getOriginalPath()
+    report = db.import_ROM_collection_assets(i_collection_FN, i_collection, i_rom_list,
+        collections_asset_dir_FN, kodi.ProgressDialog())
+    if report[db.COPY_BAD_HASH] or report[db.COPY_ERROR]:
+        kodi.notify_warn('{} assets with bad checksum, {} errors. See the log.'.format(
+            len(report[db.COPY_BAD_HASH]), len(report[db.COPY_ERROR])))
     log.debug('_command_import_collection() Finished importing assets')
 
     # --- Add imported collection to database ---
@@ -2878,7 +2911,7 @@ def command_import_collection(self):
 
     # --- Write ROM Collection databases ---
     fs_write_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH, COL['collections'])
-    fs_write_Collection_ROMs_JSON(g_PATHS.COLLECTIONS_DIR.pjoin(
+    db.write_Collection_ROMs(g_PATHS, g_PATHS.COLLECTIONS_DIR.pjoin(
         collection_base_name + '.json'), i_rom_list)
     kodi.dialog_OK('Imported ROM Collection "{}" metadata and assets.'.format(
         i_collection['m_name']))
@@ -2887,7 +2920,7 @@ def command_import_collection(self):
 def command_add_ROM_to_collection(cfg, categoryID, launcherID, romID):
     # ROM in Favourites
     if categoryID == VCATEGORY_FAVOURITES_ID:
-        roms = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+        roms = db.load_Favourite_ROMs(g_PATHS)
         new_collection_rom = roms[romID]
     # ROM in Virtual Launcher
     elif categoryID == VCATEGORY_TITLE_ID:
@@ -2941,7 +2974,7 @@ def command_add_ROM_to_collection(cfg, categoryID, launcherID, romID):
     # --- Load Collection ROMs ---
     collection = COL['collections'][collectionID]
     roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-    collection_rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+    collection_rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
     log.info('Adding ROM to Collection')
     log.info('Collection {}'.format(collection['m_name']))
     log.info('     romID {}'.format(romID))
@@ -2972,7 +3005,7 @@ def command_add_ROM_to_collection(cfg, categoryID, launcherID, romID):
     # Add ROM to the last position in the collection
     collection_rom_list.append(new_collection_rom)
     collection_json_FN = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-    fs_write_Collection_ROMs_JSON(collection_json_FN, collection_rom_list)
+    db.write_Collection_ROMs(g_PATHS, collection_json_FN, collection_rom_list)
     kodi.notify('Added ROM to Collection "{}"'.format(collection['m_name']))
     utils.refresh_container()
 
@@ -3474,7 +3507,7 @@ def command_edit_launcher(cfg, categoryID, launcherID):
             save_DB_flag = mgui_edit_ROM_rescan_ROMs_artwork(cfg, launcher)
 
         elif mdic['command'] == 'MANAGE_ROMS_SCRAPE_ARTWORK':
-            raise RuntimeError
+            save_DB_flag = mgui_edit_ROM_scrape_ROMs_artwork(cfg, cfg.launchers[launcherID])
 
         elif mdic['command'] == 'MANAGE_ROMS_REMOVE_DEAD':
             raise RuntimeError
@@ -4290,13 +4323,13 @@ def command_manage_favourites(self, categoryID, launcherID, romID):
     # --- Load ROMs ---
     if categoryID == VCATEGORY_FAVOURITES_ID:
         log.debug('_command_manage_favourites() Managing Favourite ROMs')
-        roms_fav = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+        roms_fav = db.load_Favourite_ROMs(g_PATHS)
     elif categoryID == VCATEGORY_COLLECTIONS_ID:
         log.debug('_command_manage_favourites() Managing Collection ROMs')
         COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
         collection = COL['collections'][launcherID]
         roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-        collection_rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+        collection_rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
         # NOTE ROMs in a collection are stored as a list and ROMs in Favourites are stored as
         #      a dictionary. Convert the Collection list into an ordered dictionary and then
         #      converted back the ordered dictionary into a list before saving the collection.
@@ -4571,15 +4604,15 @@ def command_manage_favourites(self, categoryID, launcherID, romID):
 
     # --- If we reach this point save favourites and refresh container ---
     if categoryID == VCATEGORY_FAVOURITES_ID:
-        fs_write_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH, roms_fav)
+        db.write_Favourite_ROMs(g_PATHS, roms_fav)
     elif categoryID == VCATEGORY_COLLECTIONS_ID:
         # Convert back the OrderedDict into a list and save Collection
         collection_rom_list = [roms_fav[key] for key in roms_fav]
         json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-        fs_write_Collection_ROMs_JSON(json_file, collection_rom_list)
+        db.write_Collection_ROMs(g_PATHS, json_file, collection_rom_list)
     kodi_refresh_container()
 
-# Recently Played ROMs are stored in a list of ROM dictionaries.
+# Recently Played ROMs are a list of ROM IDs in the play statistics.
 def command_manage_recently_played(self, rom_ID):
     VIEW_ROOT_MENU   = 100
     VIEW_INSIDE_MENU = 200
@@ -4619,24 +4652,21 @@ def command_manage_recently_played(self, rom_ID):
     # --- Execute actions ---
     if action == ACTION_DELETE_MACHINE:
         log.debug('_command_manage_most_played() ACTION_DELETE_MACHINE')
-        rom_list = fs_load_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH)
-        roms = collections.OrderedDict()
-        for rom in rom_list: roms[rom['id']] = rom
-        if not roms:
+        stats = db.load_play_stats(g_PATHS)
+        roms = db.resolve_play_stats_ROMs(g_PATHS, stats, [rom_ID])
+        if rom_ID not in stats['recent']:
             kodi_notify('Recently Played ROMs list is empty. Play some ROMs first!.')
             return
 
         # --- Confirm deletion ---
-        rom_name = roms[rom_ID]['m_name']
+        rom_name = roms[rom_ID]['m_name'] if rom_ID in roms else rom_ID
         msg_str = 'Are you sure you want to delete it from Recently Played ROMs?'
         ret = kodi_dialog_yesno('ROM "{}". '.format(rom_name) + msg_str)
         if not ret: return
-        roms.pop(rom_ID)
+        stats['recent'].remove(rom_ID)
 
         # --- Save ROMs and notify user ---
-        # Convert from OrderedDict to list.
-        rom_list = [roms[key] for key in roms]
-        fs_write_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH, rom_list)
+        db.save_play_stats(g_PATHS, stats)
         kodi_notify('Deleted ROM {}'.format(rom_name))
         kodi_refresh_container()
 
@@ -4649,54 +4679,28 @@ def command_manage_recently_played(self, rom_ID):
         if not ret: return
 
         # --- Save ROMs and notify user ---
-        fs_write_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH, [])
+        stats = db.load_play_stats(g_PATHS)
+        stats['recent'] = []
+        db.save_play_stats(g_PATHS, stats)
         kodi_notify('Deleted all Recently Played ROMs')
         kodi_refresh_container()
 
     elif action == ACTION_DELETE_MISSING:
         log.debug('_command_manage_most_played() ACTION_DELETE_MISSING')
-        rom_list = fs_load_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH)
-        roms = collections.OrderedDict()
-        for rom in rom_list: roms[rom['id']] = rom
-        if not roms:
+        stats = db.load_play_stats(g_PATHS)
+        if not stats['recent']:
             kodi_notify('Recently Played ROMs list is empty. Play some ROMs first!.')
             return
 
-        # --- Traverse ROMs and check if they exist in Launcher ---
-        # Naive, slow implementation. I will improve it when I had time.
-        # Dictionaries cannot be modified while being iterated. Make a list of keys
-        # to be deleted later.
-        pDialog = KodiProgressDialog()
-        pDialog.startProgress('Delete missing Recently Played ROMs', len(roms))
-        delete_key_list = []
-        for rom_ID in roms:
-            pDialog.updateProgressInc()
-
-            # STEP 1: Delete Favourite with missing Launcher.
-            launcher_id = roms[rom_ID]['launcherID']
-            if launcher_id not in self.launchers:
-                log.debug('ROM title {} ID {}'.format(roms[rom_ID]['m_name'], rom_ID))
-                log.debug('launcherID {} not found in Launchers.'.format(roms[rom_ID]['launcherID']))
-                log.debug('Deleting ROM from Recently Played ROMs')
-                delete_key_list.append(rom_ID)
-                continue
-
-            # STEP 2: Delete Favourite if ROM ID cannot be found in Launcher.
-            launcher_roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, self.launchers[launcher_id])
-            if rom_ID not in launcher_roms:
-                log.debug('ROM title {} ID {}'.format(roms[rom_ID]['m_name'], rom_ID))
-                log.debug('rom_ID {} not found in launcher ROMs.'.format(rom_ID))
-                log.debug('Deleting ROM from Recently Played ROMs')
-                delete_key_list.append(rom_ID)
-                continue
-        pDialog.endProgress()
+        # --- Delete ROMs that cannot be found where they were launched from ---
+        # Every ROM database is loaded only once.
+        roms = db.resolve_play_stats_ROMs(g_PATHS, stats, stats['recent'])
+        delete_key_list = [rom_ID for rom_ID in stats['recent'] if rom_ID not in roms]
         log.debug('len(delete_key_list) = {}'.format(len(delete_key_list)))
-        for key in delete_key_list: del roms[key]
+        stats['recent'] = [rom_ID for rom_ID in stats['recent'] if rom_ID in roms]
 
         # --- Save ROMs and notify user ---
-        # Convert from OrderedDict to list.
-        rom_list = [roms[key] for key in roms]
-        fs_write_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH, rom_list)
+        db.save_play_stats(g_PATHS, stats)
         if len(delete_key_list) == 0:
             kodi_notify('No Recently Played ROMs deleted')
         else:
@@ -4708,7 +4712,7 @@ def command_manage_recently_played(self, rom_ID):
         log.error(t)
         kodi.dialog_OK(t)
 
-# Most played ROMs are stored in a dictionary, key ROM ID and value ROM dictionary.
+# Most played ROMs are the ROMs with launch_count > 0 in the play statistics.
 def command_manage_most_played(self, rom_ID):
     VIEW_ROOT_MENU   = 100
     VIEW_INSIDE_MENU = 200
@@ -4750,20 +4754,21 @@ def command_manage_most_played(self, rom_ID):
         log.debug('_command_manage_most_played() ACTION_DELETE_MACHINE')
 
         # --- Load ROMs ---
-        roms = fs_load_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH)
-        if not roms:
+        stats = db.load_play_stats(g_PATHS)
+        if rom_ID not in db.get_most_played_ROM_IDs(stats):
             kodi_notify('Most Played ROMs list is empty. Play some ROMs first!.')
             return
+        roms = db.resolve_play_stats_ROMs(g_PATHS, stats, [rom_ID])
 
         # --- Confirm deletion ---
-        rom_name = roms[rom_ID]['m_name']
+        rom_name = roms[rom_ID]['m_name'] if rom_ID in roms else rom_ID
         msg_str = 'Are you sure you want to delete it from Most Played ROMs?'
         ret = kodi_dialog_yesno('ROM "{}". '.format(rom_name) + msg_str)
         if not ret: return
-        roms.pop(rom_ID)
+        stats['roms'][rom_ID]['launch_count'] = 0
 
         # --- Save ROMs and notify user ---
-        fs_write_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH, roms)
+        db.save_play_stats(g_PATHS, stats)
         kodi_notify('Deleted ROM {}'.format(rom_name))
         kodi_refresh_container()
 
@@ -4776,7 +4781,9 @@ def command_manage_most_played(self, rom_ID):
         if not ret: return
 
         # --- Save ROMs and notify user ---
-        fs_write_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH, {})
+        stats = db.load_play_stats(g_PATHS)
+        for entry in stats['roms'].values(): entry['launch_count'] = 0
+        db.save_play_stats(g_PATHS, stats)
         kodi_notify('Deleted all Most Played ROMs')
         kodi_refresh_container()
 
@@ -4784,44 +4791,21 @@ def command_manage_most_played(self, rom_ID):
         log.debug('_command_manage_most_played() ACTION_DELETE_MISSING')
 
         # --- Load ROMs ---
-        roms = fs_load_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH)
-        if not roms:
+        stats = db.load_play_stats(g_PATHS)
+        rom_ID_list = db.get_most_played_ROM_IDs(stats)
+        if not rom_ID_list:
             kodi_notify('Most Played ROMs list is empty. Play some ROMs first!.')
             return
 
-        # --- Traverse ROMs and check if they exist in Launcher ---
-        # Naive, slow implementation. I will improve it when I had time.
-        # Dictionaries cannot be modified while being iterated. Make a list of keys
-        # to be deleted later.
-        pDialog = KodiProgressDialog()
-        pDialog.startProgress('Delete missing Most Played ROMs', len(roms))
-        delete_key_list = []
-        for rom_ID in roms:
-            pDialog.updateProgressInc()
-
-            # STEP 1: Delete Favourite with missing Launcher.
-            launcher_id = roms[rom_ID]['launcherID']
-            if launcher_id not in self.launchers:
-                log.debug('ROM title {} ID {}'.format(roms[rom_ID]['m_name'], rom_ID))
-                log.debug('launcherID {} not found in Launchers.'.format(roms[rom_ID]['launcherID']))
-                log.debug('Deleting ROM from Most Played ROMs')
-                delete_key_list.append(rom_ID)
-                continue
-
-            # STEP 2: Delete Favourite if ROM ID cannot be found in Launcher.
-            launcher_roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, self.launchers[launcher_id])
-            if rom_ID not in launcher_roms:
-                log.debug('ROM title {} ID {}'.format(roms[rom_ID]['m_name'], rom_ID))
-                log.debug('rom_ID {} not found in launcher ROMs.'.format(rom_ID))
-                log.debug('Deleting ROM from Most Played ROMs')
-                delete_key_list.append(rom_ID)
-                continue
-        pDialog.endProgress()
+        # --- Delete ROMs that cannot be found where they were launched from ---
+        # Every ROM database is loaded only once.
+        roms = db.resolve_play_stats_ROMs(g_PATHS, stats, rom_ID_list)
+        delete_key_list = [rom_ID for rom_ID in rom_ID_list if rom_ID not in roms]
         log.debug('len(delete_key_list) = {}'.format(len(delete_key_list)))
-        for key in delete_key_list: del roms[key]
+        for key in delete_key_list: stats['roms'][key]['launch_count'] = 0
 
         # --- Save ROMs and notify user ---
-        fs_write_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH, roms)
+        db.save_play_stats(g_PATHS, stats)
         if len(delete_key_list) == 0:
             kodi_notify('No Most Played ROMs deleted')
         else:
@@ -4842,7 +4826,7 @@ def command_search_launcher(self, categoryID, launcherID):
 
     # Load ROMs
     if categoryID == VCATEGORY_FAVOURITES_ID:
-        roms = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+        roms = db.load_Favourite_ROMs(g_PATHS)
     elif categoryID == VCATEGORY_TITLE_ID:
         roms = fs_load_VCategory_ROMs_JSON(g_PATHS.VIRTUAL_CAT_TITLE_DIR, launcherID)
     elif categoryID == VCATEGORY_YEARS_ID:
@@ -4955,7 +4939,7 @@ def command_execute_search_launcher(self, categoryID, launcherID, search_type, s
 
     # --- Load Launcher ROMs ---
     if categoryID == VCATEGORY_FAVOURITES_ID:
-        roms = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+        roms = db.load_Favourite_ROMs(g_PATHS)
     elif categoryID == VCATEGORY_TITLE_ID:
         roms = fs_load_VCategory_ROMs_JSON(g_PATHS.VIRTUAL_CAT_TITLE_DIR, launcherID)
     elif categoryID == VCATEGORY_YEARS_ID:
@@ -5225,55 +5209,40 @@ def command_view_menu(cfg, categoryID, launcherID, romID):
         kodi.display_text_window_mono(cfg.window_title, '\n'.join(sl))
 
     # --- Launcher statistical reports ---
-    elif action == ACTION_VIEW_LAUNCHER_STATS or \
-         action == ACTION_VIEW_LAUNCHER_METADATA or \
-         action == ACTION_VIEW_LAUNCHER_ASSETS:
-        # --- Standalone launchers do not have reports! ---
-        if categoryID in self.categories: category_name = self.categories[categoryID]['m_name']
-        else:                             category_name = CATEGORY_ADDONROOT_ID
-        launcher = self.launchers[launcherID]
+    # Statistics are rendered from the counters stored in the launcher index. Metadata and
+    # asset reports list every ROM so they load the ROM database.
+    elif action == ACTION_VIEW_LAUNCHER_STATS:
+        launcher = cfg.launchers[launcherID]
         if not launcher['rompath']:
-            kodi_notify_warn('Cannot create report for standalone launcher')
+            kodi.notify_warn('Cannot create report for standalone launcher')
             return
-        # --- If no ROMs in launcher do nothing ---
-        launcher = self.launchers[launcherID]
-        roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, launcher)
-        if not roms:
-            kodi_notify_warn('No ROMs in launcher. Report not created')
+        stats, rebuilt = db.get_launcher_stats(cfg.ROMS_DIR, launcher)
+        if rebuilt: db.write_launchers_XML(cfg, cfg.update_timestamp)
+        if not stats['num_roms']:
+            kodi.notify_warn('No ROMs in launcher. Report not created')
             return
-        # --- Regenerate reports if don't exist or are outdated ---
-        self._roms_regenerate_launcher_reports(categoryID, launcherID, roms)
-
-        # --- Get report filename ---
-        roms_base_noext  = fs_get_ROMs_basename(category_name, launcher['m_name'], launcherID)
-        report_stats_FN  = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_stats.txt')
-        report_meta_FN   = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_metadata.txt')
-        report_assets_FN = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_assets.txt')
-        log.debug('command_view_menu() Stats  OP "{}"'.format(report_stats_FN.getOriginalPath()))
-        log.debug('command_view_menu() Meta   OP "{}"'.format(report_meta_FN.getOriginalPath()))
-        log.debug('command_view_menu() Assets OP "{}"'.format(report_assets_FN.getOriginalPath()))
-
-        # --- Read report file ---
-        try:
-            if action == ACTION_VIEW_LAUNCHER_STATS:
-                window_title = 'Launcher "{}" Statistics Report'.format(launcher['m_name'])
-                info_text = utils_load_file_to_str(report_stats_FN.getPath())
-            elif action == ACTION_VIEW_LAUNCHER_METADATA:
-                window_title = 'Launcher "{}" Metadata Report'.format(launcher['m_name'])
-                info_text = utils_load_file_to_str(report_meta_FN.getPath())
-            elif action == ACTION_VIEW_LAUNCHER_ASSETS:
-                window_title = 'Launcher "{}" Asset Report'.format(launcher['m_name'])
-                info_text = utils_load_file_to_str(report_assets_FN.getPath())
-        except IOError:
-            log.error('command_view_menu() (IOError) Exception reading report TXT file')
-            window_title = 'Error'
-            info_text = '[COLOR red]Exception reading report TXT file.[/COLOR]'
-        info_text = info_text.replace('<No-Intro Audit Statistics>', '[COLOR orange]<No-Intro Audit Statistics>[/COLOR]')
-        info_text = info_text.replace('<Metadata statistics>', '[COLOR orange]<Metadata statistics>[/COLOR]')
-        info_text = info_text.replace('<Asset statistics>', '[COLOR orange]<Asset statistics>[/COLOR]')
-
-        # Show information window
-        kodi_display_text_window_mono(window_title, info_text)
+        window_title = 'Launcher "{}" Statistics Report'.format(launcher['m_name'])
+        kodi.display_text_window_mono(window_title, '\n'.join(render_launcher_stats_report(stats)))
+
+    elif action == ACTION_VIEW_LAUNCHER_METADATA or action == ACTION_VIEW_LAUNCHER_ASSETS:
+        launcher = cfg.launchers[launcherID]
+        if not launcher['rompath']:
+            kodi.notify_warn('Cannot create report for standalone launcher')
+            return
+        st = kodi.new_status_dic()
+        db.load_db_index(cfg, st, categoryID, launcherID)
+        db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
+        db.load_ROMs(cfg, st)
+        if not cfg.roms:
+            kodi.notify_warn('No ROMs in launcher. Report not created')
+            return
+        if action == ACTION_VIEW_LAUNCHER_METADATA:
+            window_title = 'Launcher "{}" Metadata Report'.format(launcher['m_name'])
+            sl = render_launcher_metadata_report(cfg.roms)
+        else:
+            window_title = 'Launcher "{}" Asset Report'.format(launcher['m_name'])
+            sl = render_launcher_asset_report(launcher, cfg.roms)
+        kodi.display_text_window_mono(window_title, '\n'.join(sl))
 
     # Launcher ROM scanner report
     elif action == ACTION_VIEW_LAUNCHER_SCANNER:
@@ -5295,23 +5264,20 @@ def command_view_menu(cfg, categoryID, launcherID, romID):
     elif action == ACTION_VIEW_MAP:
         # Load ROMs
         if categoryID == VCATEGORY_FAVOURITES_ID:
-            roms = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+            roms = db.load_Favourite_ROMs(g_PATHS)
             rom = roms[romID]
-        elif categoryID == VCATEGORY_MOST_PLAYED_ID:
-            most_played_roms = fs_load_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH)
-            rom = most_played_roms[romID]
-        elif categoryID == VCATEGORY_RECENT_ID:
-            recent_roms_list = fs_load_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH)
-            current_ROM_position = fs_collection_ROM_index_by_romID(romID, recent_roms_list)
-            if current_ROM_position < 0:
-                kodi.dialog_OK('Collection ROM not found in list. This is a bug!')
+        elif launcherID == const.VLAUNCHER_RECENT_ID or launcherID == const.VLAUNCHER_MOST_PLAYED_ID:
+            stats = db.load_play_stats(g_PATHS)
+            roms = db.resolve_play_stats_ROMs(g_PATHS, stats, [romID])
+            if romID not in roms:
+                kodi.dialog_OK('ROM not found in play statistics. This is a bug!')
                 return
-            rom = recent_roms_list[current_ROM_position]
+            rom = roms[romID]
         elif categoryID == VCATEGORY_COLLECTIONS_ID:
             COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
             collection = COL['collections'][launcherID]
             roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-            collection_rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+            collection_rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
             current_ROM_position = fs_collection_ROM_index_by_romID(romID, collection_rom_list)
             if current_ROM_position < 0:
                 kodi.dialog_OK('Collection ROM not found in list. This is a bug!')
@@ -5451,7 +5417,7 @@ def command_update_browse_by_db_single(cfg, virtual_categoryID, all_roms_externa
 
     # Load Virtual Launcher index and get information.
     st = kodi.new_status_dic()
-    db.load_vlauncher_index(cfg, st, virtual_categoryID)
+    db.load_db_index(cfg, st, virtual_categoryID)
 
     # --- Delete previous hashed database JSON files ---
     aux_clean_browse_by_JSON_files(cfg, cfg.vcategory_name)
@@ -5742,7 +5708,7 @@ def mgui_export_object_XML(cfg, object_ID, edict):
         kodi.notify('Exported {} "{}" XML config'.format(object_name, edict['m_name']))
 
 def mgui_export_ROM_Collection(cfg, collection):
-    collections_asset_dir_FN = utils.FileName(self.settings['collections_asset_dir'])
+    collections_asset_dir_FN = utils.FileName(cfg.settings['collections_asset_dir'])
 
     # --- Choose output directory ---
     output_dir = kodi.dialog_get_wdirectory('Select Collection output directory')
@@ -5750,23 +5716,32 @@ def mgui_export_ROM_Collection(cfg, collection):
     out_dir_FN = utils.FileName(output_dir)
 
     # Load collection ROMs. Collection indices have been already loaded.
-    COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
-    collection = COL['collections'][launcherID]
-    roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-    rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
-    
-    st = kodi.new_status_dic()
-    db.load_ROMs(cfg, st)
-
+    roms_json_file = cfg.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
+    rom_list = db.load_Collection_ROMs(cfg, roms_json_file)
     if not rom_list:
-        kodi_notify('Collection is empty. Add ROMs to this collection first.')
+        kodi.notify('Collection is empty. Add ROMs to this collection first.')
         return
 
     # --- Export collection metadata and assets ---
-    output_FN = out_dir_FN.pjoin(collection['m_name'] + '.json')
-    db.export_ROM_collection(output_FN, collection, rom_list)
-    db.export_ROM_collection_assets(out_dir_FN, collection, rom_list, collections_asset_dir_FN)
-    kodi.notify('Exported ROM Collection {} metadata and assets.'.format(collection['m_name']))
+    # Unchanged files already in the output directory are not copied again.
+    zip_flag = kodi.dialog_yesno_custom('Export the ROM Collection as a single ZIP file or as loose files?',
+        'ZIP file', 'Loose files')
+    pdiag = kodi.ProgressDialog()
+    if zip_flag:
+        zip_FN = out_dir_FN.pjoin(collection['m_name'] + '.zip')
+        report = db.export_ROM_collection_archive(zip_FN, collection, rom_list, pdiag)
+    else:
+        output_FN = out_dir_FN.pjoin(collection['m_name'] + '.json')
+        db.export_ROM_collection(output_FN, collection, rom_list)
+        report = db.export_ROM_collection_assets(out_dir_FN, collection, rom_list,
+            collections_asset_dir_FN, pdiag)
+    if report[db.COPY_ERROR]:
+        kodi.notify_warn('{} errors exporting ROM Collection assets. See the log.'.format(
+            len(report[db.COPY_ERROR])))
+        return
+    kodi.notify('Exported ROM Collection {}. {} assets copied, {} unchanged, {} missing.'.format(
+        collection['m_name'], len(report[db.COPY_COPIED]), len(report[db.COPY_SKIPPED]),
+        len(report[db.COPY_MISSING])))
 
 # Open the subcontextmenu "Edit Assets/Artwork" 
 # --- Return value ---
@@ -6198,7 +6173,7 @@ def mgui_delete_ROM_Collection(cfg):
     COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
     collection = COL['collections'][launcherID]
     roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-    collection_rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+    collection_rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
 
     # --- Confirm deletion ---
     num_roms = len(collection_rom_list)
@@ -6366,7 +6341,7 @@ def mgui_edit_ROM_rescan_ROMs_artwork(cfg, launcher):
     for asset_kind in ROM_ASSET_ID_LIST:
         pdialog.updateProgressInc()
         AInfo = assets_get_info_scheme(asset_kind)
-        utils_file_cache_add_dir(launcher[AInfo.path_key])
+        utils.file_cache_add_dir(launcher[AInfo.path_key])
     pdialog.endProgress()
 
     # --- Traverse ROM list and check local asset/artwork ---
@@ -6409,7 +6384,7 @@ def mgui_edit_ROM_rescan_ROMs_artwork(cfg, launcher):
             # asset_dir = utils.FileName(launcher[AInfo.path_key])
             # local_asset = utils_look_for_file(asset_dir, rom_basename_noext, AInfo.exts)
             # New implementation using a cache.
-            local_asset = utils_file_cache_search(launcher[AInfo.path_key], rom_basename_noext, AInfo.exts)
+            local_asset = utils.file_cache_search(launcher[AInfo.path_key], rom_basename_noext, AInfo.exts)
             if local_asset:
                 rom[AInfo.key] = local_asset.getOriginalPath()
                 log.debug('Found {:<9} "{}"'.format(AInfo.name, local_asset.getPath()))
@@ -6515,35 +6490,35 @@ def mgui_edit_ROM_rescan_ROMs_artwork(cfg, launcher):
 # --- Scrape ROMs artwork ---
 # Mimic what the ROM scanner does. Use same settings as the ROM scanner.
 # Like the ROM scanner, only scrape artwork not found locally.
+# Missing artwork is found in one pass and images are downloaded concurrently, see
+# scrap.ScrapeStrategy.scrap_bulk_ROM_assets(). An interrupted run is resumed.
+# The ROM database is saved here. Returns False, launchers.xml is saved by db.save_ROMs().
 def mgui_edit_ROM_scrape_ROMs_artwork(cfg, launcher):
-    log.info('_command_edit_launcher() Rescraping ROM assets...')
-    launcher = self.launchers[launcherID]
-    pdialog_verbose = True
-    pdialog = KodiProgressDialog()
-
-    # --- Load metadata/asset scrapers ---
-    g_scraper_factory = ScraperFactory(g_PATHS, self.settings)
-    scraper_strategy = g_scraper_factory.create_scanner(launcher)
-    scraper_strategy.scanner_set_progress_dialog(pdialog, pdialog_verbose)
-    scraper_strategy.scanner_check_before_scraping()
-    # Confirm scraper operation with user.
-    t = ('Launcher {}{}{} missing artwork will be scraped with '
-        'scraper {}{}{}. Continue?'.format(KC_ORANGE, launcher['m_name'], KC_END,
-        KC_ORANGE, scraper_strategy.asset_scraper_name, KC_END))
-    ret = kodi_dialog_yesno(t)
-    if not ret: return
+    log.info('mgui_edit_ROM_scrape_ROMs_artwork() Scraping ROM assets...')
+    pdialog = kodi.ProgressDialog()
 
     # --- Ensure there is no duplicate asset dirs ---
-    duplicated_name_list = asset_get_duplicated_dir_list(launcher)
+    duplicated_name_list = assets.get_duplicated_dir_list(launcher)
     if duplicated_name_list:
         duplicated_asset_srt = ', '.join(duplicated_name_list)
         log.info('Duplicated asset dirs: {}'.format(duplicated_asset_srt))
         kodi.dialog_OK('Duplicated asset directories: {}. '.format(duplicated_asset_srt) +
             'Change asset directories before continuing.')
-        return
+        return False
     else:
         log.info('No duplicated asset dirs found')
 
+    # --- Load metadata/asset scrapers ---
+    scraper_factory = scrap.ScraperFactory(cfg, cfg.settings)
+    scraper_strategy = scraper_factory.create_scanner(launcher)
+    scraper_strategy.scanner_set_progress_dialog(pdialog, False)
+    scraper_strategy.scanner_check_before_scraping()
+    # Confirm scraper operation with user.
+    t = ('Launcher {}{}{} missing artwork will be scraped with '
+        'scraper {}{}{}. Continue?'.format(const.KC_ORANGE, launcher['m_name'], const.KC_END,
+        const.KC_ORANGE, scraper_strategy.asset_scraper_name, const.KC_END))
+    if not kodi.dialog_yesno(t): return False
+
     # --- Check asset dirs and disable scanning for unset dirs ---
     scraper_strategy.scanner_check_launcher_unset_asset_dirs()
     if scraper_strategy.unconfigured_name_list:
@@ -6551,100 +6526,26 @@ def mgui_edit_ROM_scrape_ROMs_artwork(cfg, launcher):
         kodi.dialog_OK('Assets directories not set: {}. '.format(unconfigured_asset_srt) +
             'Asset scanner will be disabled for this/those.')
 
-    # --- Prepare ScannerStrategy variables ---
-    enabled_asset_list = scraper_strategy.enabled_asset_list
-    asset_scraper_name = scraper_strategy.asset_scraper_name
-    asset_scraper_obj  = scraper_strategy.asset_scraper_obj
-
     # --- Create a cache of current assets on disk ---
     log.info('Scanning and caching files in asset directories ...')
-    pdialog.startProgress('Scanning files in asset directories ...', len(ROM_ASSET_ID_LIST))
-    for asset_kind in ROM_ASSET_ID_LIST:
-        pdialog.updateProgressInc()
-        AInfo = assets_get_info_scheme(asset_kind)
-        utils_file_cache_add_dir(launcher[AInfo.path_key])
-    pdialog.endProgress()
-
-    # --- Traverse ROM list ---
-    roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, launcher)
-    pdialog.startProgress('Scraping assets...', len(roms))
-    for rom_id in roms:
+    pdialog.startProgress('Scanning files in asset directories ...', len(const.ROM_ASSET_ID_LIST))
+    for asset_ID in const.ROM_ASSET_ID_LIST:
         pdialog.updateProgressInc()
-
-        # --- Search for local artwork/assets ---
-        rom = roms[rom_id]
-        ROMFile = utils.FileName(rom['filename'])
-        log.debug('***** Checking ROM "{}" (ID {})'.format(ROMFile.getBase(), rom_id))
-        local_asset_list = assets_search_local_cached_assets(launcher, ROMFile, enabled_asset_list)
-        asset_action_list = [ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET] * len(ROM_ASSET_ID_LIST)
-
-        # --- Process asset by asset ---
-        for i, asset_ID in enumerate(ROM_ASSET_ID_LIST):
-            # --- Determine if asset must be scraped or not ---
-            AInfo = assets_get_info_scheme(asset_ID)
-            if not enabled_asset_list[i]:
-                log.debug('Skipping {} (dir not configured).'.format(AInfo.name))
-                asset_action_list[i] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-            elif local_asset_list[i]:
-                log.debug('Local {} FOUND'.format(AInfo.name))
-                asset_action_list[i] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-            elif asset_scraper_obj.supports_asset_ID(asset_ID):
-                # Scrape only if scraper supports asset.
-                log.debug('Local {} NOT found. Scraping.'.format(AInfo.name))
-                asset_action_list[i] = ScrapeStrategy.ACTION_ASSET_SCRAPER
-            else:
-                log.debug('Local {} NOT found. No scraper support.'.format(AInfo.name))
-                asset_action_list[i] = ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET
-
-        # --- If any asset is going to be scraped then get candidate game ---
-        temp_asset_list = [x == ScrapeStrategy.ACTION_ASSET_SCRAPER for x in asset_action_list]
-        if any(temp_asset_list):
-            log.debug('Getting asset candidate game.')
-            # What if st_dic reports and error here? It is ignored?
-            st_dic = kodi.new_status_dic()
-            # This is a workaround! It will fail for multidisc ROMs.
-            # See proper implementation in _roms_import_roms()
-            ROM_checksums = ROMFile
-            candidate_asset = scraper_strategy._scanner_get_candidate(rom, ROMFile,
-                ROM_checksums, asset_scraper_obj, asset_scraper_name, st_dic)
-            scraper_strategy.candidate_asset = candidate_asset
-        else:
-            log.debug('Setting candidate game to None.')
-            scraper_strategy.candidate_asset = None
-
-        # --- Process asset by asset actions ---
-        for i, asset_ID in enumerate(ROM_ASSET_ID_LIST):
-            AInfo = assets_get_info_scheme(asset_ID)
-            if asset_action_list[i] == ScrapeStrategy.ACTION_ASSET_LOCAL_ASSET:
-                log.debug('Using local asset for {}'.format(AInfo.name))
-                rom[AInfo.key] = local_asset_list[i]
-            elif asset_action_list[i] == ScrapeStrategy.ACTION_ASSET_SCRAPER:
-                rom[AInfo.key] = scraper_strategy._scanner_scrap_ROM_asset(asset_ID,
-                    local_asset_list[i], ROMFile)
-            else:
-                t = 'Asset {} index {} ID {} unknown action {}'.format(AInfo.name,
-                    i, asset_ID, asset_action_list[i])
-                raise ValueError(t)
-
-        # --- Check if user pressed the cancel button ---
-        if pdialog.isCanceled():
-            pdialog.endProgress()
-            kodi.dialog_OK('Stopping ROM artwork scraping.')
-            log.info('User pressed Cancel button when scraping ROMs.')
-            break
-    else:
-        pdialog.endProgress()
-
-    # --- Flush scraper disk caches ---
-    pdialog.startProgress('Flushing scraper disk caches...')
-    g_scraper_factory.destroy_scanner()
+        utils.file_cache_add_dir(launcher[assets.ASSET_INFO_DICT[asset_ID].path_key])
     pdialog.endProgress()
 
-    # --- Save ROMs XML file ---
-    pdialog.startProgress('Saving ROM JSON database ...')
-    fs_write_ROMs_JSON(g_PATHS.ROMS_DIR, launcher, roms)
-    pdialog.endProgress()
-    kodi_notify('Rescaning of ROMs local artwork finished')
+    # --- Load ROMs, scrape and save ---
+    st = kodi.new_status_dic()
+    db.load_db_index(cfg, st, launcher['categoryID'], launcher['id'])
+    db.get_ROM_db_filenames(cfg, st, launcher['categoryID'], launcher['id'])
+    db.load_ROMs(cfg, st)
+    if kodi.display_status_message(st): return False
+    report = scraper_strategy.scrap_bulk_ROM_assets(cfg.roms, cfg.SCRAPE_ARTWORK_PROGRESS_FILE_PATH, pdialog)
+    scraper_factory.destroy_scanner(pdialog)
+    db.save_ROMs(cfg, st)
+    kodi.notify('Downloaded {} / Not found {} ROM artwork'.format(
+        report[scrap.BULK_DOWNLOADED], report[scrap.BULK_NOT_FOUND]))
+    return False
 
 # --- Remove Remove dead/missing ROMs ROMs ---
 def mgui_edit_ROM_remove_dead_ROMs(cfg, launcher):
@@ -6724,9 +6625,25 @@ def exec_utils_restore_backup(cfg):
 def exec_utils_create_backup(cfg):
     kodi.dialog_OK('Create backup not implemented yet.')
 
-# Checks all databases and updates to newer version if possible
-def exec_utils_check_database(cfg):
-    log.debug('exec_utils_check_database() Beginning...')
+# Checks all databases and updates to newer version if possible.
+# All writes are done inside a write batch so launchers.xml is written only once.
+# In dry run mode nothing is written and the files that would change are reported.
+def exec_utils_check_database(cfg, dry_run = False):
+    log.debug('exec_utils_check_database() Beginning... dry_run {}'.format(dry_run))
+    with db.WriteBatch(cfg, dry_run) as batch:
+        result_list, cancelled = _exec_utils_check_database(cfg)
+    slist = _make_check_database_report(result_list, cancelled)
+    if dry_run:
+        slist.extend(['', 'Dry run. {} database writes, {} files would change.'.format(
+            batch.num_writes, len(batch.changed_files)), ''])
+        slist.extend(batch.changed_files)
+        kodi.display_text_window_mono('Check databases (dry run)', '\n'.join(slist))
+    else:
+        # So long and thanks for all the fish.
+        kodi.display_text_window_mono('Check databases report', '\n'.join(slist))
+    log.debug('exec_utils_check_database() Exiting')
+
+def _exec_utils_check_database(cfg):
     pdiag = kodi.ProgressDialog()
 
     # Open Categories/Launchers XML. XML should be updated automatically on load.
@@ -6766,74 +6683,14 @@ def exec_utils_check_database(cfg):
         if launcher['default_poster'] == 's_flyer':     launcher['default_poster'] = 's_poster'
         if launcher['default_clearlogo'] == 's_flyer':  launcher['default_clearlogo'] = 's_poster'
         if launcher['default_controller'] == 's_flyer': launcher['default_controller'] = 's_poster'
-    # Save categories.xml/launchers.xml to update timestamp.
+    # Save categories.xml/launchers.xml to update timestamp. Deferred by the write batch.
     db.write_launchers_XML(cfg)
     pdiag.endProgress()
 
-    # Traverse all launchers. Load ROMs and check every ROMs.
-    pdiag.startProgress('Checking Launcher ROMs...', len(cfg.launchers))
-    for launcherID, launcher in cfg.launchers.items():
-        pdiag.updateProgressInc()
-        log.debug('exec_utils_check_database() Checking Launcher "{}"'.format(launcher['m_name']))
-        # Load and fix standard ROM database.
-        st = kodi.new_status_dic()
-        db.get_ROM_db_filenames(cfg, st, launcher['categoryID'], launcherID)
-        db.load_ROMs(cfg, st)
-        for rom_id, rom in cfg.roms.items(): misc_ael.fix_rom_object(rom)
-        db.save_ROMs(cfg, st)
-
-        # >>> If exists, load and fix Parent ROM database.
-        # parents_FN = cfg.ROMS_DIR.pjoin(self.launchers[launcherID]['roms_base_noext'] + '_parents.json')
-        # if parents_FN.exists():
-        #     roms = utils_load_JSON_file(parents_FN.getPath())
-        #     for rom_id in roms: self._misc_fix_rom_object(roms[rom_id])
-        #     utils_write_JSON_file(parents_FN.getPath(), roms)
-
-        # This updates timestamps and forces regeneration of Virtual Launchers.
-        launcher['timestamp_launcher'] = time.time()
-    # Save categories.xml because launcher timestamps changed.
-    db.write_launchers_XML(cfg)
-    pdiag.endProgress()
-
-    # Load Favourite ROMs and update JSON
-    st = kodi.new_status_dic()
-    db.load_db_index(cfg, st, None, const.VLAUNCHER_FAVOURITES_ID)
-    db.get_ROM_db_filenames(cfg, st, None, const.VLAUNCHER_FAVOURITES_ID)
-    db.load_ROMs(cfg, st)
-    pdiag.startProgress('Checking Favourite ROMs...', len(cfg.roms))
-    for rom_id, rom in cfg.roms.items():
-        pdiag.updateProgressInc()
-        misc_ael.fix_Favourite_rom_object(rom)
-    db.save_ROMs(cfg, st)
-    pdiag.endProgress()
-
-    # Load Recently Played ROMs and check/update.
-    pdiag.startProgress('Checking Recently Played ROMs...')
-    st = kodi.new_status_dic()
-    db.load_db_index(cfg, st, None, const.VLAUNCHER_RECENT_ID)
-    db.get_ROM_db_filenames(cfg, st, None, const.VLAUNCHER_RECENT_ID)
-    db.load_ROMs(cfg, st)
-    for rom_id, rom in cfg.roms.items(): misc_ael.fix_Favourite_rom_object(rom)
-    db.save_ROMs(cfg, st)
-    pdiag.endProgress()
-
-    # Load Most Played ROMs and check/update.
-    pdiag.startProgress('Checking Most Played ROMs...')
-    st = kodi.new_status_dic()
-    db.load_db_index(cfg, st, None, const.VLAUNCHER_MOST_PLAYED_ID)
-    db.get_ROM_db_filenames(cfg, st, None, const.VLAUNCHER_MOST_PLAYED_ID)
-    db.load_ROMs(cfg, st)
-    for rom_id, rom in cfg.roms.items(): misc_ael.fix_Favourite_rom_object(rom)
-    db.save_ROMs(cfg, st)
-    pdiag.endProgress()
-
-    # Traverse every ROM Collection database and check/update Favourite ROMs.
+    # Fix ROM Collections index. Collection ROMs are checked with the rest of the ROM databases.
     st = kodi.new_status_dic()
     db.load_db_index(cfg, st, const.VCATEGORY_ROM_COLLECTION_ID)
-    pdiag.startProgress('Checking Collection ROMs...', len(cfg.collections))
     for collectionID, collection in cfg.collections.items():
-        pdiag.updateProgressInc()
-        # Fix collection
         if 'default_thumb' in collection:
             collection['default_icon'] = collection['default_thumb']
             collection.pop('default_thumb')
@@ -6855,35 +6712,68 @@ def exec_utils_check_database(cfg):
         if collection['default_banner'] == 's_flyer':    collection['default_banner'] = 's_poster'
         if collection['default_poster'] == 's_flyer':    collection['default_poster'] = 's_poster'
         if collection['default_clearlogo'] == 's_flyer': collection['default_clearlogo'] = 's_poster'
-
-        # Fix collection ROMs
-        db.get_ROM_db_filenames(cfg, st, const.VCATEGORY_ROM_COLLECTION_ID, collectionID)
-        db.load_ROMs(cfg, st)
-        for rom_id, rom in cfg.roms.items(): misc_ael.fix_Favourite_rom_object(rom)
-        db.save_ROMs(cfg, st)
     db.write_Collection_index_XML(cfg.COLLECTIONS_FILE_PATH, cfg.collections)
-    # db.save_collections_index(cfg, st)
-    pdiag.endProgress()
 
-    # Also fix ROMs in virtual launchers?
-    # It is not worth it because they can be regenerated. However, it is a good exercise to test
-    # the new load/save ROM API.
-    pdiag.startProgress('Checking Browse By ROMs...', len(const.VCATEGORY_BROWSE_BY_ID_LIST))
+    # --- Make the list of ROM databases to check ---
+    # Launcher ROMs, Favourites, Collections and Browse By. Recently Played and Most Played
+    # only store ROM references in the play statistics.
+    # Virtual launchers can be regenerated but it is a good exercise to test them.
+    job_list = []
+    for launcherID, launcher in cfg.launchers.items():
+        job_list.append(('launcher_' + launcherID, 'Launcher ' + launcher['m_name'],
+            launcher['categoryID'], launcherID, misc_ael.fix_rom_object))
+    job_list.append(('favourites', 'Favourites',
+        const.VCATEGORY_SPECIAL_ID, const.VLAUNCHER_FAVOURITES_ID, misc_ael.fix_Favourite_rom_object))
+    for collectionID, collection in cfg.collections.items():
+        job_list.append(('collection_' + collectionID, 'Collection ' + collection['m_name'],
+            const.VCATEGORY_ROM_COLLECTION_ID, collectionID, misc_ael.fix_Favourite_rom_object))
     for categoryID in const.VCATEGORY_BROWSE_BY_ID_LIST:
-        pdiag.updateProgressInc()
         st = kodi.new_status_dic()
         db.load_db_index(cfg, st, categoryID)
         for launcherID in cfg.vlaunchers:
-            db.get_ROM_db_filenames(cfg, st, categoryID, launcherID)
-            db.load_ROMs(cfg, st)
-            for rom_id, rom in cfg.roms.items(): misc_ael.fix_Favourite_rom_object(rom)
-            db.save_ROMs(cfg, st)
-    pdiag.endProgress()
-
-    # So long and thanks for all the fish.
-    kodi.notify('All databases checked')
-    log.debug('exec_utils_check_database() Exiting')
+            vlauncher_base = '{}_{}.json'.format(cfg.vcategory_name, launcherID)
+            job_list.append(('vlauncher_' + vlauncher_base, 'Browse by ' + vlauncher_base,
+                categoryID, launcherID, misc_ael.fix_Favourite_rom_object))
+
+    # --- Check ROM databases in the worker pool ---
+    # Fixed launchers are saved with save_ROMs(), which updates the launcher timestamp. This
+    # forces regeneration of Virtual Launchers. launchers.xml is written when the write batch ends.
+    result_list, cancelled = db.repair_ROM_databases(cfg, job_list,
+        cfg.CHECK_DATABASE_PROGRESS_FILE_PATH, pdiag)
+
+    # Recently played and Most played ROMs are in the play statistics.
+    if not cancelled: result_list.append(db.repair_play_stats(cfg))
+
+    return result_list, cancelled
+
+# Returns a list of strings with the database check report.
+def _make_check_database_report(result_list, cancelled):
+    num_status = { status : 0 for status in [db.REPAIR_FIXED, db.REPAIR_UNCHANGED,
+        db.REPAIR_RESUMED, db.REPAIR_MISSING, db.REPAIR_ERROR] }
+    for result in result_list: num_status[result['status']] += 1
+    slist = []
+    if cancelled:
+        slist.append('Check cancelled. Run it again to resume where it stopped.')
+        slist.append('')
+    slist.append('Checked databases {:6d}'.format(len(result_list)))
+    slist.append('Fixed             {:6d}'.format(num_status[db.REPAIR_FIXED]))
+    slist.append('Unchanged         {:6d}'.format(num_status[db.REPAIR_UNCHANGED]))
+    slist.append('Resumed (skipped) {:6d}'.format(num_status[db.REPAIR_RESUMED]))
+    slist.append('Missing           {:6d}'.format(num_status[db.REPAIR_MISSING]))
+    slist.append('Errors            {:6d}'.format(num_status[db.REPAIR_ERROR]))
+    table_str = [
+        ['left', 'left', 'right', 'right'],
+        ['Database', 'Status', 'ROMs', 'Fixed ROMs'],
+    ]
+    for result in sorted(result_list, key = lambda x : x['name']):
+        if result['status'] not in (db.REPAIR_FIXED, db.REPAIR_ERROR): continue
+        table_str.append([result['name'], result['status'],
+            '{:,}'.format(result['num_roms']), '{:,}'.format(result['num_fixed'])])
+    if len(table_str) > 2:
+        slist.append('')
+        slist.extend(misc.render_table(table_str))
 
+    return slist
 
 # Working on this function now.
 
@@ -7112,6 +7002,12 @@ def exec_utils_check_launcher_sync_status(cfg):
 def exec_utils_check_artwork_integrity(cfg):
     kodi.dialog_OK('EXECUTE_UTILS_CHECK_ARTWORK_INTEGRITY not implemented yet.')
 
+# Image headers are cached in the image header index, so unchanged files are not opened again
+# the next time the check is run. Headers of files in network shares are read in a pool of
+# threads, because every file open waits for a network round trip. Local files are read
+# sequentially. Number of threads of setting io_image_header_threads.
+IMAGE_HEADER_THREADS_LIST = [1, 2, 4, 8, 16]
+
 def exec_utils_check_ROM_artwork_integrity(cfg):
     log.debug('exec_utils_check_ROM_artwork_integrity() Beginning...')
     main_slist = []
@@ -7120,25 +7016,62 @@ def exec_utils_check_ROM_artwork_integrity(cfg):
         ['left', 'right', 'right', 'right', 'right'],
         ['Launcher', 'ROMs', 'Images', 'Missing', 'Problematic'],
     ]
-    pdialog = KodiProgressDialog()
-    d_msg = 'Checking ROM artwork integrity...'
-    pdialog.startProgress(d_msg, len(self.launchers))
+    asset_key_list = [assets.ASSET_INFO_DICT[asset_id].key for asset_id in const.ROM_ASSET_ID_LIST \
+        if asset_id != const.ASSET_MANUAL_ID and asset_id != const.ASSET_TRAILER_ID]
+
+    # --- Collect the image files of every ROM launcher ---
+    # launcher_list is a list of tuples (launcher, num_roms, [asset_fname, ...])
+    pdialog = kodi.ProgressDialog()
+    d_msg = 'Loading ROM databases...'
+    pdialog.startProgress(d_msg, len(cfg.launchers))
+    launcher_list = []
+    path_set = set()
+    for launcher_id in sorted(cfg.launchers, key = lambda x : cfg.launchers[x]['m_name']):
+        pdialog.updateProgressInc(d_msg)
+        launcher = cfg.launchers[launcher_id]
+        # Skip non-ROM launcher.
+        if not launcher['rompath']: continue
+        roms_FN = cfg.ROMS_DIR.pjoin(launcher['roms_base_noext'] + '.json')
+        json_data = utils.load_JSON_file(roms_FN.getPath(), [], verbose = False)
+        roms = json_data[2] if json_data else {}
+        asset_fname_list = []
+        for rom_id in roms:
+            for asset_key in asset_key_list:
+                if roms[rom_id][asset_key]: asset_fname_list.append(roms[rom_id][asset_key])
+        launcher_list.append((launcher, len(roms), asset_fname_list))
+        path_set.update(asset_fname_list)
+    pdialog.endProgress()
+
+    # --- Read image headers ---
+    header_index = db.load_image_header_index(cfg.ART_HEADER_INDEX_FILE_PATH)
+    mount_list = utils.get_network_mount_points()
+    local_path_list, network_path_list = [], []
+    for asset_fname in path_set:
+        if utils.is_network_path(asset_fname, mount_list):
+            network_path_list.append(asset_fname)
+        else:
+            local_path_list.append(asset_fname)
+    num_threads = IMAGE_HEADER_THREADS_LIST[cfg.settings['io_image_header_threads']]
+    log.debug('exec_utils_check_ROM_artwork_integrity() {} local files, {} network files'.format(
+        len(local_path_list), len(network_path_list)))
+    pdialog.startProgress('Checking image files...', len(path_set))
+    img_id_dic, num_cached = db.read_image_headers(local_path_list, header_index, pdialog)
+    if network_path_list and not pdialog.isCanceled():
+        network_dic, network_cached = db.read_image_headers(network_path_list, header_index,
+            pdialog, num_threads)
+        img_id_dic.update(network_dic)
+        num_cached += network_cached
+    pdialog.endProgress()
+    db.write_image_header_index(cfg.ART_HEADER_INDEX_FILE_PATH, header_index)
+
+    # --- Check every image. First check if the image has the correct extension ---
     total_images = 0
     missing_images = 0
     processed_images = 0
     problematic_images = 0
-    for launcher_id in sorted(self.launchers, key = lambda x : self.launchers[x]['m_name']):
-        pdialog.updateProgressInc(d_msg)
-
-        launcher = self.launchers[launcher_id]
-        # Skip non-ROM launcher.
-        if not launcher['rompath']: continue
+    for launcher, num_roms, asset_fname_list in launcher_list:
         log.debug('Checking ROM Launcher "{}"...'.format(launcher['m_name']))
-        detailed_slist.append(KC_ORANGE + 'Launcher "{}"'.format(launcher['m_name']) + KC_END)
-        # Load ROMs.
-        pdialog.updateMessage('{}\n{}'.format(d_msg, 'Loading ROMs'))
-        roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, launcher)
-        num_roms = len(roms)
+        detailed_slist.append(const.KC_ORANGE + 'Launcher "{}"'.format(launcher['m_name']) + const.KC_END)
         R_str = 'ROM' if num_roms == 1 else 'ROMs'
         log.debug('Launcher has {} DB {}'.format(num_roms, R_str))
         detailed_slist.append('Launcher has {} DB {}'.format(num_roms, R_str))
@@ -7146,115 +7079,136 @@ def exec_utils_check_ROM_artwork_integrity(cfg):
         if num_roms < 1:
             log.debug('Launcher is empty')
             detailed_slist.append('Launcher is empty')
-            detailed_slist.append(KC_YELLOW + 'Skipping launcher' + KC_END)
+            detailed_slist.append(const.KC_YELLOW + 'Skipping launcher' + const.KC_END)
             continue
+        # Images not checked because the user cancelled the progress dialog.
+        if any(asset_fname not in img_id_dic for asset_fname in asset_fname_list):
+            detailed_slist.append('Interrupted by user (pDialog cancelled).')
+            break
 
-        # Traverse all ROMs in Launcher.
-        # For every asset check the artwork file.
-        # First check if the image has the correct extension.
         problems_detected = False
-        launcher_images = 0
+        launcher_images = len(asset_fname_list)
         launcher_missing_images = 0
         launcher_problematic_images = 0
-        pdialog.updateMessage('{}\n{}'.format(d_msg, 'Checking image files'))
-        for rom_id in roms:
-            rom = roms[rom_id]
-            # detailed_slist.append('\nProcessing ROM {}'.format(rom['filename']))
-            for asset_id in ROM_ASSET_ID_LIST:
-                A = assets_get_info_scheme(asset_id)
-                asset_fname = rom[A.key]
-                # detailed_slist.append('\nProcessing asset {}'.format(A.name))
-                # Skip empty assets
-                if not asset_fname: continue
-                # Skip manuals and trailers
-                if asset_id == ASSET_MANUAL_ID: continue
-                if asset_id == ASSET_TRAILER_ID: continue
-                launcher_images += 1
-                total_images += 1
-                # If asset file does not exits that's an error.
-                if not os.path.exists(asset_fname):
-                    detailed_slist.append('Not found {}'.format(asset_fname))
-                    launcher_missing_images += 1
-                    missing_images += 1
-                    problems_detected = True
-                    continue
-                # Process asset
-                processed_images += 1
-                asset_root, asset_ext = os.path.splitext(asset_fname)
-                asset_ext = asset_ext[1:] # Remove leading dot '.png' -> 'png'
-                img_id_ext = misc_identify_image_id_by_ext(asset_fname)
-                img_id_real = misc_identify_image_id_by_contents(asset_fname)
-                # detailed_slist.append('img_id_ext "{}" | img_id_real "{}"'.format(img_id_ext, img_id_real))
-                # Unrecognised or corrupted image.
-                if img_id_ext == IMAGE_UKNOWN_ID:
-                    detailed_slist.append('Unrecognised extension {}'.format(asset_fname))
-                    problems_detected = True
-                    problematic_images += 1
-                    launcher_problematic_images += 1
-                    continue
-                # Corrupted image.
-                if img_id_real == IMAGE_CORRUPT_ID:
-                    detailed_slist.append('Corrupted {}'.format(asset_fname))
-                    problems_detected = True
-                    problematic_images += 1
-                    launcher_problematic_images += 1
-                    continue
-                # Unrecognised or corrupted image.
-                if img_id_real == IMAGE_UKNOWN_ID:
-                    detailed_slist.append('Bin unrecog or corrupted {}'.format(asset_fname))
-                    problems_detected = True
-                    problematic_images += 1
-                    launcher_problematic_images += 1
-                    continue
-                # At this point the image is recognised but has wrong extension
-                if img_id_ext != img_id_real:
-                    detailed_slist.append('Wrong extension ({}) {}'.format(
-                        IMAGE_EXTENSIONS[img_id_real][0], asset_fname))
-                    problems_detected = True
-                    problematic_images += 1
-                    launcher_problematic_images += 1
-                    continue
-            # On big setups this can take forever. Allow the user to cancel.
-            if pdialog.isCanceled(): break
-        else:
-            # only executed if the inner loop did NOT break
-            sum_table_slist.append([
-                launcher['m_name'], '{:,d}'.format(num_roms), '{:,d}'.format(launcher_images),
-                '{:,d}'.format(launcher_missing_images), '{:,d}'.format(launcher_problematic_images),
-            ])
-            detailed_slist.append('Number of images    {:6,d}'.format(launcher_images))
-            detailed_slist.append('Missing images      {:6,d}'.format(launcher_missing_images))
-            detailed_slist.append('Problematic images  {:6,d}'.format(launcher_problematic_images))
-            if problems_detected:
-                detailed_slist.append(KC_RED + 'Launcher should be updated' + KC_END)
+        for asset_fname in asset_fname_list:
+            img_id_real = img_id_dic[asset_fname]
+            # If asset file does not exits that's an error.
+            if img_id_real is None:
+                detailed_slist.append('Not found {}'.format(asset_fname))
+                launcher_missing_images += 1
+                problems_detected = True
+                continue
+            img_id_ext = misc.identify_image_id_by_ext(asset_fname)
+            # Unrecognised or corrupted image.
+            if img_id_ext == const.IMAGE_UKNOWN_ID:
+                detailed_slist.append('Unrecognised extension {}'.format(asset_fname))
+            # Corrupted image.
+            elif img_id_real == const.IMAGE_CORRUPT_ID:
+                detailed_slist.append('Corrupted {}'.format(asset_fname))
+            # Unrecognised or corrupted image.
+            elif img_id_real == const.IMAGE_UKNOWN_ID:
+                detailed_slist.append('Bin unrecog or corrupted {}'.format(asset_fname))
+            # At this point the image is recognised but has wrong extension
+            elif img_id_ext != img_id_real:
+                detailed_slist.append('Wrong extension ({}) {}'.format(
+                    const.IMAGE_EXTENSIONS[img_id_real][0], asset_fname))
             else:
-                detailed_slist.append(KC_GREEN + 'Launcher OK' + KC_END)
-            detailed_slist.append('')
-            continue
-        # only executed if the inner loop DID break
-        detailed_slist.append('Interrupted by user (pDialog cancelled).')
-        break
-    pdialog.endProgress()
+                continue
+            problems_detected = True
+            launcher_problematic_images += 1
+        total_images += launcher_images
+        missing_images += launcher_missing_images
+        processed_images += launcher_images - launcher_missing_images
+        problematic_images += launcher_problematic_images
+        sum_table_slist.append([
+            launcher['m_name'], '{:,d}'.format(num_roms), '{:,d}'.format(launcher_images),
+            '{:,d}'.format(launcher_missing_images), '{:,d}'.format(launcher_problematic_images),
+        ])
+        detailed_slist.append('Number of images    {:6,d}'.format(launcher_images))
+        detailed_slist.append('Missing images      {:6,d}'.format(launcher_missing_images))
+        detailed_slist.append('Problematic images  {:6,d}'.format(launcher_problematic_images))
+        if problems_detected:
+            detailed_slist.append(const.KC_RED + 'Launcher should be updated' + const.KC_END)
+        else:
+            detailed_slist.append(const.KC_GREEN + 'Launcher OK' + const.KC_END)
+        detailed_slist.append('')
 
     # Generate, save and display report.
-    log.info('Writing report file "{}"'.format(g_PATHS.ROM_ART_INTEGRITY_REPORT_FILE_PATH.getPath()))
+    log.info('Writing report file "{}"'.format(cfg.ROM_ART_INTEGRITY_REPORT_FILE_PATH.getPath()))
     pdialog.startProgress('Saving report')
     main_slist.append('*** Summary ***')
-    main_slist.append('There are {:,} ROM launchers.'.format(len(self.launchers)))
+    main_slist.append('There are {:,} ROM launchers.'.format(len(launcher_list)))
     main_slist.append('Total images        {:7,d}'.format(total_images))
     main_slist.append('Missing images      {:7,d}'.format(missing_images))
     main_slist.append('Processed images    {:7,d}'.format(processed_images))
     main_slist.append('Problematic images  {:7,d}'.format(problematic_images))
+    main_slist.append('Unchanged files     {:7,d} (not read again)'.format(num_cached))
     main_slist.append('')
-    main_slist.extend(text_render_table(sum_table_slist))
+    main_slist.extend(misc.render_table(sum_table_slist))
     main_slist.append('')
     main_slist.append('*** Detailed report ***')
     main_slist.extend(detailed_slist)
-    utils_write_slist_to_file(g_PATHS.ROM_ART_INTEGRITY_REPORT_FILE_PATH.getPath(), main_slist)
+    utils.write_slist_to_file(cfg.ROM_ART_INTEGRITY_REPORT_FILE_PATH.getPath(), main_slist)
     pdialog.endProgress()
     full_string = '\n'.join(main_slist)
     kodi.display_text_window_mono('ROM artwork integrity report', full_string)
 
+# Shows the slowest commands of the last runs recorded by the command timing telemetry.
+def exec_utils_command_timing(cfg):
+    log.debug('exec_utils_command_timing() Beginning...')
+    record_list = utils.command_timing_load(cfg.COMMAND_TIMING_FILE_PATH)
+    if not record_list:
+        kodi.dialog_OK('No command timing recorded. Enable "Record command timing" in '
+            'Advanced settings and use AEL for a while.')
+        return
+
+    db.load_launchers_XML(cfg)
+
+    # --- Summary per command ---
+    command_dic = {}
+    for record in record_list:
+        if record['command'] not in command_dic:
+            command_dic[record['command']] = { 'runs' : 0, 'total' : 0.0, 'max' : 0.0 }
+        summary = command_dic[record['command']]
+        summary['runs'] += 1
+        summary['total'] += record['total']
+        summary['max'] = max(summary['max'], record['total'])
+    main_slist = []
+    main_slist.append('Last {:,} commands recorded.'.format(len(record_list)))
+    main_slist.append('')
+    main_slist.append('*** Summary per command ***')
+    table_str = [
+        ['left', 'right', 'right', 'right'],
+        ['Command', 'Runs', 'Mean (s)', 'Max (s)'],
+    ]
+    for command in sorted(command_dic, key = lambda x : command_dic[x]['max'], reverse = True):
+        summary = command_dic[command]
+        table_str.append([command, '{:,d}'.format(summary['runs']),
+            '{:.3f}'.format(summary['total'] / summary['runs']), '{:.3f}'.format(summary['max'])])
+    main_slist.extend(misc.render_table(table_str))
+
+    # --- Slowest runs ---
+    main_slist.append('')
+    main_slist.append('*** Slowest runs ***')
+    table_str = [
+        ['left', 'left', 'left', 'right', 'right', 'right', 'right', 'right', 'left'],
+        ['Date', 'Command', 'Launcher', 'Load', 'Process', 'Render', 'Other', 'Total', 'cProfile'],
+    ]
+    for record in sorted(record_list, key = lambda x : x['total'], reverse = True)[:50]:
+        launcher_name = cfg.launchers[record['launID']]['m_name'] \
+            if record['launID'] in cfg.launchers else record['launID']
+        row = [time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record['date'])),
+            record['command'], launcher_name]
+        for phase in utils.TIMING_PHASE_LIST:
+            row.append('{:.3f}'.format(record['phases'][phase]) if phase in record['phases'] else '')
+        row.extend(['{:.3f}'.format(record['total']), record['profile']])
+        table_str.append(row)
+    main_slist.extend(misc.render_table(table_str))
+    if cfg.settings['debug_cProfile']:
+        main_slist.append('')
+        main_slist.append('cProfile stats are in "{}"'.format(cfg.CPROFILE_DIR.getPath()))
+    kodi.display_text_window_mono('Command timing report', '\n'.join(main_slist))
+
 def exec_utils_delete_redundant_artwork(cfg):
     kodi.dialog_OK('EXECUTE_UTILS_DELETE_REDUNDANT_ARTWORK not implemented yet.')
 
@@ -7343,11 +7297,11 @@ def exec_utils_show_DATs(cfg):
     DAT_STRING_LIMIT_CHARS = 75
 
     # --- Get files in No-Intro and Redump DAT directories ---
-    NOINTRO_PATH_FN = utils.FileName(self.settings['audit_nointro_dir'])
+    NOINTRO_PATH_FN = utils.FileName(cfg.settings['audit_nointro_dir'])
     if not NOINTRO_PATH_FN.exists():
         kodi.dialog_OK('No-Intro DAT directory not found. Please set it up in AEL addon settings.')
         return
-    REDUMP_PATH_FN = utils.FileName(self.settings['audit_redump_dir'])
+    REDUMP_PATH_FN = utils.FileName(cfg.settings['audit_redump_dir'])
     if not REDUMP_PATH_FN.exists():
         kodi.dialog_OK('No-Intro DAT directory not found. Please set it up in AEL addon settings.')
         return
@@ -7358,19 +7312,16 @@ def exec_utils_show_DATs(cfg):
         ['Platform', 'DAT type', 'DAT file'],
     ]
 
-    # --- Scan files in DAT dirs ---
-    NOINTRO_DAT_list = NOINTRO_PATH_FN.scanFilesInPath('*.dat')
-    REDUMP_DAT_list = REDUMP_PATH_FN.scanFilesInPath('*.dat')
-    # Some debug code
-    # for fname in NOINTRO_DAT_list: log.debug(fname)
+    # --- Load the DAT catalog. DAT dirs are scanned only if changed ---
+    DAT_index = audit.load_DAT_catalog(cfg.DAT_CATALOG_FILE_PATH,
+        NOINTRO_PATH_FN.getPath(), REDUMP_PATH_FN.getPath())
 
     # --- Autodetect files ---
     # 1) Traverse all platforms.
     # 2) Autodetect DATs for No-Intro or Redump platforms only.
-    # AEL_platforms_t = AEL_platforms[0:4]
-    for platform in AEL_platforms:
-        if platform.DAT == DAT_NOINTRO:
-            fname = misc_look_for_NoIntro_DAT(platform, NOINTRO_DAT_list)
+    for platform in platforms.AEL_platforms:
+        if platform.DAT == platforms.DAT_NOINTRO:
+            fname = audit.get_DAT_for_platform(DAT_index, platform)
             if fname:
                 DAT_str = utils.FileName(fname).getBase()
                 DAT_str = text_limit_string(DAT_str, DAT_STRING_LIMIT_CHARS)
@@ -7378,8 +7329,8 @@ def exec_utils_show_DATs(cfg):
             else:
                 DAT_str = '[COLOR=yellow]No-Intro DAT not found[/COLOR]'
             table_str.append([platform.compact_name, platform.DAT, DAT_str])
-        elif platform.DAT == DAT_REDUMP:
-            fname = misc_look_for_Redump_DAT(platform, REDUMP_DAT_list)
+        elif platform.DAT == platforms.DAT_REDUMP:
+            fname = audit.get_DAT_for_platform(DAT_index, platform)
             if fname:
                 DAT_str = utils.FileName(fname).getBase()
                 DAT_str = text_limit_string(DAT_str, DAT_STRING_LIMIT_CHARS)
@@ -7740,56 +7691,67 @@ def exec_utils_ArcadeDB_check(cfg):
         sl.append('\nNo games returned. ArcadeDB scraper not working correctly.')
     kodi.display_text_window_mono(window_title, '\n'.join(sl))
 
-def exec_global_rom_stats(self):
-    log.debug('_command_exec_global_rom_stats() BEGIN')
+# Returns a list of tuples (category_name, launcher, stats) of the ROM launchers, sorted by
+# category and launcher name. Launchers with no category go last. Statistics are taken from
+# the launcher index and the index is saved if stale statistics had to be rebuilt.
+def get_global_report_launchers(cfg):
+    cat_name_dic = { cat_id : cfg.categories[cat_id]['m_name'] for cat_id in cfg.categories }
+    launcher_list = []
+    for launcher_id in cfg.launchers:
+        launcher = cfg.launchers[launcher_id]
+        # Skip Standalone Launchers
+        if not launcher['rompath']: continue
+        if launcher['categoryID'] in cat_name_dic:
+            sort_key = (0, cat_name_dic[launcher['categoryID']], launcher['m_name'])
+        else:
+            sort_key = (1, '', launcher['m_name'])
+        launcher_list.append((sort_key, launcher))
+    launcher_list.sort(key = lambda x : x[0])
+    num_rebuilt = 0
+    report_list = []
+    for sort_key, launcher in launcher_list:
+        stats, rebuilt = db.get_launcher_stats(cfg.ROMS_DIR, launcher)
+        if rebuilt: num_rebuilt += 1
+        report_list.append((sort_key[1], launcher, stats))
+    log.debug('get_global_report_launchers() {} launchers, {} statistics rebuilt'.format(
+        len(report_list), num_rebuilt))
+    if num_rebuilt: db.write_launchers_XML(cfg, cfg.update_timestamp)
+
+    return report_list
+
+def exec_global_rom_stats(cfg):
+    log.debug('exec_global_rom_stats() BEGIN')
     window_title = 'Global ROM statistics'
-    sl = []
-    # sl.append('[COLOR violet]Launcher ROM report.[/COLOR]')
-    # sl.append('')
+    meta_field_list = [field for field, name in db.LAUNCHER_STATS_META_LIST]
+    asset_field_list = [field for field, name in db.LAUNCHER_STATS_ASSET_LIST]
+    def have_pcent(stats, field_list):
+        if not stats['num_roms']: return '-'
+        num_have = sum(stats['num_roms'] - stats['missing'][field] for field in field_list)
+        return '{:.1f}'.format(100.0 * num_have / (stats['num_roms'] * len(field_list)))
 
     # --- Table header ---
     table_str = [
-        ['left', 'left', 'left'],
-        ['Category', 'Launcher', 'ROMs'],
+        ['left', 'left', 'right', 'right', 'right', 'right', 'right'],
+        ['Category', 'Launcher', 'ROMs', 'Metadata %', 'Assets %', 'Boxfront %', 'Snap %'],
     ]
-
-    # Traverse categories and sort alphabetically.
-    log.debug('Number of categories {}'.format(len(self.categories)))
-    log.debug('Number of launchers {}'.format(len(self.launchers)))
-    for cat_id in sorted(self.categories, key = lambda x : self.categories[x]['m_name']):
-        # Get launchers of this category alphabetically sorted.
-        launcher_list = []
-        for launcher_id in sorted(self.launchers, key = lambda x : self.launchers[x]['m_name']):
-            launcher = self.launchers[launcher_id]
-            # Skip Standalone Launchers
-            if not launcher['rompath']: continue
-            if launcher['categoryID'] == cat_id: launcher_list.append(launcher)
-        # Render list of launchers for this category.
-        cat_name = self.categories[cat_id]['m_name']
-        for launcher in launcher_list:
-            table_str.append([cat_name, launcher['m_name'], text_type(launcher['num_roms'])])
-    # Traverse launchers with no category.
-    catless_launchers = {}
-    for launcher_id in self.launchers:
-        launcher = self.launchers[launcher_id]
-        if launcher['categoryID'] == CATEGORY_ADDONROOT_ID:
-            catless_launchers[launcher_id] = launcher
-    for launcher_id in sorted(catless_launchers, key = lambda x : catless_launchers[x]['m_name']):
-        launcher = self.launchers[launcher_id]
-        # Skip Standalone Launchers
-        if not launcher['rompath']: continue
-        table_str.append(['', launcher['m_name'], text_type(launcher['num_roms'])])
+    total_roms = 0
+    for cat_name, launcher, stats in get_global_report_launchers(cfg):
+        total_roms += stats['num_roms']
+        table_str.append([
+            cat_name, launcher['m_name'], const.text_type(stats['num_roms']),
+            have_pcent(stats, meta_field_list), have_pcent(stats, asset_field_list),
+            have_pcent(stats, ['s_boxfront']), have_pcent(stats, ['s_snap']),
+        ])
+    table_str.append(['', 'Total', const.text_type(total_roms), '', '', '', ''])
 
     # Generate table and print report
-    # log.debug(text_type(table_str))
-    sl.extend(text_render_table(table_str))
-    kodi_display_text_window_mono(window_title, '\n'.join(sl))
+    sl = misc.render_table(table_str)
+    kodi.display_text_window_mono(window_title, '\n'.join(sl))
 
 # TODO Add a table columnd to tell user if the DAT is automatic or custom.
 def exec_global_audit_stats(cfg, report_type):
     log.debug('exec_global_audit_stats() Report type {}'.format(report_type))
     window_title = 'Global ROM Audit statistics'
-    sl = []
 
     # --- Table header ---
     # Table cell padding: left, right
@@ -7797,59 +7759,24 @@ def exec_global_audit_stats(cfg, report_type):
         ['left', 'left', 'left', 'left', 'left', 'left', 'left', 'left'],
         ['Category', 'Launcher', 'Platform', 'Type', 'ROMs', 'Have', 'Miss', 'Unknown'],
     ]
-
-    # Traverse categories and sort alphabetically.
-    log.debug('Number of categories {}'.format(len(self.categories)))
-    log.debug('Number of launchers {}'.format(len(self.launchers)))
-    for cat_id in sorted(self.categories, key = lambda x : self.categories[x]['m_name']):
-        # Get launchers of this category alphabetically sorted.
-        launcher_list = []
-        for launcher_id in sorted(self.launchers, key = lambda x : self.launchers[x]['m_name']):
-            launcher = self.launchers[launcher_id]
-            # Skip Standalone Launchers and Launcher with no ROM Audit.
-            if not launcher['rompath']: continue
-            if launcher['audit_state'] == AUDIT_STATE_OFF: continue
-            if launcher['categoryID'] == cat_id: launcher_list.append(launcher)
-        # Render list of launchers for this category.
-        cat_name = self.categories[cat_id]['m_name']
-        for launcher in launcher_list:
-            p_index = get_AEL_platform_index(launcher['platform'])
-            p_obj = AEL_platforms[p_index]
-            # Skip launchers depending on user settings.
-            if report_type == AUDIT_REPORT_NOINTRO and p_obj.DAT != DAT_NOINTRO: continue
-            if report_type == AUDIT_REPORT_REDUMP and p_obj.DAT != DAT_REDUMP: continue
-            table_str.append([
-                cat_name, launcher['m_name'], p_obj.compact_name, p_obj.DAT,
-                text_type(launcher['num_roms']), text_type(launcher['num_have']),
-                text_type(launcher['num_miss']), text_type(launcher['num_unknown']),
-            ])
-    # Traverse launchers with no category.
-    catless_launchers = {}
-    for launcher_id in self.launchers:
-        launcher = self.launchers[launcher_id]
-        if launcher['categoryID'] == CATEGORY_ADDONROOT_ID:
-            catless_launchers[launcher_id] = launcher
-    for launcher_id in sorted(catless_launchers, key = lambda x : catless_launchers[x]['m_name']):
-        launcher = self.launchers[launcher_id]
-        # Skip Standalone Launchers
-        if not launcher['rompath']: continue
-
-        p_index = get_AEL_platform_index(launcher['platform'])
-        p_obj = AEL_platforms[p_index]
+    for cat_name, launcher, stats in get_global_report_launchers(cfg):
+        # Skip Launchers with no ROM Audit.
+        if launcher['audit_state'] == const.AUDIT_STATE_OFF: continue
+        p_obj = platforms.AEL_platforms[platforms.get_AEL_platform_index(launcher['platform'])]
         # Skip launchers depending on user settings.
-        if report_type == AUDIT_REPORT_NOINTRO and p_obj.DAT != DAT_NOINTRO: continue
-        if report_type == AUDIT_REPORT_REDUMP and p_obj.DAT != DAT_REDUMP: continue
+        if report_type == const.AUDIT_REPORT_NOINTRO and p_obj.DAT != platforms.DAT_NOINTRO: continue
+        if report_type == const.AUDIT_REPORT_REDUMP and p_obj.DAT != platforms.DAT_REDUMP: continue
         table_str.append([
-            ' ', launcher['m_name'], p_obj.compact_name, text_type(p_obj.DAT),
-            text_type(launcher['num_roms']), text_type(launcher['num_have']),
-            text_type(launcher['num_miss']), text_type(launcher['num_unknown']),
+            cat_name, launcher['m_name'], p_obj.compact_name, const.text_type(p_obj.DAT),
+            const.text_type(stats['num_roms']),
+            const.text_type(stats['audit'][const.AUDIT_STATUS_HAVE]),
+            const.text_type(stats['audit'][const.AUDIT_STATUS_MISS]),
+            const.text_type(stats['audit'][const.AUDIT_STATUS_UNKNOWN]),
         ])
 
     # Generate table and print report
-    # log.debug(text_type(table_str))
-    log.debug(text_type(table_str))
-    sl.extend(text_render_table(table_str))
-    kodi_display_text_window_mono(window_title, '\n'.join(sl))
+    sl = misc.render_table(table_str)
+    kodi.display_text_window_mono(window_title, '\n'.join(sl))
 
 # ------------------------------------------------------------------------------------------------
 # Executors
@@ -7920,7 +7847,7 @@ def command_run_rom(self, categoryID, launcherID, romID):
     # --- ROM in Favourites ---
     if categoryID == VCATEGORY_FAVOURITES_ID and launcherID == VLAUNCHER_FAVOURITES_ID:
         log.info('_command_run_rom() Launching ROM in Favourites...')
-        roms = fs_load_Favourites_JSON(g_PATHS.FAV_JSON_FILE_PATH)
+        roms = db.load_Favourite_ROMs(g_PATHS)
         rom = roms[romID]
         recent_rom = rom
         minimize_flag     = rom['toggle_window']
@@ -7929,41 +7856,25 @@ def command_run_rom(self, categoryID, launcherID, romID):
         standard_app      = rom['application']
         standard_args     = rom['args']
         args_extra        = rom['args_extra'] if 'args_extra' in rom else list()
-    # --- ROM in Recently played ROMs list ---
-    elif categoryID == VCATEGORY_MOST_PLAYED_ID and launcherID == VLAUNCHER_MOST_PLAYED_ID:
-        log.info('_command_run_rom() Launching ROM in Recently Played ROMs ...')
-        recent_roms_list = fs_load_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH)
-        current_ROM_position = fs_collection_ROM_index_by_romID(romID, recent_roms_list)
-        if current_ROM_position < 0:
-            kodi.dialog_OK('Collection ROM not found in list. This is a bug!')
+    # --- ROM in Recently played or Most played ROMs ---
+    # Play statistics only store a reference to where the ROM was launched from.
+    # Launch the ROM from there so the statistics are updated with the same reference.
+    elif launcherID == const.VLAUNCHER_RECENT_ID or launcherID == const.VLAUNCHER_MOST_PLAYED_ID:
+        log.info('_command_run_rom() Launching ROM in Recently/Most played ROMs ...')
+        stats = db.load_play_stats(g_PATHS)
+        if romID not in stats['roms']:
+            kodi.dialog_OK('ROM not found in play statistics. This is a bug!')
             return
-        rom = recent_roms_list[current_ROM_position]
-        recent_rom = rom
-        minimize_flag     = rom['toggle_window']
-        non_blocking_flag = rom['non_blocking']
-        romext            = rom['romext']
-        standard_app      = rom['application']
-        standard_args     = rom['args']
-        args_extra        = rom['args_extra'] if 'args_extra' in rom else list()
-    # --- ROM in Most played ROMs ---
-    elif categoryID == VCATEGORY_RECENT_ID and launcherID == VLAUNCHER_RECENT_ID:
-        log.info('_command_run_rom() Launching ROM in Most played ROMs ...')
-        most_played_roms = fs_load_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH)
-        rom = most_played_roms[romID]
-        recent_rom = rom
-        minimize_flag     = rom['toggle_window']
-        non_blocking_flag = rom['non_blocking']
-        romext            = rom['romext']
-        standard_app      = rom['application']
-        standard_args     = rom['args']
-        args_extra        = rom['args_extra'] if 'args_extra' in rom else list()
+        entry = stats['roms'][romID]
+        self.command_run_rom(entry['categoryID'], entry['launcherID'], romID)
+        return
     # --- ROM in Collection ---
     elif categoryID == VCATEGORY_COLLECTIONS_ID:
         log.info('_command_run_rom() Launching ROM in Collection ...')
         COL = fs_load_Collection_index_XML(g_PATHS.COLLECTIONS_FILE_PATH)
         collection = COL['collections'][launcherID]
         roms_json_file = g_PATHS.COLLECTIONS_DIR.pjoin(collection['roms_base_noext'] + '.json')
-        collection_rom_list = fs_load_Collection_ROMs_JSON(roms_json_file)
+        collection_rom_list = db.load_Collection_ROMs(g_PATHS, roms_json_file)
         current_ROM_position = fs_collection_ROM_index_by_romID(romID, collection_rom_list)
         if current_ROM_position < 0:
             kodi.dialog_OK('Collection ROM not found in list. This is a bug!')
@@ -8123,28 +8034,13 @@ def command_run_rom(self, categoryID, launcherID, romID):
     arguments = arguments.replace('%ROM%', ROMFileName.getPath())
     log.info('_command_run_rom() final arguments "{}"'.format(arguments))
 
-    # --- Compute ROM recently played list ---
-    MAX_RECENT_PLAYED_ROMS = 100
-    recent_roms_list = fs_load_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH)
-    recent_roms_list = [rom for rom in recent_roms_list if rom['id'] != recent_rom['id']]
-    recent_roms_list.insert(0, recent_rom)
-    if len(recent_roms_list) > MAX_RECENT_PLAYED_ROMS:
-        log.debug('_command_run_rom() len(recent_roms_list) = {}'.format(len(recent_roms_list)))
-        log.debug('_command_run_rom() Trimming list to {} ROMs'.format(MAX_RECENT_PLAYED_ROMS))
-        temp_list = recent_roms_list[:MAX_RECENT_PLAYED_ROMS]
-        recent_roms_list = temp_list
-    fs_write_Collection_ROMs_JSON(g_PATHS.RECENT_PLAYED_FILE_PATH, recent_roms_list)
-
-    # --- Compute most played ROM statistics ---
-    most_played_roms = fs_load_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH)
-    if recent_rom['id'] in most_played_roms:
-        rom_id = recent_rom['id']
-        most_played_roms[rom_id]['launch_count'] += 1
+    # --- Update play statistics ---
+    # Only appends the ROM reference to the launch log. ROMs in Browse By virtual launchers
+    # are recorded with their parent launcher.
+    if categoryID in const.VCATEGORY_BROWSE_BY_ID_LIST:
+        db.record_ROM_launch(g_PATHS, '', recent_rom['launcherID'], romID, recent_rom)
     else:
-        # Add field launch_count to recent_rom to count how many times have been launched.
-        recent_rom['launch_count'] = 1
-        most_played_roms[recent_rom['id']] = recent_rom
-    fs_write_Favourites_JSON(g_PATHS.MOST_PLAYED_FILE_PATH, most_played_roms)
+        db.record_ROM_launch(g_PATHS, categoryID, launcherID, romID, recent_rom)
 
     # --- Execute Kodi Retroplayer if launcher configured to do so ---
     # See https://github.com/Wintermute0110/plugin.program.advanced.emulator.launcher/issues/33
@@ -8177,7 +8073,9 @@ def command_run_rom(self, categoryID, launcherID, romID):
     else:
         log.info('_command_run_rom() Launcher is not Kodi Retroplayer.')
         self._run_before_execution(romtitle, minimize_flag)
+        launch_time = time.time()
         self._run_process(application.getPath(), arguments, apppath, romext, non_blocking_flag)
+        if not non_blocking_flag: db.record_ROM_playtime(g_PATHS, romID, time.time() - launch_time)
         self._run_after_execution(minimize_flag)
 
 # Launches a ROM launcher or standalone launcher
@@ -8537,6 +8435,20 @@ def command_rom_scanner(self, launcherID):
     report_slist.append('{} ROMs currently in database'.format(num_roms))
     log.info('Launcher ROM database contain {} items'.format(num_roms))
 
+    # --- Resume an interrupted scan ---
+    # The journal has the dead ROMs removed, the new ROMs and the ROMs with pending assets.
+    journal = db.ScannerJournal(g_PATHS.SCANNER_JOURNAL_DIR, launcher)
+    pending_assets_list = []
+    if journal.load():
+        if kodi.dialog_yesno('A previous scan of this launcher was interrupted after adding '
+            '{} new ROMs. Resume from the last checkpoint?'.format(journal.get_num_new_ROMs())):
+            pending_assets_list = journal.apply(roms)
+            num_roms = len(roms)
+            report_slist.append('Resuming interrupted scan. {} ROMs after applying the journal'.format(num_roms))
+            log.info('Resuming interrupted scan. {} ROMs after applying the journal'.format(num_roms))
+        else:
+            journal.reset()
+
     # --- Progress dialog ---
     pdialog_verbose = True
     pdialog = KodiProgressDialog()
@@ -8573,33 +8485,27 @@ def command_rom_scanner(self, launcherID):
             'Asset scanner will be disabled for this/those.')
 
     # --- Create a cache of assets ---
-    # utils_file_cache_add_dir() creates a set with all files in a given directory.
-    # That set is stored in a function internal cache associated with the path.
-    # Files in the cache can be searched with utils_file_cache_search()
+    # utils.file_cache_add_dir() creates an index with all files in a given directory.
+    # The index is stored in a module internal cache associated with the path, and on disk
+    # so unchanged directories are not listed again.
+    # Files in the cache can be searched with utils.file_cache_search()
     log.info('Scanning and caching files in asset directories...')
     pdialog.startProgress('Scanning files in asset directories...', len(ROM_ASSET_ID_LIST))
     for i, asset_kind in enumerate(ROM_ASSET_ID_LIST):
         pdialog.updateProgress(i)
         AInfo = assets_get_info_scheme(asset_kind)
-        utils_file_cache_add_dir(launcher[AInfo.path_key])
+        utils.file_cache_add_dir(launcher[AInfo.path_key])
     pdialog.endProgress()
 
     # --- Remove dead ROM entries ------------------------------------------------------------
     log.info('Removing dead ROMs...'.format())
     report_slist.append('Removing dead ROMs...')
     num_removed_roms = 0
-    if num_roms > 0:
+    if journal.get_stage() != db.SCANNER_STAGE_DEAD_ROMS:
+        log.info('Dead ROMs already removed by the interrupted scan.')
+    elif num_roms > 0:
         pdialog.startProgress('Checking for dead ROMs...', num_roms)
-        i = 0
-        for key in sorted(roms, key = lambda x : roms[x]['m_name']):
-            pdialog.updateProgress(i)
-            i += 1
-            log.debug('Searching {}'.format(roms[key]['filename']))
-            fileName = utils.FileName(roms[key]['filename'])
-            if not fileName.exists():
-                log.debug('Deleting from DB {}'.format(roms[key]['filename']))
-                del roms[key]
-                num_removed_roms += 1
+        num_removed_roms = journal.remove_dead_ROMs(roms, pdialog)
         pdialog.endProgress()
         if num_removed_roms > 0:
             kodi_notify('{} dead ROMs removed successfully'.format(num_removed_roms))
@@ -8608,6 +8514,7 @@ def command_rom_scanner(self, launcherID):
             log.info('No dead ROMs found')
     else:
         log.info('Launcher is empty. No dead ROM check.')
+    if journal.get_stage() == db.SCANNER_STAGE_DEAD_ROMS: journal.set_stage(db.SCANNER_STAGE_ROMS)
 
     # --- Scan all files in ROM path (mask *.*) and put them in a list -----------------------
     pdialog.startProgress('Scanning and caching files in ROM path ...')
@@ -8651,6 +8558,35 @@ def command_rom_scanner(self, launcherID):
     for f_path in sorted(files): file_list.append((f_path, False))
     for f_path in sorted(extra_files): file_list.append((f_path, True))
 
+    # --- Warm scraper caches for the platform -----------------------------------------------
+    # Scrapers fetch in bulk everything they can (for example, ArcadeDB resolves many ROMs
+    # with one request) and fill their disk caches, so the per-ROM scraper calls in the
+    # loop below are cache hits.
+    rom_ext_list = ['.' + ext for ext in launcher_exts.split('|')]
+    rom_filename_set = set(roms[rom_id]['filename'] for rom_id in roms)
+    prefetch_FN_list = []
+    for f_path, extra_ROM_flag in file_list:
+        if f_path in rom_filename_set: continue
+        ROM = utils.FileName(f_path)
+        if ROM.getExt() in rom_ext_list: prefetch_FN_list.append(ROM)
+    num_saved = g_scraper_factory.warm_cache_for_platform(prefetch_FN_list, pdialog)
+    log.info('Scraper cache warming saved {} per-ROM requests'.format(num_saved))
+    report_slist.append('Scraper cache warming saved {} per-ROM requests'.format(num_saved))
+
+    # --- Scrape assets of the ROMs added by the interrupted scan ---------------------------
+    if pending_assets_list:
+        log.info('Scraping assets of {} ROMs of the interrupted scan'.format(len(pending_assets_list)))
+        report_slist.append('Scraping assets of {} ROMs of the interrupted scan'.format(len(pending_assets_list)))
+        pdialog.startProgress('Scraping assets of interrupted scan...', len(pending_assets_list))
+        if not journal.scrape_pending_assets(roms, pending_assets_list, scraper_strategy, pdialog):
+            pdialog.endProgress()
+            kodi.dialog_OK('Stopping ROM scanning. The ROM database has not been changed. '
+                'Progress has been saved and the next scan can resume it.')
+            log.info('User pressed Cancel button when scraping assets. ROM scanning stopped.')
+            g_scraper_factory.destroy_scanner(pdialog)
+            return
+        pdialog.endProgress()
+
     # --- Now go processing file by file -----------------------------------------------------
     pdialog.startProgress('Processing ROMs...', len(file_list))
     log.info('============================== Processing ROMs ===============================')
@@ -8733,7 +8669,9 @@ def command_rom_scanner(self, launcherID):
             # If set already in ROMs, just add this disk into the set disks field.
             else:
                 log.debug('Adding additional disk "{}" to set'.format(MDSet.discName))
-                roms[MultiDisc_rom_id]['disks'].append(MDSet.discName)
+                # The disk may be already in the set if the scan was resumed.
+                if MDSet.discName not in roms[MultiDisc_rom_id]['disks']:
+                    roms[MultiDisc_rom_id]['disks'].append(MDSet.discName)
                 # Reorder disks like Disk 1, Disk 2, ...
 
                 # Process next file
@@ -8775,12 +8713,7 @@ def command_rom_scanner(self, launcherID):
         romdata['filename'] = ROM.getOriginalPath()
         romdata['i_extra_ROM'] = extra_ROM_flag
         ROM_checksums = ROM_original if MDSet.isMultiDisc and launcher_multidisc else ROM
-        scraper_strategy.scanner_process_ROM_begin(romdata, ROM, ROM_checksums)
-        scraper_strategy.scanner_process_ROM_metadata(romdata, ROM)
-        scraper_strategy.scanner_process_ROM_assets(romdata, ROM)
-
-        # --- Add ROM to database ------------------------------------------------------------
-        roms[romdata['id']] = romdata
+        journal.scrape_new_ROM(roms, romdata, ROM, ROM_checksums, scraper_strategy)
         num_new_roms += 1
 
         # --- This was the first ROM in a multidisc set ---
@@ -8789,13 +8722,15 @@ def command_rom_scanner(self, launcherID):
             roms[romdata['id']]['disks'].append(MDSet.discName)
 
         # --- Check if user pressed the cancel button ---
-        if pdialog.isCanceled():
+        if journal.checkpoint_is_canceled(pdialog):
             pdialog.endProgress()
-            kodi.dialog_OK('Stopping ROM scanning. No changes have been made.')
+            kodi.dialog_OK('Stopping ROM scanning. The ROM database has not been changed. '
+                'Progress has been saved and the next scan can resume it.')
             log.info('User pressed Cancel button when scanning ROMs. ROM scanning stopped.')
             # Flush scraper disk caches.
             g_scraper_factory.destroy_scanner(pdialog)
             # Flush report
+            report_head_sl = []
             report_head_sl.append('WARNING ROM Scanner interrupted (cancel button pressed).')
             report_head_sl.append('')
             r_all_sl = []
@@ -8805,6 +8740,7 @@ def command_rom_scanner(self, launcherID):
             return
         report_slist.append('')
     pdialog.endProgress()
+    journal.set_stage(db.SCANNER_STAGE_SAVE)
     # Flush scraper disk caches.
     g_scraper_factory.destroy_scanner(pdialog)
 
@@ -8829,6 +8765,7 @@ def command_rom_scanner(self, launcherID):
         r_all_sl.extend(report_head_sl)
         r_all_sl.extend(report_slist)
         utils_write_slist_to_file(launcher_report_FN.getPath(), r_all_sl)
+        journal.delete()
         kodi.dialog_OK('The scanner found no ROMs! Make sure launcher directory and file '
             'extensions are correct.')
         return
@@ -8852,6 +8789,8 @@ def command_rom_scanner(self, launcherID):
                 report_head_sl.append('Total ROMs   {:6d}'.format(self.audit_total))
                 report_head_sl.append('Parent ROMs  {:6d}'.format(self.audit_parents))
                 report_head_sl.append('Clone ROMs   {:6d}'.format(self.audit_clones))
+                for step_name, step_time in self.audit_timing:
+                    report_head_sl.append('{:<30} {:8.3f} s'.format(step_name, step_time))
             else:
                 kodi_notify_warn('Error auditing ROMs')
         else:
@@ -8882,340 +8821,98 @@ def command_rom_scanner(self, launcherID):
     fs_write_catfile(g_PATHS.CATEGORIES_FILE_PATH, self.categories, self.launchers)
     pdialog.updateProgress(25)
     fs_write_ROMs_JSON(g_PATHS.ROMS_DIR, launcher, roms)
+    journal.delete()
     pdialog.endProgress()
     kodi_refresh_container()
 
-# Check if Launcher reports must be created/regenerated.
-def roms_regenerate_launcher_reports(self, categoryID, launcherID, roms):
-    # --- Get report filename ---
-    if categoryID in self.categories: category_name = self.categories[categoryID]['m_name']
-    else:                             category_name = CATEGORY_ADDONROOT_ID
-    roms_base_noext  = fs_get_ROMs_basename(category_name, self.launchers[launcherID]['m_name'], launcherID)
-    report_stats_FN  = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_stats.txt')
-    log.debug('_command_view_menu() Stats  OP "{}"'.format(report_stats_FN.getOriginalPath()))
-
-    # --- If report doesn't exists create it automatically ---
-    log.debug('_command_view_Launcher_Report() Testing report file "{}"'.format(report_stats_FN.getPath()))
-    if not report_stats_FN.exists():
-        kodi.dialog_OK('Report file not found. Will be generated now.')
-        self._roms_create_launcher_reports(categoryID, launcherID, roms)
-        self.launchers[launcherID]['timestamp_report'] = time.time()
-        # DO NOT update the timestamp of categories/launchers or report will always be obsolete!!!
-        # Keep same timestamp as before.
-        fs_write_catfile(g_PATHS.CATEGORIES_FILE_PATH, self.categories, self.launchers, self.update_timestamp)
-
-    # --- If report timestamp is older than launchers last modification, recreate it ---
-    if self.launchers[launcherID]['timestamp_report'] <= self.launchers[launcherID]['timestamp_launcher']:
-        kodi.dialog_OK('Report is outdated. Will be regenerated now.')
-        self._roms_create_launcher_reports(categoryID, launcherID, roms)
-        self.launchers[launcherID]['timestamp_report'] = time.time()
-        fs_write_catfile(g_PATHS.CATEGORIES_FILE_PATH, self.categories, self.launchers, self.update_timestamp)
-
 # ------------------------------------------------------------------------------------------------
 # ROM Management and ROM Scanner
 # ------------------------------------------------------------------------------------------------
-# Creates a Launcher report having:
-#  1) Launcher statistics
-#  2) Report of ROM metadata
-#  3) Report of ROM artwork
-#  4) If No-Intro file, then No-Intro audit information.
-def roms_create_launcher_reports(self, categoryID, launcherID, roms):
-    ROM_NAME_LENGHT = 50
-
-    # Report file name.
-    if categoryID in self.categories: category_name = self.categories[categoryID]['m_name']
-    else:                             category_name = CATEGORY_ADDONROOT_ID
-    launcher = self.launchers[launcherID]
-    roms_base_noext  = fs_get_ROMs_basename(category_name, launcher['m_name'], launcherID)
-    report_stats_FN  = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_stats.txt')
-    report_meta_FN   = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_metadata.txt')
-    report_assets_FN = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '_assets.txt')
-    log.debug('_roms_create_launcher_reports() Stats  OP "{}"'.format(report_stats_FN.getOriginalPath()))
-    log.debug('_roms_create_launcher_reports() Meta   OP "{}"'.format(report_meta_FN.getOriginalPath()))
-    log.debug('_roms_create_launcher_reports() Assets OP "{}"'.format(report_assets_FN.getOriginalPath()))
-    roms_base_noext = fs_get_ROMs_basename(category_name, launcher['m_name'], launcherID)
-    report_file_name = g_PATHS.REPORTS_DIR.pjoin(roms_base_noext + '.txt')
-    log.debug('_roms_create_launcher_reports() Report filename "{}"'.format(report_file_name.getOriginalPath()))
-
-    # >> Step 1: Build report data
-    num_roms = len(roms)
-    missing_m_year      = missing_m_genre    = missing_m_developer = missing_m_nplayers  = 0
-    missing_m_esrb      = missing_m_rating   = missing_m_plot      = 0
-    missing_s_title     = missing_s_snap     = missing_s_fanart    = missing_s_banner    = 0
-    missing_s_clearlogo = missing_s_boxfront = missing_s_boxback   = missing_s_cartridge = 0
-    missing_s_flyer     = missing_s_map      = missing_s_manual    = missing_s_trailer   = 0
-    audit_none = audit_have = audit_miss = audit_unknown = 0
-    audit_num_parents = audit_num_clones = 0
-    check_list = []
-    path_title_P = utils.FileName(launcher['path_title']).getPath()
-    path_snap_P = utils.FileName(launcher['path_snap']).getPath()
-    path_boxfront_P = utils.FileName(launcher['path_boxfront']).getPath()
-    path_boxback_P = utils.FileName(launcher['path_boxback']).getPath()
-    path_cartridge_P = utils.FileName(launcher['path_cartridge']).getPath()
+# Launcher reports:
+#  1) Launcher statistics, rendered from the counters stored in the launcher index.
+#  2) Report of ROM metadata and No-Intro/Redump audit information.
+#  3) Report of ROM artwork.
+LAUNCHER_REPORT_ROM_NAME_LENGHT = 50
+
+def render_launcher_stats_report(stats):
+    num_roms = stats['num_roms']
+    sl = []
+    sl.append('[COLOR orange]<No-Intro Audit Statistics>[/COLOR]')
+    sl.append('Number of ROMs   {:5d}'.format(num_roms))
+    sl.append('Not checked ROMs {:5d}'.format(stats['audit'][const.AUDIT_STATUS_NONE]))
+    sl.append('Have ROMs        {:5d}'.format(stats['audit'][const.AUDIT_STATUS_HAVE]))
+    sl.append('Missing ROMs     {:5d}'.format(stats['audit'][const.AUDIT_STATUS_MISS]))
+    sl.append('Unknown ROMs     {:5d}'.format(stats['audit'][const.AUDIT_STATUS_UNKNOWN]))
+    sl.append('Parent           {:5d}'.format(stats['pclone'][const.PCLONE_STATUS_PARENT]))
+    sl.append('Clones           {:5d}'.format(stats['pclone'][const.PCLONE_STATUS_CLONE]))
+    for title, field_list in [('<Metadata statistics>', db.LAUNCHER_STATS_META_LIST),
+                              ('<Asset statistics>', db.LAUNCHER_STATS_ASSET_LIST)]:
+        sl.append('')
+        sl.append('[COLOR orange]{}[/COLOR]'.format(title))
+        for field, name in field_list:
+            num_miss = stats['missing'][field]
+            num_have = num_roms - num_miss
+            sl.append('{:<9} {:5d} have / {:5d} miss  ({:5.1f}%, {:5.1f}%)'.format(name,
+                num_have, num_miss, 100.0 * num_have / num_roms, 100.0 * num_miss / num_roms))
+
+    return sl
+
+def render_launcher_metadata_report(roms):
+    def yes_no(flag): return 'YES' if flag else '---'
+    sl = []
+    sl.append('{} Year Genre Developer Rating Plot Audit    PClone'.format(
+        'Name'.ljust(LAUNCHER_REPORT_ROM_NAME_LENGHT)))
+    sl.append('-' * 99)
     for rom_id in sorted(roms, key = lambda x : roms[x]['m_name']):
         rom = roms[rom_id]
-        rom_info = {}
-        rom_info['m_name'] = rom['m_name']
-        rom_info['m_nointro_status'] = rom['nointro_status']
-        rom_info['m_pclone_status'] = rom['pclone_status']
-        # --- Metadata ---
-        if rom['m_year']:                 rom_info['m_year']      = 'YES'
-        else:                             rom_info['m_year']      = '---'; missing_m_year += 1
-        if rom['m_genre']:                rom_info['m_genre']     = 'YES'
-        else:                             rom_info['m_genre']     = '---'; missing_m_genre += 1
-        if rom['m_developer']:            rom_info['m_developer'] = 'YES'
-        else:                             rom_info['m_developer'] = '---'; missing_m_developer += 1
-        if rom['m_nplayers']:             rom_info['m_nplayers']  = 'YES'
-        else:                             rom_info['m_nplayers']  = '---'; missing_m_nplayers += 1
-        if rom['m_esrb'] == ESRB_PENDING: rom_info['m_esrb']      = '---'; missing_m_esrb += 1
-        else:                             rom_info['m_studio']    = 'YES'
-        if rom['m_rating']:               rom_info['m_rating']    = 'YES'
-        else:                             rom_info['m_rating']    = '---'; missing_m_rating += 1
-        if rom['m_plot']:                 rom_info['m_plot']      = 'YES'
-        else:                             rom_info['m_plot']      = '---'; missing_m_plot += 1
-        # --- Assets ---
-        # >> Y means the asset exists and has the Base_noext of the ROM.
-        # >> S means the asset exists and is a PClone group substitution.
-        # >> C means the asset exists and is a user customised asset.
-        # >> X means the asset exists, getDir() is same but Base_noext() is different
-        # path_* and art getDir() different ==> Custom asset (user customised it) C
-        # path_* and art getDir() equal and Base_noext() equal ==> Own artwork Y
-        # path_* and art getDir() equal and Base_noext() different ==> Maybe S or maybe C => O
-        # To differentiate between S and C a test in the PClone group must be done.
-        #
-        romfile_FN = utils.FileName(rom['filename'])
-        romfile_getBase_noext = romfile_FN.getBaseNoExt()
-        if rom['s_title']:
-            rom_info['s_title'] = self._aux_get_info(utils.FileName(rom['s_title']), path_title_P, romfile_getBase_noext)
-        else:
-            rom_info['s_title'] = '-'
-            missing_s_title += 1
-        if rom['s_snap']:
-            rom_info['s_snap'] = self._aux_get_info(utils.FileName(rom['s_snap']), path_snap_P, romfile_getBase_noext)
-        else:
-            rom_info['s_snap'] = '-'
-            missing_s_snap += 1
-        if rom['s_boxfront']:
-            rom_info['s_boxfront'] = self._aux_get_info(utils.FileName(rom['s_boxfront']), path_boxfront_P, romfile_getBase_noext)
-        else:
-            rom_info['s_boxfront'] = '-'
-            missing_s_boxfront += 1
-        if rom['s_boxback']:
-            rom_info['s_boxback'] = self._aux_get_info(utils.FileName(rom['s_boxback']), path_boxback_P, romfile_getBase_noext)
-        else:
-            rom_info['s_boxback'] = '-'
-            missing_s_boxback += 1
-        if rom['s_cartridge']:
-            rom_info['s_cartridge'] = self._aux_get_info(utils.FileName(rom['s_cartridge']), path_cartridge_P, romfile_getBase_noext)
-        else:
-            rom_info['s_cartridge'] = '-'
-            missing_s_cartridge += 1
-        if rom['s_fanart']:    rom_info['s_fanart']    = 'Y'
-        else:                  rom_info['s_fanart']    = '-'; missing_s_fanart += 1
-        if rom['s_banner']:    rom_info['s_banner']    = 'Y'
-        else:                  rom_info['s_banner']    = '-'; missing_s_banner += 1
-        if rom['s_clearlogo']: rom_info['s_clearlogo'] = 'Y'
-        else:                  rom_info['s_clearlogo'] = '-'; missing_s_clearlogo += 1
-        if rom['s_flyer']:     rom_info['s_flyer']     = 'Y'
-        else:                  rom_info['s_flyer']     = '-'; missing_s_flyer += 1
-        if rom['s_map']:       rom_info['s_map']       = 'Y'
-        else:                  rom_info['s_map']       = '-'; missing_s_map += 1
-        if rom['s_manual']:    rom_info['s_manual']    = 'Y'
-        else:                  rom_info['s_manual']    = '-'; missing_s_manual += 1
-        if rom['s_trailer']:   rom_info['s_trailer']   = 'Y'
-        else:                  rom_info['s_trailer']   = '-'; missing_s_trailer += 1
-        # --- ROM audit ---
-        if   rom['nointro_status'] == AUDIT_STATUS_NONE:    audit_none += 1
-        elif rom['nointro_status'] == AUDIT_STATUS_HAVE:    audit_have += 1
-        elif rom['nointro_status'] == AUDIT_STATUS_MISS:    audit_miss += 1
-        elif rom['nointro_status'] == AUDIT_STATUS_UNKNOWN: audit_unknown += 1
-        else:
-            log.error('Unknown audit status {}.'.format(rom['nointro_status']))
-            kodi.dialog_OK('Unknown audit status {}. This is a bug, please report it.'.format(rom['nointro_status']))
-            return
-        if   rom['pclone_status'] == PCLONE_STATUS_PARENT: audit_num_parents += 1
-        elif rom['pclone_status'] == PCLONE_STATUS_CLONE:  audit_num_clones += 1
-        elif rom['pclone_status'] == PCLONE_STATUS_NONE:   pass
-        else:
-            log.error('Unknown pclone status {}.'.format(rom['pclone_status']))
-            kodi.dialog_OK('Unknown pclone status {}. This is a bug, please report it.'.format(rom['pclone_status']))
-            return
-
-        # Add to list
-        check_list.append(rom_info)
-
-    # Math
-    have_m_year = num_roms - missing_m_year
-    have_m_genre = num_roms - missing_m_genre
-    have_m_developer = num_roms - missing_m_developer
-    have_m_nplayers = num_roms - missing_m_nplayers
-    have_m_esrb = num_roms - missing_m_esrb
-    have_m_rating = num_roms - missing_m_rating
-    have_m_plot = num_roms - missing_m_plot
-
-    have_s_year_pcent = float(have_m_year*100) / num_roms
-    have_s_genre_pcent = float(have_m_genre*100) / num_roms
-    have_s_developer_pcent = float(have_m_developer*100) / num_roms
-    have_s_nplayers_pcent = float(have_m_nplayers*100) / num_roms
-    have_s_esrb_pcent = float(have_m_esrb*100) / num_roms
-    have_s_rating_pcent = float(have_m_rating*100) / num_roms
-    have_s_plot_pcent = float(have_m_plot*100) / num_roms
-
-    miss_s_year_pcent = float(missing_m_year*100) / num_roms
-    miss_s_genre_pcent = float(missing_m_genre*100) / num_roms
-    miss_s_developer_pcent = float(missing_m_developer*100) / num_roms
-    miss_s_nplayers_pcent = float(missing_m_nplayers*100) / num_roms
-    miss_s_esrb_pcent = float(missing_m_esrb*100) / num_roms
-    miss_s_rating_pcent = float(missing_m_rating*100) / num_roms
-    miss_s_plot_pcent = float(missing_m_plot*100) / num_roms
-
-    have_s_title = num_roms - missing_s_title
-    have_s_snap = num_roms - missing_s_snap
-    have_s_boxfront = num_roms - missing_s_boxfront
-    have_s_boxback = num_roms - missing_s_boxback
-    have_s_cartridge = num_roms - missing_s_cartridge
-    have_s_fanart = num_roms - missing_s_fanart
-    have_s_banner = num_roms - missing_s_banner
-    have_s_clearlogo = num_roms - missing_s_clearlogo
-    have_s_flyer = num_roms - missing_s_flyer
-    have_s_map = num_roms - missing_s_map
-    have_s_manual = num_roms - missing_s_manual
-    have_s_trailer = num_roms - missing_s_trailer
-
-    have_s_title_pcent = float(have_s_title*100) / num_roms
-    have_s_snap_pcent = float(have_s_snap*100) / num_roms
-    have_s_boxfront_pcent = float(have_s_boxfront*100) / num_roms
-    have_s_boxback_pcent = float(have_s_boxback*100) / num_roms
-    have_s_cartridge_pcent = float(have_s_cartridge*100) / num_roms
-    have_s_fanart_pcent = float(have_s_fanart*100) / num_roms
-    have_s_banner_pcent = float(have_s_banner*100) / num_roms
-    have_s_clearlogo_pcent = float(have_s_clearlogo*100) / num_roms
-    have_s_flyer_pcent = float(have_s_flyer*100) / num_roms
-    have_s_map_pcent = float(have_s_map*100) / num_roms
-    have_s_manual_pcent = float(have_s_manual*100) / num_roms
-    have_s_trailer_pcent = float(have_s_trailer*100) / num_roms
-
-    miss_s_title_pcent = float(missing_s_title*100) / num_roms
-    miss_s_snap_pcent = float(missing_s_snap*100) / num_roms
-    miss_s_boxfront_pcent = float(missing_s_boxfront*100) / num_roms
-    miss_s_boxback_pcent = float(missing_s_boxback*100) / num_roms
-    miss_s_cartridge_pcent = float(missing_s_cartridge*100) / num_roms
-    miss_s_fanart_pcent = float(missing_s_fanart*100) / num_roms
-    miss_s_banner_pcent = float(missing_s_banner*100) / num_roms
-    miss_s_clearlogo_pcent = float(missing_s_clearlogo*100) / num_roms
-    miss_s_flyer_pcent = float(missing_s_flyer*100) / num_roms
-    miss_s_map_pcent = float(missing_s_map*100) / num_roms
-    miss_s_manual_pcent = float(missing_s_manual*100) / num_roms
-    miss_s_trailer_pcent = float(missing_s_trailer*100) / num_roms
-
-    # --- Step 2: Statistics report ---
-    # Launcher name printed on window title
-    # Audit statistics
-    str_list = []
-    str_list.append('<No-Intro Audit Statistics>\n')
-    str_list.append('Number of ROMs   {:5d}\n'.format(num_roms))
-    str_list.append('Not checked ROMs {:5d}\n'.format(audit_none))
-    str_list.append('Have ROMs        {:5d}\n'.format(audit_have))
-    str_list.append('Missing ROMs     {:5d}\n'.format(audit_miss))
-    str_list.append('Unknown ROMs     {:5d}\n'.format(audit_unknown))
-    str_list.append('Parent           {:5d}\n'.format(audit_num_parents))
-    str_list.append('Clones           {:5d}\n'.format(audit_num_clones))
-    # Metadata
-    str_list.append('\n<Metadata statistics>\n')
-    str_list.append('Year      {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_year, missing_m_year, have_s_year_pcent, miss_s_year_pcent))
-    str_list.append('Genre     {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_genre, missing_m_genre, have_s_genre_pcent, miss_s_genre_pcent))
-    str_list.append('Developer {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_developer, missing_m_developer, have_s_developer_pcent, miss_s_developer_pcent))
-    str_list.append('NPlayers  {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_nplayers, missing_m_nplayers, have_s_nplayers_pcent, miss_s_nplayers_pcent))
-    str_list.append('ESRB      {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_esrb, missing_m_esrb, have_s_esrb_pcent, miss_s_esrb_pcent))
-    str_list.append('Rating    {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_rating, missing_m_rating, have_s_rating_pcent, miss_s_rating_pcent))
-    str_list.append('Plot      {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_m_plot, missing_m_plot, have_s_plot_pcent, miss_s_plot_pcent))
-    # Assets statistics
-    str_list.append('\n<Asset statistics>\n')
-    str_list.append('Title     {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_title, missing_s_title, have_s_title_pcent, miss_s_title_pcent))
-    str_list.append('Snap      {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_snap, missing_s_snap, have_s_snap_pcent, miss_s_snap_pcent))
-    str_list.append('Boxfront  {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_boxfront, missing_s_boxfront, have_s_boxfront_pcent, miss_s_boxfront_pcent))
-    str_list.append('Boxback   {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_boxback, missing_s_boxback, have_s_boxback_pcent, miss_s_boxback_pcent))
-    str_list.append('Cartridge {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_cartridge, missing_s_cartridge, have_s_cartridge_pcent, miss_s_cartridge_pcent))
-    str_list.append('Fanart    {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_fanart, missing_s_fanart, have_s_fanart_pcent, miss_s_fanart_pcent))
-    str_list.append('Banner    {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_banner, missing_s_banner, have_s_banner_pcent, miss_s_banner_pcent))
-    str_list.append('Clearlogo {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_clearlogo, missing_s_clearlogo, have_s_clearlogo_pcent, miss_s_clearlogo_pcent))
-    str_list.append('Flyer     {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_flyer, missing_s_flyer, have_s_flyer_pcent, miss_s_flyer_pcent))
-    str_list.append('Map       {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_map, missing_s_map, have_s_map_pcent, miss_s_map_pcent))
-    str_list.append('Manual    {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_manual, missing_s_manual, have_s_manual_pcent, miss_s_manual_pcent))
-    str_list.append('Trailer   {0:5d} have / {1:5d} miss  ({2:5.1f}%, {3:5.1f}%)\n'.format(
-        have_s_trailer, missing_s_trailer, have_s_trailer_pcent, miss_s_trailer_pcent))
-
-    # Step 3: Metadata report
-    str_meta_list = []
-    str_meta_list.append('{} Year Genre Developer Rating Plot Audit    PClone\n'.format('Name'.ljust(ROM_NAME_LENGHT)))
-    str_meta_list.append('{}\n'.format('-' * 99))
-    for m in check_list:
-        # Limit ROM name string length
-        name_str = text_limit_string(m['m_name'], ROM_NAME_LENGHT)
-        str_meta_list.append('{} {}  {}   {}       {}    {}  {:<7}  {}\n'.format(
-            name_str.ljust(ROM_NAME_LENGHT),
-            m['m_year'], m['m_genre'], m['m_developer'],
-            m['m_rating'], m['m_plot'], m['m_nointro_status'], m['m_pclone_status']))
-
-    # Step 4: Asset report
-    str_asset_list = []
-    str_asset_list.append('{} Tit Sna Fan Ban Clr Bxf Bxb Car Fly Map Man Tra\n'.format('Name'.ljust(ROM_NAME_LENGHT)))
-    str_asset_list.append('{}\n'.format('-' * 98))
-    for m in check_list:
-        # Limit ROM name string length
-        name_str = text_limit_string(m['m_name'], ROM_NAME_LENGHT)
-        str_asset_list.append('{}  {}   {}   {}   {}   {}   {}   {}   {}   {}   {}   {}   {}\n'.format(
-            name_str.ljust(ROM_NAME_LENGHT),
-            m['s_title'],     m['s_snap'],     m['s_fanart'],  m['s_banner'],
-            m['s_clearlogo'], m['s_boxfront'], m['s_boxback'], m['s_cartridge'],
-            m['s_flyer'],     m['s_map'],      m['s_manual'],  m['s_trailer']))
-
-    # Step 5: Join string and write TXT reports
-    try:
-        # Stats report
-        full_string = ''.join(str_list).encode('utf-8')
-        file = open(report_stats_FN.getPath(), 'w')
-        file.write(full_string)
-        file.close()
-
-        # Metadata report
-        full_string = ''.join(str_meta_list).encode('utf-8')
-        file = open(report_meta_FN.getPath(), 'w')
-        file.write(full_string)
-        file.close()
-
-        # Asset report
-        full_string = ''.join(str_asset_list).encode('utf-8')
-        file = open(report_assets_FN.getPath(), 'w')
-        file.write(full_string)
-        file.close()
-    except OSError:
-        log.error('Cannot write Launcher Report file (OSError)')
-        kodi_notify_warn('Cannot write Launcher Report (OSError)')
-    except IOError:
-        log.error('Cannot write categories.xml file (IOError)')
-        kodi_notify_warn('Cannot write Launcher Report (IOError)')
+        name_str = misc.limit_string(rom['m_name'], LAUNCHER_REPORT_ROM_NAME_LENGHT)
+        sl.append('{} {}  {}   {}       {}    {}  {:<7}  {}'.format(
+            name_str.ljust(LAUNCHER_REPORT_ROM_NAME_LENGHT),
+            yes_no(rom['m_year']), yes_no(rom['m_genre']), yes_no(rom['m_developer']),
+            yes_no(rom['m_rating']), yes_no(rom['m_plot']),
+            rom['nointro_status'], rom['pclone_status']))
+
+    return sl
+
+# Asset report codes:
+#   Y  The asset exists and has the Base_noext of the ROM.
+#   O  The asset exists in the asset directory but Base_noext is different. It may be a PClone
+#      group substitution or a user customised asset.
+#   C  The asset exists and is a user customised asset, it is not in the asset directory.
+#   -  The asset is not set.
+# Only artwork with a ROM filename based name is checked. The rest is reported as Y.
+def render_launcher_asset_report(launcher, roms):
+    checked_asset_list = ['s_title', 's_snap', 's_boxfront', 's_boxback', 's_cartridge']
+    column_list = [
+        's_title', 's_snap', 's_fanart', 's_banner', 's_clearlogo', 's_boxfront', 's_boxback',
+        's_cartridge', 's_flyer', 's_map', 's_manual', 's_trailer',
+    ]
+    asset_dir_dic = {}
+    for asset_key in checked_asset_list:
+        asset_dir_dic[asset_key] = utils.FileName(launcher['path' + asset_key[1:]]).getPath()
+    sl = []
+    sl.append('{} Tit Sna Fan Ban Clr Bxf Bxb Car Fly Map Man Tra'.format(
+        'Name'.ljust(LAUNCHER_REPORT_ROM_NAME_LENGHT)))
+    sl.append('-' * 98)
+    for rom_id in sorted(roms, key = lambda x : roms[x]['m_name']):
+        rom = roms[rom_id]
+        romfile_getBase_noext = utils.FileName(rom['filename']).getBaseNoExt()
+        code_list = []
+        for asset_key in column_list:
+            if not rom[asset_key]:
+                code_list.append('-')
+            elif asset_key in asset_dir_dic:
+                code_list.append(aux_get_info(utils.FileName(rom[asset_key]),
+                    asset_dir_dic[asset_key], romfile_getBase_noext))
+            else:
+                code_list.append('Y')
+        name_str = misc.limit_string(rom['m_name'], LAUNCHER_REPORT_ROM_NAME_LENGHT)
+        sl.append('{}  {}'.format(name_str.ljust(LAUNCHER_REPORT_ROM_NAME_LENGHT),
+            '   '.join(code_list)))
 
+    return sl
 
-def aux_get_info(self, asset_FN, path_asset_P, romfile_getBase_noext):
+def aux_get_info(asset_FN, path_asset_P, romfile_getBase_noext):
     # log.debug('title_FN.getDir() "{}"'.format(title_FN.getDir()))
     # log.debug('path_title_P      "{}"'.format(path_title_P))
     if path_asset_P != asset_FN.getDir():
@@ -9248,8 +8945,8 @@ def roms_set_NoIntro_DAT(self, launcher):
             kodi.dialog_OK('No-Intro DAT directory not found. '
                 'Please set it up in AEL addon settings.')
             return None
-        NOINTRO_DAT_list = NOINTRO_PATH_FN.scanFilesInPath('*.dat')
-        REDUMP_DAT_list = REDUMP_PATH_FN.scanFilesInPath('*.dat')
+        DAT_index = audit.load_DAT_catalog(g_PATHS.DAT_CATALOG_FILE_PATH,
+            NOINTRO_PATH_FN.getPath(), REDUMP_PATH_FN.getPath())
         # Locate platform object.
         if launcher['platform'] in platform_long_to_index_dic:
             p_index = platform_long_to_index_dic[launcher['platform']]
@@ -9260,18 +8957,18 @@ def roms_set_NoIntro_DAT(self, launcher):
                 'ROM Audit cancelled.')
             return None
         # Autolocate DAT file
-        if platform.DAT == DAT_NOINTRO:
+        if platform.DAT == platforms.DAT_NOINTRO:
             log.debug('Autolocating No-Intro DAT')
-            fname = misc_look_for_NoIntro_DAT(platform, NOINTRO_DAT_list)
+            fname = audit.get_DAT_for_platform(DAT_index, platform)
             if fname:
                 launcher['audit_auto_dat_file'] = fname
                 nointro_xml_FN = utils.FileName(fname)
             else:
                 kodi.dialog_OK('No-Intro DAT cannot be auto detected.')
                 return None
-        elif platform.DAT == DAT_REDUMP:
+        elif platform.DAT == platforms.DAT_REDUMP:
             log.debug('Autolocating Redump DAT')
-            fname = misc_look_for_Redump_DAT(platform, REDUMP_DAT_list)
+            fname = audit.get_DAT_for_platform(DAT_index, platform)
             if fname:
                 launcher['audit_auto_dat_file'] = fname
                 nointro_xml_FN = utils.FileName(fname)
@@ -9380,37 +9077,41 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     __debug_time_step = 0.0005
 
     # --- Reset the No-Intro status and removed No-Intro missing ROMs ---
+    # audit_timing is a list of (step name, seconds) tuples for the audit report.
     audit_have = audit_miss = audit_unknown = audit_extra = 0
+    audit_timing = []
+    step_start = time.time()
     pDialog = KodiProgressDialog()
     pDialog.startProgress('Deleting Missing/Dead ROMs and clearing flags...')
     self._roms_reset_NoIntro_status(launcher, roms)
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
+    audit_timing.append(('Reset audit status', time.time() - step_start))
 
     # --- Check if DAT file exists ---
     if not DAT_FN.exists():
         log.warning('_roms_update_NoIntro_status() Not found {}'.format(DAT_FN.getPath()))
         return False
+    step_start = time.time()
     pDialog.startProgress('Loading No-Intro/Redump XML DAT file...')
-    roms_nointro = audit_load_NoIntro_XML_file(DAT_FN)
+    roms_nointro = audit.load_NoIntro_XML_file_cached(DAT_FN, g_PATHS.DAT_CACHE_DIR)
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
     if not roms_nointro:
         log.warning('_roms_update_NoIntro_status() Error loading {}'.format(DAT_FN.getPath()))
         return False
 
+    audit_timing.append(('Load DAT', time.time() - step_start))
+
     # --- Remove BIOSes from No-Intro ROMs ---
+    step_start = time.time()
     if self.settings['scan_ignore_bios']:
         log.info('_roms_update_NoIntro_status() Removing BIOSes from No-Intro ROMs ...')
-        pDialog.startProgress('Removing BIOSes from No-Intro ROMs...', len(roms_nointro))
+        pDialog.startProgress('Removing BIOSes from No-Intro ROMs...')
         filtered_roms_nointro = {}
         for rom_id in roms_nointro:
-            pDialog.updateProgressInc()
-            if __debug_progress_dialogs: time.sleep(__debug_time_step)
-
             rom = roms_nointro[rom_id]
-            BIOS_str_list = re.findall('\[BIOS\]', rom['name'])
-            if not BIOS_str_list:
+            if '[BIOS]' not in rom['name']:
                 filtered_roms_nointro[rom_id] = rom
             else:
                 log.debug('_roms_update_NoIntro_status() Removed BIOS "{}"'.format(rom['name']))
@@ -9421,51 +9122,73 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
 
     # --- Put No-Intro ROM names in a set ---
     # Set is the fastest Python container for searching elements (implements hashed search).
-    # No-Intro names include tags
+    # No-Intro names include tags. ROM paths and basenames are computed only once here
+    # and reused in all the audit steps.
     roms_nointro_set = set(roms_nointro.keys())
-    roms_set = set()
     pDialog.startProgress('Creating No-Intro and ROM sets...')
+    roms_path_dic, roms_basename_dic = {}, {}
     for rom_id in roms:
         ROMFileName = utils.FileName(roms[rom_id]['filename'])
-        roms_set.add(ROMFileName.getBaseNoExt()) # Use the ROM basename.
+        roms_path_dic[rom_id] = ROMFileName.getPath()
+        roms_basename_dic[rom_id] = ROMFileName.getBaseNoExt()
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
+    audit_timing.append(('Build sets', time.time() - step_start))
 
     # --- Traverse Launcher ROMs and check if they are in the No-Intro ROMs list ---
+    # In verify mode ROMs are matched by contents (size/CRC/SHA1) and not by filename.
+    # Missing files and files that cannot be read are matched by filename.
+    # roms_dat_name_dic maps ROM IDs to DAT names and is used to build the PClone index.
+    # Checksums are cached so unchanged files are never hashed again.
+    step_start = time.time()
+    verify_checksums = self.settings['audit_verify_checksums']
+    roms_dat_name_dic = dict(roms_basename_dic)
+    if verify_checksums:
+        log.info('_roms_update_NoIntro_status() Verifying ROMs by checksum.')
+        checksum_index = audit.make_NoIntro_checksum_index(roms_nointro)
+        checksum_cache_FN = g_PATHS.DAT_CACHE_DIR.pjoin('ROM_checksums.pickle')
+        checksum_cache = audit.load_checksum_cache(checksum_cache_FN)
     pDialog.startProgress('Audit Step 1/4: Checking Have and Unknown ROMs...', len(roms))
     for rom_id in roms:
         pDialog.updateProgressInc()
         if __debug_progress_dialogs: time.sleep(__debug_time_step)
-        ROMFileName = utils.FileName(roms[rom_id]['filename'])
         if roms[rom_id]['i_extra_ROM']:
             roms[rom_id]['nointro_status'] = AUDIT_STATUS_EXTRA
             audit_extra += 1
-            # log.debug('_roms_update_NoIntro_status() EXTRA   "{}"'.format(ROMFileName.getBaseNoExt()))
-        elif ROMFileName.getBaseNoExt() in roms_nointro_set:
+            continue
+        dat_name = None
+        if verify_checksums:
+            dat_name = audit.match_ROM_by_checksum(roms_path_dic[rom_id], checksum_index, checksum_cache)
+        if dat_name is None:
+            dat_name = roms_basename_dic[rom_id] if roms_basename_dic[rom_id] in roms_nointro_set else ''
+        if verify_checksums: roms_dat_name_dic[rom_id] = dat_name
+        if dat_name:
             roms[rom_id]['nointro_status'] = AUDIT_STATUS_HAVE
             audit_have += 1
-            # log.debug('_roms_update_NoIntro_status() HAVE    "{}"'.format(ROMFileName.getBaseNoExt()))
         else:
             roms[rom_id]['nointro_status'] = AUDIT_STATUS_UNKNOWN
             audit_unknown += 1
-            # log.debug('_roms_update_NoIntro_status() UNKNOWN "{}"'.format(ROMFileName.getBaseNoExt()))
     pDialog.endProgress()
+    if verify_checksums: audit.save_checksum_cache(checksum_cache_FN, checksum_cache)
+    roms_set = set(roms_dat_name_dic.values())
+    audit_timing.append(('Step 1 Have/Unknown', time.time() - step_start))
 
     # --- Mark Launcher dead ROMs as Missing ---
-    pDialog.startProgress('Audit Step 2/4: Checking Missing ROMs...', len(roms))
+    # File existence is checked in parallel, this is much faster on network shares.
+    step_start = time.time()
+    pDialog.startProgress('Audit Step 2/4: Checking Missing ROMs...')
+    missing_set = utils.get_missing_files(list(roms_path_dic.values()))
     for rom_id in roms:
-        pDialog.updateProgressInc()
-        if __debug_progress_dialogs: time.sleep(__debug_time_step)
-        ROMFileName = utils.FileName(roms[rom_id]['filename'])
-        if not ROMFileName.exists():
+        if roms_path_dic[rom_id] in missing_set:
             roms[rom_id]['nointro_status'] = AUDIT_STATUS_MISS
             audit_miss += 1
-            # log.debug('_roms_update_NoIntro_status() MISSING "{}"'.format(ROMFileName.getBaseNoExt()))
     pDialog.endProgress()
+    audit_timing.append(('Step 2 Missing files', time.time() - step_start))
 
     # --- Now add Missing ROMs to Launcher ---
     # Traverse the No-Intro set and add the No-Intro ROM if it's not in the Launcher
     # Added/Missing ROMs have their own romID.
+    step_start = time.time()
     ROMPath = utils.FileName(launcher['rompath'])
     pDialog.startProgress('Audit Step 3/4: Adding Missing ROMs...', len(roms_nointro_set))
     for nointro_rom in sorted(roms_nointro_set):
@@ -9482,13 +9205,16 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
             rom['m_name']         = nointro_rom
             rom['nointro_status'] = AUDIT_STATUS_MISS
             roms[rom_id] = rom
+            roms_dat_name_dic[rom_id] = nointro_rom
             audit_miss += 1
             # log.debug('_roms_update_NoIntro_status() ADDED   "{}"'.format(rom['m_name']))
             # log.debug('_roms_update_NoIntro_status()    OP   "{}"'.format(rom['filename']))
     pDialog.endProgress()
+    audit_timing.append(('Step 3 Add missing', time.time() - step_start))
 
     # --- Detect if the DAT file has PClone information or not ---
-    dat_pclone_dic = audit_make_NoIntro_PClone_dic(roms_nointro)
+    step_start = time.time()
+    dat_pclone_dic = audit.make_NoIntro_PClone_dic(roms_nointro)
     num_dat_clones = 0
     for parent_name in dat_pclone_dic: num_dat_clones += len(dat_pclone_dic[parent_name])
     log.debug('No-Intro/Redump DAT has {} clone ROMs'.format(num_dat_clones))
@@ -9523,7 +9249,8 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     # code from the PClone generation code.
     log.debug('Generating DAT-based Parent/Clone groups')
     pDialog.startProgress('Building DAT-based Parent/Clone index...')
-    roms_pclone_index = audit_generate_DAT_PClone_index(roms, roms_nointro, unknown_ROMs_are_parents)
+    roms_pclone_index = audit.generate_DAT_PClone_index(roms, roms_nointro,
+        unknown_ROMs_are_parents, roms_dat_name_dic)
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
 
@@ -9537,7 +9264,10 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
 
+    audit_timing.append(('PClone indices', time.time() - step_start))
+
     # --- Set ROMs pclone_status flag and update launcher statistics ---
+    step_start = time.time()
     pDialog.startProgress('Audit Step 4/4: Setting Parent/Clone status and cloneof fields...', len(roms))
     audit_parents, audit_clones = 0, 0
     for rom_id in roms:
@@ -9563,7 +9293,7 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     # --- Make a Parent only ROM list and save JSON ---
     # This is to speed up rendering of launchers in Parent/Clone display mode.
     pDialog.startProgress('Building Parent/Clone index and Parent dictionary...')
-    parent_roms = audit_generate_parent_ROMs_dic(roms, roms_pclone_index)
+    parent_roms = audit.generate_parent_ROMs_dic(roms, roms_pclone_index)
     pDialog.endProgress()
     if __debug_progress_dialogs: time.sleep(0.5)
 
@@ -9578,6 +9308,7 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     f_FN = g_PATHS.ROMS_DIR.pjoin(launcher['roms_base_noext'] + '_parents.json')
     utils_write_JSON_file(f_FN.getPath(), parent_roms)
     pDialog.endProgress()
+    audit_timing.append(('Step 4 PClone status and save', time.time() - step_start))
 
     # --- Update launcher number of ROMs ---
     self.audit_have    = audit_have
@@ -9587,6 +9318,7 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     self.audit_total   = len(roms)
     self.audit_parents = audit_parents
     self.audit_clones  = audit_clones
+    self.audit_timing  = audit_timing
 
     # --- Report ---
     log.info('********** No-Intro/Redump audit finished. Report ***********')
@@ -9597,6 +9329,8 @@ def roms_update_NoIntro_status(self, launcher, roms, DAT_FN):
     log.info('Total ROMs   {:6d}'.format(self.audit_total))
     log.info('Parent ROMs  {:6d}'.format(self.audit_parents))
     log.info('Clone ROMs   {:6d}'.format(self.audit_clones))
+    for step_name, step_time in self.audit_timing:
+        log.info('{:<30} {:8.3f} s'.format(step_name, step_time))
 
     return True
 
@@ -9792,13 +9526,15 @@ def aux_fav_check_favourites(self, roms_fav):
     pDialog.endProgress()
 
     # STEP 2: Find missing ROM ID
-    # Get a list of launchers Favourite ROMs belong.
+    # Group Favourite ROMs by launcher so every launcher is visited once. ROM membership is
+    # checked with the launcher ROM ID manifest, no need to load the full ROM databases.
     log.debug('_fav_check_favourites() STEP 2: Search unlinked ROMs')
-    launchers_fav = set()
-    for rom_fav_ID in roms_fav: launchers_fav.add(roms_fav[rom_fav_ID]['launcherID'])
+    launchers_fav = {}
+    for rom_fav_ID in roms_fav:
+        launcher_id = roms_fav[rom_fav_ID]['launcherID']
+        if launcher_id not in launchers_fav: launchers_fav[launcher_id] = []
+        launchers_fav[launcher_id].append(rom_fav_ID)
 
-    # Traverse list of launchers. For each launcher, load ROMs it and check all favourite ROMs
-    # that belong to that launcher.
     pDialog.startProgress('Checking Favourite ROMs. Step 2 of 3...', len(launchers_fav))
     for launcher_id in launchers_fav:
         pDialog.updateProgressInc()
@@ -9806,30 +9542,26 @@ def aux_fav_check_favourites(self, roms_fav):
         # If Favourite does not have launcher skip it. It has been marked as 'Unlinked Launcher'
         # in step 1.
         if launcher_id not in self.launchers: continue
-
-        # Load launcher ROMs
-        roms = fs_load_ROMs_JSON(g_PATHS.ROMS_DIR, self.launchers[launcher_id])
-
-        # Traverse all favourites and check them if belong to this launcher.
-        # This should be efficient because traversing favourites is cheap but loading ROMs is expensive.
-        for rom_fav_ID in roms_fav:
-            if roms_fav[rom_fav_ID]['launcherID'] == launcher_id:
-                # Check if ROM ID exists
-                if roms_fav[rom_fav_ID]['id'] not in roms:
-                    s = 'Fav ROM "{}" Unlinked ROM because romID not in launcher ROMs'
-                    log.debug(s.format(roms_fav[rom_fav_ID]['m_name']))
-                    roms_fav[rom_fav_ID]['fav_status'] = 'Unlinked ROM'
-                    self.num_fav_urom += 1
+        rom_ID_set = db.load_ROM_ID_set(g_PATHS.ROMS_DIR, self.launchers[launcher_id])
+        for rom_fav_ID in launchers_fav[launcher_id]:
+            if roms_fav[rom_fav_ID]['id'] not in rom_ID_set:
+                s = 'Fav ROM "{}" Unlinked ROM because romID not in launcher ROMs'
+                log.debug(s.format(roms_fav[rom_fav_ID]['m_name']))
+                roms_fav[rom_fav_ID]['fav_status'] = 'Unlinked ROM'
+                self.num_fav_urom += 1
     pDialog.endProgress()
 
     # STEP 3: Check if file exists. Even if the ROM ID is not there because user
     # deleted ROM or launcher, the file may still be there.
+    # Files are checked in parallel, this is much faster on network shares.
     log.debug('_fav_check_favourites() STEP 3: Search broken ROMs')
-    pDialog.startProgress('Checking Favourite ROMs. Step 3 of 3...', len(launchers_fav))
+    pDialog.startProgress('Checking Favourite ROMs. Step 3 of 3...')
+    fav_path_dic = {}
     for rom_fav_ID in roms_fav:
-        pDialog.updateProgressInc()
-        romFile = utils.FileName(roms_fav[rom_fav_ID]['filename'])
-        if not romFile.exists():
+        fav_path_dic[rom_fav_ID] = utils.FileName(roms_fav[rom_fav_ID]['filename']).getPath()
+    missing_set = utils.get_missing_files(list(fav_path_dic.values()))
+    for rom_fav_ID in roms_fav:
+        if fav_path_dic[rom_fav_ID] in missing_set:
             s = 'Fav ROM "{}" broken because filename does not exist'
             log.debug(s.format(roms_fav[rom_fav_ID]['m_name']))
             roms_fav[rom_fav_ID]['fav_status'] = 'Broken'
@@ -25,6 +25,7 @@ import resources.log as log
 # --- Python standard library ---
 import collections
 import hashlib
+import json
 import os
 import random
 import re
@@ -403,7 +404,8 @@ def unescape_HTML(s):
     if const.ADDON_RUNNING_PYTHON_2:
         s = HTMLParser.HTMLParser().unescape(s)
     elif const.ADDON_RUNNING_PYTHON_3:
-        s = html.parser.HTMLParser().unescape(s)
+        # HTMLParser.unescape() was removed in Python 3.9.
+        s = html.unescape(s)
     else:
         raise TypeError('Undefined Python runtime version.')
 
@@ -535,6 +537,27 @@ def escape_regex_special_chars(s):
 
     return s
 
+# Matches a JSON string or a trailing comma followed by ']' or '}'.
+# Strings are matched first so commas inside strings are never touched.
+JSON_TRAILING_COMMA_RE = re.compile(r'("(?:[^"\\]|\\.)*")|,(\s*[\]}])')
+JSON_TRAILING_COMMA_FAST_RE = re.compile(r',\s*[\]}]')
+
+# Decode JSON tolerating trailing commas before ']' and '}'. Some web APIs (notably
+# ScreenScraper API V2) sometimes return JSON with trailing commas, for example:
+#
+#			],     <----- Here it should be a ']' and not '],'.
+#		}
+#	}
+#
+# The trailing commas are removed in one pass over the data and the JSON is decoded with a
+# single json.loads(). If the data has no trailing commas it is decoded directly.
+# Raises ValueError if the data is not valid JSON after the repair.
+def decode_tolerant_JSON(json_str):
+    if JSON_TRAILING_COMMA_FAST_RE.search(json_str):
+        json_str = JSON_TRAILING_COMMA_RE.sub(
+            lambda m: m.group(1) if m.group(1) is not None else m.group(2), json_str)
+    return json.loads(json_str)
+
 # Search for a No-Intro DAT filename.
 def look_for_NoIntro_DAT(platform, DAT_list):
     # log.debug('Testing No-Intro platform "{}"'.format(platform.long_name))
@@ -681,36 +704,44 @@ def replace_fav(dict_in, old_item_key, new_item_key, new_value):
     else:
         raise TypeError
 
+# Number of bytes at the beginning of an image file needed to identify the image type.
+IMAGE_HEADER_SIZE = 64
+
 # Inspects an image file and determine its type by using the magic numbers,
 # Returns an image id defined in list IMAGE_IDS or IMAGE_UKNOWN_ID.
 def identify_image_id_by_contents(asset_fname):
     # If file size is 0 or less than 64 bytes it is corrupt.
     statinfo = os.stat(asset_fname)
-    if statinfo.st_size < 64: return IMAGE_CORRUPT_ID
+    if statinfo.st_size < IMAGE_HEADER_SIZE: return const.IMAGE_CORRUPT_ID
 
     # Read first 64 bytes of file.
-    # Search for the magic number of the beginning of the file.
     with open(asset_fname, "rb") as f:
-        file_bytes = f.read(64)
-    for img_id in IMAGE_MAGIC_DIC:
-        for magic_bytes in IMAGE_MAGIC_DIC[img_id]:
-            magic_bytes_len = len(magic_bytes)
-            file_chunk = file_bytes[0:magic_bytes_len]
-            if len(file_chunk) != magic_bytes_len: raise TypeError
-            if file_chunk == magic_bytes: return img_id
+        file_bytes = f.read(IMAGE_HEADER_SIZE)
+
+    return identify_image_id_by_header(file_bytes, statinfo.st_size)
+
+# Search for the magic number at the beginning of the file. file_bytes are the first
+# IMAGE_HEADER_SIZE bytes of the file and file_size the size of the file.
+# Returns an image id defined in list IMAGE_IDS, IMAGE_UKNOWN_ID or IMAGE_CORRUPT_ID.
+def identify_image_id_by_header(file_bytes, file_size):
+    if file_size < IMAGE_HEADER_SIZE or len(file_bytes) < IMAGE_HEADER_SIZE:
+        return const.IMAGE_CORRUPT_ID
+    for img_id in const.IMAGE_MAGIC_DIC:
+        for magic_bytes in const.IMAGE_MAGIC_DIC[img_id]:
+            if file_bytes[0:len(magic_bytes)] == magic_bytes: return img_id
 
-    return IMAGE_UKNOWN_ID
+    return const.IMAGE_UKNOWN_ID
 
 # Returns an image id defined in list IMAGE_IDS or IMAGE_UKNOWN_ID.
 def identify_image_id_by_ext(asset_fname):
     asset_root, asset_ext = os.path.splitext(asset_fname)
     # log.debug('asset_ext {}'.format(asset_ext))
-    if not asset_ext: return IMAGE_UKNOWN_ID
+    if not asset_ext: return const.IMAGE_UKNOWN_ID
     asset_ext = asset_ext[1:] # Remove leading dot '.png' -> 'png'
-    for img_id in IMAGE_EXTENSIONS:
-        for img_ext in IMAGE_EXTENSIONS[img_id]:
+    for img_id in const.IMAGE_EXTENSIONS:
+        for img_ext in const.IMAGE_EXTENSIONS[img_id]:
             if asset_ext.lower() == img_ext: return img_id
-    return IMAGE_UKNOWN_ID
+    return const.IMAGE_UKNOWN_ID
 
 # Remove initial and trailing quotation characters " or '
 # String must have 3 characters or more.
@@ -79,9 +79,11 @@ def print_ROM_additional_slist(rom, sl):
 
     # Favourite ROMs unique fields.
     sl.append("[COLOR violet]fav_status[/COLOR]: '{}'".format(rom['fav_status']))
-    # 'launch_count' only in Favourite ROMs in "Most played ROMs"
+    # Play statistics fields only in "Recently played ROMs" and "Most played ROMs"
     if 'launch_count' in rom:
         sl.append("[COLOR skyblue]launch_count[/COLOR]: {}".format(rom['launch_count']))
+    if 'playtime' in rom:
+        sl.append("[COLOR skyblue]playtime[/COLOR]: {:.0f} s".format(rom['playtime']))
 
 def print_Launcher_slist(launcher, sl):
     sl.append("[COLOR violet]id[/COLOR]: '{}'".format(launcher['id']))
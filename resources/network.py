@@ -19,6 +19,10 @@ import resources.const as const
 import resources.log as log
 
 # --- Python standard library ---
+import base64
+import hashlib
+import io
+import json
 import os
 import random
 import ssl
@@ -36,6 +40,18 @@ else:
 # USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:88.0) Gecko/20100101 Firefox/88.0'
 USER_AGENT = 'Mozilla/5.0 (X11; Linux i686; rv:88.0) Gecko/20100101 Firefox/88.0'
 
+# --- Record/replay transport ---
+# In TRANSPORT_RECORD mode every page retrieved with get_URL() is also saved as a JSON fixture
+# file in the fixtures directory. In TRANSPORT_REPLAY mode get_URL() never touches the network
+# and pages are served from the fixtures. This is used by the dev-scrapers benchmarks to run
+# the scrapers offline. Addon code always uses TRANSPORT_LIVE.
+TRANSPORT_LIVE   = 0
+TRANSPORT_RECORD = 1
+TRANSPORT_REPLAY = 2
+transport_mode = TRANSPORT_LIVE
+transport_fixture_dir = ''
+transport_stats = {'requests' : 0, 'bytes' : 0, 'fixture_misses' : 0}
+
 def get_random_UserAgent():
     platform = random.choice(['Macintosh', 'Windows', 'X11'])
     if platform == 'Macintosh':
@@ -85,7 +101,108 @@ def get_random_UserAgent():
             token = ''
         return 'Mozilla/5.0 (compatible; MSIE ' + version + '; ' + os_str + '; ' + token + 'Trident/' + engine + ')'
 
-def download_img(img_url, file_path):
+# @param mode: [int] One of the TRANSPORT_* constants.
+# @param fixture_dir: [str] Directory where fixture files are written to/read from.
+def set_transport(mode, fixture_dir = ''):
+    global transport_mode, transport_fixture_dir
+    if mode not in (TRANSPORT_LIVE, TRANSPORT_RECORD, TRANSPORT_REPLAY):
+        raise TypeError('Unknown transport mode {}'.format(mode))
+    if mode != TRANSPORT_LIVE and not fixture_dir:
+        raise TypeError('Record/replay transport requires a fixture directory.')
+    transport_mode = mode
+    transport_fixture_dir = fixture_dir
+    if mode == TRANSPORT_RECORD and not os.path.isdir(fixture_dir): os.makedirs(fixture_dir)
+    log.debug('set_transport() Mode {} fixture dir "{}"'.format(mode, fixture_dir))
+
+def reset_transport_stats():
+    transport_stats['requests'] = 0
+    transport_stats['bytes'] = 0
+    transport_stats['fixture_misses'] = 0
+
+# Fixtures are keyed by the SHA1 of the URL and, for POST requests, the POST data. The full URL
+# may contain API keys so url_log is used as the key if available, and only url_log is stored
+# inside the fixture. This way fixtures recorded with some API keys can be replayed without them.
+def _get_fixture_path(url, url_log, data):
+    key = url_log if url_log is not None else url
+    key_bytes = key.encode('utf-8')
+    if data is not None:
+        key_bytes += b'\n' + (data if isinstance(data, const.binary_type) else data.encode('utf-8'))
+    url_hash = hashlib.sha1(key_bytes).hexdigest()
+    return os.path.join(transport_fixture_dir, url_hash + '.json')
+
+# Number of bytes transferred. Text is counted encoded as UTF-8.
+def _get_num_bytes(page_data):
+    if isinstance(page_data, const.binary_type): return len(page_data)
+    return len(page_data.encode('utf-8'))
+
+# On HTTP errors get_URL() returns the undecoded page bytes. Store them as text.
+# Binary data (images) is stored encoded in base64.
+def _record_fixture(url, url_log, data, page_data, http_code, binary):
+    if binary:
+        page_data = base64.b64encode(page_data).decode('ascii')
+    elif isinstance(page_data, const.binary_type):
+        page_data = page_data.decode('utf-8', 'replace')
+    fixture = {
+        'url' : url_log if url_log is not None else url,
+        'http_code' : http_code,
+        'page_data' : page_data,
+    }
+    with io.open(_get_fixture_path(url, url_log, data), 'wt', encoding = 'utf-8') as file:
+        file.write(const.text_type(json.dumps(fixture, ensure_ascii = False, indent = 1)))
+
+# Returns (None, None) if there is no fixture, same as a network error in get_URL().
+def _replay_fixture(url, url_log, data, binary):
+    fixture_path = _get_fixture_path(url, url_log, data)
+    if not os.path.isfile(fixture_path):
+        transport_stats['fixture_misses'] += 1
+        log.error('_replay_fixture() No fixture for URL "{}"'.format(url_log if url_log else url))
+        return None, None
+    with io.open(fixture_path, 'rt', encoding = 'utf-8') as file:
+        fixture = json.load(file)
+    log.debug('_replay_fixture() Replaying fixture "{}"'.format(fixture_path))
+    page_data = fixture['page_data']
+    if binary: page_data = base64.b64decode(page_data.encode('ascii'))
+    return page_data, fixture['http_code']
+
+# All the network requests go through the record/replay transport.
+# fetch_function() does the request and returns (page_data, http_code). page_data is a Unicode
+# string, or bytes if binary is True. data is the POST data or None for GET requests.
+def _transport_request(url, url_log, data, binary, fetch_function):
+    if transport_mode == TRANSPORT_REPLAY:
+        page_data, http_code = _replay_fixture(url, url_log, data, binary)
+    else:
+        page_data, http_code = fetch_function()
+        # Do not record network errors/exceptions. They will be fixture misses when replaying.
+        if transport_mode == TRANSPORT_RECORD and http_code is not None:
+            _record_fixture(url, url_log, data, page_data, http_code, binary)
+    transport_stats['requests'] += 1
+    if page_data is not None: transport_stats['bytes'] += _get_num_bytes(page_data)
+    return page_data, http_code
+
+# Images are not decoded. HTTP errors are not returned as image data.
+# @param url_log: [Unicode string] If not None this URL will be used in the logs and fixtures.
+def download_img(img_url, file_path, url_log = None):
+    img_buf, http_code = _transport_request(img_url, url_log, None, True,
+        lambda : _download_img_urllib(img_url))
+    if img_buf is None: return
+
+    # --- Write image file to disk ---
+    # There should be no more 0 size files with this code.
+    try:
+        f = open(file_path, 'wb')
+        f.write(img_buf)
+        f.close()
+    except IOError as ex:
+        log.error('(IOError) In download_img(), disk code.')
+        log.error('(IOError) Object type "{}"'.format(type(ex)))
+        log.error('(IOError) Message "{}"'.format(const.text_type(ex)))
+    except Exception as ex:
+        log.error('(Exception) In download_img(), disk code.')
+        log.error('(Exception) Object type "{}"'.format(type(ex)))
+        log.error('(Exception) Message "{}"'.format(const.text_type(ex)))
+
+# Returns (image bytes, HTTP status code) or (None, None) if network error/exception.
+def _download_img_urllib(img_url):
     # --- Download image to a buffer in memory ---
     # If an exception happens here no file is created (avoid creating files with 0 bytes).
     try:
@@ -97,12 +214,14 @@ def download_img(img_url, file_path):
             # response = urllib2.urlopen(req, timeout = 120)
             response = urllib2.urlopen(req, timeout = 120, context = ssl._create_unverified_context())
             img_buf = response.read()
+            http_code = response.getcode()
             response.close()
         elif const.ADDON_RUNNING_PYTHON_3:
             req = urllib.request.Request(img_url)
             req.add_unredirected_header('User-Agent', USER_AGENT)
             response = urllib.request.urlopen(req, timeout = 120, context = ssl._create_unverified_context())
             img_buf = response.read()
+            http_code = response.getcode()
             response.close()
     # If an exception happens record it in the log and do nothing.
     # This must be fixed. If an error happened when downloading stuff caller code must
@@ -111,27 +230,14 @@ def download_img(img_url, file_path):
         log.error('(IOError) In download_img(), network code.')
         log.error('(IOError) Object type "{}"'.format(type(ex)))
         log.error('(IOError) Message "{}"'.format(const.text_type(ex)))
-        return
+        return None, None
     except Exception as ex:
         log.error('(Exception) In download_img(), network code.')
         log.error('(Exception) Object type "{}"'.format(type(ex)))
         log.error('(Exception) Message "{}"'.format(const.text_type(ex)))
-        return
+        return None, None
 
-    # --- Write image file to disk ---
-    # There should be no more 0 size files with this code.
-    try:
-        f = open(file_path, 'wb')
-        f.write(img_buf)
-        f.close()
-    except IOError as ex:
-        log.error('(IOError) In download_img(), disk code.')
-        log.error('(IOError) Object type "{}"'.format(type(ex)))
-        log.error('(IOError) Message "{}"'.format(const.text_type(ex)))
-    except Exception as ex:
-        log.error('(Exception) In download_img(), disk code.')
-        log.error('(Exception) Object type "{}"'.format(type(ex)))
-        log.error('(Exception) Message "{}"'.format(const.text_type(ex)))
+    return img_buf, http_code
 
 # User agent is fixed and defined in global var USER_AGENT
 # https://docs.python.org/2/library/urllib2.html
@@ -142,6 +248,9 @@ def download_img(img_url, file_path):
 #          a Unicode string or None if network error/exception. Second tuple element is the
 #          HTTP status code as integer or None if network error/exception.
 def get_URL(url, url_log = None):
+    return _transport_request(url, url_log, None, False, lambda : _get_URL_urllib(url, url_log))
+
+def _get_URL_urllib(url, url_log):
     page_bytes, http_code = None, None
     if url_log is not None: log.debug('get_URL() GET URL "{}"'.format(url_log))
     if const.ADDON_RUNNING_PYTHON_2:
@@ -223,7 +332,11 @@ def get_URL_oneline(url, url_log = None):
 # Do HTTP request with POST: https://docs.python.org/2/library/urllib2.html#urllib2.Request
 # If an exception happens return empty data.
 def post_URL(url, data):
-    page_data = ''
+    page_data, http_code = _transport_request(url, None, data, False, lambda : _post_URL_urllib(url, data))
+    return page_data if page_data is not None else ''
+
+# Returns (page_data, HTTP status code) or (None, None) if network error/exception.
+def _post_URL_urllib(url, data):
     try:
         if const.ADDON_RUNNING_PYTHON_2:
             req = urllib2.Request(url, data)
@@ -233,6 +346,7 @@ def post_URL(url, data):
             log.debug('post_URL() POST URL "{}"'.format(req.get_full_url()))
             response = urllib2.urlopen(req, timeout = 120)
             page_bytes = response.read()
+            http_code = response.getcode()
             encoding = response.headers['content-type'].split('charset=')[-1]
             response.close()
         elif const.ADDON_RUNNING_PYTHON_3:
@@ -243,22 +357,23 @@ def post_URL(url, data):
             log.debug('post_URL() POST URL "{}"'.format(req.get_full_url()))
             response = urllib.request.urlopen(req, timeout = 120)
             page_bytes = response.read()
+            http_code = response.getcode()
             encoding = response.headers['content-type'].split('charset=')[-1]
             response.close()
     except IOError as ex:
         log.error('(IOError exception) In net_get_URL()')
         log.error('Message: {}'.format(const.text_type(ex)))
-        return page_data
+        return None, None
     except Exception as ex:
         log.error('(General exception) In net_get_URL()')
         log.error('Message: {}'.format(const.text_type(ex)))
-        return page_data
+        return None, None
     num_bytes = len(page_bytes)
     log.debug('post_URL() Read {} bytes'.format(num_bytes))
     # Convert page data to Unicode
     page_data = decode_URL_data(page_bytes, encoding)
 
-    return page_data
+    return page_data, http_code
 
 def decode_URL_data(page_bytes, MIME_type):
     # --- Try to guess encoding ---
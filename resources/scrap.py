@@ -40,12 +40,15 @@ import json
 import os
 import re
 import socket
+import threading
 import time
 import zipfile
 if const.ADDON_RUNNING_PYTHON_2:
     import urllib
+    import Queue as queue
 elif const.ADDON_RUNNING_PYTHON_3:
     import urllib.parse
+    import queue
 else:
     raise TypeError('Undefined Python runtime version.')
 
@@ -392,6 +395,30 @@ class ScraperFactory(object):
 
         return self.strategy_obj
 
+    # Warm the disk caches of the scanner scrapers for the launcher platform. Everything
+    # that can be fetched in bulk is fetched before the scan, so the ROM scanner loop makes
+    # fewer requests. create_scanner() must be called before this function.
+    #
+    # @param ROM_FN_list: [list of FileName] ROMs to be scanned.
+    # @param pdialog: [ProgressDialog] Optional progress dialog.
+    # @return: [int] Number of per-ROM requests saved.
+    def warm_cache_for_platform(self, ROM_FN_list, pdialog = None):
+        strategy = self.strategy_obj
+        log.debug('ScraperFactory.warm_cache_for_platform() Platform "{}", {} ROMs'.format(
+            strategy.platform, len(ROM_FN_list)))
+        scraper_list = []
+        if strategy.scan_metadata_policy in (2, 3):
+            scraper_list.append(strategy.meta_scraper_obj)
+        if strategy.scan_asset_policy in (1, 2) and not strategy.meta_and_asset_scraper_same:
+            scraper_list.append(strategy.asset_scraper_obj)
+        num_saved = 0
+        for scraper_obj in scraper_list:
+            scraper_saved = scraper_obj.warm_platform_cache(ROM_FN_list, strategy.platform, pdialog)
+            log.debug('Scraper {} saved {} per-ROM requests'.format(scraper_obj.get_name(), scraper_saved))
+            num_saved += scraper_saved
+
+        return num_saved
+
     # * Flush caches before dereferencing object.
     def destroy_scanner(self, pdialog = None):
         log.debug('ScraperFactory.destroy_scanner() Flushing disk caches...')
@@ -507,20 +534,20 @@ class ScrapeStrategy(object):
     # Display errors reported in st_dic as a Kodi dialog in this function but do not abort,
     # just disable the scraper.
     def scanner_check_before_scraping(self):
-        st_dic = kodi_new_status_dic()
+        st_dic = kodi.new_status_dic()
         self.meta_scraper_obj.check_before_scraping(st_dic)
         if st_dic['abort']: kodi.dialog_OK(st_dic['msg'])
 
         # Only check asset scraper if it's different from the metadata scraper.
         if not self.meta_and_asset_scraper_same:
-            st_dic = kodi_new_status_dic()
+            st_dic = kodi.new_status_dic()
             self.asset_scraper_obj.check_before_scraping(st_dic)
             if st_dic['abort']: kodi.dialog_OK(st_dic['msg'])
 
     def scanner_check_launcher_unset_asset_dirs(self):
         log.debug('ScrapeStrategy.scanner_check_launcher_unset_asset_dirs() BEGIN ...')
-        self.enabled_asset_list = asset_get_enabled_asset_list(self.launcher)
-        self.unconfigured_name_list = asset_get_unconfigured_name_list(self.enabled_asset_list)
+        self.enabled_asset_list = assets.get_enabled_asset_list(self.launcher)
+        self.unconfigured_name_list = assets.get_unconfigured_name_list(self.enabled_asset_list)
 
     # Determine the actions to be carried out by process_ROM_metadata() and process_ROM_assets().
     # Must be called before the aforementioned methods.
@@ -770,7 +797,7 @@ class ScrapeStrategy(object):
             # I think it is better to keep things like this. If the scraper does not
             # find a proper candidate game the user can fix the scraper cache with the
             # context menu.
-            rom_name_scraping = text_format_ROM_name_for_scraping(ROM_FN.getBaseNoExt())
+            rom_name_scraping = misc.format_ROM_name_for_scraping(ROM_FN.getBaseNoExt())
             candidates = scraper_obj.get_candidates(
                 rom_name_scraping, ROM_FN, ROM_checksums_FN, self.platform, st_dic)
             # * If the scraper produced an error notification show it and continue scanner operation.
@@ -783,8 +810,8 @@ class ScrapeStrategy(object):
                 self.pdialog.close()
                 # Close error message dialog automatically 1 minute to keep scanning.
                 # kodi.dialog_OK(st_dic['msg'])
-                kodi_dialog_yesno_timer(st_dic['msg'], 60000)
-                st_dic = kodi_new_status_dic()
+                kodi.dialog_yesno_timer(st_dic['msg'], 60000)
+                st_dic = kodi.new_status_dic()
                 self.pdialog.reopen()
             # * If candidates is None some kind of error/exception happened.
             # * None is also returned if the scraper is disabled (also no error in st_dic).
@@ -1295,7 +1322,7 @@ class ScrapeStrategy(object):
             keyboard = KodiKeyboardDialog('Enter the search term...', search_term)
             keyboard.executeDialog()
             if not keyboard.isConfirmed():
-                utils.set_error_status(st_dic, '{} scraping canceled'.format(object_name))
+                kodi.set_error_status(st_dic, '{} scraping canceled'.format(object_name))
                 return
             if const.ADDON_RUNNING_PYTHON_2:
                 search_term = keyboard.getData().strip().decode('utf-8')
@@ -1318,7 +1345,7 @@ class ScrapeStrategy(object):
         # that the scraper is disabled when scraping from the context menu.
         log.debug('Scraper found {} result/s'.format(len(candidate_list)))
         if not candidate_list:
-            utils.set_error_status(st_dic, 'Scraper found no matching games')
+            kodi.set_error_status(st_dic, 'Scraper found no matching games')
             return
 
         # --- Display corresponding game list found so user choses ---
@@ -1330,7 +1357,7 @@ class ScrapeStrategy(object):
             heading = 'Select game for ROM "{}"'.format(object_dic['m_name'])
             select_candidate_idx = KodiSelectDialog(heading, game_name_list).executeDialog()
             if select_candidate_idx is None:
-                utils.set_error_status(st_dic, '{} scraping canceled'.format(object_name))
+                kodi.set_error_status(st_dic, '{} scraping canceled'.format(object_name))
                 return
         # log.debug('select_candidate_idx {}'.format(select_candidate_idx))
         candidate = candidate_list[select_candidate_idx]
@@ -1368,7 +1395,7 @@ class ScrapeStrategy(object):
         log.debug('{} {} scraper returned {} images'.format(scraper_name, asset_info.name, len(assetdata_list)))
         # Scraper found no assets. Return immediately.
         if not assetdata_list:
-            utils.set_error_status(st_dic, '{}{}{} scraper found no {}{}{} images.'.format(
+            kodi.set_error_status(st_dic, '{}{}{} scraper found no {}{}{} images.'.format(
                 KC_GREEN, scraper_name, const.KC_END, const.KC_ORANGE, asset_info.name, const.KC_END))
             st_dic['scrap_all_assets_do_not_print'] = True
             return
@@ -1405,14 +1432,14 @@ class ScrapeStrategy(object):
         # User canceled dialog
         if image_selected_index is None:
             log.debug('_scrap_CM_scrap_asset() User cancelled image select dialog. Returning.')
-            utils.set_error_status(st_dic, 'Select dialog canceled. '
+            kodi.set_error_status(st_dic, 'Select dialog canceled. '
                 '{} image not changed'.format(asset_info.name))
             st_dic['scrap_all_assets_do_not_print'] = True
             return
         # User chose to keep current asset.
         if local_asset_in_list_flag and image_selected_index == 0:
             log.debug('_scrap_CM_scrap_asset() Selected current image "{}"'.format(current_asset_FN.getPath()))
-            utils.set_error_status(st_dic, 'Selected current asset. '
+            kodi.set_error_status(st_dic, 'Selected current asset. '
                 '{}{}{} image not changed'.format(const.KC_ORANGE, asset_info.name, const.KC_END))
             st_dic['scrap_all_assets_do_not_print'] = True
             return
@@ -1429,7 +1456,7 @@ class ScrapeStrategy(object):
         log.debug('Resolved {} to URL "{}"'.format(asset_info.name, image_url_log))
         if not image_url:
             log.error('_scrap_CM_scrap_asset() Error in scraper.resolve_asset_URL()')
-            utils.set_error_status(st_dic, 'Error downloading asset')
+            kodi.set_error_status(st_dic, 'Error downloading asset')
             return
         pdialog.startProgress('Resolving URL extension with {}...'.format(scraper_name))
         image_ext = self.scraper_obj.resolve_asset_URL_extension(selected_asset, image_url, st_dic)
@@ -1437,7 +1464,7 @@ class ScrapeStrategy(object):
         log.debug('Resolved URL extension "{}"'.format(image_ext))
         if not image_ext:
             log.error('_scrap_CM_scrap_asset() Error in scraper.resolve_asset_URL_extension()')
-            utils.set_error_status(st_dic, 'Error downloading asset')
+            kodi.set_error_status(st_dic, 'Error downloading asset')
             return
 
         # --- Download image ---
@@ -1453,7 +1480,7 @@ class ScrapeStrategy(object):
         except socket.timeout:
             pdialog.endProgress()
             kodi_notify_warn('Cannot download {} image (Timeout)'.format(image_name))
-            utils.set_error_status(st_dic, 'Network timeout')
+            kodi.set_error_status(st_dic, 'Network timeout')
             return
         else:
             pdialog.endProgress()
@@ -1468,6 +1495,265 @@ class ScrapeStrategy(object):
         # In the DB always store original paths, never translated paths.
         object_dic[asset_info.key] = image_local_path_FN.getOriginalPath()
 
+    # Scrapes the missing artwork of all the ROMs of the launcher. Used by the "Scrape ROMs
+    # artwork" context menu, with the same scraper settings as the ROM scanner.
+    #
+    # 1) One pass over the ROMs finds the missing artwork with the asset file cache. ROM asset
+    #    fields are updated with the local artwork found.
+    # 2) ROM by ROM, the candidate game and the image URLs of the missing assets are resolved.
+    #    This uses the scraper disk caches and the scraper's own API throttling.
+    # 3) Images are downloaded concurrently by an AssetDownloadPool while the next ROMs are
+    #    resolved, within the download limits of the asset scraper.
+    #
+    # The first candidate game and the first image returned by the scraper are always used,
+    # whatever game_selection_mode and asset_selection_mode.
+    # Every BULK_CHECKPOINT_INTERVAL seconds the scraper disk caches are flushed and the ROMs
+    # finished are written to progress_FN. If the user cancels, or Kodi is killed, the next run
+    # does not scrape again the finished ROMs. Artwork already downloaded is found locally.
+    #
+    # Must be called after scanner_set_progress_dialog(), scanner_check_before_scraping()
+    # and scanner_check_launcher_unset_asset_dirs(), and with the asset file cache filled.
+    #
+    # @param roms: [dict] Launcher ROMs. Mutable and edited by assignment.
+    # @param progress_FN: [FileName] Progress file.
+    # @param pdialog: [ProgressDialog]
+    # @return: [dict] Report { BULK_* : int, ... }
+    def scrap_bulk_ROM_assets(self, roms, progress_FN, pdialog):
+        scraper_obj = self.asset_scraper_obj
+        report = { BULK_LOCAL : 0, BULK_DOWNLOADED : 0, BULK_NOT_FOUND : 0, BULK_SKIPPED : 0 }
+
+        # --- Resume an interrupted run ---
+        done_list = []
+        if progress_FN.exists():
+            progress = utils.load_JSON_file(progress_FN.getPath(), {}, verbose = False)
+            if progress and progress['launcherID'] == self.launcher['id']: done_list = progress['done']
+        done_set = set(done_list)
+
+        # --- Find missing artwork ---
+        scraped_asset_list = []
+        for i, asset_ID in enumerate(const.ROM_ASSET_ID_LIST):
+            if self.enabled_asset_list[i] and scraper_obj.supports_asset_ID(asset_ID):
+                scraped_asset_list.append(assets.ASSET_INFO_DICT[asset_ID])
+        work_list = []
+        pdialog.startProgress('Searching for missing artwork...', len(roms))
+        for romID in sorted(roms, key = lambda x : roms[x]['m_name']):
+            pdialog.updateProgressInc()
+            rom = roms[romID]
+            ROM_FN = utils.FileName(rom['filename'])
+            missing_list = []
+            for AInfo in scraped_asset_list:
+                local_asset = utils.file_cache_search(self.launcher[AInfo.path_key], ROM_FN.getBaseNoExt(), AInfo.exts)
+                if local_asset:
+                    rom[AInfo.key] = local_asset.getOriginalPath()
+                    report[BULK_LOCAL] += 1
+                elif rom[AInfo.key] and os.path.isfile(utils.FileName(rom[AInfo.key]).getPath()):
+                    report[BULK_LOCAL] += 1
+                else:
+                    missing_list.append(AInfo)
+            if not missing_list: continue
+            if romID in done_set:
+                report[BULK_SKIPPED] += len(missing_list)
+            else:
+                work_list.append((romID, ROM_FN, missing_list))
+        pdialog.endProgress()
+        log.info('ScrapeStrategy.scrap_bulk_ROM_assets() {} ROMs with missing artwork, {} done by a previous run'.format(
+            len(work_list), len(done_set)))
+
+        # --- Resolve image URLs and download images ---
+        download_pool = AssetDownloadPool()
+        pending_dic = {} # { romID : number of downloads not finished }
+        last_checkpoint = time.time()
+        canceled = False
+        pdialog.startProgress('Scraping artwork with {}...'.format(self.asset_scraper_name), len(work_list))
+        for romID, ROM_FN, missing_list in work_list:
+            pdialog.updateProgressIncThrottled('ROM [COLOR orange]{}[/COLOR]\n{} images downloading'.format(
+                ROM_FN.getBase(), download_pool.num_pending))
+            job_list = self._bulk_resolve_ROM_assets(roms[romID], ROM_FN, missing_list)
+            report[BULK_NOT_FOUND] += len(missing_list) - len(job_list)
+            if job_list:
+                pending_dic[romID] = len(job_list)
+                for asset_ID, image_url, image_path in job_list:
+                    download_pool.add_job(scraper_obj, (romID, asset_ID, image_url, image_path))
+            else:
+                done_list.append(romID)
+            for result in download_pool.get_results():
+                self._bulk_apply_download(roms, result, pending_dic, done_list, report)
+            if time.time() - last_checkpoint > BULK_CHECKPOINT_INTERVAL:
+                self._bulk_checkpoint(progress_FN, done_list)
+                last_checkpoint = time.time()
+            if pdialog.isCanceled():
+                canceled = True
+                break
+        pdialog.endProgress()
+
+        # --- Wait for the downloads not finished ---
+        if not canceled and download_pool.num_pending:
+            pdialog.startProgress('Downloading artwork...', download_pool.num_pending)
+            while download_pool.num_pending:
+                pdialog.updateProgressInc()
+                self._bulk_apply_download(roms, download_pool.get_result(), pending_dic, done_list, report)
+                if pdialog.isCanceled():
+                    canceled = True
+                    break
+            pdialog.endProgress()
+        for result in download_pool.close(cancel = canceled):
+            self._bulk_apply_download(roms, result, pending_dic, done_list, report)
+
+        # --- Save progress if interrupted, otherwise delete it ---
+        if canceled:
+            self._bulk_checkpoint(progress_FN, done_list)
+        elif progress_FN.exists():
+            progress_FN.unlink()
+        log.info('ScrapeStrategy.scrap_bulk_ROM_assets() {} local, {} downloaded, {} not found, {} skipped'.format(
+            report[BULK_LOCAL], report[BULK_DOWNLOADED], report[BULK_NOT_FOUND], report[BULK_SKIPPED]))
+
+        return report
+
+    # Returns a list of (asset_ID, image_url, image_path) of the ROM missing assets.
+    # Scraper errors are logged and the asset skipped. The bulk scraper does not stop.
+    def _bulk_resolve_ROM_assets(self, rom, ROM_FN, missing_list):
+        scraper_obj = self.asset_scraper_obj
+        st_dic = kodi.new_status_dic()
+        game_selection_mode = self.game_selection_mode
+        self.game_selection_mode = 1
+        self._scanner_get_candidate(rom, ROM_FN, ROM_FN, scraper_obj, self.asset_scraper_name, st_dic)
+        self.game_selection_mode = game_selection_mode
+        if not scraper_obj.candidate: return []
+        job_list = []
+        for AInfo in missing_list:
+            st_dic = kodi.new_status_dic()
+            assetdata_list = scraper_obj.get_assets(AInfo.id, st_dic)
+            if not st_dic['abort'] and assetdata_list:
+                selected_asset = assetdata_list[0]
+                image_url, image_url_log = scraper_obj.resolve_asset_URL(selected_asset, st_dic)
+            else:
+                image_url = None
+            if not st_dic['abort'] and image_url:
+                image_ext = scraper_obj.resolve_asset_URL_extension(selected_asset, image_url, st_dic)
+            else:
+                image_ext = None
+            if st_dic['abort']:
+                log.warning('ScrapeStrategy._bulk_resolve_ROM_assets() {}'.format(st_dic['msg']))
+            if not image_ext: continue
+            image_path = utils.FileName(self.launcher[AInfo.path_key]).pjoin(
+                ROM_FN.getBaseNoExt() + '.' + image_ext).getPath()
+            job_list.append((AInfo.id, image_url, image_path))
+
+        return job_list
+
+    def _bulk_apply_download(self, roms, result, pending_dic, done_list, report):
+        romID, asset_ID, image_path = result
+        if image_path:
+            roms[romID][assets.ASSET_INFO_DICT[asset_ID].key] = image_path
+            report[BULK_DOWNLOADED] += 1
+        else:
+            report[BULK_NOT_FOUND] += 1
+        pending_dic[romID] -= 1
+        if pending_dic[romID] == 0:
+            del pending_dic[romID]
+            done_list.append(romID)
+
+    def _bulk_checkpoint(self, progress_FN, done_list):
+        log.debug('ScrapeStrategy._bulk_checkpoint() {} ROMs done'.format(len(done_list)))
+        self.asset_scraper_obj.flush_disk_cache()
+        progress = { 'launcherID' : self.launcher['id'], 'done' : done_list }
+        utils.write_JSON_file(progress_FN.getPath(), progress, verbose = False)
+
+# ------------------------------------------------------------------------------------------------
+# Parallel asset downloads
+# ------------------------------------------------------------------------------------------------
+# Used by ScrapeStrategy.scrap_bulk_ROM_assets(). Jobs are grouped by scraper. Every scraper
+# has its own job queue and at most Scraper.DOWNLOAD_MAX_THREADS download threads, and the
+# downloads of a scraper start at least Scraper.DOWNLOAD_MIN_INTERVAL seconds apart.
+BULK_LOCAL      = 'local'      # Artwork found locally.
+BULK_DOWNLOADED = 'downloaded' # Artwork downloaded.
+BULK_NOT_FOUND  = 'not_found'  # Scraper found nothing or the download failed.
+BULK_SKIPPED    = 'skipped'    # Missing artwork of ROMs done by an interrupted run.
+BULK_CHECKPOINT_INTERVAL = 60
+
+# Shared by the download threads of a scraper. wait() blocks until a new download can start.
+class DownloadRateLimiter(object):
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.time()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.min_interval
+        if wait_time > 0: time.sleep(wait_time)
+
+class Threaded_Asset_Download(threading.Thread):
+    def __init__(self, job_queue, result_queue, cancel_event, rate_limiter):
+        threading.Thread.__init__(self)
+        self.job_queue = job_queue
+        self.result_queue = result_queue
+        self.cancel_event = cancel_event
+        self.rate_limiter = rate_limiter
+
+    # A None job stops the thread.
+    def run(self):
+        while True:
+            job = self.job_queue.get()
+            if job is None or self.cancel_event.is_set(): return
+            romID, asset_ID, image_url, image_path = job
+            self.rate_limiter.wait()
+            # network.download_img() does not create the file if the download fails.
+            network.download_img(image_url, image_path)
+            self.result_queue.put((romID, asset_ID, image_path if os.path.isfile(image_path) else ''))
+
+# Results are tuples (romID, asset_ID, image_path). image_path is empty if the download failed.
+class AssetDownloadPool(object):
+    def __init__(self):
+        self.pools = {} # { scraper name : (job_queue, [workers]) }
+        self.result_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.num_pending = 0
+
+    def add_job(self, scraper_obj, job):
+        scraper_name = scraper_obj.get_name()
+        if scraper_name not in self.pools:
+            log.debug('AssetDownloadPool.add_job() {} with {} threads, {} s interval'.format(
+                scraper_name, scraper_obj.DOWNLOAD_MAX_THREADS, scraper_obj.DOWNLOAD_MIN_INTERVAL))
+            job_queue = queue.Queue()
+            rate_limiter = DownloadRateLimiter(scraper_obj.DOWNLOAD_MIN_INTERVAL)
+            workers = [Threaded_Asset_Download(job_queue, self.result_queue, self.cancel_event, rate_limiter) \
+                for i in range(scraper_obj.DOWNLOAD_MAX_THREADS)]
+            for worker in workers: worker.start()
+            self.pools[scraper_name] = (job_queue, workers)
+        self.pools[scraper_name][0].put(job)
+        self.num_pending += 1
+
+    # Returns a list with the results available now. Does not block.
+    def get_results(self):
+        result_list = []
+        while True:
+            try:
+                result_list.append(self.result_queue.get_nowait())
+            except queue.Empty:
+                break
+        self.num_pending -= len(result_list)
+        return result_list
+
+    # Blocks until a result is available.
+    def get_result(self):
+        result = self.result_queue.get()
+        self.num_pending -= 1
+        return result
+
+    # Stops the threads. If cancel is False all the jobs are downloaded first, otherwise the
+    # jobs not started are discarded. Returns the results not retrieved yet.
+    def close(self, cancel = False):
+        if cancel: self.cancel_event.set()
+        for job_queue, workers in self.pools.values():
+            for worker in workers: job_queue.put(None)
+        for job_queue, workers in self.pools.values():
+            for worker in workers: worker.join()
+        self.pools = {}
+        return self.get_results()
+
 # Abstract base class for all scrapers (offline or online, metadata or asset).
 # The scrapers are Launcher and ROM agnostic. All the required Launcher/ROM properties are
 # stored in the strategy object.
@@ -1481,6 +1767,11 @@ class Scraper(object):
     # the number of API calls is exceeded).
     EXCEPTION_COUNTER_THRESHOLD = 5
 
+    # Image downloads of the bulk artwork scraper, see AssetDownloadPool. Scrapers with
+    # stricter limits override these.
+    DOWNLOAD_MAX_THREADS = 4
+    DOWNLOAD_MIN_INTERVAL = 0.0
+
     # Disk cache types. These strings will be part of the cache JSON file names.
     CACHE_CANDIDATES = 'candidates'
     CACHE_METADATA   = 'metadata'
@@ -1646,6 +1937,21 @@ class Scraper(object):
         self._update_disk_cache(Scraper.CACHE_CANDIDATES, self.cache_key, candidate)
         log.debug('Scrape.set_candidate() Added "{}" to cache'.format(self.cache_key))
 
+    # Scrapers able to resolve many ROMs with one request override this function to fill
+    # their disk caches before the ROM scanner loop. By default do nothing.
+    #
+    # @param rom_FN_list: [list of FileName] ROMs to be scanned.
+    # @param platform: [str] AEL platform.
+    # @param pdialog: [ProgressDialog] Optional progress dialog.
+    # @return: [int] Number of per-ROM requests saved.
+    def prefetch_candidates(self, rom_FN_list, platform, pdialog = None): return 0
+
+    # Fetch everything this scraper can fetch once per platform and store it in the disk
+    # caches. Scrapers with platform-wide data override this and call the parent function.
+    # Same parameters and return value as prefetch_candidates().
+    def warm_platform_cache(self, rom_FN_list, platform, pdialog = None):
+        return self.prefetch_candidates(rom_FN_list, platform, pdialog)
+
     # When the user decides to rescrape an item that was in the cache make sure all
     # the caches are purged.
     def clear_cache(self, rom_FN, platform):
@@ -2480,6 +2786,19 @@ class TheGamesDB(Scraper):
     def resolve_asset_URL_extension(self, selected_asset, image_url, st):
         return text_get_URL_extension(image_url)
 
+    # Genres and developers are platform independent and stored in the global caches. Fetch
+    # them before the scan so errors show up before scanning and not in the middle of it.
+    # They are requested once, not per ROM, so no per-ROM requests are saved here.
+    def warm_platform_cache(self, rom_FN_list, platform, pdialog = None):
+        num_saved = super(TheGamesDB, self).warm_platform_cache(rom_FN_list, platform, pdialog)
+        if self.scraper_disabled: return num_saved
+        st_dic = kodi.new_status_dic()
+        self._retrieve_genres(st_dic)
+        if kodi.is_error_status(st_dic): return num_saved
+        self._retrieve_developers(st_dic)
+
+        return num_saved
+
     # --- This class own methods -----------------------------------------------------------------
     def debug_get_platforms(self, st):
         log.debug('TheGamesDB.debug_get_platforms() BEGIN...')
@@ -2842,7 +3161,7 @@ class TheGamesDB(Scraper):
         log.error('Disabling TGDB scraper.')
         self.scraper_disabled = True
         err_msg = 'TGDB monthly allowance is {}. Scraper disabled.'.format(remaining_monthly_allowance)
-        utils.set_error_status(st_dic, err_msg)
+        kodi.set_error_status(st_dic, err_msg)
 
 # ------------------------------------------------------------------------------------------------
 # MobyGames online scraper.
@@ -2885,6 +3204,10 @@ class MobyGames(Scraper):
     URL_games     = 'https://api.mobygames.com/v1/games'
     URL_platforms = 'https://api.mobygames.com/v1/platforms'
 
+    # Images are served by the MobyGames CDN, not the API, but keep the load low.
+    DOWNLOAD_MAX_THREADS = 2
+    DOWNLOAD_MIN_INTERVAL = 0.5
+
     # --- Constructor ----------------------------------------------------------------------------
     def __init__(self, settings):
         # --- This scraper settings ---
@@ -2923,7 +3246,7 @@ class MobyGames(Scraper):
         log.error('MobyGames.check_before_scraping() MobiGames API key not configured.')
         log.error('MobyGames.check_before_scraping() Disabling MobyGames scraper.')
         self.scraper_disabled = True
-        utils.set_error_status(st_dic, 'AEL requires your MobyGames API key. '
+        kodi.set_error_status(st_dic, 'AEL requires your MobyGames API key. '
             'Visit https://www.mobygames.com/info/api for directions about how to get your key '
             'and introduce the API key in AEL addon settings.')
 
@@ -2938,7 +3261,7 @@ class MobyGames(Scraper):
         rombase_noext = rom_FN.getBaseNoExt()
 
         # --- Request is not cached. Get candidates and introduce in the cache ---
-        scraper_platform = AEL_platform_to_MobyGames(platform)
+        scraper_platform = platforms.AEL_platform_to_MobyGames(platform)
         log.debug('MobyGames.get_candidates() search_term        "{}"'.format(search_term))
         log.debug('MobyGames.get_candidates() rombase_noext      "{}"'.format(rombase_noext))
         log.debug('MobyGames.get_candidates() AEL platform       "{}"'.format(platform))
@@ -2994,7 +3317,7 @@ class MobyGames(Scraper):
             log.debug('MobyGames.get_assets() Scraper disabled. Returning empty data.')
             return []
 
-        asset_info = assets_get_info_scheme(asset_ID)
+        asset_info = assets.ASSET_INFO_DICT[asset_ID]
         log.debug('MobyGames.get_assets() Getting assets {} (ID {}) for candidate ID "{}"'.format(
             asset_info.name, asset_ID, self.candidate['id']))
 
@@ -3020,7 +3343,7 @@ class MobyGames(Scraper):
         return url, url_log
 
     def resolve_asset_URL_extension(self, selected_asset, image_url, st_dic):
-        return text_get_URL_extension(image_url)
+        return misc.get_URL_extension(image_url)
 
     # --- This class own methods -----------------------------------------------------------------
     def debug_get_platforms(self, st_dic):
@@ -3077,13 +3400,13 @@ class MobyGames(Scraper):
         return candidate_list
 
     def _parse_metadata_title(self, json_data):
-        title_str = json_data['title'] if 'title' in json_data else DEFAULT_META_TITLE
+        title_str = json_data['title'] if 'title' in json_data else const.DEFAULT_META_TITLE
 
         return title_str
 
     def _parse_metadata_year(self, json_data, scraper_platform):
         platform_data = json_data['platforms']
-        if len(platform_data) == 0: return DEFAULT_META_YEAR
+        if len(platform_data) == 0: return const.DEFAULT_META_YEAR
         for platform in platform_data:
             if platform['platform_id'] == int(scraper_platform):
                 return platform['first_release_date'][0:4]
@@ -3097,16 +3420,16 @@ class MobyGames(Scraper):
             for genre in json_data['genres']: genre_names.append(genre['genre_name'])
             genre_str = ', '.join(genre_names)
         else:
-            genre_str = DEFAULT_META_GENRE
+            genre_str = const.DEFAULT_META_GENRE
 
         return genre_str
 
     def _parse_metadata_plot(self, json_data):
         if 'description' in json_data:
             plot_str = json_data['description']
-            plot_str = text_remove_HTML_tags(plot_str) # Clean HTML tags like <i>, </i>
+            plot_str = misc.remove_HTML_tags(plot_str) # Clean HTML tags like <i>, </i>
         else:
-            plot_str = DEFAULT_META_PLOT
+            plot_str = const.DEFAULT_META_PLOT
 
         return plot_str
 
@@ -3151,9 +3474,9 @@ class MobyGames(Scraper):
             # Search for it
             caption_lower = image_data['caption'].lower()
             if caption_lower.find('title') >= 0:
-                asset_data['asset_ID'] = ASSET_TITLE_ID
+                asset_data['asset_ID'] = const.ASSET_TITLE_ID
             else:
-                asset_data['asset_ID'] = ASSET_SNAP_ID
+                asset_data['asset_ID'] = const.ASSET_SNAP_ID
             asset_data['display_name'] = image_data['caption']
             asset_data['url_thumb'] = image_data['thumbnail_image']
             # URL is not mandatory here but MobyGames provides it anyway.
@@ -3476,6 +3799,10 @@ class ScreenScraper(Scraper):
     # Time to wait in get_assets() in seconds (float) to avoid scraper overloading.
     TIME_WAIT_GET_ASSETS = 1.2
 
+    # Media downloads are API requests. Registered users without contribution have 1 thread.
+    DOWNLOAD_MAX_THREADS = 1
+    DOWNLOAD_MIN_INTERVAL = TIME_WAIT_GET_ASSETS
+
     # --- Constructor ----------------------------------------------------------------------------
     def __init__(self, settings):
         # --- This scraper settings ---
@@ -3536,7 +3863,7 @@ class ScreenScraper(Scraper):
         log.error('ScreenScraper.check_before_scraping() ScreenScraper user name and/or pass not configured.')
         log.error('ScreenScraper.check_before_scraping() Disabling ScreenScraper scraper.')
         self.scraper_deactivated = True
-        utils.set_error_status(st_dic, 'AEL requires your ScreenScraper user name and password. '
+        kodi.set_error_status(st_dic, 'AEL requires your ScreenScraper user name and password. '
             'Create a user account in https://www.screenscraper.fr/ '
             'and set you user name and password in AEL addon settings.')
 
@@ -3608,7 +3935,7 @@ class ScreenScraper(Scraper):
             log.debug('ScreenScraper.get_assets() Scraper disabled. Returning empty data.')
             return []
 
-        asset_info = assets_get_info_scheme(asset_ID)
+        asset_info = assets.ASSET_INFO_DICT[asset_ID]
         log.debug('ScreenScraper.get_assets() Getting assets {} (ID {}) for candidate ID = {}'.format(
             asset_info.name, asset_ID, self.candidate['id']))
 
@@ -3747,7 +4074,7 @@ class ScreenScraper(Scraper):
     # Debug test function for jeuRecherche.php (game search).
     def debug_game_search(self, search_term, rombase_noext, platform, st_dic):
         log.debug('ScreenScraper.debug_game_search() Calling jeuRecherche.php...')
-        scraper_platform = AEL_platform_to_ScreenScraper(platform)
+        scraper_platform = platforms.AEL_platform_to_ScreenScraper(platform)
         system_id = scraper_platform
         recherche = urllib.quote(rombase_noext)
         log.debug('ScreenScraper.debug_game_search() system_id  "{}"'.format(system_id))
@@ -3797,7 +4124,7 @@ class ScreenScraper(Scraper):
         else:
             checksums = self._get_SS_checksum(rom_checksums_FN)
             if checksums is None:
-                utils.set_error_status(st_dic, 'Error computing file checksums.')
+                kodi.set_error_status(st_dic, 'Error computing file checksums.')
                 return None
 
         # --- Actual data for scraping in AEL ---
@@ -3872,7 +4199,7 @@ class ScreenScraper(Scraper):
     def _search_candidates_jeuRecherche(self, search_term, rombase_noext, platform, scraper_platform, st_dic):
         # --- Actual data for scraping in AEL ---
         log.debug('ScreenScraper._search_candidates_jeuRecherche() Calling jeuRecherche.php...')
-        scraper_platform = AEL_platform_to_ScreenScraper(platform)
+        scraper_platform = platforms.AEL_platform_to_ScreenScraper(platform)
         system_id = scraper_platform
         if const.ADDON_RUNNING_PYTHON_2:
             recherche = urllib.quote_plus(rombase_noext)
@@ -3930,7 +4257,7 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_TITLE
+        return const.DEFAULT_META_TITLE
 
     def _parse_meta_year(self, jeu_dic):
         try:
@@ -3942,7 +4269,7 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_YEAR
+        return const.DEFAULT_META_YEAR
 
     # Use first genre only for now.
     def _parse_meta_genre(self, jeu_dic):
@@ -3956,7 +4283,7 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_GENRE
+        return const.DEFAULT_META_GENRE
 
     def _parse_meta_developer(self, jeu_dic):
         try:
@@ -3964,7 +4291,7 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_DEVELOPER
+        return const.DEFAULT_META_DEVELOPER
 
     def _parse_meta_nplayers(self, jeu_dic):
         # EAFP Easier to ask for forgiveness than permission.
@@ -3973,14 +4300,14 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_NPLAYERS
+        return const.DEFAULT_META_NPLAYERS
 
     # Do not working at the moment.
     def _parse_meta_esrb(self, jeu_dic):
         # if 'classifications' in jeu_dic and 'ESRB' in jeu_dic['classifications']:
         #     return jeu_dic['classifications']['ESRB']
 
-        return DEFAULT_META_ESRB
+        return const.DEFAULT_META_ESRB
 
     def _parse_meta_plot(self, jeu_dic):
         try:
@@ -3992,7 +4319,7 @@ class ScreenScraper(Scraper):
         except KeyError:
             pass
 
-        return DEFAULT_META_PLOT
+        return const.DEFAULT_META_PLOT
 
     # Get ALL available assets for game. Returns all assets found in the jeu_dic dictionary.
     # It is not necessary to cache this function because all the assets can be easily
@@ -4084,7 +4411,7 @@ class ScreenScraper(Scraper):
                 log.debug('_get_SS_checksum() Decompressing file "{}"'.format(namelist[0]))
                 file_bytes = zip.read(namelist[0])
                 log.debug('_get_SS_checksum() Decompressed size is {} bytes'.format(len(file_bytes)))
-                checksums = misc_calculate_stream_checksums(file_bytes)
+                checksums = misc.calculate_stream_checksums(file_bytes)
                 checksums['rom_name'] = namelist[0]
                 log.debug('_get_SS_checksum() ROM name is "{}"'.format(checksums['rom_name']))
                 return checksums
@@ -4094,7 +4421,7 @@ class ScreenScraper(Scraper):
         else:
             log.debug('_get_SS_checksum() File is not ZIP. Computing checksum of whole file.')
         # Otherwise calculate checksums of the whole file
-        checksums = misc_calculate_file_checksums(f_path)
+        checksums = misc.calculate_file_checksums(f_path)
         checksums['rom_name'] = f_basename
         log.debug('_get_SS_checksum() ROM name is "{}"'.format(checksums['rom_name']))
 
@@ -4132,68 +4459,29 @@ class ScreenScraper(Scraper):
 
     # Reimplementation of base class method.
     # ScreenScraper needs URL cleaning in JSON before dumping because URL have passwords.
-    # Only clean data if JSON file is dumped.
+    # Only clean data if JSON file is dumped. Data is cleaned in a copy because the scraper
+    # keeps using the original data.
     def _dump_json_debug(self, file_name, json_data):
         if not self.dump_file_flag: return
-        json_data_clean = self._clean_JSON_for_dumping(json_data)
-        super(ScreenScraper, self)._dump_json_debug(file_name, json_data)
-
-    # JSON recursive iterator generator. Keeps also track of JSON keys.
-    # yield from added in Python 3.3
-    # https://stackoverflow.com/questions/38397285/iterate-over-all-items-in-json-object
-    # https://stackoverflow.com/questions/14692690/access-nested-dictionary-items-via-a-list-of-keys
-    def _recursive_iter(self, obj, keys = ()):
-        if isinstance(obj, dict):
-            # Old P2 code: for k, v in obj.iteritems():
-            # Change when P3 version is established.
-            for k in obj:
-                v = obj[k]
-                # yield from self._recursive_iter(item)
-                for k_t, v_t in self._recursive_iter(v, keys + (k,)):
-                    yield k_t, v_t
-        elif any(isinstance(obj, t) for t in (list, tuple)):
-            for idx, item in enumerate(obj):
-                # yield from recursive_iter(item, keys + (idx,))
-                for k_t, v_t in self._recursive_iter(item, keys + (idx,)):
-                    yield k_t, v_t
-        else:
-            yield keys, obj
-
-    # Get a given data from a dictionary with position provided as a list (iterable)
-    # Example maplist = ["b", "v", "y"] or ("b", "v", "y")
-    def _getFromDict(self, dataDict, mapList):
-        for k in mapList: dataDict = dataDict[k]
-
-        return dataDict
+        json_data_clean = copy.deepcopy(json_data)
+        self._clean_JSON_for_dumping(json_data_clean)
+        super(ScreenScraper, self)._dump_json_debug(file_name, json_data_clean)
 
     # Recursively cleans URLs in a JSON data structure for safe JSON file data dumping.
+    # json_data dictionary/list is modified by assigment.
     def _clean_JSON_for_dumping(self, json_data):
-        # --- Recursively iterate data ---
-        # Do not modify dictionary when it is recursively iterated.
-        URL_key_list = []
-        log.debug('ScreenScraper._clean_JSON_for_dumping() Cleaning JSON URLs.')
-        for keys, item in self._recursive_iter(json_data):
-            # log.debug('{} "{}"'.format(keys, item))
-            # log.debug('Type item "{}"'.format(type(item)))
-            # Skip non string objects.
-            if not isinstance(item, const.binary_type) and not isinstance(item, const.text_type): continue
-            if item.startswith('http'):
-                # log.debug('Adding URL "{}"'.format(item))
-                URL_key_list.append(keys)
-
-        # --- Do the actual cleaning ---
-        for keys in URL_key_list:
-            # log.debug('Cleaning "{}"'.format(keys))
-            url = self._getFromDict(json_data, keys)
-            clean_url = self._clean_URL_for_log(url)
-            # log.debug('Cleaned  "{}"'.format(clean_url))
-            self._setInDict(json_data, keys, clean_url)
-        log.debug('ScreenScraper._clean_JSON_for_dumping() Cleaned {} URLs'.format(len(URL_key_list)))
-
-    # Set a given data in a dictionary with position provided as a list (iterable)
-    def _setInDict(self, dataDict, mapList, value):
-        for k in mapList[:-1]: dataDict = dataDict[k]
-        dataDict[mapList[-1]] = value
+        if isinstance(json_data, dict):
+            key_iterator = list(json_data.keys())
+        elif isinstance(json_data, list):
+            key_iterator = range(len(json_data))
+        else:
+            return
+        for key in key_iterator:
+            item = json_data[key]
+            if isinstance(item, const.text_type) and item.startswith('http'):
+                json_data[key] = self._clean_URL_for_log(item)
+            else:
+                self._clean_JSON_for_dumping(item)
 
     # Retrieve URL and decode JSON object.
     #
@@ -4229,45 +4517,16 @@ class ScreenScraper(Scraper):
             self._handle_error(st_dic, 'Network error/exception in network.get_URL()')
             return None
 
-        # Convert data to JSON.
-        try:
-            return json.loads(page_data_raw)
-        except Exception as ex:
-            log.error('Error decoding JSON data from ScreenScraper.')
-
-        # This point is reached if there was an exception decoding JSON.
-        # Sometimes ScreenScraper API V2 returns badly formatted JSON. Try to fix this.
+        # Convert data to JSON. Sometimes ScreenScraper API V2 returns badly formatted JSON
+        # with trailing commas at the end of the file. decode_tolerant_JSON() fixes them.
         # See https://github.com/muldjord/skyscraper/blob/master/src/screenscraper.cpp
-        # The badly formatted JSON is at the end of the file, for example:
-        #			],     <----- Here it should be a ']' and not '],'.
-        #		}
-        #	}
-        #}
-        log.error('Trying to repair ScreenScraper raw data (Try 1).')
-        new_page_data_raw = page_data_raw.replace('],\n\t\t}', ']\n\t\t}')
         try:
-            return json.loads(new_page_data_raw)
+            return misc.decode_tolerant_JSON(page_data_raw)
         except Exception as ex:
-            log.error('Error decoding JSON data from ScreenScraper (Try 1).')
-
-        # At the end of the JSON data file...
-        #		},         <----- Here it should be a '}' and not '},'.
-        #		}
-        #	}
-        #
-        log.error('Trying to repair ScreenScraper raw data (Try 2).')
-        new_page_data_raw = page_data_raw.replace('\t\t},\n\t\t}', '\t\t}\n\t\t}')
-        try:
-            return json.loads(new_page_data_raw)
-        except Exception as ex:
-            log.error('Error decoding JSON data from ScreenScraper (Try 2).')
-            log.error('Cannot decode JSON (invalid JSON returned). Dumping debug files...')
-            file_path = os.path.join(self.scraper_cache_dir, 'ScreenScraper_url.txt')
-            self._write_str_to_file(file_path, url)
-            file_path = os.path.join(self.scraper_cache_dir, 'ScreenScraper_page_data_raw.txt')
-            self._write_str_to_file(file_path, page_data_raw)
-            self._handle_exception(ex, st_dic,
-                'Error decoding JSON data from ScreenScraper (fixed version).')
+            log.error('Cannot decode JSON (invalid JSON returned).')
+            self._dump_file_debug('ScreenScraper_url.txt', self._clean_URL_for_log(url))
+            self._dump_file_debug('ScreenScraper_page_data_raw.txt', page_data_raw)
+            self._handle_exception(ex, st_dic, 'Error decoding JSON data from ScreenScraper.')
             return None
 
     # All ScreenScraper URLs must have these arguments.
@@ -4297,6 +4556,91 @@ class ScreenScraper(Scraper):
         # Update waiting time for next call.
         self.last_get_assets_call = datetime.datetime.now()
 
+# ------------------------------------------------------------------------------------------------
+# GameFAQs page extractors.
+#
+# Each extractor gets all the fields the GameFAQs scraper needs from one page type. Regular
+# expressions are compiled once when the module is loaded. The page text must be joined into
+# one line like network.get_URL_oneline() does.
+# ------------------------------------------------------------------------------------------------
+# Search results page. Returns a list of tuples (platform, game URL, game name).
+#
+# <div class="sr_cell sr_platform">SNES</div>
+# <div class="sr_cell sr_title"><a class="log_search" data-row="1" data-col="1" data-pid="519824" href="/snes/519824-super-mario-world">Super Mario World</a></div>
+# <div class="sr_cell sr_release">1990</div>
+GAMEFAQS_SEARCH_RE = re.compile(
+    r'<div class="sr_cell sr_platform">(.*?)</div>\s*<div class="sr_cell sr_title">'
+    r'<a class="log_search" data-row="[0-9]+" data-col="1" data-pid="[0-9]+" href="(.*?)">(.*?)</a></div>')
+
+def GameFAQs_parse_search_page(page_data):
+    return [(m[0], m[1], misc.unescape_HTML(m[2])) for m in GAMEFAQS_SEARCH_RE.findall(page_data)]
+
+# Game page. Returns a dictionary with keys year, genre, developer and plot.
+# Only the first genre is returned.
+#
+# <li><b>Release:</b> <a href="/snes/519824-super-mario-world/data">August 13, 1991</a></li>
+# <li><b>Genre:</b> <a href="/snes/category/163-action-adventure">Action Adventure</a> &raquo; ...
+# <li><b>Developer/Publisher: </b><a href="/company/2324-capcom">Capcom</a></li>
+# <li><b>Developer: </b><a href="/company/45872-intelligent-systems">Intelligent Systems</a></li>
+# <script type="application/ld+json">{ "name":"Super Metroid", "description":"...", ... }</script>
+GAMEFAQS_RELEASE_RE = re.compile('<li><b>Release:</b> <a href=".*?">(.*?)</a></li>')
+GAMEFAQS_YEAR_RE = re.compile(r'\d\d\d\d')
+GAMEFAQS_GENRE_RE = re.compile('<li><b>Genre:</b> <a href=".*?">(.*?)</a>')
+GAMEFAQS_DEVPUB_RE = re.compile('<li><b>Developer/Publisher: </b><a href=".*?">(.*?)</a></li>')
+GAMEFAQS_DEVELOPER_RE = re.compile('<li><b>Developer: </b><a href=".*?">(.*?)</a></li>')
+GAMEFAQS_PLOT_RE = re.compile('"description":"(.*?)",')
+
+def GameFAQs_parse_game_page(page_data):
+    m_date = GAMEFAQS_RELEASE_RE.search(page_data)
+    m_year = GAMEFAQS_YEAR_RE.search(m_date.group(1)) if m_date else None
+    m_genre = GAMEFAQS_GENRE_RE.search(page_data)
+    m_dev_a = GAMEFAQS_DEVPUB_RE.search(page_data)
+    m_dev_b = GAMEFAQS_DEVELOPER_RE.search(page_data) if not m_dev_a else None
+    if   m_dev_a: developer = m_dev_a.group(1)
+    elif m_dev_b: developer = m_dev_b.group(1)
+    else:         developer = ''
+    m_plot = GAMEFAQS_PLOT_RE.search(page_data)
+
+    return {
+        'year' : m_year.group(0) if m_year else '',
+        'genre' : m_genre.group(1) if m_genre else '',
+        'developer' : developer,
+        'plot' : misc.unescape_HTML(m_plot.group(1)) if m_plot else '',
+    }
+
+# Game images page. Returns a list of tuples (table title, image list). Each image in the
+# image list is a tuple (image page URL, thumb URL, alt text).
+#
+# <div class="head"><h2 class="title">Game Box Shots</h2></div>
+# <div class="body"><table class="contrib"><tr><td class="thumb">
+# <a href="/genesis/563316-chakan/images/145463">
+#   <img class="img100 imgboxart" src="https://gamefaqs.akamaized.net/box/3/1/7/2317_thumb.jpg" alt="Chakan (US)" />
+# </a>
+GAMEFAQS_IMAGE_TABLE_RE = re.compile(
+    r'<div class="head"><h2 class="title">([\w\s]+?)</h2></div>'
+    r'<div class="body"><table class="contrib">(.*?)</table></div>')
+GAMEFAQS_IMAGE_THUMB_RE = re.compile(
+    r'<a href="(?P<lnk>.+?)"><img class="(img100\s)?imgboxart" src="(?P<thumb>.+?)" (alt="(?P<alt>.+?)")?\s?/></a>')
+
+def GameFAQs_parse_images_page(page_data):
+    table_list = []
+    for table_title, table_data in GAMEFAQS_IMAGE_TABLE_RE.findall(page_data):
+        image_list = [(m.group('lnk'), m.group('thumb'), m.group('alt') or '') \
+            for m in GAMEFAQS_IMAGE_THUMB_RE.finditer(table_data)]
+        table_list.append((table_title, image_list))
+
+    return table_list
+
+# Image page. Returns a list of tuples (image URL, alt text).
+#
+# <img class="full_boxshot cte" data-img-width="640" data-img-height="480" data-img="https://..." src="..." alt="Chakan (US) Box Front">
+GAMEFAQS_IMAGE_RE = re.compile(
+    r'<img (class="full_boxshot cte" )?data-img-width="\d+" data-img-height="\d+" '
+    r'data-img="(?P<url>.+?)" (class="full_boxshot cte" )?src=".+?" alt="(?P<alt>.+?)"(\s/)?>')
+
+def GameFAQs_parse_image_page(page_data):
+    return [(m.group('url'), m.group('alt')) for m in GAMEFAQS_IMAGE_RE.finditer(page_data)]
+
 # ------------------------------------------------------------------------------------------------
 # GameFAQs online scraper.
 #
@@ -4318,13 +4662,24 @@ class GameFAQs(Scraper):
         const.ASSET_BOXFRONT_ID,
         const.ASSET_BOXBACK_ID,
     ]
+    URL_base   = 'https://gamefaqs.gamespot.com'
+    URL_search = 'https://gamefaqs.gamespot.com/search_advanced'
+
+    # Maximum number of parsed pages kept in the page cache.
+    PAGE_CACHE_SIZE = 64
+
+    # GameFAQs blocks clients making too many requests.
+    DOWNLOAD_MAX_THREADS = 1
+    DOWNLOAD_MIN_INTERVAL = 1.0
 
     # --- Constructor ----------------------------------------------------------------------------
     def __init__(self, settings):
         # --- This scraper settings ---
 
         # --- Internal stuff ---
-        self.all_asset_cache = {}
+        # Parsed pages cache. Keys are the page URLs and values the parser results. Metadata
+        # and assets of the same candidate never download or parse the same page twice.
+        self.page_cache = collections.OrderedDict()
 
         # --- Pass down common scraper settings ---
         super(GameFAQs, self).__init__(settings)
@@ -4339,12 +4694,12 @@ class GameFAQs(Scraper):
     def supports_search_string(self): return True
 
     def supports_metadata_ID(self, metadata_ID):
-        return True if asset_ID in ScreenScraper_V1.supported_metadata_list else False
+        return True if metadata_ID in GameFAQs.supported_metadata_list else False
 
     def supports_metadata(self): return True
 
     def supports_asset_ID(self, asset_ID):
-        return True if asset_ID in ScreenScraper_V1.supported_asset_list else False
+        return True if asset_ID in GameFAQs.supported_asset_list else False
 
     def supports_assets(self): return True
 
@@ -4353,52 +4708,67 @@ class GameFAQs(Scraper):
     def check_before_scraping(self, st_dic): return st_dic
 
     def get_candidates(self, search_term, rom_FN, rom_checksums_FN, platform, st_dic):
-        scraper_platform = AEL_platform_to_GameFAQs(platform)
+        # If the scraper is disabled return None and do not mark error in st_dic.
+        if self.scraper_disabled:
+            log.debug('GameFAQs.get_candidates() Scraper disabled. Returning empty data.')
+            return None
+
+        rombase_noext = rom_FN.getBaseNoExt()
+        scraper_platform = platforms.AEL_platform_to_GameFAQs(platform)
         log.debug('GameFAQs.get_candidates() search_term      "{}"'.format(search_term))
         log.debug('GameFAQs.get_candidates() rombase_noext    "{}"'.format(rombase_noext))
         log.debug('GameFAQs.get_candidates() platform         "{}"'.format(platform))
         log.debug('GameFAQs.get_candidates() scraper_platform "{}"'.format(scraper_platform))
+        candidate_list = self._get_candidates_from_page(search_term, platform, scraper_platform, st_dic)
+        if kodi.is_error_status(st_dic): return None
 
-        # Order list based on score
-        game_list = self._get_candidates_from_page(search_term, platform, scraper_platform)
-        game_list.sort(key = lambda result: result['order'], reverse = True)
-
-        return game_list
+        return candidate_list
 
     # --- Example URLs ---
     # https://gamefaqs.gamespot.com/snes/519824-super-mario-world
     def get_metadata(self, st_dic):
-        # --- Grab game information page ---
-        log.debug('GameFAQs._scraper_get_metadata() Get metadata from {}'.format(candidate['id']))
-        url = 'https://gamefaqs.gamespot.com{}'.format(candidate['id'])
-        page_data = network.get_URL(url)
-        self._dump_file_debug('GameFAQs_get_metadata.html', page_data)
+        # --- If scraper is disabled return immediately and silently ---
+        if self.scraper_disabled:
+            log.debug('GameFAQs.get_metadata() Scraper disabled. Returning empty data.')
+            return self._new_gamedata_dic()
 
-        # --- Parse data ---
-        game_year      = self._parse_year(page_data)
-        game_genre     = self._parse_genre(page_data)
-        game_developer = self._parse_developer(page_data)
-        game_plot      = self._parse_plot(page_data)
+        # --- Check if search term is in the cache ---
+        if self._check_disk_cache(Scraper.CACHE_METADATA, self.cache_key):
+            log.debug('GameFAQs.get_metadata() Metadata cache hit "{}"'.format(self.cache_key))
+            return self._retrieve_from_disk_cache(Scraper.CACHE_METADATA, self.cache_key)
+
+        # --- Grab game information page ---
+        log.debug('GameFAQs.get_metadata() Metadata cache miss "{}"'.format(self.cache_key))
+        url = GameFAQs.URL_base + self.candidate['id']
+        page_dic = self._get_parsed_page(url, GameFAQs_parse_game_page,
+            'GameFAQs_get_metadata.html', st_dic)
+        if kodi.is_error_status(st_dic): return None
 
         # --- Build metadata dictionary ---
-        game_data = self._new_gamedata_dic()
-        game_data['title']     = candidate['game_name']
-        game_data['year']      = game_year
-        game_data['genre']     = game_genre
-        game_data['developer'] = game_developer
-        game_data['nplayers']  = ''
-        game_data['esrb']      = ''
-        game_data['plot']      = game_plot
+        gamedata = self._new_gamedata_dic()
+        gamedata['title']     = self.candidate['game_name']
+        gamedata['year']      = page_dic['year']
+        gamedata['genre']     = page_dic['genre']
+        gamedata['developer'] = page_dic['developer']
+        gamedata['plot']      = page_dic['plot']
 
-        return game_data
+        # --- Put metadata in the cache ---
+        log.debug('GameFAQs.get_metadata() Adding to metadata cache "{}"'.format(self.cache_key))
+        self._update_disk_cache(Scraper.CACHE_METADATA, self.cache_key, gamedata)
+
+        return gamedata
 
     def get_assets(self, asset_ID, st_dic):
-        # log.debug('GameFAQs._scraper_get_assets() asset_ID = {} ...'.format(asset_ID))
-        # Get all assets for candidate. _scraper_get_assets_all() caches all assets for a candidate.
-        # Then select asset of a particular type.
-        all_asset_list = self._scraper_get_assets_all(candidate)
+        # --- If scraper is disabled return immediately and silently ---
+        if self.scraper_disabled:
+            log.debug('GameFAQs.get_assets() Scraper disabled. Returning empty data.')
+            return []
+        # Get all assets for candidate. The images page is parsed only once per candidate
+        # thanks to the page cache. Then select asset of a particular type.
+        all_asset_list = self._load_assets_from_page(self.candidate, st_dic)
+        if kodi.is_error_status(st_dic): return None
         asset_list = [asset_dic for asset_dic in all_asset_list if asset_dic['asset_ID'] == asset_ID]
-        log.debug('GameFAQs._scraper_get_assets() Total assets {} / Returned assets {1}'.format(
+        log.debug('GameFAQs.get_assets() Total assets {} / Returned assets {}'.format(
             len(all_asset_list), len(asset_list)))
 
         return asset_list
@@ -4414,23 +4784,21 @@ class GameFAQs(Scraper):
     # Screenshot examples:
     # https://gamefaqs.gamespot.com/snes/519824-super-mario-world/images/21
     # https://gamefaqs.gamespot.com/snes/519824-super-mario-world/images/29
-    def resolve_asset_URL(self, candidate, st_dic):
-        url = 'https://gamefaqs.gamespot.com{}'.format(candidate['url'])
-        log.debug('GameFAQs._scraper_resolve_asset_URL() Get image from "{}" for asset type {}'.format(
-            url, asset_info.name))
-        page_data = network.get_URL(url)
-        self._dump_json_debug('GameFAQs_scraper_resolve_asset_URL.html', page_data)
-
-        r_str = '<img (class="full_boxshot cte" )?data-img-width="\d+" data-img-height="\d+" data-img="(?P<url>.+?)" (class="full_boxshot cte" )?src=".+?" alt="(?P<alt>.+?)"(\s/)?>'
-        images_on_page = re.finditer(r_str, page_data)
-        for image_data in images_on_page:
-            image_on_page = image_data.groupdict()
-            image_asset_ids = self._parse_asset_type(image_on_page['alt'])
-            log.debug('Found "{}" of types {} with url {}'.format(image_on_page['alt'], image_asset_ids, image_on_page['url']))
-            if asset_info.id in image_asset_ids:
-                log.debug('GameFAQs._scraper_resolve_asset_URL() Found match {}'.format(image_on_page['alt']))
-                return image_on_page['url']
-        log.debug('GameFAQs._scraper_resolve_asset_URL() No correct match')
+    def resolve_asset_URL(self, selected_asset, st_dic):
+        url = GameFAQs.URL_base + selected_asset['url']
+        log.debug('GameFAQs.resolve_asset_URL() Get image from "{}" for asset ID {}'.format(
+            url, selected_asset['asset_ID']))
+        image_list = self._get_parsed_page(url, GameFAQs_parse_image_page,
+            'GameFAQs_resolve_asset_URL.html', st_dic)
+        if kodi.is_error_status(st_dic): return None, None
+
+        for image_url, image_alt in image_list:
+            image_asset_ids = self._parse_asset_type(image_alt)
+            log.debug('Found "{}" of types {} with url {}'.format(image_alt, image_asset_ids, image_url))
+            if selected_asset['asset_ID'] in image_asset_ids:
+                log.debug('GameFAQs.resolve_asset_URL() Found match {}'.format(image_alt))
+                return image_url, image_url
+        log.debug('GameFAQs.resolve_asset_URL() No correct match')
 
         return '', ''
 
@@ -4439,140 +4807,83 @@ class GameFAQs(Scraper):
 
     # --- This class own methods -----------------------------------------------------------------
     def _parse_asset_type(self, header):
-        if 'Screenshots' in header: return [ASSET_SNAP_ID, ASSET_TITLE_ID]
-        elif 'Box Back' in header:  return [ASSET_BOXBACK_ID]
-        elif 'Box Front' in header: return [ASSET_BOXFRONT_ID]
-        elif 'Box' in header:       return [ASSET_BOXFRONT_ID, ASSET_BOXBACK_ID]
+        if 'Screenshots' in header: return [const.ASSET_SNAP_ID, const.ASSET_TITLE_ID]
+        elif 'Box Back' in header:  return [const.ASSET_BOXBACK_ID]
+        elif 'Box Front' in header: return [const.ASSET_BOXFRONT_ID]
+        elif 'Box' in header:       return [const.ASSET_BOXFRONT_ID, const.ASSET_BOXBACK_ID]
+
+        return [const.ASSET_SNAP_ID]
+
+    # Download a page and parse it with the page extractor parse_function. Parsed pages are
+    # cached so each page is downloaded and parsed only once. If post_data is not None the
+    # page is requested with POST.
+    # Returns None if error/exception.
+    def _get_parsed_page(self, url, parse_function, dump_fname, st_dic, post_data = None):
+        cache_key = url if post_data is None else url + '?' + post_data
+        if cache_key in self.page_cache:
+            log.debug('GameFAQs._get_parsed_page() Page cache hit "{}"'.format(cache_key))
+            return self.page_cache[cache_key]
+        log.debug('GameFAQs._get_parsed_page() Page cache miss "{}"'.format(cache_key))
+
+        if post_data is None:
+            page_data, http_code = network.get_URL(url)
+            if page_data is None or http_code != 200:
+                self._handle_error(st_dic, 'Error getting GameFAQs page (HTTP code {})'.format(http_code))
+                return None
+        else:
+            page_data = network.post_URL(url, post_data.encode('utf-8'))
+            if not page_data:
+                self._handle_error(st_dic, 'Error getting GameFAQs page (POST)')
+                return None
+        self._dump_file_debug(dump_fname, page_data)
+
+        # --- Put all page text into one line for the page extractors ---
+        page_data = page_data.replace('\r\n', '').replace('\n', '')
+        try:
+            parsed_data = parse_function(page_data)
+        except Exception as ex:
+            self._handle_exception(ex, st_dic, 'Error parsing GameFAQs page.')
+            return None
+        if len(self.page_cache) >= GameFAQs.PAGE_CACHE_SIZE: self.page_cache.popitem(last = False)
+        self.page_cache[cache_key] = parsed_data
 
-        return [ASSET_SNAP_ID]
+        return parsed_data
 
     # Deactivate the recursive search with no platform if no games found with platform.
-    # Could be added later.
-    def _get_candidates_from_page(self, search_term, platform, scraper_platform, url = None):
-        # --- Get URL data as a text string ---
-        if url is None:
-            url = 'https://gamefaqs.gamespot.com/search_advanced'
-            data = urllib.urlencode({'game': search_term, 'platform': scraper_platform})
-            page_data = net_post_URL(url, data)
+    # Could be added later. Just get all the games on the first page which should be
+    # more than enough.
+    def _get_candidates_from_page(self, search_term, platform, scraper_platform, st_dic):
+        search_dic = {'game' : search_term.encode('utf-8'), 'platform' : scraper_platform}
+        if const.ADDON_RUNNING_PYTHON_2:
+            post_data = urllib.urlencode(search_dic)
+        elif const.ADDON_RUNNING_PYTHON_3:
+            post_data = urllib.parse.urlencode(search_dic)
         else:
-            page_data = network.get_URL(url)
-        self._dump_file_debug('GameFAQs_get_candidates.html', page_data)
+            raise TypeError('Undefined Python runtime version.')
+        results = self._get_parsed_page(GameFAQs.URL_search, GameFAQs_parse_search_page,
+            'GameFAQs_get_candidates.html', st_dic, post_data)
+        if kodi.is_error_status(st_dic): return None
 
         # --- Parse game list ---
-        # --- First row ---
-        # <div class="sr_cell sr_platform">Platform</div>
-        # <div class="sr_cell sr_title">Game</div>
-        # <div class="sr_cell sr_release">Release</div>
-        #
-        # --- Game row ---
-        # <div class="sr_cell sr_platform">SNES</div>
-        # <div class="sr_cell sr_title"><a class="log_search" data-row="1" data-col="1" data-pid="519824" href="/snes/519824-super-mario-world">Super Mario World</a></div>
-        # <div class="sr_cell sr_release">1990</div>
-        r = r'<div class="sr_cell sr_platform">(.*?)</div>\s*<div class="sr_cell sr_title"><a class="log_search" data-row="[0-9]+" data-col="1" data-pid="[0-9]+" href="(.*?)">(.*?)</a></div>'
-        regex_results = re.findall(r, page_data, re.MULTILINE)
-        game_list = []
-        for result in regex_results:
-            game = self._new_candidate_dic()
-            game_platform = result[0]
-            game_id       = result[1]
-            game_name     = text_unescape_HTML(result[2])
-            game['id']               = result[1]
-            game['display_name']     = game_name + ' / ' + game_platform.capitalize()
-            game['platform']         = platform
-            game['scraper_platform'] = scraper_platform
-            game['order']            = 1
-            game['game_name']        = game_name # Additional GameFAQs scraper field
-            # Skip first row of the games table.
-            if game_name == 'Game': continue
+        candidate_list = []
+        for game_platform, game_id, game_name in results:
+            candidate = self._new_candidate_dic()
+            candidate['id']               = game_id
+            candidate['display_name']     = game_name + ' / ' + game_platform.capitalize()
+            candidate['platform']         = platform
+            candidate['scraper_platform'] = scraper_platform
+            candidate['order']            = 1
+            candidate['game_name']        = game_name # Additional GameFAQs scraper field
             # Increase search score based on our own search.
             # In the future use an scoring algortihm based on Levenshtein distance.
-            title = game_name
-            if title.lower() == search_term.lower():          game['order'] += 1
-            if title.lower().find(search_term.lower()) != -1: game['order'] += 1
-            if platform > 0 and game_platform == platform:    game['order'] += 1
-            game_list.append(game)
-
-        # --- Recursively load more games ---
-        # Deactivate for now, just get all the games on the first page which should be
-        # more than enough.
-        # next_page_result = re.findall('<li><a href="(\S*?)">Next Page\s<i', page_data, re.MULTILINE)
-        # if len(next_page_result) > 0:
-        #     link = next_page_result[0].replace('&amp;', '&')
-        #     new_url = 'https://gamefaqs.gamespot.com' + link
-        #     game_list = game_list + self._get_candidates_from_page(search_term, no_platform, new_url)
+            if game_name.lower() == search_term.lower():          candidate['order'] += 1
+            if game_name.lower().find(search_term.lower()) != -1: candidate['order'] += 1
+            candidate_list.append(candidate)
 
         # --- Sort game list based on the score ---
-        game_list.sort(key = lambda result: result['order'], reverse = True)
-
-        return game_list
-
-    #
-    # Functions to parse metadata from game web page.
-    #
-    def _parse_year(self, page_data):
-        # <li><b>Release:</b> <a href="/snes/519824-super-mario-world/data">August 13, 1991</a></li>
-        # <li><b>Release:</b> <a href="/snes/588699-street-fighter-alpha-2/data">November 1996</a></li>
-        re_str = '<li><b>Release:</b> <a href=".*?">(.*?)</a></li>'
-        m_date = re.search(re_str, page_data)
-        game_year = ''
-        if m_date:
-            # Matches the year in the date string.
-            date_str = m_date.group(1)
-            m_year = re.search('\d\d\d\d', date_str)
-            if m_year: game_year = m_year.group(0)
-
-        return game_year
-
-    def _parse_genre(self, page_data):
-        # Parse only the first genre. Later versions will parse all the genres and return a list.
-        # <li><b>Genre:</b> <a href="/snes/category/163-action-adventure">Action Adventure</a> &raquo; <a href="/snes/category/292-action-adventure-open-world">Open-World</a>
-        m_genre = re.search('<li><b>Genre:</b> <a href=".*?">(.*?)</a>', page_data)
-        if m_genre: game_genre = m_genre.group(1)
-
-        return game_genre
-
-    def _parse_developer(self, page_data):
-        # --- Developer and publisher are the same
-        # <li><b>Developer/Publisher: </b><a href="/company/2324-capcom">Capcom</a></li>
-        # --- Developer and publisher separated
-        # <li><b>Developer:</b> <a href="/company/45872-intelligent-systems">Intelligent Systems</a></li>
-        # <li><b>Publisher:</b> <a href="/company/1143-nintendo">Nintendo</a></li>
-        m_dev_a = re.search('<li><b>Developer/Publisher: </b><a href=".*?">(.*?)</a></li>', page_data)
-        m_dev_b = re.search('<li><b>Developer: </b><a href=".*?">(.*?)</a></li>', page_data)
-        if   m_dev_a: game_developer = m_dev_a.group(1)
-        elif m_dev_b: game_developer = m_dev_b.group(1)
-        else:         game_developer = ''
-
-        return game_developer
-
-    def _parse_plot(self, page_data):
-        # <script type="application/ld+json">
-        # {
-        #     "name":"Super Metroid",
-        #     "description":"Take on a legion of Space Pirates ....",
-        #     "keywords":"" }
-        # </script>
-        m_plot = re.search('"description":"(.*?)",', page_data)
-        if m_plot: game_plot = m_plot.group(1)
-
-        return game_plot
-
-    # Get ALL available assets for game.
-    # Cache the results because this function may be called multiple times for the
-    # same candidate game.
-    def _scraper_get_assets_all(self, candidate):
-        cache_key = const.text_type(candidate['id'])
-        if cache_key in self.all_asset_cache:
-            log.debug('MobyGames._scraper_get_assets_all() Cache hit "{}"'.format(cache_key))
-            asset_list = self.all_asset_cache[cache_key]
-        else:
-            log.debug('MobyGames._scraper_get_assets_all() Cache miss "{}"'.format(cache_key))
-            asset_list = self._load_assets_from_page(candidate)
-            log.debug('A total of {} assets found for candidate ID {}'.format(
-                len(asset_list), candidate['id']))
-            self.all_asset_cache[cache_key] = asset_list
+        candidate_list.sort(key = lambda result: result['order'], reverse = True)
 
-        return asset_list
+        return candidate_list
 
     # Load assets from assets web page.
     # The Game Images URL shows a page with boxart and screenshots thumbnails.
@@ -4586,88 +4897,40 @@ class GameFAQs(Scraper):
     # https://gamefaqs.gamespot.com/snes/519824-super-mario-world/images
     # https://gamefaqs.gamespot.com/snes/588741-super-metroid/images
     # https://gamefaqs.gamespot.com/genesis/563316-chakan/images
-    #
-    # <div class="pod game_imgs">
-    #   <div class="head"><h2 class="title">Game Box Shots</h2></div>
-    #   <div class="body">
-    #   <table class="contrib">
-    #   <tr>
-    #     <td class="thumb index:0 modded:0 iteration:1 modded:1">
-    #       <div class="img boxshot">
-    #         <a href="/genesis/563316-chakan/images/145463">
-    #           <img class="img100 imgboxart" src="https://gamefaqs.akamaized.net/box/3/1/7/2317_thumb.jpg" alt="Chakan (US)" />
-    #         </a>
-    #         <div class="region">US 1992</div>
-    #       </div>
-    #     </td>
-    #   ......
-    #     <td></td>
-    #   </tr>
-    #   </table>
-    #   </div>
-    #   <div class="head"><h2 class="title">GameFAQs Reader Screenshots</h2></div>
-    #   <div class="body"><table class="contrib">
-    #   <tr>
-    #     <td class="thumb">
-    #     <a href="/genesis/563316-chakan/images/21">
-    #       <img class="imgboxart" src="https://gamefaqs.akamaized.net/screens/f/c/b/gfs_45463_1_1_thm.jpg" />
-    #     </a>
-    #   </td>
-    def _load_assets_from_page(self, candidate):
-        url = 'https://gamefaqs.gamespot.com{}/images'.format(candidate['id'])
-        log.debug('GameFAQs._scraper_get_assets_all() Get asset data from {}'.format(url))
-        page_data = network.get_URL(url)
-        self._dump_file_debug('GameFAQs_load_assets_from_page.html', page_data)
-
-        # --- Parse all assets ---
-        # findall() returns a list of strings OR a list of tuples of strings (re with groups).
-        # This RE picks the contents inside the screenshoots tables.
-        r_str = '<div class="head"><h2 class="title">([\w\s]+?)</h2></div><div class="body"><table class="contrib">(.*?)</table></div>'
-        m_asset_blocks = re.findall(r_str, page_data)
+    def _load_assets_from_page(self, candidate, st_dic):
+        url = GameFAQs.URL_base + '{}/images'.format(candidate['id'])
+        log.debug('GameFAQs._load_assets_from_page() Get asset data from {}'.format(url))
+        table_list = self._get_parsed_page(url, GameFAQs_parse_images_page,
+            'GameFAQs_load_assets_from_page.html', st_dic)
+        if kodi.is_error_status(st_dic): return None
+
         assets_list = []
-        for asset_block in m_asset_blocks:
-            asset_table_title = asset_block[0]
-            asset_table_data = asset_block[1]
+        for asset_table_title, image_list in table_list:
             log.debug('Collecting assets from "{}"'.format(asset_table_title))
-
             # --- Depending on the table title select assets ---
+            # Title is usually the first screenshot in GameFAQs.
             title_snap_taken = True
             if 'Box' in asset_table_title:
-                asset_infos = [ASSET_BOXFRONT_ID, ASSET_BOXBACK_ID]
-            # Title is usually the first or first snapshots in GameFAQs.
+                asset_infos = [const.ASSET_BOXFRONT_ID, const.ASSET_BOXBACK_ID]
             elif 'Screenshots' in asset_table_title:
-                asset_infos = [ASSET_SNAP_ID]
-                if not('?page=' in url):
-                    asset_infos.append(ASSET_TITLE_ID)
-                    title_snap_taken = False
-
-            # --- Parse all image links in table ---
-            # <a href="/nes/578318-castlevania/images/135454">
-            # <img class="img100 imgboxart" src="https://gamefaqs.akamaized.net/box/2/7/6/2276_thumb.jpg" alt="Castlevania (US)" />
-            # </a>
-            r_str = '<a href="(?P<lnk>.+?)"><img class="(img100\s)?imgboxart" src="(?P<thumb>.+?)" (alt="(?P<alt>.+?)")?\s?/></a>'
-            block_items = re.finditer(r_str, asset_table_data)
-            for m in block_items:
-                image_data = m.groupdict()
-                # log_variable('image_data', image_data)
+                asset_infos = [const.ASSET_SNAP_ID, const.ASSET_TITLE_ID]
+                title_snap_taken = False
+            else:
+                continue
+
+            for image_link, image_thumb, image_alt in image_list:
                 for asset_id in asset_infos:
-                    if asset_id == ASSET_TITLE_ID and title_snap_taken: continue
-                    if asset_id == ASSET_TITLE_ID: title_snap_taken = True
+                    if asset_id == const.ASSET_TITLE_ID and title_snap_taken: continue
+                    if asset_id == const.ASSET_TITLE_ID: title_snap_taken = True
                     asset_data = self._new_assetdata_dic()
                     asset_data['asset_ID']     = asset_id
-                    asset_data['display_name'] = image_data['alt'] if image_data['alt'] else ''
-                    asset_data['url_thumb']    = image_data['thumb']
-                    asset_data['url']          = image_data['lnk']
+                    asset_data['display_name'] = image_alt
+                    asset_data['url_thumb']    = image_thumb
+                    asset_data['url']          = image_link
                     asset_data['is_on_page']   = True
                     assets_list.append(asset_data)
-                    # log_variable('asset_data', asset_data)
-
-        # --- Recursively load more image pages ---
-        # Deactivated for now. Images on the first page should me more than enough.
-        # next_page_result = re.findall('<li><a href="(\S*?)">Next Page\s<i', page_data, re.MULTILINE)
-        # if len(next_page_result) > 0:
-        #     new_url = 'https://gamefaqs.gamespot.com{}'.format(next_page_result[0])
-        #     assets_list = assets_list + self._load_assets_from_url(new_url)
+        log.debug('A total of {} assets found for candidate ID {}'.format(
+            len(assets_list), candidate['id']))
 
         return assets_list
 
@@ -4694,6 +4957,8 @@ class ArcadeDB(Scraper):
         const.ASSET_BOXFRONT_ID,
         const.ASSET_FLYER_ID,
     ]
+    # Maximum number of game names sent in one QUERY_MAME request.
+    QUERY_MAME_CHUNK_SIZE = 50
 
     # --- Constructor ----------------------------------------------------------------------------
     def __init__(self, settings):
@@ -4753,12 +5018,7 @@ class ArcadeDB(Scraper):
         elif num_games == 1:
             log.debug('ArcadeDB.get_candidates() Scraper found one game.')
             gameinfo_dic = json_response_dic['result'][0]
-            candidate = self._new_candidate_dic()
-            candidate['id'] = rombase_noext
-            candidate['display_name'] = gameinfo_dic['title']
-            candidate['platform'] = platform
-            candidate['scraper_platform'] = platform
-            candidate['order'] = 1
+            candidate = self._new_QUERY_MAME_candidate(rombase_noext, gameinfo_dic, platform)
             candidate_list.append(candidate)
 
             # --- Add candidate games to the cache ---
@@ -4831,7 +5091,61 @@ class ArcadeDB(Scraper):
         # All ArcadeDB images are in PNG format?
         return 'png'
 
+    # ArcadeDB QUERY_MAME accepts several game names separated by ';' in a single request.
+    # Resolve the ROMs not yet in the candidates cache in chunks and fill the candidates and
+    # internal disk caches, so the per-ROM get_candidates()/get_metadata()/get_assets() calls
+    # in the ROM scanner are cache hits.
+    # ROMs not found are not cached and are searched again one by one with get_candidates().
+    # Errors are not reported here. Prefetching stops and the per-ROM calls will report them.
+    def prefetch_candidates(self, rom_FN_list, platform, pdialog = None):
+        if self.scraper_disabled:
+            log.debug('ArcadeDB.prefetch_candidates() Scraper disabled. Doing nothing.')
+            return 0
+        cache_key_dic = collections.OrderedDict()
+        for rom_FN in rom_FN_list:
+            if self.check_candidates_cache(rom_FN, platform): continue
+            cache_key_dic[rom_FN.getBaseNoExt()] = rom_FN.getBase()
+        name_list = list(cache_key_dic.keys())
+        log.debug('ArcadeDB.prefetch_candidates() {} ROMs, {} not in candidates cache'.format(
+            len(rom_FN_list), len(name_list)))
+        if not name_list: return 0
+
+        if pdialog is not None:
+            pdialog.startProgress('Retrieving ArcadeDB data...', len(name_list))
+        num_resolved, num_requests = 0, 0
+        for i in range(0, len(name_list), ArcadeDB.QUERY_MAME_CHUNK_SIZE):
+            if pdialog is not None: pdialog.updateProgress(i)
+            chunk_list = name_list[i:i + ArcadeDB.QUERY_MAME_CHUNK_SIZE]
+            st_dic = kodi.new_status_dic()
+            json_response_dic = self._get_QUERY_MAME(';'.join(chunk_list), platform, st_dic)
+            num_requests += 1
+            if kodi.is_error_status(st_dic):
+                log.error('ArcadeDB.prefetch_candidates() Error "{}". Stopping.'.format(st_dic['msg']))
+                break
+            for gameinfo_dic in json_response_dic['result']:
+                game_name = gameinfo_dic.get('game_name', '')
+                if game_name not in cache_key_dic: continue
+                cache_key = cache_key_dic[game_name]
+                candidate = self._new_QUERY_MAME_candidate(game_name, gameinfo_dic, platform)
+                self._update_disk_cache(Scraper.CACHE_CANDIDATES, cache_key, candidate)
+                self._update_disk_cache(Scraper.CACHE_INTERNAL, cache_key, {'result' : [gameinfo_dic]})
+                num_resolved += 1
+        if pdialog is not None: pdialog.endProgress()
+        log.debug('ArcadeDB.prefetch_candidates() Resolved {} ROMs with {} requests'.format(
+            num_resolved, num_requests))
+
+        return max(0, num_resolved - num_requests)
+
     # --- This class own methods -----------------------------------------------------------------
+    def _new_QUERY_MAME_candidate(self, rombase_noext, gameinfo_dic, platform):
+        candidate = self._new_candidate_dic()
+        candidate['id'] = rombase_noext
+        candidate['display_name'] = gameinfo_dic['title']
+        candidate['platform'] = platform
+        candidate['scraper_platform'] = platform
+        candidate['order'] = 1
+        return candidate
+
     # Plumbing function to get the cached jeu_dic dictionary returned by ScreenScraper.
     # Cache must be lazy loaded before calling this function.
     def debug_get_QUERY_MAME_dic(self, candidate):
@@ -50,6 +50,7 @@ else:
 import collections
 import errno
 import fnmatch
+import hashlib
 import io
 import json
 import math
@@ -62,6 +63,12 @@ import threading
 import time
 import xml.etree.ElementTree
 import zlib
+if const.ADDON_RUNNING_PYTHON_2:
+    collections_abc = collections
+elif const.ADDON_RUNNING_PYTHON_3:
+    import collections.abc as collections_abc
+else:
+    raise TypeError('Undefined Python runtime version.')
 
 # -------------------------------------------------------------------------------------------------
 # Filesystem helper class.
@@ -337,7 +344,8 @@ def load_XML_to_ET(filename):
 # JSON write/load
 # -------------------------------------------------------------------------------------------------
 # Replace fs_load_JSON_file with this.
-def load_JSON_file(json_filename, default_obj = {}, verbose = True):
+# object_hook is passed to the JSON decoder, see db.compact_ROM_object_hook().
+def load_JSON_file(json_filename, default_obj = {}, verbose = True, object_hook = None):
     # If file does not exist return default object (usually empty object)
     json_data = default_obj
     if not os.path.isfile(json_filename):
@@ -347,7 +355,7 @@ def load_JSON_file(json_filename, default_obj = {}, verbose = True):
     if verbose: log.debug('load_JSON_file() "{}"'.format(json_filename))
     with io.open(json_filename, 'rt', encoding = 'utf-8') as file:
         try:
-            json_data = json.load(file)
+            json_data = json.load(file, object_hook = object_hook)
         except ValueError as ex:
             log.error('load_JSON_file() ValueError exception in json.load() function')
     return json_data
@@ -358,6 +366,11 @@ def load_JSON_file(json_filename, default_obj = {}, verbose = True):
 # Note that there is a bug in the json module where the ensure_ascii=False flag can produce
 # a mix of unicode and str objects.
 # See http://stackoverflow.com/questions/18337407/saving-utf-8-texts-in-json-dumps-as-utf8-not-as-u-escape-sequence
+# Objects that behave like a dictionary, for example db.CompactROM, are written as dictionaries.
+def JSON_encode_default(obj):
+    if isinstance(obj, collections_abc.Mapping): return dict(obj.items())
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
+
 def write_JSON_file(json_filename, json_data, verbose = True, pprint = False):
     l_start = time.time()
     if verbose: log.debug('write_JSON_file() "{}"'.format(json_filename))
@@ -368,23 +381,24 @@ def write_JSON_file(json_filename, json_data, verbose = True, pprint = False):
         if verbose: log.debug('write_JSON_file() Using OPTION_LOWMEM_WRITE_JSON option')
         if pprint:
             jobj = json.JSONEncoder(ensure_ascii = False, sort_keys = True,
-                indent = const.JSON_INDENT, separators = const.JSON_SEP)
+                indent = const.JSON_INDENT, separators = const.JSON_SEP, default = JSON_encode_default)
         else:
             if const.OPTION_COMPACT_JSON:
-                jobj = json.JSONEncoder(ensure_ascii = False, sort_keys = True)
+                jobj = json.JSONEncoder(ensure_ascii = False, sort_keys = True, default = JSON_encode_default)
             else:
                 jobj = json.JSONEncoder(ensure_ascii = False, sort_keys = True,
-                    indent = const.JSON_INDENT, separators = const.JSON_SEP)
+                    indent = const.JSON_INDENT, separators = const.JSON_SEP, default = JSON_encode_default)
     else:
         if pprint:
             jdata = json.dumps(json_data, ensure_ascii = False, sort_keys = True,
-                indent = const.JSON_INDENT, separators = const.JSON_SEP)
+                indent = const.JSON_INDENT, separators = const.JSON_SEP, default = JSON_encode_default)
         else:
             if const.OPTION_COMPACT_JSON:
-                jdata = json.dumps(json_data, ensure_ascii = False, sort_keys = True)
+                jdata = json.dumps(json_data, ensure_ascii = False, sort_keys = True,
+                    default = JSON_encode_default)
             else:
                 jdata = json.dumps(json_data, ensure_ascii = False, sort_keys = True,
-                    indent = const.JSON_INDENT, separators = const.JSON_SEP)
+                    indent = const.JSON_INDENT, separators = const.JSON_SEP, default = JSON_encode_default)
 
     # Write JSON to disk
     try:
@@ -423,77 +437,192 @@ class Threaded_Load_JSON(threading.Thread):
     def run(self):
         self.output_dic = load_JSON_file(self.json_filename)
 
+# -------------------------------------------------------------------------------------------------
+# Threaded file existence check
+# -------------------------------------------------------------------------------------------------
+# Checking files one by one is very slow on network shares (SMB/NFS) where every stat() is a
+# network round trip. The list of paths is split among num_threads worker threads. The GIL is
+# released while waiting for the filesystem, so the checks run in parallel.
+#
+# Returns the set of paths in path_list that do not exist.
+class Threaded_Exists(threading.Thread):
+    def __init__(self, path_list):
+        threading.Thread.__init__(self)
+        self.path_list = path_list
+        self.missing_list = []
+
+    def run(self):
+        for path in self.path_list:
+            if not os.path.exists(path): self.missing_list.append(path)
+
+def get_missing_files(path_list, num_threads = 8):
+    if len(path_list) < 2 * num_threads:
+        return set([path for path in path_list if not os.path.exists(path)])
+    thread_list = [Threaded_Exists(path_list[i::num_threads]) for i in range(num_threads)]
+    for thread in thread_list: thread.start()
+    for thread in thread_list: thread.join()
+    missing_set = set()
+    for thread in thread_list: missing_set.update(thread.missing_list)
+    return missing_set
+
+# -------------------------------------------------------------------------------------------------
+# Network path detection
+# -------------------------------------------------------------------------------------------------
+# A path is in a network share if it is an URL (smb://, nfs://), a Windows UNC path
+# (\\server\share) or, on Linux, a directory where a network filesystem is mounted.
+NETWORK_FS_TYPES = ('cifs', 'smb3', 'smbfs', 'nfs', 'nfs4', 'afpfs', 'fuse.sshfs')
+
+# Returns the list of mount points of network filesystems, ending in '/'. The list is empty
+# if the mount table cannot be read (platforms other than Linux).
+def get_network_mount_points(mounts_fname = '/proc/mounts'):
+    if not os.path.isfile(mounts_fname): return []
+    mount_list = []
+    try:
+        with io.open(mounts_fname, 'rt', encoding = 'utf-8', errors = 'replace') as file:
+            for line in file:
+                fields = line.split()
+                if len(fields) < 3 or fields[2] not in NETWORK_FS_TYPES: continue
+                # Spaces in mount points are escaped as \040 in the mount table.
+                mount_point = fields[1].replace('\\040', ' ')
+                mount_list.append(mount_point.rstrip('/') + '/')
+    except (IOError, OSError) as ex:
+        log.error('get_network_mount_points() Exception reading "{}"'.format(mounts_fname))
+        log.error('get_network_mount_points() {}'.format(ex))
+        return []
+    log.debug('get_network_mount_points() {} network mount points'.format(len(mount_list)))
+
+    return mount_list
+
+def is_network_path(path, mount_list):
+    if '://' in path or path.startswith('\\\\'): return True
+    for mount_point in mount_list:
+        if path.startswith(mount_point): return True
+    return False
+
 # -------------------------------------------------------------------------------------------------
 # File cache functions.
 # Depends on the FileName class.
 # -------------------------------------------------------------------------------------------------
+# The file cache has the files of every asset directory (and its subdirectories) in a
+# dictionary { lowercase relative filename without extension : [relative filename, ...] }
+# so searching for a ROM asset is a dictionary lookup.
+#
+# If file_cache_set_index_dir() is called the file cache of every directory is also stored
+# on disk, together with the mtime of the directory and its subdirectories. A directory is only
+# listed again if one of the mtimes changed.
+#
+# index = {
+#     'dir' : dir_str,
+#     'mtimes' : { relative dir : mtime, ... },    The asset directory is ''.
+#     'files' : { lowercase filename noext : [relative filename, ...], ... },
+# }
 file_cache = {}
+file_cache_index_dir = None
 
 def file_cache_clear(verbose = True):
     global file_cache
     if verbose: log.debug('file_cache_clear() Clearing file cache')
     file_cache = {}
 
+# index_dir_FN is a FileName object. Use None to disable the on-disk index.
+def file_cache_set_index_dir(index_dir_FN):
+    global file_cache_index_dir
+    file_cache_index_dir = index_dir_FN
+
+def _file_cache_get_index_FN(dir_str):
+    dir_hash = hashlib.md5(dir_str.encode('utf-8')).hexdigest()
+    return file_cache_index_dir.pjoin(dir_hash + '.json')
+
+# Returns a tuple (file_list, mtimes). File paths are relative to root_dir_str and always
+# use '/' as separator, both in file_list and in mtimes.
+def _file_cache_scan_dir(root_dir_str):
+    file_list = []
+    mtimes = {}
+    dir_stack = ['']
+    while dir_stack:
+        rel_dir = dir_stack.pop()
+        abs_dir = os.path.join(root_dir_str, rel_dir) if rel_dir else root_dir_str
+        try:
+            mtimes[rel_dir] = os.stat(abs_dir).st_mtime
+            if const.ADDON_RUNNING_PYTHON_2:
+                entry_list = [(name, os.path.isdir(os.path.join(abs_dir, name))) for name in os.listdir(abs_dir)]
+            elif const.ADDON_RUNNING_PYTHON_3:
+                entry_list = [(entry.name, entry.is_dir()) for entry in os.scandir(abs_dir)]
+            else:
+                raise TypeError('Undefined Python runtime version.')
+        except OSError as ex:
+            log.error('_file_cache_scan_dir() Exception listing "{}"'.format(abs_dir))
+            log.error('_file_cache_scan_dir() {}'.format(ex))
+            continue
+        for name, is_dir in entry_list:
+            rel_path = rel_dir + '/' + name if rel_dir else name
+            if is_dir: dir_stack.append(rel_path)
+            else:      file_list.append(rel_path)
+    return (file_list, mtimes)
+
+def _file_cache_index_is_valid(root_dir_str, index):
+    if index.get('dir') != root_dir_str: return False
+    for rel_dir, mtime in index['mtimes'].items():
+        abs_dir = os.path.join(root_dir_str, rel_dir) if rel_dir else root_dir_str
+        try:
+            if os.stat(abs_dir).st_mtime != mtime: return False
+        except OSError:
+            return False
+    return True
+
 def file_cache_add_dir(dir_str, verbose = True):
     global file_cache
 
-    # Create a set with all the files in the directory
     if not dir_str:
         log.warning('file_cache_add_dir() Empty dir_str. Exiting')
         return
     dir_FN = FileName(dir_str)
     if not dir_FN.exists():
         log.debug('file_cache_add_dir() Does not exist "{}"'.format(dir_str))
-        file_cache[dir_str] = set()
+        file_cache[dir_str] = {}
         return
     if not dir_FN.isdir():
         log.warning('file_cache_add_dir() Not a directory "{}"'.format(dir_str))
         return
-    if verbose:
-        # log.debug('file_cache_add_dir() Scanning OP "{}"'.format(dir_FN.getOriginalPath()))
-        log.debug('file_cache_add_dir() Scanning  P "{}"'.format(dir_FN.getPath()))
-    # A recursive scanning function is needed. os.listdir() is not. os.walk() is recursive
-    # file_list = os.listdir(dir_FN.getPath())
-    file_list = []
     root_dir_str = dir_FN.getPath()
-    # For Unicode errors in os.walk() see
-    # https://stackoverflow.com/questions/21772271/unicodedecodeerror-when-performing-os-walk
-    for root, dirs, files in os.walk(text_type(root_dir_str)):
-        # log.debug('----------')
-        # log.debug('root = {}'.format(root))
-        # log.debug('dirs = {}'.format(text_type(dirs)))
-        # log.debug('files = {}'.format(text_type(files)))
-        # log.debug('\n')
-        for f in files:
-            my_file = os.path.join(root, f)
-            cache_file = my_file.replace(root_dir_str, '')
-            # In the cache always store paths as '/' and not as '\'
-            cache_file = cache_file.replace('\\', '/')
-            # Remove '/' character at the beginning of the file. If the directory dir_str
-            # is like '/example/dir/' then the slash at the beginning will be removed. However,
-            # if dir_str is like '/example/dir' it will be present.
-            if cache_file.startswith('/'): cache_file = cache_file[1:]
-            file_list.append(cache_file)
-    file_set = set(file_list)
-    if verbose:
-        # for file in file_set: log.debug('File "{}"'.format(file))
-        log.debug('file_cache_add_dir() Adding {} files to cache'.format(len(file_set)))
-    file_cache[dir_str] = file_set
+
+    # --- Use the on-disk index if the directory did not change ---
+    if file_cache_index_dir is not None:
+        index_FN = _file_cache_get_index_FN(dir_str)
+        index = load_JSON_file(index_FN.getPath(), {}, verbose = False) if index_FN.exists() else {}
+        if index and _file_cache_index_is_valid(root_dir_str, index):
+            if verbose: log.debug('file_cache_add_dir() Unchanged "{}"'.format(root_dir_str))
+            file_cache[dir_str] = index['files']
+            return
+
+    if verbose: log.debug('file_cache_add_dir() Scanning  P "{}"'.format(root_dir_str))
+    file_list, mtimes = _file_cache_scan_dir(root_dir_str)
+    files = {}
+    for rel_path in file_list:
+        rel_path_noext = os.path.splitext(rel_path)[0]
+        files.setdefault(rel_path_noext.lower(), []).append(rel_path)
+    if verbose: log.debug('file_cache_add_dir() Adding {} files to cache'.format(len(file_list)))
+    file_cache[dir_str] = files
+    if file_cache_index_dir is not None:
+        if not file_cache_index_dir.exists(): file_cache_index_dir.makedirs()
+        index = { 'dir' : root_dir_str, 'mtimes' : mtimes, 'files' : files }
+        write_JSON_file(index_FN.getPath(), index, verbose = False)
 
 # See utils_look_for_file() documentation below.
+# Extensions are tried in the order of file_exts. A file with the same case as filename_noext
+# and the extension is preferred, otherwise the search is case insensitive.
 def file_cache_search(dir_str, filename_noext, file_exts):
     # Check for empty, unconfigured dirs
     if not dir_str: return None
-    current_cache_set = file_cache[dir_str]
-    # if filename_noext == '005':
-    #     log.debug('file_cache_search() Searching in "{}"'.format(dir_str))
-    #     log.debug('file_cache_search() current_cache_set "{}"'.format(text_type(current_cache_set)))
+    candidate_list = file_cache[dir_str].get(filename_noext.lower())
+    if not candidate_list: return None
     for ext in file_exts:
         file_base = filename_noext + '.' + ext
-        # log.debug('file_cache_search() file_Base = "{}"'.format(file_base))
-        if file_base in current_cache_set:
-            # log.debug('file_cache_search() Found in cache')
-            return FileName(dir_str).pjoin(file_base)
+        if file_base in candidate_list: return FileName(dir_str).pjoin(file_base)
+    for ext in file_exts:
+        file_base = (filename_noext + '.' + ext).lower()
+        for candidate in candidate_list:
+            if candidate.lower() == file_base: return FileName(dir_str).pjoin(candidate)
     return None
 
 # Given the image path, image filename with no extension and a list of file
@@ -641,7 +770,9 @@ def addon_obj():
 
 # -------------------------------------------------------------------------------------------------
 # Abstraction layer for settings to easy the Leia-Matrix transition.
-# Settings are only read once on every execution and they are not performance critical.
+# Every setting read is a call into Kodi. Settings are read lazily with LazySettings and the
+# values are kept in a snapshot file on disk, so most executions read the settings with a
+# single JSON file load.
 # -------------------------------------------------------------------------------------------------
 def get_int_setting(cfg, setting_str):
     return cfg.addon.addon.getSettingInt(setting_str)
@@ -655,6 +786,58 @@ def get_bool_setting(cfg, setting_str):
 def get_str_setting(cfg, setting_str):
     return cfg.addon.addon.getSettingString(setting_str)
 
+# Settings dictionary that reads a setting from Kodi the first time its key is used.
+# getter_dic is { setting key : function }, the functions are the get_*_setting() above.
+# Keys not in getter_dic and not set by the addon raise KeyError, like in a normal dictionary.
+class LazySettings(dict):
+    def __init__(self, cfg, getter_dic):
+        dict.__init__(self)
+        self.cfg = cfg
+        self.getter_dic = getter_dic
+        # Setting values as read from Kodi or the snapshot, before any change by the addon.
+        self.values = {}
+
+    def __missing__(self, key):
+        value = self.values[key] = self.getter_dic[key](self.cfg, key)
+        self[key] = value
+        return value
+
+    # Fills the settings from the snapshot values.
+    def update_values(self, values):
+        self.values.update(values)
+        self.update(values)
+
+    # Reads from Kodi the settings not used yet. Returns the setting values.
+    def read_all(self):
+        for key in self.getter_dic:
+            if key not in self.values: self.values[key] = self.getter_dic[key](self.cfg, key)
+        return self.values
+
+# The snapshot is valid while stamp does not change. Returns the setting values or None
+# if the snapshot does not exist or is not valid.
+def load_settings_snapshot(snapshot_FN, stamp):
+    if not snapshot_FN.exists(): return None
+    snapshot = load_JSON_file(snapshot_FN.getPath(), {}, verbose = False)
+    if snapshot.get('stamp') != stamp or 'settings' not in snapshot: return None
+    return snapshot['settings']
+
+# Plugin instances may run concurrently. The snapshot is written in a temporary file with an
+# unique name and then renamed so a concurrent load never reads a partially written file.
+def save_settings_snapshot(snapshot_FN, stamp, values):
+    temp_path = '{}.{}.{}.tmp'.format(snapshot_FN.getPath(), os.getpid(), threading.current_thread().ident)
+    write_JSON_file(temp_path, { 'stamp' : stamp, 'settings' : values }, verbose = False)
+    try:
+        if const.ADDON_RUNNING_PYTHON_2:
+            if snapshot_FN.exists(): snapshot_FN.unlink()
+            os.rename(temp_path, snapshot_FN.getPath())
+        elif const.ADDON_RUNNING_PYTHON_3:
+            os.replace(temp_path, snapshot_FN.getPath())
+        else:
+            raise TypeError('Undefined Python runtime version.')
+    except OSError as ex:
+        log.warning('save_settings_snapshot() Exception renaming "{}": {}'.format(temp_path, ex))
+        if os.path.isfile(temp_path): os.remove(temp_path)
+
 # -------------------------------------------------------------------------------------------------
 # Determine Kodi version and create some constants to allow version-dependent code.
 # This if useful to work around bugs in Kodi core.
@@ -742,7 +925,7 @@ def get_cached_image_FN(image_path):
 # img_path is a Unicode string
 def update_image_cache(img_path):
     # What if image is not cached?
-    cached_thumb = kodi_get_cached_image_FN(img_path)
+    cached_thumb = get_cached_image_FN(img_path)
     log.debug('update_image_cache()       img_path {}'.format(img_path))
     log.debug('update_image_cache()   cached_thumb {}'.format(cached_thumb))
 
@@ -762,20 +945,105 @@ def update_image_cache(img_path):
         return
 
     # --- Copy local image into Kodi image cache ---
-    # See https://docs.python.org/2/library/sys.html#sys.getfilesystemencoding
     log.debug('update_image_cache() Image found in cache. Updating Kodi image cache')
     log.debug('update_image_cache() copying {}'.format(img_path))
     log.debug('update_image_cache() into    {}'.format(cached_thumb))
-    fs_encoding = sys.getfilesystemencoding()
-    log.debug('update_image_cache() fs_encoding = "{}"'.format(fs_encoding))
-    encoded_img_path = img_path.encode(fs_encoding, 'ignore')
-    encoded_cached_thumb = cached_thumb.encode(fs_encoding, 'ignore')
     try:
-        shutil.copy2(encoded_img_path, encoded_cached_thumb)
-    except OSError:
-        log_kodi_notify_warn('AEL warning', 'Cannot update cached image (OSError)')
-        lod_error('Exception in kodi_update_image_cache()')
-        lod_error('(OSError) Cannot update cached image')
+        shutil.copy2(img_path, cached_thumb)
+    except (IOError, OSError):
+        log.error('Exception in update_image_cache()')
+        log.error('(OSError) Cannot update cached image')
 
     # Is this really needed?
     # xbmc.executebuiltin('ReloadSkin()')
+
+# -------------------------------------------------------------------------------------------------
+# Command timing telemetry.
+# -------------------------------------------------------------------------------------------------
+# When enabled, the wall time of a plugin command is recorded, split in phases. The command code
+# adds the time of the phases with command_timing_add(). Time not added to any phase is reported
+# as TIMING_PHASE_OTHER. command_timing_add() returns immediately if telemetry is disabled.
+#
+# Every command appends one JSON line to the timing log. Commands running concurrently with
+# other AEL instances only append to the log. The log and the cProfile stats files are only
+# trimmed by commands that run protected.
+#
+# record = {
+#     'command' : command, 'launID' : launcher ID or '', 'date' : time.time(),
+#     'total' : seconds, 'phases' : { phase : seconds, ... }, 'profile' : file name or '',
+# }
+TIMING_PHASE_LOAD = 'load'
+TIMING_PHASE_PROCESS = 'process'
+TIMING_PHASE_RENDER = 'render'
+TIMING_PHASE_OTHER = 'other'
+TIMING_PHASE_LIST = [TIMING_PHASE_LOAD, TIMING_PHASE_PROCESS, TIMING_PHASE_RENDER, TIMING_PHASE_OTHER]
+TIMING_MAX_RUNS = 500
+TIMING_MAX_PROFILES = 50
+command_timing_phases = None
+
+def command_timing_add(phase, seconds):
+    if command_timing_phases is None: return
+    command_timing_phases[phase] = command_timing_phases.get(phase, 0.0) + seconds
+
+# Calls function(*args) and appends the timing record to timing_log_FN.
+# If profile_dir_FN is not None the cProfile stats of the command are dumped into that directory.
+# Set trim to True only if no other AEL instance may be running.
+def command_timing_run(timing_log_FN, profile_dir_FN, trim, command, launID, function, *args):
+    global command_timing_phases
+    command_timing_phases = {}
+    profiler = None
+    if profile_dir_FN is not None:
+        try:
+            import cProfile
+            profiler = cProfile.Profile()
+        except ImportError:
+            log.warning('command_timing_run() cProfile not available in this Python runtime')
+    start_time = time.time()
+    if profiler is not None: profiler.enable()
+    try:
+        function(*args)
+    finally:
+        if profiler is not None: profiler.disable()
+        total_time = time.time() - start_time
+        phases = command_timing_phases
+        command_timing_phases = None
+        phases[TIMING_PHASE_OTHER] = max(0.0, total_time - sum(phases.values()))
+        profile_fname = ''
+        if profiler is not None:
+            if not profile_dir_FN.exists(): profile_dir_FN.makedirs()
+            profile_fname = '{}_{:03d}_{}.prof'.format(time.strftime('%Y%m%d_%H%M%S',
+                time.localtime(start_time)), int(start_time * 1000) % 1000, command)
+            profiler.dump_stats(profile_dir_FN.pjoin(profile_fname).getPath())
+        record = {
+            'command' : command, 'launID' : launID, 'date' : start_time,
+            'total' : total_time, 'phases' : phases, 'profile' : profile_fname,
+        }
+        log.debug('command_timing_run() {} {:.3f} s'.format(command, total_time))
+        try:
+            with io.open(timing_log_FN.getPath(), 'at', encoding = 'utf-8') as file:
+                file.write(const.text_type(json.dumps(record)) + '\n')
+            if trim: _command_timing_trim(timing_log_FN, profile_dir_FN)
+        except (IOError, OSError) as ex:
+            log.error('command_timing_run() Exception writing timing log {}'.format(ex))
+
+def _command_timing_trim(timing_log_FN, profile_dir_FN):
+    line_list = load_file_to_slist(timing_log_FN.getPath())
+    if len(line_list) > 2 * TIMING_MAX_RUNS:
+        with io.open(timing_log_FN.getPath(), 'wt', encoding = 'utf-8') as file:
+            file.write(''.join(line_list[-TIMING_MAX_RUNS:]))
+    if profile_dir_FN is None or not profile_dir_FN.exists(): return
+    profile_list = sorted(fname for fname in os.listdir(profile_dir_FN.getPath()) if fname.endswith('.prof'))
+    for fname in profile_list[:-TIMING_MAX_PROFILES]:
+        os.remove(profile_dir_FN.pjoin(fname).getPath())
+
+# Returns a list with the last max_runs timing records, oldest first.
+def command_timing_load(timing_log_FN, max_runs = TIMING_MAX_RUNS):
+    if not timing_log_FN.exists(): return []
+    record_list = []
+    for line in load_file_to_slist(timing_log_FN.getPath())[-max_runs:]:
+        try:
+            record_list.append(json.loads(line))
+        except ValueError:
+            # Line cut by a concurrent write or by Kodi being killed.
+            continue
+    return record_list